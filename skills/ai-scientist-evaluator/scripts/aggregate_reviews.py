@@ -1,16 +1,52 @@
 #!/usr/bin/env python3
 """Aggregate and rank AI scientist evaluation JSON files.
 
+Reviews may be given as files, directories (searched recursively for *.json),
+or glob patterns. Each review is parsed once, across a process pool for large
+sweeps, and reduced to a small leaderboard row, so parsed reviews are never all
+held in memory at once; --top keeps only the best K rows on a heap.
+
 Usage:
     python scripts/aggregate_reviews.py review1.json review2.json --out_md leaderboard.md
+    python scripts/aggregate_reviews.py 'sweep/**/*.json' --top 50 --out_csv leaderboard.csv
 """
 
 from __future__ import annotations
 
 import argparse
+import csv
+import glob
+import heapq
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Score category -> leaderboard column; the first matching score entry wins.
+CATEGORY_COLUMNS = {
+    "task_completion": "task_completion",
+    "reproducibility": "reproducibility",
+    "validation_robustness": "validation",
+    "benchmarking": "validation",
+}
+TABLE_COLUMNS = (
+    ("rank", "int64"),
+    ("submission_id", "string"),
+    ("scientist_name", "string"),
+    ("total_score_100", "float64"),
+    ("recommendation", "string"),
+    ("task_completion", "float64"),
+    ("reproducibility", "float64"),
+    ("validation", "float64"),
+    ("gate_fails", "int64"),
+    ("red_flags", "int64"),
+    ("path", "string"),
+)
+PARQUET_ROW_GROUP = 10000
+# Below this many reviews a process pool costs more to start than it saves.
+MIN_PARALLEL_REVIEWS = 256
 
 
 def load_review(path: Path) -> Dict[str, Any]:
@@ -47,50 +83,173 @@ def sort_key(data: Dict[str, Any]) -> Tuple[float, float, float, float, float]:
     return (total, task, repro, validation, -penalties)
 
 
-def format_markdown(reviews: List[Tuple[Path, Dict[str, Any]]]) -> str:
+def summarize_review(path: Path, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a review to its leaderboard row, scanning each list once."""
+    columns = {"task_completion": 0.0, "reproducibility": 0.0, "validation": 0.0}
+    seen = set()
+    for item in data.get("scores", []):
+        column = CATEGORY_COLUMNS.get(item.get("category"))
+        if column is None or column in seen:
+            continue
+        seen.add(column)
+        try:
+            columns[column] = float(item.get("weighted_points", 0))
+        except (TypeError, ValueError):
+            pass
+    row = {
+        "submission_id": data.get("submission_id", path.stem),
+        "scientist_name": data.get("scientist_name", ""),
+        "total_score_100": float(data["overall"].get("total_score_100", 0)),
+        "recommendation": data["overall"].get("recommendation", ""),
+        **columns,
+        "gate_fails": gate_fail_count(data),
+        "red_flags": red_flag_count(data),
+        "path": str(path),
+    }
+    row["sort_key"] = (
+        row["total_score_100"],
+        row["task_completion"],
+        row["reproducibility"],
+        row["validation"],
+        -(row["gate_fails"] + row["red_flags"]),
+    )
+    return row
+
+
+def load_row(path: Path) -> Dict[str, Any]:
+    return summarize_review(path, load_review(path))
+
+
+def iter_review_paths(specs: Iterable[str]) -> Iterator[Path]:
+    """Expand files, directories, and glob patterns into review paths, each once."""
+    seen = set()
+    for spec in specs:
+        path = Path(spec)
+        if path.is_dir():
+            matches = sorted(path.rglob("*.json"))
+        elif path.exists():
+            matches = [path]
+        elif glob.has_magic(spec):
+            matches = sorted(Path(match) for match in glob.glob(spec, recursive=True) if Path(match).is_file())
+        else:
+            raise FileNotFoundError(f"{spec} does not exist")
+        for match in matches:
+            key = match.resolve()
+            if key not in seen:
+                seen.add(key)
+                yield match
+
+
+def _load_row_job(job: Tuple[str, bool]) -> Optional[Dict[str, Any]]:
+    path, skip_invalid = job
+    try:
+        return load_row(Path(path))
+    except (OSError, ValueError, TypeError, AttributeError) as exc:
+        # json.JSONDecodeError is a ValueError; malformed "overall" blocks raise the others.
+        if not skip_invalid:
+            raise
+        print(f"WARNING: skipping {path}: {exc}", file=sys.stderr)
+        return None
+
+
+def iter_rows(paths: Iterable[Path], workers: int = 1, skip_invalid: bool = False) -> Iterator[Dict[str, Any]]:
+    """Yield leaderboard rows in input order, parsing reviews across processes."""
+    jobs = [(str(path), skip_invalid) for path in paths]
+    if workers <= 1 or len(jobs) < MIN_PARALLEL_REVIEWS:
+        rows: Iterable[Optional[Dict[str, Any]]] = map(_load_row_job, jobs)
+        yield from (row for row in rows if row is not None)
+        return
+    # Only the small leaderboard rows cross the process boundary, never the parsed reviews.
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        rows = pool.map(_load_row_job, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+        yield from (row for row in rows if row is not None)
+
+
+def rank_rows(rows: Iterable[Dict[str, Any]], top: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Order rows best-first; ties keep input order, as with a stable sort."""
+    if top is None:
+        ranked = sorted(rows, key=lambda row: row["sort_key"], reverse=True)
+    else:
+        ranked = heapq.nlargest(top, rows, key=lambda row: row["sort_key"])
+    for rank, row in enumerate(ranked, start=1):
+        row["rank"] = rank
+    return ranked
+
+
+def format_markdown(rows: List[Dict[str, Any]]) -> str:
     lines = []
     lines.append("# AI Scientist Leaderboard")
     lines.append("")
     lines.append("| Rank | Submission | Scientist | Score | Recommendation | Gate fails | Red flags |")
     lines.append("|---:|---|---|---:|---|---:|---:|")
-    for idx, (path, data) in enumerate(reviews, start=1):
-        submission = data.get("submission_id", path.stem)
-        scientist = data.get("scientist_name", "")
-        score = float(data["overall"].get("total_score_100", 0))
-        recommendation = data["overall"].get("recommendation", "")
+    for idx, row in enumerate(rows, start=1):
         lines.append(
-            f"| {idx} | {submission} | {scientist} | {score:.1f} | {recommendation} | {gate_fail_count(data)} | {red_flag_count(data)} |"
+            f"| {idx} | {row['submission_id']} | {row['scientist_name']} | {row['total_score_100']:.1f} | "
+            f"{row['recommendation']} | {row['gate_fails']} | {row['red_flags']} |"
         )
     lines.append("")
-    if reviews:
-        winner = reviews[0][1]
+    if rows:
+        winner = rows[0]
         lines.append("## Winner")
         lines.append("")
         lines.append(
-            f"{winner.get('submission_id', reviews[0][0].stem)} "
-            f"({winner.get('scientist_name', '').strip()}) ranks first with "
-            f"{float(winner['overall'].get('total_score_100', 0)):.1f}/100."
+            f"{winner['submission_id']} "
+            f"({winner['scientist_name'].strip()}) ranks first with "
+            f"{winner['total_score_100']:.1f}/100."
         )
     return "\n".join(lines)
 
 
+def write_csv(path: Path, rows: List[Dict[str, Any]]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=[name for name, _ in TABLE_COLUMNS], extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_parquet(path: Path, rows: List[Dict[str, Any]]) -> None:
+    # Imported here so Markdown-only runs do not need pyarrow.
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)") from exc
+    schema = pa.schema([(name, getattr(pa, kind)()) for name, kind in TABLE_COLUMNS])
+    with pq.ParquetWriter(str(path), schema) as writer:
+        for start in range(0, max(len(rows), 1), PARQUET_ROW_GROUP):
+            chunk = [{name: row[name] for name, _ in TABLE_COLUMNS} for row in rows[start : start + PARQUET_ROW_GROUP]]
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Aggregate and rank AI scientist evaluation JSON files")
-    parser.add_argument("reviews", nargs="+", help="Paths to evaluation JSON files")
+    parser.add_argument("reviews", nargs="+", help="Evaluation JSON files, directories, or glob patterns")
     parser.add_argument("--out_md", help="Optional markdown output path")
+    parser.add_argument("--out_csv", help="Optional CSV output path")
+    parser.add_argument("--out_parquet", help="Optional Parquet output path (requires pyarrow)")
+    parser.add_argument("--top", type=int, help="Keep only the best K reviews")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="JSON loading processes")
+    parser.add_argument("--skip-invalid", action="store_true", help="Warn about and skip unreadable reviews")
+    parser.add_argument("--quiet", action="store_true", help="Do not print the markdown leaderboard")
     args = parser.parse_args()
+    if args.top is not None and args.top < 1:
+        parser.error("--top must be at least 1")
 
-    loaded: List[Tuple[Path, Dict[str, Any]]] = []
-    for review_path in args.reviews:
-        path = Path(review_path)
-        loaded.append((path, load_review(path)))
-
-    loaded.sort(key=lambda item: sort_key(item[1]), reverse=True)
-    markdown = format_markdown(loaded)
-    print(markdown)
+    try:
+        paths = iter_review_paths(args.reviews)
+        ranked = rank_rows(iter_rows(paths, workers=args.workers, skip_invalid=args.skip_invalid), top=args.top)
+    except FileNotFoundError as exc:
+        parser.error(str(exc))
+    markdown = format_markdown(ranked)
+    if not args.quiet:
+        print(markdown)
 
     if args.out_md:
         Path(args.out_md).write_text(markdown, encoding="utf-8")
+    if args.out_csv:
+        write_csv(Path(args.out_csv), ranked)
+    if args.out_parquet:
+        write_parquet(Path(args.out_parquet), ranked)
 
 
 if __name__ == "__main__":
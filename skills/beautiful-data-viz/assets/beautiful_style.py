@@ -4,21 +4,30 @@ Goal:
 - Publication-quality plots with readable labels, minimal whitespace, and sensible defaults.
 - Works in Jupyter notebooks.
 - Matplotlib-first; uses seaborn if available for easier theming.
+- Large-data fast paths: `fast_scatter` / `fast_line` rasterize, bin, or
+  LTTB-downsample automatically above configurable point thresholds.
+- Cheap to import and to re-apply: pyplot, seaborn, and IPython are never
+  imported at module load, and the merged rcParams for each style are built once
+  per process and applied in a single update.
 
 References:
 - Seaborn aesthetics + palettes: https://seaborn.pydata.org/
 - LearnUI palette guidance: https://www.learnui.design/tools/data-color-picker.html
+- LTTB downsampling: Steinarsson, "Downsampling Time Series for Visual Representation" (2013)
 """
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Optional, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
 
 import matplotlib as mpl
-import matplotlib.pyplot as plt
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
+import numpy as np  # already loaded by matplotlib itself
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
 
 
 @dataclass(frozen=True)
@@ -29,6 +38,18 @@ class VizConfig:
     dpi: int = 150
 
 
+@dataclass(frozen=True)
+class LargeDataThresholds:
+    rasterize_points: int = 10_000   # above: draw markers/lines as a bitmap inside vector output
+    bin_points: int = 200_000        # above: aggregate scatter points into a 2D density image
+    line_points: int = 5_000         # above: LTTB-downsample lines to this many points
+
+
+LARGE_DATA = LargeDataThresholds()
+# Marker styling that has no meaning once points are aggregated into density cells.
+_MARKER_ONLY_KWARGS = ("s", "c", "color", "marker", "edgecolor", "edgecolors", "facecolor", "facecolors", "linewidths")
+
+
 TUFTE_COLORS = {
     "light_bg": "#ffffff",
     "dark_bg": "#151515",
@@ -47,33 +68,42 @@ TUFTE_COLORS = {
 }
 
 
+_retina_shells: set = set()
+
+
 def _maybe_set_retina() -> None:
     """Make notebook output crisper if running inside IPython."""
+    # A running IPython shell has always imported IPython; plain scripts skip the import.
+    if "IPython" not in sys.modules:
+        return
     try:
         from IPython import get_ipython  # type: ignore
         ip = get_ipython()
-        if ip is not None:
+        if ip is not None and id(ip) not in _retina_shells:
             ip.run_line_magic("config", "InlineBackend.figure_format = 'retina'")
+            _retina_shells.add(id(ip))
     except Exception:
         pass
 
 
-def set_beautiful_style(*, medium: str = "notebook", background: str = "light", font_scale: float = 1.0, dpi: int = 150) -> VizConfig:
-    """Set global plotting defaults.
+@lru_cache(maxsize=None)
+def _seaborn_rc(medium: str, font_scale: float) -> Optional[Dict[str, Any]]:
+    """Seaborn's white style, context, and colorblind palette as one rc dict, or None."""
+    try:
+        import seaborn as sns  # type: ignore
+        rc = dict(sns.axes_style("white"))
+        rc.update(sns.plotting_context(medium, font_scale=font_scale))
+        rc["axes.prop_cycle"] = mpl.cycler(color=sns.color_palette("colorblind"))
+        # sns.set_theme() also remaps the "b", "g", ... shorthands; keep that behaviour.
+        sns.set_color_codes("deep")
+    except Exception:
+        return None
+    return rc
 
-    Parameters
-    ----------
-    medium:
-        notebook | paper | slides
-    background:
-        light | dark
-    font_scale:
-        Additional scale factor applied to font sizes.
-    dpi:
-        Figure DPI for notebook rendering.
-    """
-    _maybe_set_retina()
 
+@lru_cache(maxsize=None)
+def _style_rc(medium: str, background: str, font_scale: float, dpi: int) -> Dict[str, Any]:
+    """Build the full rcParams for one style; cached, so treat the result as read-only."""
     # Base size ladder (points)
     base = {
         "paper":   {"title": 11, "label": 9,  "tick": 8,  "legend": 8},
@@ -144,18 +174,27 @@ def set_beautiful_style(*, medium: str = "notebook", background: str = "light",
         "legend.title_fontsize": legend,
     }
 
-    mpl.rcParams.update(rc)
+    # If seaborn is available, use it for coherent themes/palettes; our values win.
+    seaborn_rc = _seaborn_rc(medium, font_scale)
+    return {**seaborn_rc, **rc} if seaborn_rc else rc
 
-    # If seaborn is available, use it for coherent themes/palettes.
-    try:
-        import seaborn as sns  # type: ignore
-        sns.set_theme(style="white", context=medium)
-        sns.set_context(medium, font_scale=font_scale)
-        sns.set_palette("colorblind")
-        mpl.rcParams.update(rc)
-    except Exception:
-        pass
 
+def set_beautiful_style(*, medium: str = "notebook", background: str = "light", font_scale: float = 1.0, dpi: int = 150) -> VizConfig:
+    """Set global plotting defaults.
+
+    Parameters
+    ----------
+    medium:
+        notebook | paper | slides
+    background:
+        light | dark
+    font_scale:
+        Additional scale factor applied to font sizes.
+    dpi:
+        Figure DPI for notebook rendering.
+    """
+    _maybe_set_retina()
+    mpl.rcParams.update(_style_rc(medium, background, float(font_scale), dpi))
     return VizConfig(medium=medium, background=background, font_scale=font_scale, dpi=dpi)
 
 
@@ -294,6 +333,8 @@ def finalize_axes(
     ax.xaxis.grid(False)
 
     if tight:
+        from matplotlib.figure import Figure  # loaded already once an Axes exists
+
         fig = ax.figure
         if isinstance(fig, Figure):
             try:
@@ -302,3 +343,178 @@ def finalize_axes(
                 pass
 
     return ax
+
+
+def lttb_downsample(x: Sequence[float], y: Sequence[float], n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets downsampling of a line sorted by x.
+
+    Keeps the first and last points plus, from each of ``n_out - 2`` buckets, the
+    point forming the largest triangle with its neighbours, so peaks and dips
+    survive where plain striding would drop them. Buckets are taken over the
+    finite points; wherever non-finite points lay between two kept points a NaN
+    is put back, so the line breaks at gaps exactly as ``ax.plot`` would draw it.
+    """
+    x_arr = np.asarray(x, dtype=float)
+    y_arr = np.asarray(y, dtype=float)
+    if x_arr.ndim != 1 or x_arr.shape != y_arr.shape:
+        raise ValueError("x and y must be 1-D sequences of equal length")
+    if n_out < 3:
+        raise ValueError("n_out must be at least 3")
+    finite = np.isfinite(x_arr) & np.isfinite(y_arr)
+    positions = np.flatnonzero(finite)
+    fx, fy = x_arr[positions], y_arr[positions]
+    n = fx.size
+    if n <= n_out:
+        selected = np.arange(n)
+    else:
+        # Bucket i covers indices [edges[i], edges[i + 1]); the endpoints sit outside all buckets.
+        edges = np.floor(np.linspace(1, n - 1, n_out - 1)).astype(np.intp)
+        selected = np.empty(n_out, dtype=np.intp)
+        selected[0], selected[-1] = 0, n - 1
+        a = 0
+        for i in range(n_out - 2):
+            lo, hi = edges[i], edges[i + 1]
+            if i + 2 < edges.size:
+                avg_x = fx[hi:edges[i + 2]].mean()
+                avg_y = fy[hi:edges[i + 2]].mean()
+            else:
+                avg_x, avg_y = fx[-1], fy[-1]
+            area = np.abs((fx[a] - avg_x) * (fy[lo:hi] - fy[a]) - (fx[a] - fx[lo:hi]) * (avg_y - fy[a]))
+            a = lo + int(area.argmax())
+            selected[i + 1] = a
+
+    out_x, out_y = fx[selected], fy[selected]
+    if positions.size == x_arr.size:
+        return out_x, out_y
+    # A gap lies between two kept points when the count of non-finite points before them differs.
+    missing_before = np.cumsum(~finite)[positions[selected]]
+    gaps = np.flatnonzero(np.diff(missing_before)) + 1
+    return np.insert(out_x, gaps, np.nan), np.insert(out_y, gaps, np.nan)
+
+
+def _bin_counts(x: np.ndarray, y: np.ndarray, bins: int) -> tuple[np.ndarray, tuple[float, float, float, float]]:
+    """Count points on a ``bins`` x ``bins`` grid with one bincount (no per-point Python work)."""
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    if x.size == 0:
+        return np.zeros((bins, bins)), (0.0, 1.0, 0.0, 1.0)
+    extent = []
+    indices = []
+    for values in (x, y):
+        lo, hi = float(values.min()), float(values.max())
+        if hi == lo:
+            lo, hi = lo - 0.5, hi + 0.5
+        extent.extend((lo, hi))
+        indices.append(np.minimum(((values - lo) * (bins / (hi - lo))).astype(np.intp), bins - 1))
+    counts = np.bincount(indices[1] * bins + indices[0], minlength=bins * bins).reshape(bins, bins)
+    return counts, (extent[0], extent[1], extent[2], extent[3])
+
+
+def fast_scatter(
+    ax: Axes,
+    x: Sequence[float],
+    y: Sequence[float],
+    *,
+    mode: str = "auto",
+    bins: int = 400,
+    gridsize: int = 100,
+    cmap: str = "viridis",
+    thresholds: Optional[LargeDataThresholds] = None,
+    **kwargs,
+) -> Axes:
+    """Scatter that stays fast and small at millions of points.
+
+    ``mode="auto"`` draws plain markers up to ``thresholds.rasterize_points``,
+    rasterized markers up to ``thresholds.bin_points``, and a log-scaled 2D
+    density image above that. ``"bin"`` falls back to ``"hexbin"`` on log axes,
+    where a linear grid would distort. Other modes: ``"points"``, ``"raster"``,
+    ``"bin"``, ``"hexbin"``. Extra keyword arguments go to the underlying
+    ``scatter`` / ``imshow`` / ``hexbin`` call (marker styling such as ``s`` or
+    ``color`` is dropped once points are binned); the density mappable for a
+    colorbar is ``ax.images[-1]`` (bin) or ``ax.collections[-1]`` (hexbin).
+    """
+    from matplotlib.colors import LogNorm
+
+    limits = thresholds or LARGE_DATA
+    x_arr = np.asarray(x, dtype=float).ravel()
+    y_arr = np.asarray(y, dtype=float).ravel()
+    if mode == "auto":
+        n = x_arr.size
+        mode = "points" if n <= limits.rasterize_points else "raster" if n <= limits.bin_points else "bin"
+    if mode == "bin" and "log" in (ax.get_xscale(), ax.get_yscale()):
+        mode = "hexbin"
+
+    if mode in ("points", "raster"):
+        if mode == "raster":
+            kwargs.setdefault("rasterized", True)
+        ax.scatter(x_arr, y_arr, **kwargs)
+        return ax
+
+    for key in _MARKER_ONLY_KWARGS:
+        kwargs.pop(key, None)
+    if mode == "bin":
+        counts, extent = _bin_counts(x_arr, y_arr, bins)
+        kwargs.setdefault("norm", LogNorm())
+        ax.imshow(
+            np.ma.masked_equal(counts, 0),
+            origin="lower",
+            extent=extent,
+            aspect="auto",
+            interpolation="nearest",
+            cmap=cmap,
+            **kwargs,
+        )
+    elif mode == "hexbin":
+        kwargs.setdefault("rasterized", True)
+        ax.hexbin(
+            x_arr,
+            y_arr,
+            gridsize=gridsize,
+            bins="log",
+            mincnt=1,
+            cmap=cmap,
+            xscale=ax.get_xscale(),
+            yscale=ax.get_yscale(),
+            **kwargs,
+        )
+    else:
+        raise ValueError(f"Unknown mode {mode!r}; expected auto, points, raster, bin, or hexbin")
+    return ax
+
+
+def fast_line(
+    ax: Axes,
+    x: Sequence[float],
+    y: Sequence[float],
+    *,
+    max_points: Optional[int] = None,
+    thresholds: Optional[LargeDataThresholds] = None,
+    **kwargs,
+) -> Axes:
+    """Plot a long line (coverage, abundance along a genome) via LTTB downsampling.
+
+    Lines longer than ``max_points`` (default ``thresholds.line_points``, at least 3)
+    are reduced with :func:`lttb_downsample`; x must be 1-D and sorted. As with
+    ``ax.plot``, a 2-D ``y`` of shape ``(len(x), k)`` draws one line per column;
+    each column is downsampled on its own, and NaN gaps stay breaks in the line.
+    Anything still above ``thresholds.rasterize_points`` is rasterized. Keyword
+    arguments go to ``ax.plot``.
+    """
+    limits = thresholds or LARGE_DATA
+    max_points = limits.line_points if max_points is None else max_points
+    if max_points < 3:
+        raise ValueError(f"max_points must be at least 3 (LTTB keeps both endpoints), got {max_points}")
+    x_arr = np.asarray(x, dtype=float)
+    y_arr = np.asarray(y, dtype=float)
+    if x_arr.ndim != 1 or y_arr.ndim not in (1, 2) or y_arr.shape[0] != x_arr.size:
+        raise ValueError(
+            f"fast_line needs 1-D x and y of shape (len(x),) or (len(x), k); got {x_arr.shape} and {y_arr.shape}"
+        )
+    kwargs.setdefault("rasterized", min(x_arr.size, max_points) > limits.rasterize_points)
+    if x_arr.size <= max_points:
+        ax.plot(x_arr, y_arr, **kwargs)
+        return ax
+    for column in y_arr.reshape(x_arr.size, -1).T:
+        ax.plot(*lttb_downsample(x_arr, column, max_points), **kwargs)
+    return ax
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark render time and file size of large scatter/line plots.
+
+Compares plain matplotlib calls against the `fast_scatter` / `fast_line` paths in
+`assets/beautiful_style.py` on synthetic per-gene abundance (scatter) and
+genome-wide coverage (line) data.
+
+Usage:
+    python scripts/benchmark_large_data.py --sizes 1e5 1e6 1e7 --formats png pdf
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "assets"))
+from beautiful_style import fast_line, fast_scatter, set_beautiful_style  # noqa: E402
+
+
+def make_data(n: int, seed: int = 0) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    expression = rng.lognormal(mean=2.0, sigma=1.5, size=n)
+    return {
+        "scatter_x": np.log10(expression),
+        "scatter_y": np.log10(expression * rng.lognormal(0.0, 0.5, size=n)),
+        "line_x": np.arange(n, dtype=float),
+        "line_y": np.maximum(0.0, 30 + np.cumsum(rng.normal(0.0, 1.0, size=n)) / np.sqrt(n) * 10 + rng.normal(0, 3, n)),
+    }
+
+
+def render(draw: Callable[[Any], None], fmt: str) -> Dict[str, float]:
+    started = time.perf_counter()
+    fig, ax = plt.subplots(figsize=(6, 4))
+    draw(ax)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt)
+    plt.close(fig)
+    return {"seconds": round(time.perf_counter() - started, 3), "bytes": buffer.tell()}
+
+
+def run(sizes: List[int], formats: List[str], naive_limit: int) -> List[Dict[str, Any]]:
+    rows = []
+    for n in sizes:
+        data = make_data(n)
+        cases = {
+            ("scatter", "naive"): lambda ax: ax.scatter(data["scatter_x"], data["scatter_y"], s=2),
+            ("scatter", "fast"): lambda ax: fast_scatter(ax, data["scatter_x"], data["scatter_y"], s=2),
+            ("line", "naive"): lambda ax: ax.plot(data["line_x"], data["line_y"], linewidth=0.5),
+            ("line", "fast"): lambda ax: fast_line(ax, data["line_x"], data["line_y"], linewidth=0.5),
+        }
+        for (kind, strategy), draw in cases.items():
+            for fmt in formats:
+                if strategy == "naive" and n > naive_limit:
+                    continue
+                rows.append({"points": n, "plot": kind, "strategy": strategy, "format": fmt, **render(draw, fmt)})
+    return rows
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    lines = ["| Points | Plot | Strategy | Format | Render (s) | Size (KB) |", "|---:|---|---|---|---:|---:|"]
+    for row in rows:
+        lines.append(
+            f"| {row['points']:.0e} | {row['plot']} | {row['strategy']} | {row['format']} | "
+            f"{row['seconds']:.2f} | {row['bytes'] / 1024:,.0f} |"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark large-data plotting fast paths")
+    parser.add_argument("--sizes", nargs="+", type=float, default=[1e5, 1e6, 1e7], help="Point counts")
+    parser.add_argument("--formats", nargs="+", default=["png", "pdf"], help="Output formats (png, pdf, svg)")
+    parser.add_argument(
+        "--naive-limit",
+        type=float,
+        default=1e6,
+        help="Skip plain matplotlib above this many points (vector files get very large)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON rows instead of a Markdown table")
+    args = parser.parse_args()
+
+    set_beautiful_style(medium="paper")
+    rows = run([int(size) for size in args.sizes], args.formats, int(args.naive_limit))
+    print(json.dumps(rows, indent=2) if args.json else format_table(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,12 @@ This script is intentionally conservative:
 - It reads `.command.sh` when present and embeds it into the manifest.
 - It does NOT guess tool versions.
 
+Large runs (100k+ tasks) are handled as a stream: trace rows are read lazily,
+work directories are probed by a bounded thread pool (each stat is slow on
+NFS/Lustre), and steps are written to the manifest as they complete.
+`--dedup-commands` stores each distinct command body once under a top-level
+`commands` map keyed by SHA-256 and points steps at it.
+
 Usage:
   python scripts/extract_nextflow_run.py --trace trace.txt --workdir work --out run_manifest.yaml \
       --pipeline-name rnaseq --commit-sha <sha> --launch-command "nextflow run ..."
@@ -15,15 +21,24 @@ Usage:
 
 import argparse
 import csv
+import hashlib
 import json
+import os
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, Any, Optional, TextIO, Tuple
 
-import yaml
+COMMAND_FILES = ('.command.sh', '.command.run', '.command.bash')
+# Probes kept in flight per thread; bounds memory while keeping the pool busy.
+PROBE_WINDOW_PER_WORKER = 8
 
 
 def sniff_dialect(path: Path) -> csv.Dialect:
-    sample = path.read_text(errors='ignore')[:4096]
+    with path.open(errors='ignore') as f:
+        sample = f.read(4096)
     try:
         return csv.Sniffer().sniff(sample, delimiters=[',', '\t'])
     except Exception:
@@ -39,14 +54,157 @@ def sniff_dialect(path: Path) -> csv.Dialect:
         return Tab()
 
 
-def read_command(work_task_dir: Path) -> Optional[str]:
-    for fname in ['.command.sh', '.command.run', '.command.bash']:
-        p = work_task_dir / fname
-        if p.exists():
-            return p.read_text(errors='ignore')
+def iter_trace(path: Path) -> Iterator[Dict[str, str]]:
+    dialect = sniff_dialect(path)
+    with path.open(newline='', errors='ignore') as f:
+        yield from csv.DictReader(f, dialect=dialect)
+
+
+@lru_cache(maxsize=None)
+def list_bucket(bucket: str) -> Tuple[str, ...]:
+    """Sorted task directory names under one `work/xx/` bucket (listed once)."""
+    try:
+        with os.scandir(bucket) as entries:
+            return tuple(sorted(entry.name for entry in entries if entry.is_dir()))
+    except OSError:
+        return ()
+
+
+def resolve_task_dir(workdir: str, task_hash: str) -> Optional[str]:
+    """Map a trace hash to its work directory without guessing.
+
+    Trace hashes are abbreviated (`45/ab752a` for `work/45/ab752a9f...`), so the
+    name is matched by prefix against the cached bucket listing; a prefix that
+    matches more than one directory is left unresolved.
+    """
+    bucket, _, prefix = task_hash.partition('/')
+    if not prefix or '/' in prefix:
+        path = os.path.join(workdir, task_hash)
+        return path if os.path.isdir(path) else None
+    names = list_bucket(os.path.join(workdir, bucket))
+    i = bisect_left(names, prefix)
+    if i == len(names) or not names[i].startswith(prefix):
+        return None
+    if names[i] != prefix and i + 1 < len(names) and names[i + 1].startswith(prefix):
+        return None
+    return os.path.join(workdir, bucket, names[i])
+
+
+def read_command(work_task_dir: str) -> Optional[str]:
+    for fname in COMMAND_FILES:
+        try:
+            with open(os.path.join(work_task_dir, fname), errors='ignore') as f:
+                return f.read()
+        except OSError:
+            continue
     return None
 
 
+def probe_task(workdir: str, task_hash: str) -> Tuple[str, Optional[str]]:
+    work_task_dir = resolve_task_dir(workdir, task_hash) if task_hash else None
+    if work_task_dir is None:
+        return '', None
+    return work_task_dir, read_command(work_task_dir)
+
+
+def probe_rows(
+    rows: Iterable[Dict[str, str]], workdir: str, workers: int
+) -> Iterator[Tuple[Dict[str, str], str, Optional[str]]]:
+    """Yield `(row, workdir, command)` in trace order, probing ahead concurrently."""
+    if workers <= 1:
+        for row in rows:
+            yield (row, *probe_task(workdir, (row.get('hash') or '').strip()))
+        return
+    window: deque = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for row in rows:
+            window.append((row, pool.submit(probe_task, workdir, (row.get('hash') or '').strip())))
+            if len(window) >= workers * PROBE_WINDOW_PER_WORKER:
+                row, future = window.popleft()
+                yield (row, *future.result())
+        while window:
+            row, future = window.popleft()
+            yield (row, *future.result())
+
+
+class CommandStore:
+    """Hash command bodies; with `dedup`, keep each distinct body once."""
+
+    def __init__(self, dedup: bool):
+        self.dedup = dedup
+        self.bodies: Dict[str, str] = {}
+        self.digests = set()
+
+    def add(self, body: str) -> Tuple[str, str]:
+        digest = hashlib.sha256(body.encode('utf-8')).hexdigest()
+        self.digests.add(digest)
+        if not self.dedup:
+            return body, digest
+        self.bodies.setdefault(digest, body)
+        return f'sha256:{digest}', digest
+
+
+def iter_steps(
+    rows: Iterable[Dict[str, str]], workdir: str, workers: int, commands: CommandStore
+) -> Iterator[Dict[str, Any]]:
+    for i, (row, workdir_str, cmd) in enumerate(probe_rows(rows, workdir, workers), start=1):
+        step: Dict[str, Any] = {
+            'step_id': f'nf-task-{i}',
+            'name': (row.get('name') or '').strip() or f'task_{i}',
+            'status': (row.get('status') or '').strip(),
+            'exit_code': (row.get('exit') or '').strip(),
+            'workdir': workdir_str,
+            'command': 'NOT CAPTURED',
+        }
+        if cmd:
+            step['command'], step['command_sha256'] = commands.add(cmd)
+        step['resources'] = {
+            'duration': row.get('duration'),
+            'realtime': row.get('realtime'),
+            'cpu_pct': row.get('%cpu'),
+            'peak_rss': row.get('peak_rss'),
+            'peak_vmem': row.get('peak_vmem'),
+        }
+        yield step
+
+
+def write_json(out: TextIO, head: Dict[str, Any], steps: Iterable[Dict[str, Any]], tail) -> int:
+    """Write the same text as `json.dumps(manifest, indent=2)`, one step at a time."""
+    out.write(json.dumps(head, indent=2)[:-2])
+    out.write(',\n  "steps": [')
+    count = 0
+    for step in steps:
+        out.write(',\n' if count else '\n')
+        out.write('    ' + json.dumps(step, indent=2).replace('\n', '\n    '))
+        count += 1
+    out.write('\n  ]' if count else ']')
+    out.write(',' + json.dumps(tail(), indent=2)[1:])
+    return count
+
+
+def write_yaml(out: TextIO, head: Dict[str, Any], steps: Iterable[Dict[str, Any]], tail) -> int:
+    # Imported here so JSON output and nextflow_resource_report (which reuses
+    # iter_trace) work without PyYAML.
+    import yaml
+
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+    def dump(obj: Any) -> str:
+        return yaml.dump(obj, Dumper=dumper, sort_keys=False)
+
+    out.write(dump(head))
+    count = 0
+    for step in steps:
+        if not count:
+            out.write('steps:\n')
+        out.write(dump([step]))
+        count += 1
+    if not count:
+        out.write('steps: []\n')
+    out.write(dump(tail()))
+    return count
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument('--trace', required=True, type=Path, help='Nextflow trace file (e.g., trace.txt)')
@@ -58,43 +216,14 @@ def main():
     ap.add_argument('--commit-sha', default='', help='Commit SHA if known')
     ap.add_argument('--engine-version', default='', help='Nextflow version if known')
     ap.add_argument('--launch-command', default='', help='Exact nextflow launch command (quoted)')
+    ap.add_argument('--workers', type=int, default=16,
+                    help='Threads probing work directories (default: 16; 1 disables the pool)')
+    ap.add_argument('--dedup-commands', action='store_true',
+                    help='Store each distinct command once under `commands` and reference it as sha256:<digest>')
 
     args = ap.parse_args()
 
-    dialect = sniff_dialect(args.trace)
-    with args.trace.open(newline='', errors='ignore') as f:
-        reader = csv.DictReader(f, dialect=dialect)
-        rows = list(reader)
-
-    steps: List[Dict[str, Any]] = []
-    for i, row in enumerate(rows, start=1):
-        task_hash = (row.get('hash') or '').strip()
-        task_name = (row.get('name') or '').strip() or f'task_{i}'
-        work_task_dir = args.workdir / task_hash if task_hash else None
-
-        cmd = None
-        workdir_str = ''
-        if work_task_dir and work_task_dir.exists():
-            workdir_str = str(work_task_dir)
-            cmd = read_command(work_task_dir)
-
-        steps.append({
-            'step_id': f'nf-task-{i}',
-            'name': task_name,
-            'status': (row.get('status') or '').strip(),
-            'exit_code': (row.get('exit') or '').strip(),
-            'workdir': workdir_str,
-            'command': cmd or 'NOT CAPTURED',
-            'resources': {
-                'duration': row.get('duration'),
-                'realtime': row.get('realtime'),
-                'cpu_pct': row.get('%cpu'),
-                'peak_rss': row.get('peak_rss'),
-                'peak_vmem': row.get('peak_vmem'),
-            }
-        })
-
-    manifest: Dict[str, Any] = {
+    head: Dict[str, Any] = {
         'run_id': 'NOT CAPTURED',
         'workflow_summary': '',
         'workflow': {
@@ -111,17 +240,29 @@ def main():
                 'workdir': str(args.workdir),
             }
         },
-        'steps': steps,
-        'outputs': [],
-        'evidence': [str(args.trace), str(args.workdir)]
     }
+    commands = CommandStore(args.dedup_commands)
 
-    if args.out.suffix.lower() in {'.yml', '.yaml'}:
-        args.out.write_text(yaml.safe_dump(manifest, sort_keys=False))
-    else:
-        args.out.write_text(json.dumps(manifest, indent=2))
+    def tail() -> Dict[str, Any]:
+        rest: Dict[str, Any] = {
+            'outputs': [],
+            'evidence': [str(args.trace), str(args.workdir)]
+        }
+        if commands.dedup:
+            rest['commands'] = commands.bodies
+        return rest
+
+    steps = iter_steps(iter_trace(args.trace), str(args.workdir), args.workers, commands)
+    writer = write_yaml if args.out.suffix.lower() in {'.yml', '.yaml'} else write_json
+    partial = args.out.with_name(args.out.name + '.partial')
+    try:
+        with partial.open('w') as out:
+            count = writer(out, head, steps, tail)
+        os.replace(partial, args.out)
+    finally:
+        partial.unlink(missing_ok=True)
 
-    print(f"Wrote: {args.out}")
+    print(f"Wrote: {args.out} ({count} tasks, {len(commands.digests)} distinct commands)")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""Resource-usage and bottleneck report from a Nextflow `trace.txt`.
+
+Parses the trace into a typed task table (seconds, bytes, CPU percent) and
+summarizes it per process:
+- p50/p95/max realtime and CPU efficiency (used vs requested CPU-time),
+- peak RSS against requested memory (headroom),
+- an estimated critical path through the run,
+- processes ranked by reserved-but-unused CPU and memory, with suggested sizes.
+
+Requested resources come from the `cpus`, `memory` and `time` trace fields;
+add them to `trace.fields` in nextflow.config. When they are missing,
+efficiency and right-sizing are reported as NOT CAPTURED rather than guessed.
+Both the formatted trace and `trace.raw = true` (ms, bytes, epoch ms) parse.
+
+Usage:
+  python scripts/nextflow_resource_report.py --trace trace.txt --out resources.json \
+      --tasks-out tasks.tsv
+
+"""
+
+import argparse
+import csv
+import json
+import math
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from extract_nextflow_run import iter_trace
+
+DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0, 'd': 86400.0}
+DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(ms|d|h|m|s)')
+DURATION_FULL_RE = re.compile(r'(?:\s*\d+(?:\.\d+)?\s*(?:ms|d|h|m|s))+\s*')
+# Nextflow's MemoryUnit uses 1024 multiples with KB/MB/GB labels.
+MEMORY_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4, 'PB': 1024 ** 5}
+MEMORY_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([KMGTP]?B)', re.IGNORECASE)
+NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+FAILED_STATUSES = {'FAILED', 'ABORTED'}
+# Exit codes schedulers use for tasks killed over their memory or time limit.
+MEMORY_EXIT_CODES = {'137'}
+TIME_EXIT_CODES = {'140', '143'}
+GIB = 1024 ** 3
+NOT_CAPTURED = 'NOT CAPTURED'
+
+
+@dataclass
+class Task:
+    task_id: str
+    process: str
+    name: str
+    status: str
+    exit: str
+    submit: Optional[float]
+    start: Optional[float]
+    complete: Optional[float]
+    duration_s: Optional[float]
+    realtime_s: Optional[float]
+    cpu_pct: Optional[float]
+    peak_rss: Optional[float]
+    peak_vmem: Optional[float]
+    cpus: Optional[float]
+    memory: Optional[float]
+    time_s: Optional[float]
+
+    @property
+    def executed(self) -> bool:
+        return self.status != 'CACHED'
+
+
+def _blank(text: Optional[str]) -> Optional[str]:
+    text = (text or '').strip()
+    return None if text in {'', '-'} else text
+
+
+def parse_number(text: Optional[str]) -> Optional[float]:
+    text = _blank(text)
+    if text is None:
+        return None
+    try:
+        return float(text.rstrip('%'))
+    except ValueError:
+        return None
+
+
+def parse_duration(text: Optional[str]) -> Optional[float]:
+    """Seconds from `1h 2m 3.5s` / `350ms`, or from raw milliseconds."""
+    text = _blank(text)
+    if text is None:
+        return None
+    if NUMBER_RE.fullmatch(text):
+        return float(text) / 1000
+    if not DURATION_FULL_RE.fullmatch(text):
+        return None
+    return sum(float(value) * DURATION_UNITS[unit] for value, unit in DURATION_RE.findall(text))
+
+
+def parse_memory(text: Optional[str]) -> Optional[float]:
+    """Bytes from `1.2 GB` / `512 MB`, or from raw bytes."""
+    text = _blank(text)
+    if text is None:
+        return None
+    if NUMBER_RE.fullmatch(text):
+        return float(text)
+    match = MEMORY_RE.fullmatch(text)
+    if not match:
+        return None
+    return float(match.group(1)) * MEMORY_UNITS[match.group(2).upper()]
+
+
+def parse_timestamp(text: Optional[str]) -> Optional[float]:
+    """Seconds since the epoch from `2024-01-02 03:04:05.678`, or from raw epoch ms."""
+    text = _blank(text)
+    if text is None:
+        return None
+    if text.isdigit():
+        return int(text) / 1000
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        return None
+
+
+def parse_task(row: Dict[str, str], index: int) -> Task:
+    name = (row.get('name') or '').strip() or f'task_{index}'
+    process = (row.get('process') or '').strip() or name.split(' (', 1)[0]
+    submit = parse_timestamp(row.get('submit'))
+    duration = parse_duration(row.get('duration'))
+    realtime = parse_duration(row.get('realtime'))
+    complete = parse_timestamp(row.get('complete'))
+    if complete is None and submit is not None and duration is not None:
+        complete = submit + duration
+    start = parse_timestamp(row.get('start'))
+    if start is None and complete is not None and realtime is not None:
+        start = complete - realtime
+    return Task(
+        task_id=(row.get('task_id') or '').strip() or str(index),
+        process=process,
+        name=name,
+        status=(row.get('status') or '').strip().upper(),
+        exit=(row.get('exit') or '').strip(),
+        submit=submit,
+        start=start if start is not None else submit,
+        complete=complete,
+        duration_s=duration,
+        realtime_s=realtime,
+        cpu_pct=parse_number(row.get('%cpu')),
+        peak_rss=parse_memory(row.get('peak_rss')),
+        peak_vmem=parse_memory(row.get('peak_vmem')),
+        cpus=parse_number(row.get('cpus')),
+        memory=parse_memory(row.get('memory')),
+        time_s=parse_duration(row.get('time')),
+    )
+
+
+def read_tasks(trace: Path) -> List[Task]:
+    return [parse_task(row, i) for i, row in enumerate(iter_trace(trace), start=1)]
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """Linearly interpolated percentile (q in 0..100) of an ascending list."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q / 100
+    low = math.floor(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+def _spread(values: Iterable[Optional[float]]) -> Dict[str, Optional[float]]:
+    ordered = sorted(value for value in values if value is not None)
+    return {
+        'p50': percentile(ordered, 50),
+        'p95': percentile(ordered, 95),
+        'max': ordered[-1] if ordered else None,
+    }
+
+
+def _round_up_memory(nbytes: float) -> int:
+    step = GIB if nbytes > GIB else 256 * 1024 ** 2
+    return int(math.ceil(nbytes / step) * step)
+
+
+def format_bytes(nbytes: Optional[float]) -> str:
+    if nbytes is None:
+        return NOT_CAPTURED
+    for unit in ('PB', 'TB', 'GB', 'MB', 'KB'):
+        if nbytes >= MEMORY_UNITS[unit]:
+            return f'{nbytes / MEMORY_UNITS[unit]:.1f} {unit}'
+    return f'{nbytes:.0f} B'
+
+
+def summarize_process(process: str, tasks: List[Task], margin: float) -> Dict[str, Any]:
+    executed = [task for task in tasks if task.executed]
+    cpu_used = cpu_reserved = 0.0
+    cpu_unused_s = memory_unused_gib_s = 0.0
+    memory_ratios: List[float] = []
+    time_ratios: List[float] = []
+    for task in executed:
+        if task.realtime_s is not None and task.cpus and task.cpu_pct is not None:
+            cpu_used += task.cpu_pct / 100 * task.realtime_s
+            cpu_reserved += task.cpus * task.realtime_s
+            cpu_unused_s += max(task.cpus - task.cpu_pct / 100, 0.0) * task.realtime_s
+        if task.memory and task.peak_rss is not None:
+            memory_ratios.append(task.peak_rss / task.memory)
+            if task.realtime_s is not None:
+                memory_unused_gib_s += max(task.memory - task.peak_rss, 0.0) / GIB * task.realtime_s
+        if task.time_s and task.realtime_s is not None:
+            time_ratios.append(task.realtime_s / task.time_s)
+
+    realtime = _spread(task.realtime_s for task in executed)
+    rss = _spread(task.peak_rss for task in executed)
+    cpu = _spread(task.cpu_pct for task in executed)
+    requested_time = max((task.time_s for task in executed if task.time_s), default=None)
+    requested_cpus = max((task.cpus for task in executed if task.cpus), default=None)
+    requested_memory = max((task.memory for task in executed if task.memory), default=None)
+    failed = [task for task in tasks if task.status in FAILED_STATUSES]
+    memory_failures = sum(1 for task in failed if task.exit in MEMORY_EXIT_CODES)
+    time_failures = sum(1 for task in failed if task.exit in TIME_EXIT_CODES)
+
+    summary: Dict[str, Any] = {
+        'process': process,
+        'tasks': len(tasks),
+        'executed': len(executed),
+        'cached': len(tasks) - len(executed),
+        'failed': len(failed),
+        'limit_failures': memory_failures + time_failures,
+        'realtime_s': {**realtime, 'total': sum(task.realtime_s or 0.0 for task in executed)},
+        'cpu_pct': cpu,
+        'peak_rss_bytes': rss,
+        'requested': {
+            'cpus': requested_cpus,
+            'memory_bytes': requested_memory,
+            'time_s': requested_time,
+        },
+        'cpu_efficiency': cpu_used / cpu_reserved if cpu_reserved else None,
+        'memory_utilization_max': max(memory_ratios) if memory_ratios else None,
+        'rss_headroom': 1 - max(memory_ratios) if memory_ratios else None,
+        'time_utilization_max': max(time_ratios) if time_ratios else None,
+        'unused_cpu_hours': cpu_unused_s / 3600,
+        'unused_memory_gib_hours': memory_unused_gib_s / 3600,
+    }
+
+    suggestion: Dict[str, Any] = {}
+    if requested_memory and rss['max'] is not None:
+        suggested = _round_up_memory(rss['max'] * (1 + margin))
+        if memory_failures:
+            suggested = max(suggested, _round_up_memory(requested_memory * 1.5))
+        suggestion['memory_bytes'] = suggested
+    if requested_cpus and cpu['p95'] is not None:
+        suggestion['cpus'] = max(1, math.ceil(cpu['p95'] / 100 * (1 + margin) - 1e-9))
+    if requested_time and realtime['max'] is not None:
+        suggested = math.ceil(realtime['max'] * (1 + margin) / 60) * 60
+        if time_failures:
+            suggested = max(suggested, math.ceil(requested_time * 1.5 / 60) * 60)
+        suggestion['time_s'] = suggested
+    summary['suggested'] = suggestion or NOT_CAPTURED
+    return summary
+
+
+def critical_path(tasks: List[Task]) -> Dict[str, Any]:
+    """Estimate the critical path without a DAG (the trace records none).
+
+    Walks back from the last task to finish, each time to the latest task that
+    completed before the current one started. Gaps between the two are queue
+    or scheduling waits on the path.
+    """
+    timed = sorted(
+        (task for task in tasks if task.executed and task.start is not None and task.complete is not None),
+        key=lambda task: task.complete,
+    )
+    if not timed:
+        return {'estimated': True, 'tasks': [], 'length_s': None}
+    completes = [task.complete for task in timed]
+    path = [timed[-1]]
+    index = len(timed) - 1
+    while True:
+        current = path[-1]
+        index = min(bisect_right(completes, current.start) - 1, index - 1)
+        if index < 0:
+            break
+        path.append(timed[index])
+    path.reverse()
+
+    by_process: Dict[str, float] = defaultdict(float)
+    steps = []
+    previous_complete = None
+    for task in path:
+        busy = task.complete - task.start
+        by_process[task.process] += busy
+        steps.append({
+            'task_id': task.task_id,
+            'name': task.name,
+            'process': task.process,
+            'busy_s': busy,
+            'wait_s': task.start - previous_complete if previous_complete is not None else 0.0,
+        })
+        previous_complete = task.complete
+    run_start = min(task.submit if task.submit is not None else task.start for task in timed)
+    return {
+        'estimated': True,
+        'length_s': path[-1].complete - run_start,
+        'busy_s': sum(by_process.values()),
+        'by_process': dict(sorted(by_process.items(), key=lambda item: -item[1])),
+        'tasks': steps,
+    }
+
+
+def build_report(tasks: List[Task], *, margin: float = 0.2, gib_per_cpu: float = 4.0) -> Dict[str, Any]:
+    grouped: Dict[str, List[Task]] = defaultdict(list)
+    for task in tasks:
+        grouped[task.process].append(task)
+    processes = [summarize_process(process, members, margin) for process, members in grouped.items()]
+    processes.sort(key=lambda item: -item['realtime_s']['total'])
+
+    right_sizing = []
+    for summary in processes:
+        if summary['suggested'] == NOT_CAPTURED:
+            continue
+        # Rank on one scale: memory GiB-hours converted to CPU-hours at the node ratio.
+        score = summary['unused_cpu_hours'] + summary['unused_memory_gib_hours'] / gib_per_cpu
+        right_sizing.append({
+            'process': summary['process'],
+            'score_cpu_hours': score,
+            'requested': summary['requested'],
+            'suggested': summary['suggested'],
+            'cpu_efficiency': summary['cpu_efficiency'],
+            'memory_utilization_max': summary['memory_utilization_max'],
+            'limit_failures': summary['limit_failures'],
+        })
+    right_sizing.sort(key=lambda item: (-item['limit_failures'], -item['score_cpu_hours']))
+
+    timed = [task for task in tasks if task.executed and task.start is not None and task.complete is not None]
+    return {
+        'tasks': len(tasks),
+        'executed': sum(1 for task in tasks if task.executed),
+        'failed': sum(1 for task in tasks if task.status in FAILED_STATUSES),
+        'wall_time_s': max(t.complete for t in timed) - min(t.start for t in timed) if timed else None,
+        'cpu_hours': sum((t.cpu_pct or 0.0) / 100 * (t.realtime_s or 0.0) for t in tasks if t.executed) / 3600,
+        'requested_fields_captured': any(task.cpus or task.memory or task.time_s for task in tasks),
+        'margin': margin,
+        'processes': processes,
+        'critical_path': critical_path(tasks),
+        'right_sizing': right_sizing,
+    }
+
+
+def write_tasks(path: Path, tasks: List[Task]) -> None:
+    columns = [field.name for field in fields(Task)]
+    delimiter = ',' if path.suffix.lower() == '.csv' else '\t'
+    with path.open('w', newline='') as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        writer.writerow(columns)
+        for task in tasks:
+            writer.writerow(['' if value is None else value for value in (getattr(task, name) for name in columns)])
+
+
+def render_summary(report: Dict[str, Any], top: int) -> str:
+    lines = [
+        f"{report['tasks']} tasks ({report['executed']} executed, {report['failed']} failed); "
+        f"{report['cpu_hours']:.1f} CPU-hours",
+        '',
+        'Process                         p50 s     p95 s   CPU eff   max RSS   RSS/req',
+    ]
+    for summary in report['processes'][:top]:
+        realtime = summary['realtime_s']
+        efficiency = summary['cpu_efficiency']
+        utilization = summary['memory_utilization_max']
+        lines.append(
+            f"{summary['process'][:30]:<30} {realtime['p50'] or 0:>7.0f} {realtime['p95'] or 0:>9.0f} "
+            f"{'-' if efficiency is None else format(efficiency, '.0%'):>9} "
+            f"{format_bytes(summary['peak_rss_bytes']['max']):>9} "
+            f"{'-' if utilization is None else format(utilization, '.0%'):>9}"
+        )
+    path = report['critical_path']
+    if path['tasks']:
+        lines += ['', f"Estimated critical path: {len(path['tasks'])} tasks, {path['length_s'] / 3600:.2f} h"]
+        for process, seconds in list(path['by_process'].items())[:top]:
+            lines.append(f"  {process}: {seconds / 3600:.2f} h")
+    if report['right_sizing']:
+        lines += ['', 'Right-sizing candidates (unused CPU-hour equivalents):']
+        for item in report['right_sizing'][:top]:
+            requested, suggested = item['requested'], item['suggested']
+            change = []
+            if 'cpus' in suggested:
+                change.append(f"cpus {requested['cpus']:g} -> {suggested['cpus']}")
+            if 'memory_bytes' in suggested:
+                change.append(f"memory {format_bytes(requested['memory_bytes'])} -> {format_bytes(suggested['memory_bytes'])}")
+            if 'time_s' in suggested:
+                change.append(f"time {requested['time_s'] / 60:.0f}m -> {suggested['time_s'] / 60:.0f}m")
+            failures = f", {item['limit_failures']} limit failures" if item['limit_failures'] else ''
+            lines.append(f"  {item['process']}: {item['score_cpu_hours']:.1f}{failures}; {', '.join(change)}")
+    elif not report['requested_fields_captured']:
+        lines += ['', 'Right-sizing: NOT CAPTURED (add cpus,memory,time to trace.fields)']
+    return '\n'.join(lines)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--trace', required=True, type=Path, help='Nextflow trace file (e.g., trace.txt)')
+    ap.add_argument('--out', type=Path, help='Write the JSON report here')
+    ap.add_argument('--tasks-out', type=Path, help='Write the typed task table (.tsv or .csv)')
+    ap.add_argument('--margin', type=float, default=0.2, help='Safety margin over observed peaks (default: 0.2)')
+    ap.add_argument('--gib-per-cpu', type=float, default=4.0,
+                    help='Memory GiB counted as one CPU when ranking right-sizing (default: 4)')
+    ap.add_argument('--top', type=int, default=10, help='Rows per section in the printed summary')
+
+    args = ap.parse_args()
+
+    tasks = read_tasks(args.trace)
+    report = build_report(tasks, margin=args.margin, gib_per_cpu=args.gib_per_cpu)
+    report['trace'] = str(args.trace)
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2))
+    if args.tasks_out:
+        write_tasks(args.tasks_out, tasks)
+    print(render_summary(report, args.top))
+
+
+if __name__ == '__main__':
+    main()
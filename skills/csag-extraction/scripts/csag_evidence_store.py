@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+"""Cross-paper CSAG evidence store.
+
+Loads `paper_extraction.json` files into one local SQLite database so
+assertions, evidence items, evidence links and entities can be queried across
+papers without re-parsing every JSON file.
+
+- `ingest` adds or refreshes extractions. Unchanged files are skipped by SHA-256.
+  A changed file replaces that paper's rows in one transaction.
+- `query` answers questions such as "assertions supporting entity X with strong
+  evidence". It uses indexes on entity terms, claim_role, polarity/strength and DOI.
+- `stats` prints row counts and the claim_role / polarity distributions.
+
+Entity IDs are paper-local, so entities are matched across papers by normalized
+terms: label, aliases, ontology term IDs and xrefs. Assertions are linked to
+entities through subject/object, context facets, qualifiers and conditions.
+
+Examples:
+  python3 csag_evidence_store.py ingest store.sqlite work/
+  python3 csag_evidence_store.py query store.sqlite --entity NCBITaxon:10239 \\
+      --polarity supports --min-strength strong
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from csag_quality_report import DEFAULT_EXTRACTION_NAME, collect_corpus
+from validate_paper_extraction import default_report_path
+
+SCHEMA_VERSION = 1
+STRENGTH_RANKS = {"unknown": 0, "very_weak": 1, "weak": 2, "moderate": 3, "strong": 4, "very_strong": 5}
+CONTEXT_ENTITY_FIELDS = ("organism", "cell_type", "tissue", "disease_state", "strain")
+INSERT_BATCH_PAPERS = 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS papers (
+    paper_key INTEGER PRIMARY KEY,
+    extraction_id TEXT NOT NULL UNIQUE,
+    path TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    doi TEXT,
+    pmid TEXT,
+    title TEXT,
+    validation_ok INTEGER,
+    ingested_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entities (
+    paper_key INTEGER NOT NULL REFERENCES papers(paper_key) ON DELETE CASCADE,
+    entity_id TEXT NOT NULL,
+    label TEXT,
+    entity_category TEXT,
+    PRIMARY KEY (paper_key, entity_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS entity_terms (
+    term TEXT NOT NULL,
+    paper_key INTEGER NOT NULL REFERENCES papers(paper_key) ON DELETE CASCADE,
+    entity_id TEXT NOT NULL,
+    PRIMARY KEY (term, paper_key, entity_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS assertions (
+    paper_key INTEGER NOT NULL REFERENCES papers(paper_key) ON DELETE CASCADE,
+    assertion_id TEXT NOT NULL,
+    assertion_text TEXT,
+    claim_role TEXT,
+    criticality TEXT,
+    normalization_status TEXT,
+    subject TEXT,
+    predicate TEXT,
+    object TEXT,
+    curation_status TEXT,
+    PRIMARY KEY (paper_key, assertion_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS assertion_entities (
+    paper_key INTEGER NOT NULL REFERENCES papers(paper_key) ON DELETE CASCADE,
+    entity_id TEXT NOT NULL,
+    assertion_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    PRIMARY KEY (paper_key, entity_id, assertion_id, role)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS evidence_items (
+    paper_key INTEGER NOT NULL REFERENCES papers(paper_key) ON DELETE CASCADE,
+    evidence_id TEXT NOT NULL,
+    evidence_type TEXT,
+    evidence_text TEXT,
+    PRIMARY KEY (paper_key, evidence_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS evidence_links (
+    paper_key INTEGER NOT NULL REFERENCES papers(paper_key) ON DELETE CASCADE,
+    link_id TEXT NOT NULL,
+    assertion_id TEXT,
+    evidence_id TEXT,
+    polarity TEXT,
+    strength TEXT,
+    strength_rank INTEGER,
+    rationale TEXT,
+    PRIMARY KEY (paper_key, link_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS papers_doi ON papers (doi);
+CREATE INDEX IF NOT EXISTS entity_terms_paper ON entity_terms (paper_key);
+CREATE INDEX IF NOT EXISTS assertions_claim_role ON assertions (claim_role);
+CREATE INDEX IF NOT EXISTS links_assertion ON evidence_links (paper_key, assertion_id);
+CREATE INDEX IF NOT EXISTS links_polarity_strength ON evidence_links (polarity, strength_rank);
+"""
+TABLES = ("entities", "entity_terms", "assertions", "assertion_entities", "evidence_items", "evidence_links")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load CSAG extractions into a SQLite store and query them across papers.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest_cmd = subparsers.add_parser("ingest", help="Add or refresh extractions in the store.")
+    ingest_cmd.add_argument("db", type=Path, help="SQLite store (created if missing).")
+    ingest_cmd.add_argument(
+        "paths",
+        type=Path,
+        nargs="+",
+        help=f"Extraction JSON files, or directories searched recursively for {DEFAULT_EXTRACTION_NAME}.",
+    )
+    ingest_cmd.add_argument("--extraction-name", default=DEFAULT_EXTRACTION_NAME, help="Extraction filename to look for in directories.")
+    ingest_cmd.add_argument(
+        "--require-valid",
+        action="store_true",
+        help="Only ingest extractions whose <stem>.validation.json report exists and is ok.",
+    )
+    ingest_cmd.add_argument("--prune", action="store_true", help="Drop papers whose extraction file no longer exists.")
+    ingest_cmd.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes used to parse extractions.")
+
+    query_cmd = subparsers.add_parser("query", help="Query assertions and their evidence across papers.")
+    query_cmd.add_argument("db", type=Path)
+    query_cmd.add_argument("--entity", action="append", default=None, help="Entity label, alias, ontology term ID, or xref. Repeat to require all.")
+    query_cmd.add_argument("--entity-role", default=None, help="Restrict entity matches to a role such as subject, object, organism, or qualifier.")
+    query_cmd.add_argument("--claim-role", action="append", default=None, help="Assertion claim_role; repeat for several.")
+    query_cmd.add_argument("--criticality", action="append", default=None, help="Assertion criticality; repeat for several.")
+    query_cmd.add_argument("--polarity", action="append", default=None, help="Evidence link polarity; repeat for several.")
+    query_cmd.add_argument("--min-strength", choices=tuple(STRENGTH_RANKS), default=None, help="Minimum evidence link strength.")
+    query_cmd.add_argument("--doi", default=None, help="Restrict to one paper by DOI.")
+    query_cmd.add_argument("--text", default=None, help="Case-insensitive substring of the assertion text.")
+    query_cmd.add_argument("--valid-only", action="store_true", help="Only papers whose validation report was ok at ingest.")
+    query_cmd.add_argument("--limit", type=int, default=200, help="Maximum rows (0 for no limit).")
+    query_cmd.add_argument("--format", choices=("text", "jsonl", "csv"), default="text")
+
+    stats_cmd = subparsers.add_parser("stats", help="Summarize the store.")
+    stats_cmd.add_argument("db", type=Path)
+    return parser.parse_args()
+
+
+def normalize_term(value: object) -> str | None:
+    if not isinstance(value, str):
+        return None
+    term = " ".join(value.split()).casefold()
+    return term or None
+
+
+def normalize_doi(value: object) -> str | None:
+    term = normalize_term(value)
+    if term is None:
+        return None
+    for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
+        if term.startswith(prefix):
+            term = term[len(prefix):]
+    return term
+
+
+def dict_items(value: object) -> list[dict]:
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+def text_or_none(value: object) -> str | None:
+    return value if isinstance(value, str) and value else None
+
+
+def entity_terms(entity: dict) -> set[str]:
+    # The entity's own id is paper-local ("N1"), so it is never a cross-paper term.
+    values: list[object] = [entity.get("label")]
+    aliases = entity.get("aliases")
+    if isinstance(aliases, list):
+        values.extend(aliases)
+    xrefs = entity.get("xrefs")
+    if isinstance(xrefs, list):
+        values.extend(xrefs)
+    for annotation in dict_items(entity.get("ontology_annotations")):
+        values.append(annotation.get("term_id"))
+        values.append(annotation.get("term_label"))
+    return {term for term in map(normalize_term, values) if term}
+
+
+def assertion_entity_refs(assertion: dict) -> Iterable[tuple[str, str]]:
+    """(entity ref, role) pairs for every Entity reference on an assertion."""
+    for role in ("subject", "object"):
+        ref = assertion.get(role)
+        if isinstance(ref, str) and ref:
+            yield ref, role
+    for context in dict_items(assertion.get("contexts")):
+        for role in CONTEXT_ENTITY_FIELDS:
+            ref = context.get(role)
+            if isinstance(ref, str) and ref:
+                yield ref, role
+        for qualifier in dict_items(context.get("additional_context_qualifiers")):
+            ref = qualifier.get("value_entity_ref")
+            if isinstance(ref, str) and ref:
+                yield ref, "qualifier"
+    for qualifier in dict_items(assertion.get("qualifiers")):
+        ref = qualifier.get("value_entity_ref")
+        if isinstance(ref, str) and ref:
+            yield ref, "qualifier"
+    for condition in dict_items(assertion.get("conditions")):
+        ref = condition.get("entity_involved")
+        if isinstance(ref, str) and ref:
+            yield ref, "condition"
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def validation_status(extraction_path: Path) -> bool | None:
+    report_path = default_report_path(extraction_path)
+    if not report_path.exists():
+        return None
+    try:
+        return bool(json.loads(report_path.read_text(encoding="utf-8")).get("ok"))
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return False
+
+
+def paper_rows(path_text: str) -> dict[str, Any]:
+    """Parse one extraction into row tuples (paper_key filled in by the writer)."""
+    path = Path(path_text)
+    try:
+        extraction = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        return {"path": path_text, "error": f"{type(exc).__name__}: {exc}"}
+    if not isinstance(extraction, dict):
+        return {"path": path_text, "error": "extraction JSON is not an object"}
+
+    entities = []
+    terms: set[tuple[str, str]] = set()
+    entity_ids: set[str] = set()
+    for entity in dict_items(extraction.get("entities")):
+        entity_id = entity.get("id")
+        if not isinstance(entity_id, str) or not entity_id or entity_id in entity_ids:
+            continue
+        entity_ids.add(entity_id)
+        entities.append((entity_id, text_or_none(entity.get("label")), text_or_none(entity.get("entity_category"))))
+        terms.update((term, entity_id) for term in entity_terms(entity))
+
+    assertions = []
+    assertion_entities: set[tuple[str, str, str]] = set()
+    seen_assertions: set[str] = set()
+    for assertion in dict_items(extraction.get("assertions")):
+        assertion_id = assertion.get("id")
+        if not isinstance(assertion_id, str) or not assertion_id or assertion_id in seen_assertions:
+            continue
+        seen_assertions.add(assertion_id)
+        assertions.append(
+            (
+                assertion_id,
+                text_or_none(assertion.get("assertion_text")),
+                text_or_none(assertion.get("claim_role")),
+                text_or_none(assertion.get("criticality")),
+                text_or_none(assertion.get("normalization_status")),
+                text_or_none(assertion.get("subject")),
+                text_or_none(assertion.get("predicate")),
+                text_or_none(assertion.get("object")),
+                text_or_none(assertion.get("curation_status")),
+            )
+        )
+        for ref, role in assertion_entity_refs(assertion):
+            assertion_entities.add((ref, assertion_id, role))
+            if ref not in entity_ids and ":" in ref:
+                # A bare CURIE used directly as a reference is still matchable by that CURIE.
+                term = normalize_term(ref)
+                if term:
+                    terms.add((term, ref))
+
+    evidence_items = []
+    seen_evidence: set[str] = set()
+    for item in dict_items(extraction.get("evidence_items")):
+        evidence_id = item.get("id")
+        if not isinstance(evidence_id, str) or not evidence_id or evidence_id in seen_evidence:
+            continue
+        seen_evidence.add(evidence_id)
+        evidence_items.append((evidence_id, text_or_none(item.get("evidence_type")), text_or_none(item.get("evidence_text"))))
+
+    links = []
+    seen_links: set[str] = set()
+    for link in dict_items(extraction.get("evidence_links")):
+        link_id = link.get("id")
+        if not isinstance(link_id, str) or not link_id or link_id in seen_links:
+            continue
+        seen_links.add(link_id)
+        strength = text_or_none(link.get("strength"))
+        links.append(
+            (
+                link_id,
+                text_or_none(link.get("assertion")),
+                text_or_none(link.get("evidence_item")),
+                text_or_none(link.get("polarity")),
+                strength,
+                STRENGTH_RANKS.get(strength) if strength else None,
+                text_or_none(link.get("rationale")),
+            )
+        )
+
+    extraction_id = extraction.get("id")
+    return {
+        "path": path_text,
+        "paper": {
+            "extraction_id": extraction_id if isinstance(extraction_id, str) and extraction_id else f"path:{path_text}",
+            "doi": normalize_doi(extraction.get("doi")),
+            "pmid": text_or_none(extraction.get("pmid")),
+            "title": text_or_none(extraction.get("title")),
+        },
+        "entities": entities,
+        "entity_terms": sorted(terms),
+        "assertions": assertions,
+        "assertion_entities": sorted(assertion_entities),
+        "evidence_items": evidence_items,
+        "evidence_links": links,
+    }
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    db_path = db_path.expanduser().resolve()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.executescript(SCHEMA)
+    row = connection.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is None:
+        connection.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+    elif int(row["value"]) != SCHEMA_VERSION:
+        raise SystemExit(f"{db_path} uses store schema {row['value']}; this script writes schema {SCHEMA_VERSION}. Rebuild the store.")
+    return connection
+
+
+def collect_extractions(paths: list[Path], extraction_name: str) -> list[Path]:
+    found: list[Path] = []
+    for path in paths:
+        path = path.expanduser().resolve()
+        if path.is_dir():
+            found.extend(collect_corpus(path, extraction_name))
+        elif path.is_file():
+            found.append(path)
+        else:
+            raise SystemExit(f"Path not found: {path}")
+    return sorted(set(found))
+
+
+def write_paper(connection: sqlite3.Connection, rows: dict[str, Any], sha256: str, validation_ok: bool | None) -> None:
+    paper = rows["paper"]
+    existing = connection.execute(
+        "SELECT path FROM papers WHERE extraction_id = ? AND path != ?", (paper["extraction_id"], rows["path"])
+    ).fetchone()
+    if existing is not None and Path(existing["path"]).exists():
+        raise ValueError(f"extraction id {paper['extraction_id']} is already ingested from {existing['path']}")
+    connection.execute("DELETE FROM papers WHERE extraction_id = ? OR path = ?", (paper["extraction_id"], rows["path"]))
+    cursor = connection.execute(
+        "INSERT INTO papers (extraction_id, path, sha256, doi, pmid, title, validation_ok, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            paper["extraction_id"],
+            rows["path"],
+            sha256,
+            paper["doi"],
+            paper["pmid"],
+            paper["title"],
+            None if validation_ok is None else int(validation_ok),
+            datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        ),
+    )
+    paper_key = cursor.lastrowid
+    connection.executemany("INSERT INTO entities VALUES (?, ?, ?, ?)", ((paper_key, *row) for row in rows["entities"]))
+    connection.executemany("INSERT INTO entity_terms VALUES (?, ?, ?)", ((term, paper_key, entity_id) for term, entity_id in rows["entity_terms"]))
+    connection.executemany("INSERT INTO assertions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", ((paper_key, *row) for row in rows["assertions"]))
+    connection.executemany(
+        "INSERT INTO assertion_entities VALUES (?, ?, ?, ?)",
+        ((paper_key, ref, assertion_id, role) for ref, assertion_id, role in rows["assertion_entities"]),
+    )
+    connection.executemany("INSERT INTO evidence_items VALUES (?, ?, ?, ?)", ((paper_key, *row) for row in rows["evidence_items"]))
+    connection.executemany("INSERT INTO evidence_links VALUES (?, ?, ?, ?, ?, ?, ?, ?)", ((paper_key, *row) for row in rows["evidence_links"]))
+
+
+def ingest(
+    connection: sqlite3.Connection,
+    paths: list[Path],
+    *,
+    require_valid: bool = False,
+    prune: bool = False,
+    workers: int = 1,
+) -> dict[str, Any]:
+    """Ingest extraction files; returns counts plus per-file failures."""
+    known = {
+        row["path"]: (row["sha256"], None if row["validation_ok"] is None else bool(row["validation_ok"]))
+        for row in connection.execute("SELECT path, sha256, validation_ok FROM papers")
+    }
+    summary: dict[str, Any] = {
+        "ingested": 0,
+        "unchanged": 0,
+        "revalidated": 0,
+        "skipped_invalid": 0,
+        "pruned": 0,
+        "failed": [],
+    }
+
+    pending: list[tuple[Path, str, bool | None]] = []
+    revalidated: list[tuple[int | None, str]] = []
+    for path in paths:
+        validation_ok = validation_status(path)
+        stored = known.get(str(path))
+        # The report can change without the extraction changing; keep the stored status current.
+        if stored is not None and stored[1] != validation_ok:
+            revalidated.append((None if validation_ok is None else int(validation_ok), str(path)))
+        if require_valid and validation_ok is not True:
+            summary["skipped_invalid"] += 1
+            continue
+        sha256 = sha256_file(path)
+        if stored is not None and stored[0] == sha256:
+            summary["unchanged"] += 1
+            continue
+        pending.append((path, sha256, validation_ok))
+
+    if revalidated:
+        connection.execute("BEGIN")
+        connection.executemany("UPDATE papers SET validation_ok = ? WHERE path = ?", revalidated)
+        connection.execute("COMMIT")
+        summary["revalidated"] = len(revalidated)
+
+    if prune:
+        missing = [(path,) for path in known if not Path(path).exists()]
+        connection.execute("BEGIN")
+        connection.executemany("DELETE FROM papers WHERE path = ?", missing)
+        connection.execute("COMMIT")
+        summary["pruned"] = len(missing)
+
+    path_texts = [str(path) for path, _, _ in pending]
+    if workers > 1 and len(pending) > 1:
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(pending)))
+        parsed = executor.map(paper_rows, path_texts, chunksize=4)
+    else:
+        executor = None
+        parsed = map(paper_rows, path_texts)
+    try:
+        batch = 0
+        connection.execute("BEGIN")
+        for (path, sha256, validation_ok), rows in zip(pending, parsed):
+            if "error" in rows:
+                summary["failed"].append({"path": rows["path"], "error": rows["error"]})
+                continue
+            connection.execute("SAVEPOINT paper")
+            try:
+                write_paper(connection, rows, sha256, validation_ok)
+            except (ValueError, sqlite3.IntegrityError) as exc:
+                connection.execute("ROLLBACK TO paper")
+                connection.execute("RELEASE paper")
+                summary["failed"].append({"path": rows["path"], "error": str(exc)})
+                continue
+            connection.execute("RELEASE paper")
+            summary["ingested"] += 1
+            batch += 1
+            if batch >= INSERT_BATCH_PAPERS:
+                connection.execute("COMMIT")
+                connection.execute("BEGIN")
+                batch = 0
+        connection.execute("COMMIT")
+    except BaseException:
+        if connection.in_transaction:
+            connection.execute("ROLLBACK")
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return summary
+
+
+def build_query(args: argparse.Namespace) -> tuple[str, list[Any]]:
+    """Assertion × evidence-link rows filtered by the query flags."""
+    where: list[str] = []
+    params: list[Any] = []
+    link_filtered = bool(args.polarity or args.min_strength)
+
+    for entity in args.entity or []:
+        term = normalize_term(entity)
+        role_clause = ""
+        if args.entity_role:
+            role_clause = " AND ae.role = ?"
+        where.append(
+            "(a.paper_key, a.assertion_id) IN ("
+            "SELECT ae.paper_key, ae.assertion_id FROM entity_terms t "
+            "JOIN assertion_entities ae ON ae.paper_key = t.paper_key AND ae.entity_id = t.entity_id "
+            f"WHERE t.term = ?{role_clause})"
+        )
+        params.append(term)
+        if args.entity_role:
+            params.append(args.entity_role)
+    for column, values in (("a.claim_role", args.claim_role), ("a.criticality", args.criticality), ("l.polarity", args.polarity)):
+        if values:
+            where.append(f"{column} IN ({', '.join('?' for _ in values)})")
+            params.extend(values)
+    if args.min_strength:
+        where.append("l.strength_rank >= ?")
+        params.append(STRENGTH_RANKS[args.min_strength])
+    if args.doi:
+        where.append("p.doi = ?")
+        params.append(normalize_doi(args.doi))
+    if args.text:
+        where.append("instr(lower(a.assertion_text), ?) > 0")
+        params.append(args.text.lower())
+    if args.valid_only:
+        where.append("p.validation_ok = 1")
+
+    sql = (
+        "SELECT p.doi, p.title, p.extraction_id, a.assertion_id, a.claim_role, a.criticality, a.assertion_text, "
+        "l.link_id, l.polarity, l.strength, e.evidence_id, e.evidence_type, e.evidence_text "
+        "FROM assertions a JOIN papers p ON p.paper_key = a.paper_key "
+        f"{'JOIN' if link_filtered else 'LEFT JOIN'} evidence_links l ON l.paper_key = a.paper_key AND l.assertion_id = a.assertion_id "
+        "LEFT JOIN evidence_items e ON e.paper_key = l.paper_key AND e.evidence_id = l.evidence_id"
+    )
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY p.doi, p.extraction_id, a.assertion_id, l.link_id"
+    if args.limit:
+        sql += " LIMIT ?"
+        params.append(args.limit)
+    return sql, params
+
+
+def render_rows(rows: list[sqlite3.Row], fmt: str) -> None:
+    if fmt == "jsonl":
+        for row in rows:
+            print(json.dumps(dict(row), ensure_ascii=False))
+        return
+    if fmt == "csv":
+        writer = csv.writer(sys.stdout)
+        if rows:
+            writer.writerow(rows[0].keys())
+        writer.writerows(tuple(row) for row in rows)
+        return
+    for row in rows:
+        paper = row["doi"] or row["extraction_id"]
+        evidence = f"{row['polarity'] or '-'}/{row['strength'] or '-'} {row['evidence_id'] or ''}".rstrip()
+        print(f"{paper}  {row['assertion_id']}  [{row['claim_role'] or '-'}]  {evidence}")
+        print(f"    {row['assertion_text'] or ''}")
+        if row["evidence_text"]:
+            print(f"    evidence: {row['evidence_text']}")
+    print(f"{len(rows)} rows")
+
+
+def store_stats(connection: sqlite3.Connection) -> dict[str, Any]:
+    counts = {table: connection.execute(f"SELECT count(*) FROM {table}").fetchone()[0] for table in ("papers", *TABLES)}
+    claim_roles = dict(connection.execute("SELECT coalesce(claim_role, '(none)'), count(*) FROM assertions GROUP BY 1 ORDER BY 2 DESC").fetchall())
+    polarities = dict(connection.execute("SELECT coalesce(polarity, '(none)'), count(*) FROM evidence_links GROUP BY 1 ORDER BY 2 DESC").fetchall())
+    return {"counts": counts, "claim_role": claim_roles, "polarity": polarities}
+
+
+def main() -> int:
+    args = parse_args()
+    connection = connect(args.db)
+    try:
+        if args.command == "ingest":
+            paths = collect_extractions(args.paths, args.extraction_name)
+            summary = ingest(
+                connection,
+                paths,
+                require_valid=args.require_valid,
+                prune=args.prune,
+                workers=max(1, args.workers),
+            )
+            print(json.dumps(summary, indent=2))
+            return 1 if summary["failed"] else 0
+        if args.command == "query":
+            sql, params = build_query(args)
+            render_rows(connection.execute(sql, params).fetchall(), args.format)
+            return 0
+        print(json.dumps(store_stats(connection), indent=2))
+        return 0
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
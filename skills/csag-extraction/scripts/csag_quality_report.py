@@ -5,6 +5,11 @@ Reads a `paper_extraction.json` (CSAG `PaperExtraction`) and prints a quality
 report covering coverage, grounding, normalization, and structural integrity.
 Optionally writes the same report to a JSON file for downstream tooling.
 
+Corpus mode (`--corpus DIR`) reports every `paper_extraction.json` under a
+directory in a process pool, caches per-document reports by content hash, and
+writes one aggregate row per document (claim_role / evidence distributions,
+grounding coverage, scores) to Parquet, CSV, or JSONL.
+
 This is complementary to `validate_paper_extraction.py`:
 - `validate_paper_extraction.py` enforces correctness (errors fail the run).
 - `csag_quality_report.py` summarizes shape, coverage, and gaps without failing.
@@ -12,14 +17,18 @@ This is complementary to `validate_paper_extraction.py`:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 WORD_RE = re.compile(r"\w+", re.UNICODE)
+SECTION_HEADING_RE = re.compile(r"^##+\s+(.+?)\s*$")
 DATASET_SIGNAL_RE = re.compile(
     r"\b(data availability|accession|project id|repository|zenodo|img/m|data portal|sra|geo|pride|available at|downloaded at)\b",
     re.IGNORECASE,
@@ -60,10 +69,16 @@ SECTION_TYPES = (
     "other",
 )
 
+# Bump when build_report output changes so cached corpus reports are rebuilt.
+REPORT_VERSION = 1
+DEFAULT_EXTRACTION_NAME = "paper_extraction.json"
+CACHE_DIRNAME = ".csag_quality_cache"
+GROUNDED_COLLECTIONS = ("assertions", "evidence_items", "evidence_links")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Report CSAG quality stats for a PaperExtraction.")
-    parser.add_argument("extraction_json", type=Path, help="Path to paper_extraction.json")
+    parser.add_argument("extraction_json", type=Path, nargs="?", help="Path to paper_extraction.json")
     parser.add_argument(
         "--source-markdown",
         type=Path,
@@ -87,7 +102,41 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Exit non-zero when structural issues are detected.",
     )
-    return parser.parse_args()
+    corpus = parser.add_argument_group("corpus mode")
+    corpus.add_argument(
+        "--corpus",
+        type=Path,
+        default=None,
+        help="Report every extraction under this directory instead of a single file.",
+    )
+    corpus.add_argument(
+        "--extraction-name",
+        default=DEFAULT_EXTRACTION_NAME,
+        help=f"Extraction file name to look for (default: {DEFAULT_EXTRACTION_NAME}).",
+    )
+    corpus.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    corpus.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=f"Per-document report cache (default: <corpus>/{CACHE_DIRNAME}).",
+    )
+    corpus.add_argument("--no-cache", action="store_true", help="Rebuild every report.")
+    corpus.add_argument(
+        "--aggregate-out",
+        type=Path,
+        default=None,
+        help="Write one row per document to .parquet (needs pyarrow), .csv, or .jsonl.",
+    )
+    corpus.add_argument(
+        "--write-reports",
+        action="store_true",
+        help="Also write <extraction stem>.quality.json next to each extraction.",
+    )
+    args = parser.parse_args()
+    if (args.extraction_json is None) == (args.corpus is None):
+        parser.error("pass either extraction_json or --corpus DIR")
+    return args
 
 
 def count_words(text: str) -> int:
@@ -100,16 +149,17 @@ def count_words_per_section(markdown: str) -> dict[str, int]:
     if not markdown:
         return counts
     current = "_preamble"
-    buffer: list[str] = []
+    words = 0
     for line in markdown.splitlines():
-        match = re.match(r"^##+\s+(.+?)\s*$", line.strip())
-        if match:
-            counts[current] = counts.get(current, 0) + count_words("\n".join(buffer))
-            buffer = []
-            current = match.group(1).strip()
-            continue
-        buffer.append(line)
-    counts[current] = counts.get(current, 0) + count_words("\n".join(buffer))
+        if line.lstrip().startswith("##"):
+            match = SECTION_HEADING_RE.match(line.strip())
+            if match:
+                counts[current] = counts.get(current, 0) + words
+                words = 0
+                current = match.group(1).strip()
+                continue
+        words += count_words(line)
+    counts[current] = counts.get(current, 0) + words
     return {key: value for key, value in counts.items() if value > 0}
 
 
@@ -685,8 +735,256 @@ def render_text(report: dict) -> str:
     return "\n".join(lines)
 
 
+def find_sidecars(extraction_path: Path) -> tuple[Path | None, Path | None]:
+    """Locate STEM.md and STEM.article.json next to an extraction (work/STEM/ layout)."""
+    folder = extraction_path.parent
+    markdown = folder / f"{folder.name}.md"
+    article = folder / f"{folder.name}.article.json"
+    if not markdown.exists():
+        candidates = sorted(folder.glob("*.md"))
+        markdown = candidates[0] if len(candidates) == 1 else None
+    if not article.exists():
+        candidates = sorted(folder.glob("*.article.json"))
+        article = candidates[0] if len(candidates) == 1 else None
+    return markdown, article
+
+
+def collect_corpus(root: Path, extraction_name: str = DEFAULT_EXTRACTION_NAME) -> list[Path]:
+    return sorted(
+        path for path in root.rglob(extraction_name) if path.is_file() and CACHE_DIRNAME not in path.parts
+    )
+
+
+def report_cache_key(extraction_bytes: bytes, markdown_bytes: bytes | None, article_bytes: bytes | None) -> str:
+    digest = hashlib.sha256(f"csag-quality-report:{REPORT_VERSION}".encode("utf-8"))
+    for label, payload in (("extraction", extraction_bytes), ("markdown", markdown_bytes), ("article", article_bytes)):
+        digest.update(f"\0{label}:{-1 if payload is None else len(payload)}\0".encode("utf-8"))
+        digest.update(payload or b"")
+    return digest.hexdigest()
+
+
+def aggregate_row(report: dict) -> dict:
+    """Flatten the corpus-relevant parts of a report into one fixed-schema row."""
+    row: dict[str, Any] = {
+        "extraction_id": report.get("extraction_id"),
+        "title": report.get("title"),
+        "doi": report.get("doi"),
+    }
+    for key, value in report["counts"].items():
+        row[f"count__{key}"] = value
+    for name, distribution in report["distributions"].items():
+        other = 0
+        for key, value in distribution.items():
+            if key.startswith("_other:"):
+                other += value
+            else:
+                row[f"{name}__{key}"] = value
+        row[f"{name}__other"] = other
+    grounded = total = 0
+    for collection in GROUNDED_COLLECTIONS:
+        info = report["grounding"][collection]
+        row[f"grounding__{collection}_with_text_spans"] = info["with_text_spans"]
+        row[f"grounding__{collection}_without_text_spans"] = info["without_text_spans"]
+        grounded += info["with_text_spans"]
+        total += info["with_text_spans"] + info["without_text_spans"]
+    row["grounding_coverage"] = round(grounded / total, 4) if total else None
+    coverage = report["coverage"]
+    row["assertions_with_evidence_links"] = coverage["with_evidence_links"]
+    row["assertions_with_decisive_evidence"] = coverage["with_decisive_evidence"]
+    row["completeness_score"] = report["completeness"]["score"]
+    row["field_completeness_score"] = report["field_quality"]["overall_field_completeness_score"]
+    row["source_word_count"] = report["completeness"]["source_word_count"]
+    row["issue_count"] = len(report["issues"])
+    return row
+
+
+def _read_optional(path: Path | None) -> bytes | None:
+    return path.read_bytes() if path is not None else None
+
+
+def corpus_document(extraction_path: str, cache_dir: str | None, write_reports: bool) -> dict:
+    """Build (or load from cache) one document's report; return its aggregate row."""
+    path = Path(extraction_path)
+    row: dict[str, Any] = {"path": extraction_path, "status": "built", "error": None}
+    try:
+        markdown_path, article_path = find_sidecars(path)
+        extraction_bytes = path.read_bytes()
+        markdown_bytes = _read_optional(markdown_path)
+        article_bytes = _read_optional(article_path)
+        key = report_cache_key(extraction_bytes, markdown_bytes, article_bytes)
+        cache_path = Path(cache_dir) / f"{key}.json" if cache_dir else None
+
+        report = None
+        if cache_path is not None and cache_path.exists():
+            try:
+                report = json.loads(cache_path.read_text(encoding="utf-8"))
+                row["status"] = "cached"
+            except ValueError:
+                report = None
+        if report is None:
+            extraction = json.loads(extraction_bytes)
+            if not isinstance(extraction, dict):
+                raise ValueError("extraction JSON is not an object")
+            markdown = markdown_bytes.decode("utf-8") if markdown_bytes is not None else None
+            article_json = json.loads(article_bytes) if article_bytes is not None else None
+            report = build_report(extraction, markdown, article_json)
+            if cache_path is not None:
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(report), encoding="utf-8")
+                os.replace(tmp_path, cache_path)
+
+        if write_reports:
+            out_path = path.with_name(f"{path.stem}.quality.json")
+            out_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        row["source_markdown"] = str(markdown_path) if markdown_path else None
+        row["article_json"] = str(article_path) if article_path else None
+        row.update(aggregate_row(report))
+    except Exception as exc:  # noqa: BLE001 - one bad extraction must not sink the corpus
+        row["status"] = "failed"
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    return row
+
+
+def run_corpus(
+    paths: list[Path],
+    *,
+    workers: int | None = None,
+    cache_dir: Path | None = None,
+    write_reports: bool = False,
+) -> list[dict]:
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [(str(path), str(cache_dir) if cache_dir else None, write_reports) for path in paths]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks) or 1))
+    if workers == 1:
+        return [corpus_document(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(corpus_document, *zip(*tasks), chunksize=max(1, len(tasks) // (workers * 8))))
+
+
+def corpus_summary(rows: list[dict]) -> dict:
+    reported = [row for row in rows if row["status"] != "failed"]
+    totals: Counter[str] = Counter()
+    for row in reported:
+        for key, value in row.items():
+            if "__" in key and isinstance(value, int):
+                totals[key] += value
+
+    def distribution(name: str) -> dict[str, int]:
+        prefix = f"{name}__"
+        return {key[len(prefix):]: totals[key] for key in sorted(totals) if key.startswith(prefix)}
+
+    def mean(field: str) -> float | None:
+        values = [row[field] for row in reported if row.get(field) is not None]
+        return round(sum(values) / len(values), 4) if values else None
+
+    return {
+        "documents": len(rows),
+        "built": sum(1 for row in rows if row["status"] == "built"),
+        "cached": sum(1 for row in rows if row["status"] == "cached"),
+        "failed": [{"path": row["path"], "error": row["error"]} for row in rows if row["status"] == "failed"],
+        "documents_with_issues": sum(1 for row in reported if row["issue_count"]),
+        "mean_completeness_score": mean("completeness_score"),
+        "mean_field_completeness_score": mean("field_completeness_score"),
+        "mean_grounding_coverage": mean("grounding_coverage"),
+        "counts": distribution("count"),
+        "distributions": {
+            name: distribution(name)
+            for name in ("claim_role", "criticality", "normalization_status", "evidence_polarity", "evidence_strength")
+        },
+        "grounding": distribution("grounding"),
+    }
+
+
+def render_corpus_text(summary: dict) -> str:
+    lines = ["CSAG corpus quality report"]
+    lines.append(
+        f"  documents: {summary['documents']} (built {summary['built']}, cached {summary['cached']}, "
+        f"failed {len(summary['failed'])})"
+    )
+    lines.append(f"  documents_with_issues:         {summary['documents_with_issues']}")
+    lines.append(f"  mean_completeness_score:       {summary['mean_completeness_score']}")
+    lines.append(f"  mean_field_completeness_score: {summary['mean_field_completeness_score']}")
+    lines.append(f"  mean_grounding_coverage:       {summary['mean_grounding_coverage']}")
+    lines.append("")
+    lines.append("Distributions:")
+    for name, distribution in summary["distributions"].items():
+        active = {k: v for k, v in distribution.items() if v}
+        rendered = ", ".join(f"{k}={v}" for k, v in active.items()) or "(empty)"
+        lines.append(f"  {name:<22} {rendered}")
+    if summary["failed"]:
+        lines.append("")
+        lines.append("Failed:")
+        for item in summary["failed"]:
+            lines.append(f"  - {item['path']}: {item['error']}")
+    return "\n".join(lines)
+
+
+def write_aggregate(rows: list[dict], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise SystemExit("Writing Parquet needs pyarrow (pip install pyarrow); use .csv or .jsonl instead.") from exc
+        table = pa.Table.from_pylist([{column: row.get(column) for column in columns} for row in rows])
+        pq.write_table(table, path)
+    elif suffix == ".csv":
+        import csv
+
+        with path.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+    elif suffix in {".jsonl", ".ndjson"}:
+        with path.open("w", encoding="utf-8") as handle:
+            for row in rows:
+                handle.write(json.dumps(row) + "\n")
+    else:
+        raise SystemExit(f"Unsupported aggregate format {path.suffix!r}; use .parquet, .csv, or .jsonl")
+
+
+def corpus_main(args: argparse.Namespace) -> int:
+    root = args.corpus.expanduser().resolve()
+    if not root.is_dir():
+        print(f"ERROR: corpus directory not found: {root}", file=sys.stderr)
+        return 2
+    paths = collect_corpus(root, args.extraction_name)
+    if not paths:
+        print(f"ERROR: no {args.extraction_name} files under {root}", file=sys.stderr)
+        return 2
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = args.cache_dir.expanduser().resolve() if args.cache_dir else root / CACHE_DIRNAME
+
+    rows = run_corpus(paths, workers=args.workers, cache_dir=cache_dir, write_reports=args.write_reports)
+    summary = corpus_summary(rows)
+    print(render_corpus_text(summary))
+
+    if args.aggregate_out:
+        aggregate_path = args.aggregate_out.expanduser().resolve()
+        write_aggregate(rows, aggregate_path)
+        print(f"\naggregate={aggregate_path}")
+    if args.report_out:
+        out_path = args.report_out.expanduser().resolve()
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps({"summary": summary, "documents": rows}, indent=2) + "\n", encoding="utf-8")
+        print(f"report={out_path}")
+
+    if summary["failed"]:
+        return 2
+    if args.strict and summary["documents_with_issues"]:
+        return 1
+    return 0
+
+
 def main() -> int:
     args = parse_args()
+    if args.corpus is not None:
+        return corpus_main(args)
     extraction_path = args.extraction_json.expanduser().resolve()
     extraction = json.loads(extraction_path.read_text(encoding="utf-8"))
     if not isinstance(extraction, dict):
@@ -4,10 +4,15 @@ from __future__ import annotations
 import argparse
 from collections import Counter
 from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import lru_cache
 import json
 import re
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from csag_quality_report import find_sidecars
 
 
 DOI_RE = re.compile(r"\b10\.\d{4,9}/[-._;()/:A-Z0-9]+\b", re.IGNORECASE)
@@ -20,6 +25,11 @@ FIGURE_SIGNAL_RE = re.compile(
     r"^\s*(fig(?:ure)?\.?|table|supplementary figure|supplementary table)\b",
     re.IGNORECASE,
 )
+REVIEW_ACTIVITY_RE = re.compile(r"\b(human review|curation|curator review)\b", re.IGNORECASE)
+ISSUE_RE = re.compile(
+    r"^object=(?P<object_id>.*?); field=(?P<field_path>.*?); reason=(?P<reason>.*?); suggested_fix=(?P<suggested_fix>.*)$"
+)
+ISSUE_CODE_RE = re.compile(r"[^a-z0-9]+")
 
 ASSERTION_CRITICALITIES = {"core", "major", "supporting", "background"}
 CLAIM_ROLES = {
@@ -123,10 +133,24 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Validate a CSAG PaperExtraction with repo-specific enforcement rules."
     )
-    parser.add_argument("extraction_json", type=Path)
+    parser.add_argument(
+        "extraction_json",
+        type=Path,
+        nargs="+",
+        help=(
+            "One or more PaperExtraction JSON files. With several files, each is validated in "
+            "the same process, sidecars (STEM.md, STEM.article.json) are discovered next to "
+            "each extraction, and reports are written as <stem>.validation.json beside it."
+        ),
+    )
     parser.add_argument("--source-markdown", type=Path, default=None)
     parser.add_argument("--article-json", type=Path, default=None)
-    parser.add_argument("--report-out", type=Path, required=True)
+    parser.add_argument(
+        "--report-out",
+        type=Path,
+        default=None,
+        help="Report path for a single extraction (default: <stem>.validation.json beside it).",
+    )
     parser.add_argument(
         "--profile",
         choices=PROFILE_CHOICES,
@@ -148,7 +172,35 @@ def parse_args() -> argparse.Namespace:
             "artifact types."
         ),
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--previous-report",
+        type=Path,
+        default=None,
+        help=(
+            "Validation report from an earlier run. With --previous-extraction, objects whose "
+            "inputs did not change reuse their previous errors; the report is identical to a full run."
+        ),
+    )
+    parser.add_argument(
+        "--previous-extraction",
+        type=Path,
+        default=None,
+        help="The extraction (after repair, if --repair-out was used) that --previous-report was built from.",
+    )
+    args = parser.parse_args()
+    if (args.previous_report is None) != (args.previous_extraction is None):
+        parser.error("--previous-report and --previous-extraction must be given together")
+    if len(args.extraction_json) > 1:
+        for flag, value in (
+            ("--report-out", args.report_out),
+            ("--repair-out", args.repair_out),
+            ("--previous-report", args.previous_report),
+            ("--source-markdown", args.source_markdown),
+            ("--article-json", args.article_json),
+        ):
+            if value is not None:
+                parser.error(f"{flag} only applies to a single extraction")
+    return args
 
 
 def load_json(path: Path | None) -> dict | None:
@@ -192,15 +244,12 @@ def issue(object_id: object, field_path: str, reason: str, suggested_fix: str) -
 
 
 def issue_code(reason: str) -> str:
-    code = re.sub(r"[^a-z0-9]+", "_", reason.lower()).strip("_")
+    code = ISSUE_CODE_RE.sub("_", reason.lower()).strip("_")
     return code[:80] or "validation_error"
 
 
 def structured_issue(message: str) -> dict[str, str]:
-    match = re.match(
-        r"^object=(?P<object_id>.*?); field=(?P<field_path>.*?); reason=(?P<reason>.*?); suggested_fix=(?P<suggested_fix>.*)$",
-        message,
-    )
+    match = ISSUE_RE.match(message)
     if not match:
         return {
             "code": issue_code(message),
@@ -214,8 +263,8 @@ def structured_issue(message: str) -> dict[str, str]:
     return payload
 
 
-def error_summary(errors: list[str]) -> dict[str, int]:
-    counter = Counter(item["code"] for item in (structured_issue(error) for error in errors))
+def error_summary(structured_errors: list[dict[str, str]]) -> dict[str, int]:
+    counter = Counter(item["code"] for item in structured_errors)
     return dict(sorted(counter.items()))
 
 
@@ -344,20 +393,75 @@ def has_text_spans(item: dict | None) -> bool:
     return bool(isinstance(item, dict) and isinstance(item.get("text_spans"), list) and item.get("text_spans"))
 
 
-def collect_ids(extraction: dict, errors: list[str]) -> dict[str, set[str]]:
+def is_limitation_or_speculation(assertion: dict) -> bool:
+    return assertion.get("claim_role") in {"limitation", "speculation"}
+
+
+def dict_items(value: object) -> list[dict]:
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+EMPTY_IDS: frozenset[str] = frozenset()
+
+
+@dataclass
+class ExtractionIndex:
+    """IDs and reverse lookups built once per extraction and shared by every rule."""
+
+    ids_by_key: dict[str, set[str]]
+    duplicates_by_key: dict[str, set[str]]
+    evidence_by_id: dict[str, dict]
+    links_by_assertion: dict[str, list[dict]]
+
+    def ids(self, key: str) -> set[str]:
+        return self.ids_by_key.get(key, EMPTY_IDS)
+
+    def links(self, assertion: dict) -> list[dict]:
+        assertion_id = assertion.get("id")
+        return self.links_by_assertion.get(assertion_id, []) if isinstance(assertion_id, str) else []
+
+    def linked_evidence(self, assertion: dict) -> list[dict | None]:
+        refs = (link.get("evidence_item") for link in self.links(assertion))
+        return [self.evidence_by_id.get(ref) if isinstance(ref, str) else None for ref in refs]
+
+
+def build_index(extraction: dict) -> ExtractionIndex:
     ids_by_key: dict[str, set[str]] = {}
+    duplicates_by_key: dict[str, set[str]] = {}
     for key in ID_LIST_KEYS:
         seen: set[str] = set()
         duplicates: set[str] = set()
-        for item in extraction.get(key, []) or []:
-            if not isinstance(item, dict):
-                continue
+        for item in dict_items(extraction.get(key)):
             item_id = item.get("id")
             if not isinstance(item_id, str) or not item_id:
                 continue
             if item_id in seen:
                 duplicates.add(item_id)
             seen.add(item_id)
+        ids_by_key[key] = seen
+        if duplicates:
+            duplicates_by_key[key] = duplicates
+
+    evidence_by_id: dict[str, dict] = {}
+    for item in dict_items(extraction.get("evidence_items")):
+        item_id = item.get("id")
+        if isinstance(item_id, str) and item_id:
+            evidence_by_id[item_id] = item
+
+    links_by_assertion: dict[str, list[dict]] = {}
+    for link in dict_items(extraction.get("evidence_links")):
+        assertion_id = link.get("assertion")
+        if isinstance(assertion_id, str):
+            links_by_assertion.setdefault(assertion_id, []).append(link)
+
+    return ExtractionIndex(ids_by_key, duplicates_by_key, evidence_by_id, links_by_assertion)
+
+
+def validate_unique_ids(index: ExtractionIndex, errors: list[str]) -> None:
+    for key in ID_LIST_KEYS:
+        duplicates = index.duplicates_by_key.get(key)
         if duplicates:
             errors.append(
                 issue(
@@ -367,424 +471,676 @@ def collect_ids(extraction: dict, errors: list[str]) -> dict[str, set[str]]:
                     "Rename duplicate objects so every ID is unique within the PaperExtraction.",
                 )
             )
-        ids_by_key[key] = seen
-    return ids_by_key
 
 
-def expect_required_ref(ref: object, known_ids: set[str], label: str, errors: list[str]) -> None:
-    if not isinstance(ref, str) or not ref:
-        errors.append(issue(label, label, "required reference is missing", "Populate this field with an ID from the same PaperExtraction."))
-        return
-    expect(ref in known_ids, issue(ref, label, "reference does not resolve", "Use an ID that exists in the same PaperExtraction."), errors)
+# ---------------------------------------------------------------------------
+# Rule tables
+#
+# Each Rule is evaluated against one object. The issue string is only formatted
+# when the check fails, so passing objects cost one predicate call per rule.
+# ---------------------------------------------------------------------------
 
+Check = Callable[[dict, ExtractionIndex], bool]
 
-def expect_optional_ref(ref: object, known_ids: set[str], message: str, errors: list[str]) -> None:
-    if isinstance(ref, str) and ref:
-        expect(ref in known_ids, issue(ref, message, "reference does not resolve", "Use an ID that exists in the same PaperExtraction or remove the optional reference."), errors)
 
+@dataclass(frozen=True)
+class Rule:
+    field_path: str
+    reason: str | Callable[[dict], str]
+    suggested_fix: str
+    check: Check
+    applies: Callable[[dict], bool] | None = None
 
-def expect_refs(refs: object, known_ids: set[str], message_prefix: str, errors: list[str]) -> None:
-    if not isinstance(refs, list):
-        return
-    for ref in refs:
-        if isinstance(ref, str) and ref:
-            expect(ref in known_ids, issue(ref, message_prefix, "reference does not resolve", "Use an ID that exists in the same PaperExtraction."), errors)
-
-
-def validate_nested_artifact_refs(value: object, artifact_ids: set[str], path: str, errors: list[str]) -> None:
-    if isinstance(value, dict):
-        if "artifact_ref" in value:
-            expect_optional_ref(
-                value.get("artifact_ref"),
-                artifact_ids,
-                f"{path}.artifact_ref references missing id {value.get('artifact_ref')}",
-                errors,
-            )
-        if "associated_artifacts" in value:
-            expect_refs(value.get("associated_artifacts"), artifact_ids, f"{path}.associated_artifacts", errors)
-        for key, item in value.items():
-            validate_nested_artifact_refs(item, artifact_ids, f"{path}.{key}", errors)
-    elif isinstance(value, list):
-        for index, item in enumerate(value):
-            validate_nested_artifact_refs(item, artifact_ids, f"{path}[{index}]", errors)
+    def evaluate(self, item: dict, object_id: object, index: ExtractionIndex, errors: list[str]) -> None:
+        if self.applies is not None and not self.applies(item):
+            return
+        if self.check(item, index):
+            return
+        reason = self.reason(item) if callable(self.reason) else self.reason
+        errors.append(issue(object_id, self.field_path, reason, self.suggested_fix))
 
 
-def is_limitation_or_speculation(assertion: dict) -> bool:
-    return assertion.get("claim_role") in {"limitation", "speculation"}
+@dataclass(frozen=True)
+class RefRule:
+    """A cross-reference from ``field`` to the IDs of the ``target`` collection.
 
+    ``kind`` is ``required`` (must be set and resolve), ``optional`` (must resolve
+    when set), or ``list`` (every non-empty entry must resolve). ``label`` is a
+    ``str.format`` template over ``id`` (the owning object) and ``ref``.
+    """
 
-def validate_optional_assertion_metadata(extraction: dict, errors: list[str]) -> None:
-    for item in extraction.get("assertions", []) or []:
-        if not isinstance(item, dict):
-            continue
-        criticality = item.get("criticality")
-        if criticality is not None:
-            expect(
-                criticality in ASSERTION_CRITICALITIES,
-                issue(
-                    item.get("id"),
-                    "assertions[].criticality",
-                    f"invalid criticality {criticality}",
-                    "Use core, major, supporting, or background.",
-                ),
-                errors,
-            )
-        falsification_criteria = item.get("falsification_criteria")
-        if falsification_criteria is not None:
-            expect(
-                nonempty_string_list(falsification_criteria),
-                issue(
-                    item.get("id"),
-                    "assertions[].falsification_criteria",
-                    "invalid falsification_criteria",
-                    "Use a JSON list of one or more concrete falsification criteria strings.",
-                ),
-                errors,
-            )
+    field: str
+    target: str
+    kind: str
+    label: str
 
 
-def validate_cross_references(extraction: dict, ids_by_key: dict[str, set[str]], errors: list[str]) -> None:
-    assertion_ids = ids_by_key.get("assertions", set())
-    evidence_ids = ids_by_key.get("evidence_items", set())
-    evidence_link_ids = ids_by_key.get("evidence_links", set())
-    artifact_ids = ids_by_key.get("artifacts", set())
-    experiment_ids = ids_by_key.get("experiments", set())
+@dataclass(frozen=True)
+class RefTable:
+    collection: str
+    rules: tuple[RefRule, ...]
+    nested_key: str | None = None
+    nested_rules: tuple[RefRule, ...] = ()
 
-    validate_nested_artifact_refs(extraction, artifact_ids, "paper_extraction", errors)
 
-    for item in extraction.get("evidence_items", []) or []:
-        expect_optional_ref(
-            item.get("associated_experiment"),
-            experiment_ids,
-            f"evidence_item {item.get('id')} references missing associated_experiment {item.get('associated_experiment')}",
-            errors,
-        )
+def field_set(name: str) -> Check:
+    return lambda item, index: bool(item.get(name))
 
-    for item in extraction.get("evidence_links", []) or []:
-        expect_required_ref(
-            item.get("evidence_item"),
-            evidence_ids,
-            f"evidence_link {item.get('id')} evidence_item",
-            errors,
-        )
-        expect_required_ref(
-            item.get("assertion"),
-            assertion_ids,
-            f"evidence_link {item.get('id')} assertion",
-            errors,
-        )
 
-    for item in extraction.get("inferences", []) or []:
-        expect_required_ref(
-            item.get("output_assertion"),
-            assertion_ids,
-            f"inference {item.get('id')} output_assertion",
-            errors,
-        )
-        expect_refs(
-            item.get("input_assertions"),
-            assertion_ids,
-            f"inference {item.get('id')} input_assertions",
-            errors,
-        )
-        expect_refs(
-            item.get("input_evidence_links"),
-            evidence_link_ids,
-            f"inference {item.get('id')} input_evidence_links",
-            errors,
-        )
+def field_in(name: str, allowed: set[str]) -> Check:
+    return lambda item, index: item.get(name) in allowed
 
-    for item in extraction.get("assertion_relations", []) or []:
-        expect_required_ref(
-            item.get("from_assertion"),
-            assertion_ids,
-            f"assertion_relation {item.get('id')} from_assertion",
-            errors,
-        )
-        expect_required_ref(
-            item.get("to_assertion"),
-            assertion_ids,
-            f"assertion_relation {item.get('id')} to_assertion",
-            errors,
-        )
 
-    for item in extraction.get("critiques", []) or []:
-        expect_refs(
-            item.get("impacted_assertions"),
-            assertion_ids,
-            f"critique {item.get('id')} impacted_assertions",
-            errors,
-        )
-        expect_refs(
-            item.get("impacted_evidence_items"),
-            evidence_ids,
-            f"critique {item.get('id')} impacted_evidence_items",
-            errors,
-        )
+def field_present(name: str) -> Callable[[dict], bool]:
+    return lambda item: bool(item.get(name))
 
-    for item in extraction.get("knowledge_gaps", []) or []:
-        expect_refs(
-            item.get("related_assertions"),
-            assertion_ids,
-            f"knowledge_gap {item.get('id')} related_assertions",
-            errors,
-        )
 
-    for item in extraction.get("qa_items", []) or []:
-        expect_optional_ref(
-            item.get("query_assertion"),
-            assertion_ids,
-            f"qa_item {item.get('id')} references missing query_assertion {item.get('query_assertion')}",
-            errors,
-        )
-        for answer in item.get("answers", []) or []:
-            expect_refs(
-                answer.get("supporting_assertions"),
-                assertion_ids,
-                f"qa_item {item.get('id')} answer supporting_assertions",
-                errors,
-            )
-            expect_refs(
-                answer.get("supporting_evidence_links"),
-                evidence_link_ids,
-                f"qa_item {item.get('id')} answer supporting_evidence_links",
-                errors,
+def field_not_none(name: str) -> Callable[[dict], bool]:
+    return lambda item: item.get(name) is not None
+
+
+def not_background(item: dict) -> bool:
+    return item.get("criticality") != "background"
+
+
+def root_object_id(extraction: dict) -> str:
+    return extraction.get("id") or "(paper extraction)"
+
+
+ROOT_RULES = (
+    Rule("id", "missing top-level id", "Set the PaperExtraction document ID.", field_set("id")),
+    Rule("title", "missing top-level title", "Set the manuscript title.", field_set("title")),
+    Rule("schema_version", "missing schema version", "Set the CSAG schema version used for the extraction.", field_set("schema_version")),
+    Rule("validator_version", "missing validator version", "Set the validator version used for the validation report.", field_set("validator_version")),
+    Rule("assertions", "missing assertions list", "Add an assertions array, even if empty only for non-paper material.", lambda item, index: isinstance(item.get("assertions"), list)),
+    Rule("evidence_items", "missing evidence_items list", "Add an evidence_items array.", lambda item, index: isinstance(item.get("evidence_items"), list)),
+    Rule("evidence_links", "missing evidence_links list", "Add an evidence_links array.", lambda item, index: isinstance(item.get("evidence_links"), list)),
+    Rule(
+        "extraction_activities",
+        "missing extraction activities",
+        "Record at least one extraction activity with DOI/PMID status parameters.",
+        lambda item, index: isinstance(item.get("extraction_activities"), list) and bool(item.get("extraction_activities")),
+    ),
+)
+
+ASSERTION_RULES = (
+    Rule("assertions[].id", "assertion ID is missing", "Assign a deterministic assertion ID.", field_set("id")),
+    Rule("assertions[].assertion_text", "missing assertion text", "Add the natural-language assertion.", field_set("assertion_text")),
+    Rule("assertions[].claim_role", "missing claim role", "Set claim_role from the controlled vocabulary.", field_set("claim_role")),
+    Rule("assertions[].claim_role", "invalid claim role", "Set claim_role from the controlled vocabulary.", field_in("claim_role", CLAIM_ROLES), field_present("claim_role")),
+    Rule("assertions[].normalization_status", "missing normalization status", "Set raw, partially_normalized, or fully_normalized.", field_set("normalization_status")),
+    Rule(
+        "assertions[].normalization_status",
+        "invalid normalization status",
+        "Set raw, partially_normalized, or fully_normalized.",
+        field_in("normalization_status", NORMALIZATION_STATUSES),
+        field_present("normalization_status"),
+    ),
+    Rule(
+        "assertions[].contexts",
+        "missing contexts",
+        "Attach at least one Context object to every Assertion.",
+        lambda item, index: isinstance(item.get("contexts"), list) and len(item["contexts"]) >= 1,
+    ),
+)
+
+EVIDENCE_LINK_RULES = (
+    Rule("evidence_links[].polarity", "missing polarity", "Use supports, refutes, mixed, or inconclusive.", field_set("polarity")),
+    Rule("evidence_links[].polarity", "invalid polarity", "Use supports, refutes, mixed, or inconclusive.", field_in("polarity", POLARITIES), field_present("polarity")),
+)
+
+ASSERTION_METADATA_RULES = (
+    Rule(
+        "assertions[].criticality",
+        lambda item: f"invalid criticality {item.get('criticality')}",
+        "Use core, major, supporting, or background.",
+        field_in("criticality", ASSERTION_CRITICALITIES),
+        field_not_none("criticality"),
+    ),
+    Rule(
+        "assertions[].falsification_criteria",
+        "invalid falsification_criteria",
+        "Use a JSON list of one or more concrete falsification criteria strings.",
+        lambda item, index: nonempty_string_list(item.get("falsification_criteria")),
+        field_not_none("falsification_criteria"),
+    ),
+)
+
+PROMOTED_ROOT_RULES = (
+    Rule(
+        "extraction_activities[].activity_type",
+        "missing promotion review provenance",
+        "Record an ExtractionActivity whose activity_type names human review or curation before using the promoted_claim profile.",
+        lambda item, index: any(
+            REVIEW_ACTIVITY_RE.search(str(activity.get("activity_type", "")))
+            for activity in dict_items(item.get("extraction_activities"))
+        ),
+    ),
+)
+
+PROMOTED_LINK_RULES = (
+    Rule("evidence_links[].strength", "missing or invalid strength", "Use one of the StrengthLevel values.", field_in("strength", STRENGTH_LEVELS)),
+    Rule("evidence_links[].rationale", "missing rationale", "Explain why this evidence supports, refutes, or qualifies the assertion.", field_set("rationale")),
+    Rule("evidence_links[].polarity", "invalid polarity", "Use supports, refutes, mixed, or inconclusive.", field_in("polarity", POLARITIES)),
+    Rule(
+        "evidence_links[].curation_status",
+        "missing human curation status",
+        "Use human_verified or human_corrected before promoting the link.",
+        field_in("curation_status", PROMOTED_CURATION_STATUSES),
+    ),
+)
+
+PROMOTED_ASSERTION_RULES = (
+    Rule("assertions[].criticality", "missing or invalid criticality", "Use core, major, supporting, or background.", field_in("criticality", ASSERTION_CRITICALITIES)),
+    Rule(
+        "assertions[].falsification_criteria",
+        "missing falsification criteria",
+        "Add at least one concrete observation or analysis that would weaken the claim.",
+        lambda item, index: nonempty_string_list(item.get("falsification_criteria")),
+    ),
+    Rule(
+        "assertions[].curation_status",
+        "missing human curation status",
+        "Use human_verified or human_corrected before promoting the assertion.",
+        field_in("curation_status", PROMOTED_CURATION_STATUSES),
+    ),
+    Rule(
+        "evidence_links",
+        "no evidence links target this assertion",
+        "Add at least one EvidenceLink from a supporting or refuting EvidenceItem.",
+        lambda item, index: bool(index.links(item)),
+        not_background,
+    ),
+    Rule(
+        "evidence_links[].polarity",
+        "no decisive evidence link",
+        "At least one linked evidence item should use supports, refutes, or mixed.",
+        lambda item, index: any(link.get("polarity") in DECISIVE_POLARITIES for link in index.links(item)),
+        not_background,
+    ),
+    Rule(
+        "assertions[].text_spans",
+        "missing assertion/evidence grounding",
+        "Add TextSpan grounding on the assertion or one of its linked EvidenceItems.",
+        lambda item, index: has_text_spans(item) or any(has_text_spans(evidence) for evidence in index.linked_evidence(item)),
+        not_background,
+    ),
+)
+
+BENCHMARK_ASSERTION_RULES = (
+    Rule(
+        "evidence_links[].strength",
+        "core or major assertion has no moderate-or-strong decisive evidence",
+        "Add a decisive EvidenceLink with strength moderate, strong, or very_strong, or lower the assertion criticality if justified.",
+        lambda item, index: any(
+            link.get("polarity") in DECISIVE_POLARITIES and link.get("strength") in ADEQUATE_STRENGTH_LEVELS
+            for link in index.links(item)
+        ),
+        lambda item: item.get("criticality") in {"core", "major"} and not is_limitation_or_speculation(item),
+    ),
+)
+
+ARTIFACT_RULES = (
+    Rule("artifacts[].id", "artifact ID is missing", "Assign a deterministic Artifact ID.", field_set("id")),
+    Rule("artifacts[].artifact_type", "missing artifact type", "Set artifact_type from the controlled vocabulary.", field_set("artifact_type")),
+    Rule(
+        "artifacts[].artifact_type",
+        "invalid artifact type",
+        "Use figure, table, supplementary, equation, protocol, code, or other.",
+        field_in("artifact_type", ARTIFACT_TYPES),
+        field_present("artifact_type"),
+    ),
+    Rule(
+        "artifacts[].artifact_label",
+        "missing artifact label or caption",
+        "Populate artifact_label or caption from the source.",
+        lambda item, index: bool(item.get("artifact_label")) or bool(item.get("caption")),
+    ),
+)
+
+DATASET_RULES = (
+    Rule("datasets[].id", "dataset ID is missing", "Assign a deterministic Dataset ID.", field_set("id")),
+    Rule(
+        "datasets[].accession",
+        "missing accession, repository, or dataset URL",
+        "Populate accession, repository, or dataset_url from the source data-availability statement.",
+        lambda item, index: bool(item.get("accession")) or bool(item.get("repository")) or bool(item.get("dataset_url")),
+    ),
+)
+
+REFERENCE_TABLES = (
+    RefTable(
+        "evidence_items",
+        (RefRule("associated_experiment", "experiments", "optional", "evidence_item {id} references missing associated_experiment {ref}"),),
+    ),
+    RefTable(
+        "evidence_links",
+        (
+            RefRule("evidence_item", "evidence_items", "required", "evidence_link {id} evidence_item"),
+            RefRule("assertion", "assertions", "required", "evidence_link {id} assertion"),
+        ),
+    ),
+    RefTable(
+        "inferences",
+        (
+            RefRule("output_assertion", "assertions", "required", "inference {id} output_assertion"),
+            RefRule("input_assertions", "assertions", "list", "inference {id} input_assertions"),
+            RefRule("input_evidence_links", "evidence_links", "list", "inference {id} input_evidence_links"),
+        ),
+    ),
+    RefTable(
+        "assertion_relations",
+        (
+            RefRule("from_assertion", "assertions", "required", "assertion_relation {id} from_assertion"),
+            RefRule("to_assertion", "assertions", "required", "assertion_relation {id} to_assertion"),
+        ),
+    ),
+    RefTable(
+        "critiques",
+        (
+            RefRule("impacted_assertions", "assertions", "list", "critique {id} impacted_assertions"),
+            RefRule("impacted_evidence_items", "evidence_items", "list", "critique {id} impacted_evidence_items"),
+        ),
+    ),
+    RefTable(
+        "knowledge_gaps",
+        (RefRule("related_assertions", "assertions", "list", "knowledge_gap {id} related_assertions"),),
+    ),
+    RefTable(
+        "qa_items",
+        (RefRule("query_assertion", "assertions", "optional", "qa_item {id} references missing query_assertion {ref}"),),
+        nested_key="answers",
+        nested_rules=(
+            RefRule("supporting_assertions", "assertions", "list", "qa_item {id} answer supporting_assertions"),
+            RefRule("supporting_evidence_links", "evidence_links", "list", "qa_item {id} answer supporting_evidence_links"),
+        ),
+    ),
+)
+
+SEMANTIC_FIELD_PLACEMENT = {
+    "polarity": {"evidence_links"},
+    "relation_type": {"assertion_relations"},
+    "inference_method": {"inferences"},
+    "inference_rationale": {"inferences"},
+    "input_assertions": {"inferences"},
+    "input_evidence_links": {"inferences"},
+    "output_assertion": {"inferences"},
+}
+MISPLACED_FIELDS = {
+    collection: tuple(
+        (field, allowed)
+        for field, allowed in SEMANTIC_FIELD_PLACEMENT.items()
+        if collection not in allowed
+    )
+    for collection in ID_LIST_KEYS
+}
+
+UNRESOLVED_REASON = "reference does not resolve"
+REQUIRED_REF_FIX = "Use an ID that exists in the same PaperExtraction."
+OPTIONAL_REF_FIX = "Use an ID that exists in the same PaperExtraction or remove the optional reference."
+
+
+def evaluate_rules(item: dict, rules: tuple[Rule, ...], index: ExtractionIndex, errors: list[str]) -> None:
+    # Rule.evaluate inlined: this loop runs once per rule per object.
+    for rule in rules:
+        if rule.applies is not None and not rule.applies(item):
+            continue
+        if not rule.check(item, index):
+            reason = rule.reason(item) if callable(rule.reason) else rule.reason
+            errors.append(issue(item.get("id"), rule.field_path, reason, rule.suggested_fix))
+
+
+def apply_rules(
+    items: list[dict],
+    rules: tuple[Rule, ...],
+    index: ExtractionIndex,
+    errors: list[str],
+) -> None:
+    for item in items:
+        evaluate_rules(item, rules, index, errors)
+
+
+def check_refs(item: dict, owner_id: object, rules: tuple[RefRule, ...], index: ExtractionIndex, errors: list[str]) -> None:
+    for rule in rules:
+        known = index.ids(rule.target)
+        value = item.get(rule.field)
+        if rule.kind == "list":
+            if isinstance(value, list):
+                for ref in value:
+                    if isinstance(ref, str) and ref and ref not in known:
+                        errors.append(issue(ref, rule.label.format(id=owner_id, ref=ref), UNRESOLVED_REASON, REQUIRED_REF_FIX))
+        elif isinstance(value, str) and value:
+            if value not in known:
+                fix = OPTIONAL_REF_FIX if rule.kind == "optional" else REQUIRED_REF_FIX
+                errors.append(issue(value, rule.label.format(id=owner_id, ref=value), UNRESOLVED_REASON, fix))
+        elif rule.kind == "required":
+            label = rule.label.format(id=owner_id, ref=value)
+            errors.append(
+                issue(label, label, "required reference is missing", "Populate this field with an ID from the same PaperExtraction.")
             )
 
 
-def validate_semantic_field_placement(extraction: dict, errors: list[str]) -> None:
-    placement_rules = {
-        "polarity": {"evidence_links"},
-        "relation_type": {"assertion_relations"},
-        "inference_method": {"inferences"},
-        "inference_rationale": {"inferences"},
-        "input_assertions": {"inferences"},
-        "input_evidence_links": {"inferences"},
-        "output_assertion": {"inferences"},
-    }
+def render_path(node: tuple | None) -> str:
+    parts: list[str] = []
+    while node is not None:
+        node, key = node
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return "paper_extraction" + "".join(reversed(parts))
+
+
+def check_artifact_fields(value: dict, artifact_ids: set[str], errors: list[str], node: tuple | None) -> None:
+    if "artifact_ref" in value:
+        ref = value["artifact_ref"]
+        if isinstance(ref, str) and ref and ref not in artifact_ids:
+            label = f"{render_path(node)}.artifact_ref references missing id {ref}"
+            errors.append(issue(ref, label, UNRESOLVED_REASON, OPTIONAL_REF_FIX))
+    refs = value.get("associated_artifacts")
+    if isinstance(refs, list):
+        for ref in refs:
+            if isinstance(ref, str) and ref and ref not in artifact_ids:
+                errors.append(issue(ref, f"{render_path(node)}.associated_artifacts", UNRESOLVED_REASON, REQUIRED_REF_FIX))
+
+
+def validate_nested_artifact_refs(value: dict, artifact_ids: set[str], errors: list[str], node: tuple | None = None) -> None:
+    """Walk a subtree for artifact_ref / associated_artifacts fields.
+
+    Paths are kept as (parent, key) links and only rendered for failures. Values
+    come from json.load, so exact dict/list type checks are enough to recurse.
+    """
+    check_artifact_fields(value, artifact_ids, errors, node)
+    for key, item in value.items():
+        kind = type(item)
+        if kind is dict:
+            validate_nested_artifact_refs(item, artifact_ids, errors, (node, key))
+        elif kind is list:
+            validate_nested_list_artifact_refs(item, artifact_ids, errors, (node, key))
+
+
+def validate_nested_list_artifact_refs(value: list, artifact_ids: set[str], errors: list[str], node: tuple) -> None:
+    for position, item in enumerate(value):
+        kind = type(item)
+        if kind is dict:
+            validate_nested_artifact_refs(item, artifact_ids, errors, (node, position))
+        elif kind is list:
+            validate_nested_list_artifact_refs(item, artifact_ids, errors, (node, position))
+
+
+# ---------------------------------------------------------------------------
+# Segments and incremental re-validation
+#
+# Every error is produced inside a named segment: one pass over one object, or
+# a document-level pass. The report stores the segments as
+# [pass, object_id | null, error_count] so a later run can splice in the
+# previous errors of objects whose inputs did not change.
+# ---------------------------------------------------------------------------
+
+ID_COLLECTIONS = frozenset(ID_LIST_KEYS)
+
+
+@dataclass
+class PreviousRun:
+    """A prior extraction and its report, keyed for reuse by object ID."""
+
+    index: ExtractionIndex
+    objects: dict[str, dict[str, dict]]
+    positions: dict[str, dict[str, int]]
+    errors_by_segment: dict[tuple[str, str], list[str]]
+
+
+def keyed_objects(extraction: dict, index: ExtractionIndex) -> tuple[dict[str, dict[str, dict]], dict[str, dict[str, int]]]:
+    """Objects with an ID that is unique in their collection, plus their list positions."""
+    objects: dict[str, dict[str, dict]] = {}
+    positions: dict[str, dict[str, int]] = {}
     for collection in ID_LIST_KEYS:
-        for item in extraction.get(collection, []) or []:
+        items = extraction.get(collection)
+        if not isinstance(items, list):
+            continue
+        duplicates = index.duplicates_by_key.get(collection, EMPTY_IDS)
+        by_id = objects.setdefault(collection, {})
+        position_by_id = positions.setdefault(collection, {})
+        for position, item in enumerate(items):
             if not isinstance(item, dict):
                 continue
-            for field, allowed_collections in placement_rules.items():
-                if field in item and collection not in allowed_collections:
+            item_id = item.get("id")
+            if isinstance(item_id, str) and item_id and item_id not in duplicates:
+                by_id[item_id] = item
+                position_by_id[item_id] = position
+    return objects, positions
+
+
+def load_previous_run(extraction: object, report: object, profile: str) -> PreviousRun | None:
+    """Index a previous extraction and its report, or return None if they cannot be reused."""
+    if not isinstance(extraction, dict) or not isinstance(report, dict):
+        return None
+    if report.get("profile") != profile or report.get("validator_version") != VALIDATOR_VERSION:
+        return None
+    errors = report.get("errors")
+    segments = report.get("error_segments")
+    if not isinstance(errors, list) or not isinstance(segments, list):
+        return None
+    errors_by_segment: dict[tuple[str, str], list[str]] = {}
+    offset = 0
+    try:
+        for name, object_id, count in segments:
+            if object_id is not None:
+                errors_by_segment[(name, object_id)] = errors[offset:offset + count]
+            offset += count
+    except (TypeError, ValueError):
+        return None
+    if offset != len(errors):
+        return None
+    index = build_index(extraction)
+    objects, positions = keyed_objects(extraction, index)
+    return PreviousRun(index, objects, positions, errors_by_segment)
+
+
+@dataclass
+class ValidationRun:
+    """Errors in report order plus the segments that produced them."""
+
+    extraction: dict = field(default_factory=dict)
+    index: ExtractionIndex | None = None
+    previous: PreviousRun | None = None
+    errors: list[str] = field(default_factory=list)
+    segments: list[list] = field(default_factory=list)
+    reused: int = 0
+    _plans: dict[str, list[tuple[dict, str | None, bool]]] = field(default_factory=dict)
+    _links_unchanged: dict[str, bool] = field(default_factory=dict)
+    ids_unchanged: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.ids_unchanged = self.previous is not None and self.previous.index.ids_by_key == self.index.ids_by_key
+
+    def plan(self, collection: str) -> list[tuple[dict, str | None, bool]]:
+        """(object, unique ID or None, unchanged since the previous run) per object, computed once."""
+        plan = self._plans.get(collection)
+        if plan is None:
+            previous_objects = self.previous.objects.get(collection, {}) if self.previous else {}
+            duplicates = self.index.duplicates_by_key.get(collection, EMPTY_IDS)
+            plan = []
+            for item in dict_items(self.extraction.get(collection)):
+                item_id = item.get("id")
+                object_id = item_id if isinstance(item_id, str) and item_id and item_id not in duplicates else None
+                plan.append((item, object_id, object_id is not None and previous_objects.get(object_id) == item))
+            self._plans[collection] = plan
+        return plan
+
+    def close(self, name: str, object_id: str | None, start: int) -> None:
+        count = len(self.errors) - start
+        if count:
+            self.segments.append([name, object_id, count])
+
+    def splice(self, name: str, object_id: str) -> None:
+        """Copy the previous errors for an unchanged object into this run."""
+        previous_errors = self.previous.errors_by_segment.get((name, object_id))
+        if previous_errors:
+            self.errors.extend(previous_errors)
+            self.segments.append([name, object_id, len(previous_errors)])
+        self.reused += 1
+
+    def links_unchanged(self, object_id: str, item: dict) -> bool:
+        """Whether an unchanged assertion still has the same links and linked evidence."""
+        unchanged = self._links_unchanged.get(object_id)
+        if unchanged is None:
+            previous_index = self.previous.index
+            previous_item = self.previous.objects["assertions"][object_id]
+            unchanged = self._links_unchanged[object_id] = (
+                previous_index.links(previous_item) == self.index.links(item)
+                and previous_index.linked_evidence(previous_item) == self.index.linked_evidence(item)
+            )
+        return unchanged
+
+
+def object_pass(
+    run: ValidationRun,
+    name: str,
+    collection: str,
+    evaluate: Callable[[dict], None],
+    *,
+    reusable: bool = True,
+    depends: Callable[[str, dict], bool] | None = None,
+) -> None:
+    """Evaluate one pass per object, splicing in previous errors for unchanged objects."""
+    reusable = reusable and run.previous is not None
+    errors = run.errors
+    for item, object_id, unchanged in run.plan(collection):
+        if reusable and unchanged and (depends is None or depends(object_id, item)):
+            run.splice(name, object_id)
+            continue
+        start = len(errors)
+        evaluate(item)
+        run.close(name, object_id, start)
+
+
+def validate_artifact_refs(run: ValidationRun, extraction: dict) -> None:
+    """Document-wide artifact reference walk, segmented per top-level collection object."""
+    artifact_ids = run.index.ids("artifacts")
+    reusable = run.ids_unchanged
+    errors = run.errors
+    start = len(errors)
+    check_artifact_fields(extraction, artifact_ids, errors, None)
+    for key, value in extraction.items():
+        kind = type(value)
+        if kind is dict:
+            validate_nested_artifact_refs(value, artifact_ids, errors, (None, key))
+        elif kind is list and key in ID_COLLECTIONS:
+            run.close("artifact_refs", None, start)
+            name = f"artifact_refs:{key}"
+            node = (None, key)
+            plan = iter(run.plan(key))
+            previous_positions = run.previous.positions.get(key, {}) if reusable else {}
+            for position, item in enumerate(value):
+                start = len(errors)
+                if type(item) is dict:
+                    _, object_id, unchanged = next(plan)
+                    if reusable and unchanged and previous_positions.get(object_id) == position:
+                        run.splice(name, object_id)
+                        continue
+                    validate_nested_artifact_refs(item, artifact_ids, errors, (node, position))
+                    run.close(name, object_id, start)
+                elif type(item) is list:
+                    validate_nested_list_artifact_refs(item, artifact_ids, errors, (node, position))
+                    run.close(name, None, start)
+            start = len(errors)
+        elif kind is list:
+            validate_nested_list_artifact_refs(value, artifact_ids, errors, (None, key))
+    run.close("artifact_refs", None, start)
+
+
+def validate_cross_references(run: ValidationRun, extraction: dict) -> None:
+    validate_artifact_refs(run, extraction)
+    index, errors = run.index, run.errors
+    ids_unchanged = run.ids_unchanged
+    for table in REFERENCE_TABLES:
+
+        def evaluate(item: dict, table: RefTable = table) -> None:
+            owner_id = item.get("id")
+            check_refs(item, owner_id, table.rules, index, errors)
+            if table.nested_key:
+                for nested in dict_items(item.get(table.nested_key)):
+                    check_refs(nested, owner_id, table.nested_rules, index, errors)
+
+        object_pass(run, f"refs:{table.collection}", table.collection, evaluate, reusable=ids_unchanged)
+
+
+def validate_semantic_field_placement(run: ValidationRun) -> None:
+    errors = run.errors
+    for collection in ID_LIST_KEYS:
+        misplaced = MISPLACED_FIELDS[collection]
+
+        def evaluate(item: dict, collection: str = collection, misplaced: tuple = misplaced) -> None:
+            for field_name, allowed_collections in misplaced:
+                if field_name in item:
                     errors.append(
                         issue(
                             item.get("id"),
-                            f"{collection}[].{field}",
+                            f"{collection}[].{field_name}",
                             "semantic field is recorded on the wrong object type",
-                            f"Move {field} to {', '.join(sorted(allowed_collections))}.",
+                            f"Move {field_name} to {', '.join(sorted(allowed_collections))}.",
                         )
                     )
 
+        object_pass(run, f"placement:{collection}", collection, evaluate)
 
-def validate_promoted_claim_profile(extraction: dict, ids_by_key: dict[str, set[str]], errors: list[str]) -> None:
-    review_activities = [
-        activity
-        for activity in extraction.get("extraction_activities", []) or []
-        if isinstance(activity, dict)
-        and re.search(r"\b(human review|curation|curator review)\b", str(activity.get("activity_type", "")), re.IGNORECASE)
-    ]
-    expect(
-        bool(review_activities),
-        issue(
-            extraction.get("id"),
-            "extraction_activities[].activity_type",
-            "missing promotion review provenance",
-            "Record an ExtractionActivity whose activity_type names human review or curation before using the promoted_claim profile.",
-        ),
-        errors,
-    )
 
-    evidence_by_id = {
-        item.get("id"): item
-        for item in extraction.get("evidence_items", []) or []
-        if isinstance(item, dict) and item.get("id")
-    }
-    links_by_assertion: dict[str, list[dict]] = {}
-    for link in extraction.get("evidence_links", []) or []:
-        if not isinstance(link, dict):
-            continue
-        assertion_id = link.get("assertion")
-        if isinstance(assertion_id, str):
-            links_by_assertion.setdefault(assertion_id, []).append(link)
-        expect(
-            link.get("strength") in STRENGTH_LEVELS,
-            issue(link.get("id"), "evidence_links[].strength", "missing or invalid strength", "Use one of the StrengthLevel values."),
-            errors,
-        )
-        expect(
-            bool(link.get("rationale")),
-            issue(link.get("id"), "evidence_links[].rationale", "missing rationale", "Explain why this evidence supports, refutes, or qualifies the assertion."),
-            errors,
-        )
-        expect(
-            link.get("polarity") in POLARITIES,
-            issue(link.get("id"), "evidence_links[].polarity", "invalid polarity", "Use supports, refutes, mixed, or inconclusive."),
-            errors,
-        )
-        expect(
-            link.get("curation_status") in PROMOTED_CURATION_STATUSES,
-            issue(link.get("id"), "evidence_links[].curation_status", "missing human curation status", "Use human_verified or human_corrected before promoting the link."),
-            errors,
-        )
+def rule_pass(run: ValidationRun, name: str, collection: str, rules: tuple[Rule, ...], **kwargs: Any) -> None:
+    index, errors = run.index, run.errors
+    object_pass(run, name, collection, lambda item: evaluate_rules(item, rules, index, errors), **kwargs)
 
-    for assertion in extraction.get("assertions", []) or []:
-        if not isinstance(assertion, dict):
-            continue
-        assertion_id = assertion.get("id")
-        criticality = assertion.get("criticality")
-        links = links_by_assertion.get(assertion_id, [])
-        linked_evidence = [evidence_by_id.get(link.get("evidence_item")) for link in links]
 
-        expect(
-            criticality in ASSERTION_CRITICALITIES,
-            issue(assertion_id, "assertions[].criticality", "missing or invalid criticality", "Use core, major, supporting, or background."),
-            errors,
-        )
-        expect(
-            nonempty_string_list(assertion.get("falsification_criteria")),
-            issue(assertion_id, "assertions[].falsification_criteria", "missing falsification criteria", "Add at least one concrete observation or analysis that would weaken the claim."),
-            errors,
-        )
-        expect(
-            assertion.get("curation_status") in PROMOTED_CURATION_STATUSES,
-            issue(assertion_id, "assertions[].curation_status", "missing human curation status", "Use human_verified or human_corrected before promoting the assertion."),
-            errors,
-        )
-        if criticality != "background":
-            expect(
-                bool(links),
-                issue(assertion_id, "evidence_links", "no evidence links target this assertion", "Add at least one EvidenceLink from a supporting or refuting EvidenceItem."),
-                errors,
-            )
-            expect(
-                any(link.get("polarity") in DECISIVE_POLARITIES for link in links),
-                issue(assertion_id, "evidence_links[].polarity", "no decisive evidence link", "At least one linked evidence item should use supports, refutes, or mixed."),
-                errors,
-            )
-            expect(
-                has_text_spans(assertion) or any(has_text_spans(item) for item in linked_evidence),
-                issue(assertion_id, "assertions[].text_spans", "missing assertion/evidence grounding", "Add TextSpan grounding on the assertion or one of its linked EvidenceItems."),
-                errors,
-            )
+def document_pass(run: ValidationRun, name: str, evaluate: Callable[[], None]) -> None:
+    start = len(run.errors)
+    evaluate()
+    run.close(name, None, start)
 
 
-def validate_benchmark_key_profile(extraction: dict, ids_by_key: dict[str, set[str]], errors: list[str]) -> None:
-    validate_promoted_claim_profile(extraction, ids_by_key, errors)
+def validate_profile(run: ValidationRun, extraction: dict, profile: str) -> None:
+    if profile not in {"promoted_claim", "benchmark_key"}:
+        return
+    index, errors = run.index, run.errors
 
-    links_by_assertion: dict[str, list[dict]] = {}
-    for link in extraction.get("evidence_links", []) or []:
-        if isinstance(link, dict) and isinstance(link.get("assertion"), str):
-            links_by_assertion.setdefault(link["assertion"], []).append(link)
+    def promoted_root() -> None:
+        for rule in PROMOTED_ROOT_RULES:
+            rule.evaluate(extraction, extraction.get("id"), index, errors)
 
-    for assertion in extraction.get("assertions", []) or []:
-        if not isinstance(assertion, dict):
-            continue
-        assertion_id = assertion.get("id")
-        criticality = assertion.get("criticality")
-        links = links_by_assertion.get(assertion_id, [])
-        if criticality in {"core", "major"} and not is_limitation_or_speculation(assertion):
-            expect(
-                any(
-                    link.get("polarity") in DECISIVE_POLARITIES
-                    and link.get("strength") in ADEQUATE_STRENGTH_LEVELS
-                    for link in links
-                ),
-                issue(assertion_id, "evidence_links[].strength", "core or major assertion has no moderate-or-strong decisive evidence", "Add a decisive EvidenceLink with strength moderate, strong, or very_strong, or lower the assertion criticality if justified."),
-                errors,
-            )
+    document_pass(run, "promoted_root", promoted_root)
+    rule_pass(run, "promoted_links", "evidence_links", PROMOTED_LINK_RULES)
+    depends = run.links_unchanged
+    rule_pass(run, "promoted_assertions", "assertions", PROMOTED_ASSERTION_RULES, depends=depends)
+    if profile == "benchmark_key":
+        rule_pass(run, "benchmark_assertions", "assertions", BENCHMARK_ASSERTION_RULES, depends=depends)
 
 
-def main() -> int:
-    args = parse_args()
-    profile = PROFILE_ALIASES.get(args.profile, args.profile)
-    extraction_path = args.extraction_json.expanduser().resolve()
-    extraction = load_json(extraction_path)
-    article = load_json(args.article_json)
-    source_markdown = (
-        args.source_markdown.expanduser().resolve().read_text(encoding="utf-8")
-        if args.source_markdown
-        else ""
-    )
-    repair_actions: list[dict[str, Any]] = []
-    if isinstance(extraction, dict) and args.repair_out:
-        extraction, repair_actions = repair_paper_extraction(extraction)
-        args.repair_out.expanduser().resolve().write_text(
-            json.dumps(extraction, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
+@lru_cache(maxsize=16)
+def source_signals(source_markdown: str, article_text: str, has_figure_legends: bool) -> tuple[bool, bool, bool, bool]:
+    """DOI/PMID/figure/dataset signals for one source; cached for batch and repair loops."""
+    source_text = front_matter_only(source_markdown) + article_text
+    figure_signals = has_figure_legends
+    if not figure_signals and source_markdown:
+        figure_signals = any(FIGURE_SIGNAL_RE.match(line) for line in source_markdown.splitlines())
+    dataset_signals = bool(source_markdown and DATASET_SIGNAL_RE.search(source_markdown))
+    return bool(DOI_RE.search(source_text)), bool(PMID_RE.search(source_text)), figure_signals, dataset_signals
 
-    errors: list[str] = []
-    warnings: list[str] = []
 
-    expect(
-        isinstance(extraction, dict),
-        issue("(input)", "paper_extraction", "paper extraction is not a JSON object", "Provide a PaperExtraction JSON object."),
-        errors,
-    )
-    if errors:
-        return write_report(args.report_out, extraction_path, False, errors, warnings, {}, profile, repair_actions)
-
-    root_id = extraction.get("id") or "(paper extraction)"
-    expect(bool(extraction.get("id")), issue(root_id, "id", "missing top-level id", "Set the PaperExtraction document ID."), errors)
-    expect(bool(extraction.get("title")), issue(root_id, "title", "missing top-level title", "Set the manuscript title."), errors)
-    expect(bool(extraction.get("schema_version")), issue(root_id, "schema_version", "missing schema version", "Set the CSAG schema version used for the extraction."), errors)
-    expect(bool(extraction.get("validator_version")), issue(root_id, "validator_version", "missing validator version", "Set the validator version used for the validation report."), errors)
-    expect(isinstance(extraction.get("assertions"), list), issue(root_id, "assertions", "missing assertions list", "Add an assertions array, even if empty only for non-paper material."), errors)
-    expect(isinstance(extraction.get("evidence_items"), list), issue(root_id, "evidence_items", "missing evidence_items list", "Add an evidence_items array."), errors)
-    expect(isinstance(extraction.get("evidence_links"), list), issue(root_id, "evidence_links", "missing evidence_links list", "Add an evidence_links array."), errors)
-    expect(isinstance(extraction.get("extraction_activities"), list) and extraction.get("extraction_activities"), issue(root_id, "extraction_activities", "missing extraction activities", "Record at least one extraction activity with DOI/PMID status parameters."), errors)
-
-    ids_by_key = collect_ids(extraction, errors)
-
-    for item in extraction.get("assertions", []):
-        assertion_id = item.get("id")
-        expect(bool(assertion_id), issue(assertion_id, "assertions[].id", "assertion ID is missing", "Assign a deterministic assertion ID."), errors)
-        expect(bool(item.get("assertion_text")), issue(assertion_id, "assertions[].assertion_text", "missing assertion text", "Add the natural-language assertion."), errors)
-        expect(bool(item.get("claim_role")), issue(assertion_id, "assertions[].claim_role", "missing claim role", "Set claim_role from the controlled vocabulary."), errors)
-        if item.get("claim_role"):
-            expect(
-                item.get("claim_role") in CLAIM_ROLES,
-                issue(assertion_id, "assertions[].claim_role", "invalid claim role", "Set claim_role from the controlled vocabulary."),
-                errors,
-            )
-        expect(bool(item.get("normalization_status")), issue(assertion_id, "assertions[].normalization_status", "missing normalization status", "Set raw, partially_normalized, or fully_normalized."), errors)
-        if item.get("normalization_status"):
-            expect(
-                item.get("normalization_status") in NORMALIZATION_STATUSES,
-                issue(assertion_id, "assertions[].normalization_status", "invalid normalization status", "Set raw, partially_normalized, or fully_normalized."),
-                errors,
-            )
-        expect(isinstance(item.get("contexts"), list) and len(item.get("contexts")) >= 1, issue(assertion_id, "assertions[].contexts", "missing contexts", "Attach at least one Context object to every Assertion."), errors)
-
-    for item in extraction.get("evidence_links", []):
-        expect(bool(item.get("polarity")), issue(item.get("id"), "evidence_links[].polarity", "missing polarity", "Use supports, refutes, mixed, or inconclusive."), errors)
-        if item.get("polarity"):
-            expect(
-                item.get("polarity") in POLARITIES,
-                issue(item.get("id"), "evidence_links[].polarity", "invalid polarity", "Use supports, refutes, mixed, or inconclusive."),
-                errors,
-            )
+def article_source_text(article: dict | None) -> str:
+    if article is None:
+        return ""
+    return "".join("\n" + article.get(field, "") for field in ("title", "authors", "affiliations", "abstract"))
 
-    validate_optional_assertion_metadata(extraction, errors)
-    validate_semantic_field_placement(extraction, errors)
-    validate_cross_references(extraction, ids_by_key, errors)
-    if profile == "promoted_claim":
-        validate_promoted_claim_profile(extraction, ids_by_key, errors)
-    if profile == "benchmark_key":
-        validate_benchmark_key_profile(extraction, ids_by_key, errors)
 
+def validate_source_coverage(
+    extraction: dict,
+    index: ExtractionIndex,
+    errors: list[str],
+    source_markdown: str,
+    article: dict | None,
+) -> None:
+    root_id = root_object_id(extraction)
+    figure_legends = article.get("figure_legends", []) if isinstance(article, dict) else []
+    source_doi, source_pmid, figure_signals, dataset_signals = source_signals(
+        source_markdown, article_source_text(article), bool(figure_legends)
+    )
     param_map = collect_parameter_map(extraction)
-    source_text = front_matter_only(source_markdown)
-    if article is not None:
-        source_text += "\n" + article.get("title", "")
-        source_text += "\n" + article.get("authors", "")
-        source_text += "\n" + article.get("affiliations", "")
-        source_text += "\n" + article.get("abstract", "")
-
-    source_doi = DOI_RE.search(source_text)
-    source_pmid = PMID_RE.search(source_text)
     doi = extraction.get("doi", "")
     pmid = extraction.get("pmid", "")
     doi_status = param_map.get("doi_status")
@@ -804,100 +1160,195 @@ def main() -> int:
     if pmid:
         expect(pmid_status in {None, "resolved"}, issue(root_id, "extraction_activities[].parameters.pmid_status", "extraction.pmid is populated but pmid_status is not resolved", "Set pmid_status to resolved when extraction.pmid is populated."), errors)
 
-    figure_legends = article.get("figure_legends", []) if isinstance(article, dict) else []
-    figure_signals = bool(figure_legends)
-    if not figure_signals and source_markdown:
-        figure_signals = any(FIGURE_SIGNAL_RE.match(line) for line in source_markdown.splitlines())
     if figure_signals:
         artifacts = extraction.get("artifacts", [])
         expect(isinstance(artifacts, list) and len(artifacts) > 0, issue(root_id, "artifacts", "figure/table captions are present in the source but extraction.artifacts is empty", "Add Artifact entries for source figures or tables, or correct the article sidecar if captions were detected incorrectly."), errors)
-        for artifact in artifacts:
-            artifact_id = artifact.get("id")
-            expect(bool(artifact_id), issue(artifact_id, "artifacts[].id", "artifact ID is missing", "Assign a deterministic Artifact ID."), errors)
-            expect(bool(artifact.get("artifact_type")), issue(artifact_id, "artifacts[].artifact_type", "missing artifact type", "Set artifact_type from the controlled vocabulary."), errors)
-            if artifact.get("artifact_type"):
-                expect(
-                    artifact.get("artifact_type") in ARTIFACT_TYPES,
-                    issue(artifact_id, "artifacts[].artifact_type", "invalid artifact type", "Use figure, table, supplementary, equation, protocol, code, or other."),
-                    errors,
-                )
-            expect(bool(artifact.get("artifact_label")) or bool(artifact.get("caption")), issue(artifact_id, "artifacts[].artifact_label", "missing artifact label or caption", "Populate artifact_label or caption from the source."), errors)
+        apply_rules(dict_items(artifacts), ARTIFACT_RULES, index, errors)
 
-    dataset_signals = bool(source_markdown and DATASET_SIGNAL_RE.search(source_markdown))
     if dataset_signals:
         datasets = extraction.get("datasets", [])
         expect(isinstance(datasets, list) and len(datasets) > 0, issue(root_id, "datasets", "dataset/data-availability signals are present in the source but extraction.datasets is empty", "Add Dataset entries for accessions or repositories mentioned by the source, or correct the source sidecar if the signal was detected incorrectly."), errors)
-        for dataset in datasets:
-            dataset_id = dataset.get("id")
-            expect(bool(dataset_id), issue(dataset_id, "datasets[].id", "dataset ID is missing", "Assign a deterministic Dataset ID."), errors)
-            expect(
-                bool(dataset.get("accession")) or bool(dataset.get("repository")) or bool(dataset.get("dataset_url")),
-                issue(dataset_id, "datasets[].accession", "missing accession, repository, or dataset URL", "Populate accession, repository, or dataset_url from the source data-availability statement."),
-                errors,
-            )
-
-    report = {
-        "ok": not errors,
-        "profile": profile,
-        "validator_version": VALIDATOR_VERSION,
-        "extraction_json": str(extraction_path),
-        "errors": errors,
-        "structured_errors": [structured_issue(error) for error in errors],
-        "error_summary": error_summary(errors),
-        "warnings": warnings,
-        "repair_actions": repair_actions,
-        "metrics": {
-            "assertions": len(extraction.get("assertions", [])),
-            "assertions_with_criticality": sum(
-                1 for item in extraction.get("assertions", []) if item.get("criticality")
-            ),
-            "assertions_with_falsification_criteria": sum(
-                1 for item in extraction.get("assertions", []) if nonempty_string_list(item.get("falsification_criteria"))
-            ),
-            "evidence_items": len(extraction.get("evidence_items", [])),
-            "evidence_links": len(extraction.get("evidence_links", [])),
-            "artifacts": len(extraction.get("artifacts", [])),
-            "datasets": len(extraction.get("datasets", [])),
-        },
+        apply_rules(dict_items(datasets), DATASET_RULES, index, errors)
+
+
+def run_validation(
+    extraction: object,
+    profile: str = "paper_local",
+    source_markdown: str = "",
+    article: dict | None = None,
+    previous: PreviousRun | None = None,
+) -> ValidationRun:
+    """Run every rule for ``profile``; with ``previous``, unchanged objects reuse its errors.
+
+    The result is identical to a full run as long as ``previous`` was produced by
+    the same validator version and profile.
+    """
+    if not isinstance(extraction, dict):
+        run = ValidationRun()
+        run.errors.append(issue("(input)", "paper_extraction", "paper extraction is not a JSON object", "Provide a PaperExtraction JSON object."))
+        run.close("input", None, 0)
+        return run
+
+    index = build_index(extraction)
+    run = ValidationRun(extraction, index, previous)
+    root_id = root_object_id(extraction)
+
+    def root() -> None:
+        for rule in ROOT_RULES:
+            rule.evaluate(extraction, root_id, index, run.errors)
+        validate_unique_ids(index, run.errors)
+
+    document_pass(run, "root", root)
+    rule_pass(run, "assertions", "assertions", ASSERTION_RULES)
+    rule_pass(run, "evidence_links", "evidence_links", EVIDENCE_LINK_RULES)
+    rule_pass(run, "assertion_metadata", "assertions", ASSERTION_METADATA_RULES)
+    validate_semantic_field_placement(run)
+    validate_cross_references(run, extraction)
+    validate_profile(run, extraction, profile)
+    document_pass(
+        run,
+        "source_coverage",
+        lambda: validate_source_coverage(extraction, index, run.errors, source_markdown, article),
+    )
+    return run
+
+
+def validate_extraction(
+    extraction: object,
+    profile: str = "paper_local",
+    source_markdown: str = "",
+    article: dict | None = None,
+) -> list[str]:
+    """Run every rule for ``profile`` and return issue strings in report order."""
+    return run_validation(extraction, profile, source_markdown, article).errors
+
+
+def extraction_metrics(extraction: dict) -> dict[str, int]:
+    assertions = dict_items(extraction.get("assertions"))
+    return {
+        "assertions": len(assertions),
+        "assertions_with_criticality": sum(1 for item in assertions if item.get("criticality")),
+        "assertions_with_falsification_criteria": sum(
+            1 for item in assertions if nonempty_string_list(item.get("falsification_criteria"))
+        ),
+        "evidence_items": len(extraction.get("evidence_items", []) or []),
+        "evidence_links": len(extraction.get("evidence_links", []) or []),
+        "artifacts": len(extraction.get("artifacts", []) or []),
+        "datasets": len(extraction.get("datasets", []) or []),
     }
-    args.report_out.expanduser().resolve().write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
-    if errors:
-        for error in errors:
-            print(f"ERROR: {error}")
-        return 1
-    print("OK")
-    return 0
 
 
-def write_report(
-    report_path: Path,
+def build_report(
     extraction_path: Path,
-    ok: bool,
     errors: list[str],
     warnings: list[str],
     metrics: dict,
     profile: str = "candidate",
     repair_actions: list[dict[str, Any]] | None = None,
-) -> int:
-    report = {
-        "ok": ok,
+    error_segments: list[list] | None = None,
+) -> dict:
+    structured_errors = [structured_issue(error) for error in errors]
+    return {
+        "ok": not errors,
         "profile": profile,
         "validator_version": VALIDATOR_VERSION,
         "extraction_json": str(extraction_path),
         "errors": errors,
-        "structured_errors": [structured_issue(error) for error in errors],
-        "error_summary": error_summary(errors),
+        "structured_errors": structured_errors,
+        "error_summary": error_summary(structured_errors),
         "warnings": warnings,
         "repair_actions": repair_actions or [],
         "metrics": metrics,
+        "error_segments": error_segments or [],
     }
+
+
+def default_report_path(extraction_path: Path) -> Path:
+    return extraction_path.with_name(f"{extraction_path.stem}.validation.json")
+
+
+def validate_file(
+    extraction_path: Path,
+    report_path: Path,
+    profile: str,
+    source_markdown_path: Path | None = None,
+    article_json_path: Path | None = None,
+    repair_out: Path | None = None,
+    previous_report_path: Path | None = None,
+    previous_extraction_path: Path | None = None,
+) -> dict:
+    """Validate one extraction file and write its report; returns the report.
+
+    With a previous report and the extraction it was produced from, objects that
+    did not change reuse their previous errors instead of being re-checked.
+    """
+    extraction = load_json(extraction_path)
+    article = load_json(article_json_path)
+    source_markdown = (
+        source_markdown_path.expanduser().resolve().read_text(encoding="utf-8")
+        if source_markdown_path
+        else ""
+    )
+    repair_actions: list[dict[str, Any]] = []
+    if isinstance(extraction, dict) and repair_out:
+        extraction, repair_actions = repair_paper_extraction(extraction)
+        repair_out.expanduser().resolve().write_text(
+            json.dumps(extraction, indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+
+    previous = None
+    if previous_report_path and previous_extraction_path:
+        previous = load_previous_run(load_json(previous_extraction_path), load_json(previous_report_path), profile)
+        if previous is None:
+            print(f"NOTE: {previous_report_path} cannot be reused for profile {profile}; validating everything", file=sys.stderr)
+    run = run_validation(extraction, profile, source_markdown, article, previous)
+    metrics = extraction_metrics(extraction) if isinstance(extraction, dict) else {}
+    report = build_report(extraction_path, run.errors, [], metrics, profile, repair_actions, run.segments)
     report_path.expanduser().resolve().write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
-    if errors:
-        for error in errors:
-            print(f"ERROR: {error}")
-        return 1
-    print("OK")
-    return 0
+    return report
+
+
+def main() -> int:
+    args = parse_args()
+    profile = PROFILE_ALIASES.get(args.profile, args.profile)
+    extraction_paths = [path.expanduser().resolve() for path in args.extraction_json]
+
+    if len(extraction_paths) == 1:
+        extraction_path = extraction_paths[0]
+        report = validate_file(
+            extraction_path,
+            args.report_out or default_report_path(extraction_path),
+            profile,
+            args.source_markdown,
+            args.article_json,
+            args.repair_out,
+            args.previous_report,
+            args.previous_extraction,
+        )
+        if report["errors"]:
+            for error in report["errors"]:
+                print(f"ERROR: {error}")
+            return 1
+        print("OK")
+        return 0
+
+    failed = 0
+    for extraction_path in extraction_paths:
+        markdown_path, article_path = find_sidecars(extraction_path)
+        try:
+            report = validate_file(extraction_path, default_report_path(extraction_path), profile, markdown_path, article_path)
+        except (OSError, json.JSONDecodeError) as exc:
+            failed += 1
+            print(f"FAILED {extraction_path}: {exc}")
+            continue
+        if report["errors"]:
+            failed += 1
+            print(f"ERROR {extraction_path}: {len(report['errors'])} errors")
+        else:
+            print(f"OK {extraction_path}")
+    print(f"{len(extraction_paths) - failed}/{len(extraction_paths)} extractions passed")
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
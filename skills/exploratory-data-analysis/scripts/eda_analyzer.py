@@ -4,11 +4,53 @@ Exploratory Data Analysis Analyzer
 Analyzes scientific data files and generates comprehensive markdown reports
 """
 
+import argparse
+import glob
+import gzip
+import json
 import os
+import re
+import statistics
+import struct
 import sys
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import json
+from functools import lru_cache, partial
+from pathlib import Path
+
+
+# Bump when analyzer output changes so stale cached profiles are recomputed.
+PROFILE_CACHE_VERSION = 5
+PROFILE_CACHE_FILENAME = '.eda_profile_cache.json'
+GLOB_CHARS = set('*?[')
+
+# Streaming tabular profiling: rows per chunk, and bounded per-column sketches
+# for approximate quantiles (uniform bottom-k sample) and distinct counts (KMV).
+TABULAR_CHUNK_ROWS = 100_000
+QUANTILE_SAMPLE_SIZE = 10_000
+DISTINCT_SKETCH_SIZE = 4_096
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# Alignment/variant summaries: per-contig counts come from the index; the
+# optional sampled scan reads this many records spread over this many regions.
+ALIGNMENT_SAMPLE_RECORDS = 20_000
+ALIGNMENT_SAMPLE_REGIONS = 20
+TOP_CONTIGS_REPORTED = 25
+COMPRESSED_SUFFIXES = ('gz', 'bgz')
+INDEX_SUFFIXES = ('.bai', '.crai', '.csi', '.tbi')
+# Sidecar index suffixes htslib accepts for each indexed format.
+INDEX_SUFFIXES_BY_FORMAT = {
+    'bam': ('.bai', '.csi'),
+    'cram': ('.crai',),
+    'vcf': ('.tbi', '.csi'),
+    'bcf': ('.csi',),
+}
+
+# Array/image statistics: reduce NPY/HDF5 arrays in slabs of about this many
+# bytes, and sample at most this many pages/pixels per image.
+ARRAY_SLAB_BYTES = 64 * 1024 * 1024
+IMAGE_SAMPLE_PAGES = 8
+IMAGE_SAMPLE_PIXELS = 1_000_000
 
 
 def detect_file_type(filepath):
@@ -126,6 +168,11 @@ def detect_file_type(filepath):
     }
 
     ext_clean = extension.lstrip('.')
+    # Look through compression suffixes (reads.fastq.gz, calls.vcf.gz)
+    if ext_clean in COMPRESSED_SUFFIXES and len(file_path.suffixes) > 1:
+        inner = file_path.suffixes[-2].lower().lstrip('.')
+        if inner in extension_map:
+            ext_clean = inner
     if ext_clean in extension_map:
         category, description = extension_map[ext_clean]
         return ext_clean, category, description
@@ -191,12 +238,10 @@ def load_reference_info(category, extension):
     # Parse the reference file for the specific extension
     # This is a simplified parser - could be more sophisticated
     try:
-        with open(ref_file, 'r') as f:
-            content = f.read()
+        content = _read_reference_text(str(ref_file))
 
         # Extract section for this file type
         # Look for the extension heading
-        import re
         pattern = rf'### \.{extension}[^#]*?(?=###|\Z)'
         match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
 
@@ -212,10 +257,22 @@ def load_reference_info(category, extension):
     return None
 
 
-def analyze_file(filepath):
+@lru_cache(maxsize=None)
+def _read_reference_text(ref_path):
+    """Read a reference file once per process; they are large and shared across files."""
+    with open(ref_path, 'r') as f:
+        return f.read()
+
+
+def analyze_file(filepath, metadata_only=False):
     """
     Main analysis function that routes to specific analyzers.
 
+    Args:
+        filepath: File to analyze
+        metadata_only: Report only what file metadata/indexes provide
+            (e.g. the Parquet footer) without scanning the data
+
     Returns:
         dict: Analysis results
     """
@@ -236,11 +293,11 @@ def analyze_file(filepath):
     # Try to perform data-specific analysis based on file type
     try:
         if category == 'general_scientific':
-            analysis['data_analysis'] = analyze_general_scientific(filepath, extension)
+            analysis['data_analysis'] = analyze_general_scientific(filepath, extension, metadata_only)
         elif category == 'bioinformatics_genomics':
-            analysis['data_analysis'] = analyze_bioinformatics(filepath, extension)
+            analysis['data_analysis'] = analyze_bioinformatics(filepath, extension, metadata_only)
         elif category == 'microscopy_imaging':
-            analysis['data_analysis'] = analyze_imaging(filepath, extension)
+            analysis['data_analysis'] = analyze_imaging(filepath, extension, metadata_only)
         # Add more specific analyzers as needed
     except Exception as e:
         analysis['data_analysis']['error'] = str(e)
@@ -248,26 +305,22 @@ def analyze_file(filepath):
     return analysis
 
 
-def analyze_general_scientific(filepath, extension):
+def analyze_general_scientific(filepath, extension, metadata_only=False):
     """Analyze general scientific data formats."""
     results = {}
 
     try:
         if extension in ['npy']:
             import numpy as np
-            data = np.load(filepath)
+            data = np.load(filepath, mmap_mode='r')
             results = {
                 'shape': data.shape,
                 'dtype': str(data.dtype),
                 'size': data.size,
                 'ndim': data.ndim,
-                'statistics': {
-                    'min': float(np.min(data)) if np.issubdtype(data.dtype, np.number) else None,
-                    'max': float(np.max(data)) if np.issubdtype(data.dtype, np.number) else None,
-                    'mean': float(np.mean(data)) if np.issubdtype(data.dtype, np.number) else None,
-                    'std': float(np.std(data)) if np.issubdtype(data.dtype, np.number) else None,
-                }
             }
+            if not metadata_only:
+                results['statistics'] = array_statistics(data)
 
         elif extension in ['npz']:
             import numpy as np
@@ -281,15 +334,16 @@ def analyze_general_scientific(filepath, extension):
         elif extension in ['csv', 'tsv']:
             import pandas as pd
             sep = '\t' if extension == 'tsv' else ','
-            df = pd.read_csv(filepath, sep=sep, nrows=10000)  # Sample first 10k rows
+            chunks = pd.read_csv(filepath, sep=sep, chunksize=TABULAR_CHUNK_ROWS)
+            results = profile_table_chunks(chunks)
 
-            results = {
-                'shape': df.shape,
-                'columns': list(df.columns),
-                'dtypes': {col: str(dtype) for col, dtype in df.dtypes.items()},
-                'missing_values': df.isnull().sum().to_dict(),
-                'summary_statistics': df.describe().to_dict() if len(df.select_dtypes(include='number').columns) > 0 else {}
-            }
+        elif extension in ['parquet']:
+            results = {'parquet_metadata': parquet_footer_summary(filepath)}
+            if not metadata_only:
+                import pyarrow.parquet as pq
+                parquet_file = pq.ParquetFile(filepath)
+                chunks = (batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=TABULAR_CHUNK_ROWS))
+                results.update(profile_table_chunks(chunks))
 
         elif extension in ['json']:
             with open(filepath, 'r') as f:
@@ -309,11 +363,18 @@ def analyze_general_scientific(filepath, extension):
                     for key in group.keys():
                         path = f"{prefix}/{key}"
                         if isinstance(group[key], h5py.Dataset):
+                            dataset = group[key]
                             items[path] = {
                                 'type': 'dataset',
-                                'shape': group[key].shape,
-                                'dtype': str(group[key].dtype)
+                                'shape': dataset.shape,
+                                'dtype': str(dataset.dtype),
+                                'chunks': dataset.chunks,
+                                'compression': dataset.compression,
                             }
+                            if not metadata_only:
+                                items[path]['statistics'] = array_statistics(
+                                    dataset, chunk_rows=dataset.chunks[0] if dataset.chunks else 1
+                                )
                         elif isinstance(group[key], h5py.Group):
                             items[path] = {'type': 'group'}
                             items.update(get_structure(group[key], path))
@@ -332,14 +393,778 @@ def analyze_general_scientific(filepath, extension):
     return results
 
 
-def analyze_bioinformatics(filepath, extension):
+class ArrayMoments:
+    """Merge min/max/mean/std and NaN/inf counts over array blocks."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.nan_count = 0
+        self.inf_count = 0
+
+    def update(self, block):
+        import numpy as np
+        block = np.asarray(block).ravel()
+        if np.issubdtype(block.dtype, np.floating):
+            finite = np.isfinite(block)
+            nan = np.isnan(block)
+            self.nan_count += int(nan.sum())
+            self.inf_count += int((~finite & ~nan).sum())
+            block = block[finite]
+        if block.size == 0:
+            return
+        x = block.astype(np.float64, copy=False)
+        n_b = x.size
+        mean_b = float(x.mean())
+        m2_b = float(((x - mean_b) ** 2).sum())
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta ** 2 * self.count * n_b / n
+        self.count = n
+        self.min = float(x.min()) if self.min is None else min(self.min, float(x.min()))
+        self.max = float(x.max()) if self.max is None else max(self.max, float(x.max()))
+
+    def result(self):
+        stats = {
+            'min': self.min,
+            'max': self.max,
+            'mean': self.mean if self.count else None,
+            'std': (self.m2 / self.count) ** 0.5 if self.count else None,
+        }
+        if self.nan_count or self.inf_count:
+            stats.update({'nan_count': self.nan_count, 'inf_count': self.inf_count})
+        return stats
+
+
+def array_statistics(array, chunk_rows=1, slab_bytes=None):
+    """
+    Exact min/max/mean/std of a memory-mapped or on-disk array in bounded memory.
+
+    The array (np.memmap, h5py.Dataset, ...) is read in slabs along axis 0 of
+    about ``slab_bytes``; slabs are a multiple of ``chunk_rows`` so HDF5
+    chunks are each read and decompressed once.
+
+    Returns:
+        dict or None: statistics, or None for non-numeric dtypes
+    """
+    import numpy as np
+
+    if not (np.issubdtype(array.dtype, np.integer) or np.issubdtype(array.dtype, np.floating)
+            or np.issubdtype(array.dtype, np.bool_)):
+        return None
+    moments = ArrayMoments()
+    if array.ndim == 0:
+        moments.update(array[()])
+        return moments.result()
+    if slab_bytes is None:
+        slab_bytes = ARRAY_SLAB_BYTES
+    row_bytes = max(1, array.dtype.itemsize * int(np.prod(array.shape[1:])))
+    rows = max(chunk_rows, (slab_bytes // row_bytes) // chunk_rows * chunk_rows)
+    for start in range(0, array.shape[0], rows):
+        moments.update(array[start:start + rows])
+    return moments.result()
+
+
+def _sample_indices(count, limit):
+    """Up to ``limit`` evenly spaced indices in range(count)."""
+    if count <= limit:
+        return list(range(count))
+    step = (count - 1) / (limit - 1)
+    return sorted({round(i * step) for i in range(limit)})
+
+
+def _pixel_sample(page):
+    """Subsample a 2D+ page on its first two axes to at most IMAGE_SAMPLE_PIXELS pixels."""
+    import math
+    pixels = page.shape[0] * (page.shape[1] if page.ndim > 1 else 1)
+    stride = max(1, math.ceil(math.sqrt(pixels / IMAGE_SAMPLE_PIXELS)))
+    if stride == 1:
+        return page, 1
+    return (page[::stride, ::stride] if page.ndim > 1 else page[::stride]), stride
+
+
+class ColumnProfile:
+    """
+    Streaming per-column accumulator with bounded memory.
+
+    Null counts, min/max, mean and std are exact (chunk-merged moments).
+    Quantiles come from a uniform bottom-k sample and distinct counts from a
+    KMV (k minimum hash values) sketch; both are exact while the column has
+    fewer values than the sketch size.
+    """
+
+    def __init__(self, rng):
+        import numpy as np
+        self.rng = rng
+        self.dtypes = []
+        self.nulls = 0
+        self.non_numeric = False
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.sample_keys = np.empty(0)
+        self.sample_values = np.empty(0)
+        self.hashes = np.empty(0, dtype=np.uint64)
+        self.hashes_saturated = False
+
+    def update(self, series):
+        import numpy as np
+        import pandas as pd
+
+        dtype = str(series.dtype)
+        if dtype not in self.dtypes:
+            self.dtypes.append(dtype)
+        values = series.dropna()
+        self.nulls += len(series) - len(values)
+        if values.empty:
+            return
+
+        # Hash a dtype-independent form: a chunk with a blank cell turns an int
+        # column into float64, and 1 and 1.0 must count as one distinct value.
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            canonical = values.astype('float64')
+        else:
+            canonical = values.astype(str)
+        hashes = np.unique(pd.util.hash_pandas_object(canonical, index=False).to_numpy())
+        hashes = np.union1d(self.hashes, hashes)
+        if len(hashes) > DISTINCT_SKETCH_SIZE:
+            hashes = hashes[:DISTINCT_SKETCH_SIZE]
+            self.hashes_saturated = True
+        self.hashes = hashes
+
+        if not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            self.non_numeric = True
+            return
+
+        x = values.to_numpy(dtype=float)
+        n_b = len(x)
+        mean_b = float(x.mean())
+        m2_b = float(((x - mean_b) ** 2).sum())
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta ** 2 * self.count * n_b / n
+        self.count = n
+        self.min = float(x.min()) if self.min is None else min(self.min, float(x.min()))
+        self.max = float(x.max()) if self.max is None else max(self.max, float(x.max()))
+
+        keys = np.concatenate([self.sample_keys, self.rng.random(n_b)])
+        sample = np.concatenate([self.sample_values, x])
+        if len(keys) > QUANTILE_SAMPLE_SIZE:
+            keep = np.argpartition(keys, QUANTILE_SAMPLE_SIZE)[:QUANTILE_SAMPLE_SIZE]
+            keys, sample = keys[keep], sample[keep]
+        self.sample_keys, self.sample_values = keys, sample
+
+    @property
+    def dtype(self):
+        import numpy as np
+        if len(self.dtypes) == 1:
+            return self.dtypes[0]
+        try:
+            return str(np.result_type(*self.dtypes))
+        except TypeError:
+            return 'object'
+
+    @property
+    def is_numeric(self):
+        return self.count > 0 and not self.non_numeric
+
+    def distinct_count(self):
+        if not self.hashes_saturated:
+            return len(self.hashes)
+        return int(round((DISTINCT_SKETCH_SIZE - 1) / (float(self.hashes[-1]) / 2.0 ** 64)))
+
+    def summary(self):
+        import numpy as np
+        stats = {
+            'count': self.count,
+            'mean': self.mean,
+            'std': (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else None,
+            'min': self.min,
+        }
+        for q, value in zip(QUANTILES, np.quantile(self.sample_values, QUANTILES)):
+            stats[f"{q:.0%}"] = float(value)
+        stats['max'] = self.max
+        return stats
+
+
+def profile_table_chunks(chunks):
+    """
+    Profile an iterable of DataFrame chunks covering the whole table.
+
+    Memory is bounded by the chunk size plus fixed-size per-column sketches.
+
+    Returns:
+        dict: shape, dtypes, exact missing values, summary statistics (exact
+        moments, approximate quantiles) and distinct counts
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    columns = {}
+    rows = 0
+    for chunk in chunks:
+        rows += len(chunk)
+        for name in chunk.columns:
+            if name not in columns:
+                columns[name] = ColumnProfile(rng)
+            columns[name].update(chunk[name])
+
+    numeric = {name: col for name, col in columns.items() if col.is_numeric}
+    quantiles_exact = all(col.count <= QUANTILE_SAMPLE_SIZE for col in numeric.values())
+    distinct_exact = not any(col.hashes_saturated for col in columns.values())
+    return {
+        'shape': (rows, len(columns)),
+        'columns': list(columns),
+        'dtypes': {name: col.dtype for name, col in columns.items()},
+        'missing_values': {name: col.nulls for name, col in columns.items()},
+        'summary_statistics': {name: col.summary() for name, col in numeric.items()},
+        'distinct_counts': {name: col.distinct_count() for name, col in columns.items()},
+        'profiling': {
+            'mode': 'streaming (full file)',
+            'chunk_rows': TABULAR_CHUNK_ROWS,
+            'quantiles': 'exact' if quantiles_exact else f"approximate (uniform sample of {QUANTILE_SAMPLE_SIZE:,} values)",
+            'distinct_counts': 'exact' if distinct_exact else f"approximate (KMV sketch, k={DISTINCT_SKETCH_SIZE:,})",
+        },
+    }
+
+
+def parquet_footer_summary(filepath):
+    """
+    Summarize a Parquet file from its footer metadata without reading data pages.
+
+    Per-column null counts and min/max are aggregated across row groups when
+    every row group carries statistics for that column.
+    """
+    import pyarrow.parquet as pq
+
+    metadata = pq.ParquetFile(filepath).metadata
+    columns = {}
+    for i in range(metadata.num_columns):
+        path = metadata.schema.column(i).path
+        column = {
+            'physical_type': metadata.schema.column(i).physical_type,
+            'compressed_bytes': 0,
+            'uncompressed_bytes': 0,
+        }
+        null_count = 0
+        minimum = maximum = None
+        complete_stats = True
+        for rg in range(metadata.num_row_groups):
+            chunk = metadata.row_group(rg).column(i)
+            column['compressed_bytes'] += chunk.total_compressed_size
+            column['uncompressed_bytes'] += chunk.total_uncompressed_size
+            stats = chunk.statistics
+            if stats is None or not stats.has_null_count or not stats.has_min_max:
+                complete_stats = False
+                continue
+            null_count += stats.null_count
+            minimum = stats.min if minimum is None else min(minimum, stats.min)
+            maximum = stats.max if maximum is None else max(maximum, stats.max)
+        if complete_stats and metadata.num_row_groups:
+            column.update({'null_count': null_count, 'min': minimum, 'max': maximum})
+        columns[path] = column
+
+    return {
+        'num_rows': metadata.num_rows,
+        'num_row_groups': metadata.num_row_groups,
+        'created_by': metadata.created_by,
+        'columns': columns,
+    }
+
+
+def _open_text(filepath):
+    """Open a possibly gzip/bgzip-compressed text file."""
+    if str(filepath).lower().endswith(tuple(f'.{suffix}' for suffix in COMPRESSED_SUFFIXES)):
+        return gzip.open(filepath, 'rt')
+    return open(filepath, 'r')
+
+
+def _index_candidates(filepath):
+    """Sidecar index paths to probe for an alignment or variant file, by its format."""
+    filepath = str(filepath)
+    extension = detect_file_type(filepath)[0]
+    suffixes = INDEX_SUFFIXES_BY_FORMAT.get(extension, ())
+    # samtools also writes sample.bai / sample.crai next to sample.bam / sample.cram.
+    bases = [filepath, os.path.splitext(filepath)[0]] if extension in ('bam', 'cram') else [filepath]
+    return [f"{base}{suffix}" for suffix in suffixes for base in bases]
+
+
+def find_index(filepath):
+    """Return the first existing sidecar index for ``filepath``, or None."""
+    for candidate in _index_candidates(filepath):
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def read_hts_index(index_path):
+    """
+    Read per-reference record counts from a BAI, TBI or CSI index.
+
+    htslib stores (mapped, unmapped) counts for each reference in a pseudo-bin,
+    so this is O(index size) and never touches the indexed file.
+
+    Returns:
+        dict: format, reference names (when the index carries them),
+        per-reference mapped/unmapped counts, per-reference (start, end) spans
+        of the non-empty bins, and unplaced record count
+    """
+    with open(index_path, 'rb') as f:
+        data = f.read()
+    if data[:4] != b'BAI\x01':
+        data = gzip.decompress(data)  # TBI and CSI are BGZF-compressed
+
+    magic = data[:4]
+    offset = 4
+    names = None
+    pseudo_bin = 37450
+    min_shift, depth = 14, 5
+    csi = magic == b'CSI\x01'
+
+    def read(fmt):
+        nonlocal offset
+        values = struct.unpack_from(fmt, data, offset)
+        offset += struct.calcsize(fmt)
+        return values
+
+    def read_names(l_nm):
+        nonlocal offset
+        raw = data[offset:offset + l_nm]
+        offset += l_nm
+        return [name.decode() for name in raw.split(b'\x00') if name]
+
+    if magic == b'BAI\x01':
+        index_format = 'BAI'
+        (n_ref,) = read('<i')
+    elif magic == b'TBI\x01':
+        index_format = 'TBI'
+        n_ref, _fmt, _col_seq, _col_beg, _col_end, _meta, _skip, l_nm = read('<8i')
+        names = read_names(l_nm)
+    elif csi:
+        index_format = 'CSI'
+        min_shift, depth, l_aux = read('<3i')
+        aux_end = offset + l_aux
+        if l_aux >= 28:  # tabix-style aux block (vcf.gz.csi) carries names
+            *_, l_nm = read('<7i')
+            names = read_names(l_nm)
+        offset = aux_end
+        (n_ref,) = read('<i')
+        pseudo_bin = ((1 << ((depth + 1) * 3)) - 1) // 7 + 1
+    else:
+        raise ValueError(f"Unrecognized index format: {index_path}")
+
+    references, bins = [], []
+    for _ in range(n_ref):
+        mapped = unmapped = 0
+        spans = []
+        (n_bin,) = read('<i')
+        for _ in range(n_bin):
+            if csi:
+                bin_id, _loffset, n_chunk = read('<IQi')
+            else:
+                bin_id, n_chunk = read('<Ii')
+            chunks = read(f'<{2 * n_chunk}Q')
+            if bin_id == pseudo_bin and n_chunk == 2:
+                mapped, unmapped = chunks[2], chunks[3]
+            elif bin_id != pseudo_bin:
+                spans.append(_bin_span(bin_id, min_shift, depth))
+        if not csi:
+            (n_intv,) = read('<i')
+            offset += 8 * n_intv
+        references.append({'mapped': mapped, 'unmapped': unmapped})
+        bins.append(sorted(spans))
+
+    no_coordinate = read('<Q')[0] if offset + 8 <= len(data) else None
+    return {
+        'format': index_format,
+        'names': names,
+        'references': references,
+        'bins': bins,
+        'no_coordinate': no_coordinate,
+    }
+
+
+def _bin_span(bin_id, min_shift, depth):
+    """Genomic [start, end) covered by an htslib binning-index bin."""
+    level, first = 0, 0
+    while level < depth and bin_id >= first + (1 << (3 * level)):
+        first += 1 << (3 * level)
+        level += 1
+    size = 1 << (min_shift + 3 * (depth - level))
+    start = (bin_id - first) * size
+    return start, start + size
+
+
+def read_crai_index(index_path):
+    """Aggregate CRAM .crai slice entries per reference id (slices, spans, bytes)."""
+    per_reference = {}
+    with gzip.open(index_path, 'rt') as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) < 6:
+                continue
+            ref_id, _start, span, _container, _slice_offset, slice_size = (int(x) for x in fields[:6])
+            entry = per_reference.setdefault(ref_id, {'slices': 0, 'span': 0, 'compressed_bytes': 0})
+            entry['slices'] += 1
+            entry['span'] += span
+            entry['compressed_bytes'] += slice_size
+    return per_reference
+
+
+def read_bam_header(filepath):
+    """Read reference names/lengths and header text from a BAM without pysam."""
+    with gzip.open(filepath, 'rb') as f:
+        if f.read(4) != b'BAM\x01':
+            raise ValueError(f"Not a BAM file: {filepath}")
+        (l_text,) = struct.unpack('<i', f.read(4))
+        text = f.read(l_text).decode(errors='replace').rstrip('\x00')
+        (n_ref,) = struct.unpack('<i', f.read(4))
+        references = []
+        for _ in range(n_ref):
+            (l_name,) = struct.unpack('<i', f.read(4))
+            name = f.read(l_name)[:-1].decode()
+            (length,) = struct.unpack('<i', f.read(4))
+            references.append((name, length))
+    return text, references
+
+
+def read_vcf_header(filepath):
+    """Read header text and ##contig entries from a VCF, VCF.gz or BCF."""
+    if str(filepath).lower().endswith('.bcf'):
+        with gzip.open(filepath, 'rb') as f:
+            if f.read(5)[:3] != b'BCF':
+                raise ValueError(f"Not a BCF file: {filepath}")
+            (l_text,) = struct.unpack('<I', f.read(4))
+            text = f.read(l_text).decode(errors='replace').rstrip('\x00')
+    else:
+        lines = []
+        with _open_text(filepath) as f:
+            for line in f:
+                if not line.startswith('#'):
+                    break
+                lines.append(line)
+                if line.startswith('#CHROM'):
+                    break
+        text = ''.join(lines)
+
+    references = []
+    for match in re.finditer(r'^##contig=<(.*)>$', text, re.MULTILINE):
+        fields = dict(re.findall(r'(\w+)=("[^"]*"|[^,]*)', match.group(1)))
+        if 'ID' in fields:
+            references.append((fields['ID'], int(fields['length']) if fields.get('length', '').isdigit() else None))
+    return text, references
+
+
+def _contig_table(references, counts, count_key):
+    """Per-contig rows sorted by count, truncated to TOP_CONTIGS_REPORTED."""
+    rows = []
+    for (name, length), count in zip(references, counts):
+        rows.append({'contig': name, 'length': length, **count})
+    rows.sort(key=lambda row: row.get(count_key, 0), reverse=True)
+    return rows[:TOP_CONTIGS_REPORTED]
+
+
+def _sample_regions(references, counts, count_key, n_regions, bins=None):
+    """
+    Pick up to ``n_regions`` (contig, start, end) windows spread over covered contigs.
+
+    With ``bins`` (per-reference spans from :func:`read_hts_index`) the windows
+    are evenly spaced picks among the non-empty index bins, so they land where
+    records are; otherwise the covered contigs are tiled from position 0.
+    """
+    covered = [i for i, (_, count) in enumerate(zip(references, counts)) if count.get(count_key, 0) > 0]
+    if not covered:
+        return []
+    if bins:
+        spans = []
+        for i in covered:
+            if not bins[i]:
+                continue
+            name, length = references[i]
+            # Only the finest bins present: they are disjoint, so no record is sampled twice.
+            width = min(end - start for start, end in bins[i])
+            spans.extend(
+                (name, start, min(end, length) if length else end)
+                for start, end in bins[i]
+                if end - start == width
+            )
+        if spans:
+            picks = min(n_regions, len(spans))
+            return [spans[int((i + 0.5) * len(spans) / picks)] for i in range(picks)]
+
+    covered = [(references[i][0], references[i][1] or 1) for i in covered]
+    total = sum(length for _, length in covered)
+    step = total / n_regions
+    regions = []
+    position, cursor = 0.0, 0
+    for name, length in covered:
+        while position < cursor + length and len(regions) < n_regions:
+            start = int(position - cursor)
+            regions.append((name, start, min(length, start + max(1, int(step)))))
+            position += step
+        cursor += length
+    return regions
+
+
+def _distribution(values):
+    """Compact numeric summary of a sample."""
+    if not values:
+        return None
+    values = sorted(values)
+    def pick(q):
+        return values[min(len(values) - 1, int(q * len(values)))]
+    return {
+        'n': len(values),
+        'mean': statistics.fmean(values),
+        'min': values[0],
+        '5%': pick(0.05),
+        '50%': pick(0.5),
+        '95%': pick(0.95),
+        'max': values[-1],
+    }
+
+
+def sample_alignments(filepath, regions, sample_records=ALIGNMENT_SAMPLE_RECORDS):
+    """
+    Sample reads for MAPQ, insert-size and flag distributions.
+
+    With ``regions`` (requires an index) reads are fetched from each region in
+    turn; otherwise the first ``sample_records`` reads of the file are used.
+    """
+    import pysam
+
+    mapq, insert_sizes = [], []
+    flags = {'paired': 0, 'proper_pair': 0, 'duplicate': 0, 'secondary': 0, 'supplementary': 0, 'unmapped': 0}
+    seen = 0
+    with pysam.AlignmentFile(filepath) as alignments:
+        if regions:
+            per_region = max(1, sample_records // len(regions))
+            iterators = (
+                _take(alignments.fetch(contig, start, end), per_region) for contig, start, end in regions
+            )
+            reads = (read for iterator in iterators for read in iterator)
+        else:
+            reads = _take(alignments.fetch(until_eof=True), sample_records)
+
+        for read in reads:
+            seen += 1
+            if read.is_unmapped:
+                flags['unmapped'] += 1
+                continue
+            mapq.append(read.mapping_quality)
+            flags['paired'] += read.is_paired
+            flags['proper_pair'] += read.is_proper_pair
+            flags['duplicate'] += read.is_duplicate
+            flags['secondary'] += read.is_secondary
+            flags['supplementary'] += read.is_supplementary
+            if read.is_proper_pair and read.is_read1 and read.template_length > 0:
+                insert_sizes.append(read.template_length)
+
+    if regions and not seen:
+        # The index promised records but the windows missed them; scan from the start instead.
+        return sample_alignments(filepath, [], sample_records)
+    return {
+        'strategy': f"{len(regions)} regions via index" if regions else 'first records of file',
+        'records_sampled': seen,
+        'mapq': _distribution(mapq),
+        'mapq_ge_30_fraction': sum(q >= 30 for q in mapq) / len(mapq) if mapq else None,
+        'insert_size': _distribution(insert_sizes),
+        'flag_fractions': {name: count / seen for name, count in flags.items()} if seen else {},
+    }
+
+
+def sample_variants(filepath, regions, sample_records=ALIGNMENT_SAMPLE_RECORDS):
+    """Sample variant records for QUAL, FILTER and variant-class summaries."""
+    import pysam
+
+    quals = []
+    passed = snvs = indels = other = seen = 0
+    with pysam.VariantFile(filepath) as variants:
+        sample_count = len(variants.header.samples)
+        if regions:
+            per_region = max(1, sample_records // len(regions))
+            records = (
+                record
+                for contig, start, end in regions
+                for record in _take(variants.fetch(contig, start, end), per_region)
+            )
+        else:
+            records = _take(variants, sample_records)
+
+        for record in records:
+            seen += 1
+            if record.qual is not None:
+                quals.append(record.qual)
+            filters = list(record.filter.keys())
+            passed += not filters or filters == ['PASS']
+            alts = record.alts or ()
+            if all(len(alt) == len(record.ref) == 1 for alt in alts) and alts:
+                snvs += 1
+            elif any(len(alt) != len(record.ref) for alt in alts if not alt.startswith('<')):
+                indels += 1
+            else:
+                other += 1
+
+    if regions and not seen:
+        return sample_variants(filepath, [], sample_records)
+    return {
+        'strategy': f"{len(regions)} regions via index" if regions else 'first records of file',
+        'records_sampled': seen,
+        'sample_count': sample_count,
+        'qual': _distribution(quals),
+        'pass_fraction': passed / seen if seen else None,
+        'variant_classes': {'snv': snvs, 'indel': indels, 'other': other},
+    }
+
+
+def _take(iterable, limit):
+    for i, item in enumerate(iterable):
+        if i >= limit:
+            break
+        yield item
+
+
+def summarize_alignments(filepath, extension, metadata_only=False):
+    """
+    Summarize a SAM/BAM/CRAM file from its header and index.
+
+    Per-contig mapped/unmapped counts come from the .bai/.csi pseudo-bins, so
+    the cost is O(contigs) regardless of file size. Unless ``metadata_only``,
+    a sampled scan adds MAPQ, insert-size and flag distributions.
+    """
+    results = {}
+    index_path = find_index(filepath) if extension in ['bam', 'cram'] else None
+    bins = None
+
+    if extension == 'bam':
+        header_text, references = read_bam_header(filepath)
+    else:
+        import pysam
+        with pysam.AlignmentFile(filepath) as alignments:
+            header_text = str(alignments.header)
+            references = list(zip(alignments.references, alignments.lengths))
+
+    header_lines = header_text.splitlines()
+    results['header'] = {
+        'reference_count': len(references),
+        'total_reference_length': sum(length or 0 for _, length in references),
+        'sort_order': next(
+            (m.group(1) for m in (re.search(r'\tSO:(\S+)', l) for l in header_lines if l.startswith('@HD')) if m),
+            None,
+        ),
+        'read_groups': sum(line.startswith('@RG') for line in header_lines),
+        'programs': [
+            m.group(1) for m in (re.search(r'\tPN:(\S+)', l) for l in header_lines if l.startswith('@PG')) if m
+        ],
+    }
+    results['index'] = {'path': index_path}
+
+    counts = [{} for _ in references]
+    if index_path and index_path.endswith('.crai'):
+        slices = read_crai_index(index_path)
+        counts = [slices.get(i, {'slices': 0, 'span': 0, 'compressed_bytes': 0}) for i in range(len(references))]
+        results['index'].update({
+            'format': 'CRAI',
+            'note': 'CRAM indexes record slices, not read counts; per-contig sizes are compressed slice bytes',
+        })
+        results['per_contig'] = _contig_table(references, counts, 'compressed_bytes')
+        results['unplaced_slices'] = slices.get(-1, {}).get('slices', 0)
+        count_key = 'slices'
+    elif index_path:
+        index = read_hts_index(index_path)
+        counts, bins = index['references'], index['bins']
+        results['index']['format'] = index['format']
+        results['mapped_reads'] = sum(c['mapped'] for c in counts)
+        results['unmapped_reads'] = sum(c['unmapped'] for c in counts) + (index['no_coordinate'] or 0)
+        results['unplaced_unmapped_reads'] = index['no_coordinate']
+        results['contigs_with_reads'] = sum(c['mapped'] > 0 for c in counts)
+        results['per_contig'] = _contig_table(references, counts, 'mapped')
+        count_key = 'mapped'
+    else:
+        results['index']['note'] = 'No index found; run `samtools index` for per-contig counts'
+        count_key = None
+
+    if not metadata_only:
+        regions = _sample_regions(references, counts, count_key, ALIGNMENT_SAMPLE_REGIONS, bins) if count_key else []
+        try:
+            results['sampled'] = sample_alignments(filepath, regions)
+        except ImportError as e:
+            results['sampled'] = {'error': f"Sampled scan needs pysam (try: pip install pysam): {e}"}
+
+    return results
+
+
+def summarize_variants(filepath, extension, metadata_only=False):
+    """
+    Summarize a VCF/BCF from its header and .tbi/.csi index.
+
+    Per-contig record counts come from the index pseudo-bins. Unless
+    ``metadata_only``, a sampled scan adds QUAL/FILTER/variant-class summaries.
+    """
+    results = {}
+    header_text, references = read_vcf_header(filepath)
+    header_lines = header_text.splitlines()
+    chrom_line = next((line for line in header_lines if line.startswith('#CHROM')), '')
+    results['header'] = {
+        'file_format': next((line.split('=', 1)[1] for line in header_lines if line.startswith('##fileformat=')), None),
+        'contig_count': len(references),
+        'info_fields': sum(line.startswith('##INFO=') for line in header_lines),
+        'format_fields': sum(line.startswith('##FORMAT=') for line in header_lines),
+        'filters': sum(line.startswith('##FILTER=') for line in header_lines),
+        'sample_count': max(0, len(chrom_line.split('\t')) - 9),
+    }
+
+    index_path = find_index(filepath)
+    results['index'] = {'path': index_path}
+    counts, bins = [], None
+    if index_path:
+        index = read_hts_index(index_path)
+        counts, bins = index['references'], index['bins']
+        if index['names']:
+            lengths = dict(references)
+            references = [(name, lengths.get(name)) for name in index['names']]
+        results['index']['format'] = index['format']
+        results['record_count'] = sum(c['mapped'] for c in counts)
+        results['contigs_with_records'] = sum(c['mapped'] > 0 for c in counts)
+        results['per_contig'] = [
+            {'contig': row['contig'], 'length': row['length'], 'records': row['mapped']}
+            for row in _contig_table(references, counts, 'mapped')
+        ]
+    else:
+        results['index']['note'] = 'No index found; bgzip and run `tabix -p vcf` (or `bcftools index`) for per-contig counts'
+
+    if not metadata_only:
+        regions = _sample_regions(references, counts, 'mapped', ALIGNMENT_SAMPLE_REGIONS, bins) if counts else []
+        try:
+            results['sampled'] = sample_variants(filepath, regions)
+        except ImportError as e:
+            results['sampled'] = {'error': f"Sampled scan needs pysam (try: pip install pysam): {e}"}
+
+    return results
+
+
+def analyze_bioinformatics(filepath, extension, metadata_only=False):
     """Analyze bioinformatics/genomics formats."""
     results = {}
 
     try:
-        if extension in ['fasta', 'fa', 'fna']:
+        if extension in ['sam', 'bam', 'cram']:
+            results = summarize_alignments(filepath, extension, metadata_only)
+
+        elif extension in ['vcf', 'bcf', 'gvcf']:
+            results = summarize_variants(filepath, extension, metadata_only)
+
+        elif extension in ['fasta', 'fa', 'fna']:
             from Bio import SeqIO
-            sequences = list(SeqIO.parse(filepath, 'fasta'))
+            with _open_text(filepath) as handle:
+                sequences = list(SeqIO.parse(handle, 'fasta'))
             lengths = [len(seq) for seq in sequences]
 
             results = {
@@ -354,10 +1179,11 @@ def analyze_bioinformatics(filepath, extension):
         elif extension in ['fastq', 'fq']:
             from Bio import SeqIO
             sequences = []
-            for i, seq in enumerate(SeqIO.parse(filepath, 'fastq')):
-                sequences.append(seq)
-                if i >= 9999:  # Sample first 10k
-                    break
+            with _open_text(filepath) as handle:
+                for i, seq in enumerate(SeqIO.parse(handle, 'fastq')):
+                    sequences.append(seq)
+                    if i >= 9999:  # Sample first 10k
+                        break
 
             lengths = [len(seq) for seq in sequences]
             qualities = [sum(seq.letter_annotations['phred_quality']) / len(seq) for seq in sequences]
@@ -378,37 +1204,105 @@ def analyze_bioinformatics(filepath, extension):
     return results
 
 
-def analyze_imaging(filepath, extension):
-    """Analyze microscopy/imaging formats."""
+def _tiff_page_count(filepath):
+    """Count TIFF pages by following the IFD offset chain, without reading any tags or pixels."""
+    with open(filepath, 'rb') as f:
+        header = f.read(16)
+        endian = {b'II': '<', b'MM': '>'}.get(header[:2])
+        if endian is None:
+            raise ValueError(f"Not a TIFF file: {filepath}")
+        (version,) = struct.unpack(f'{endian}H', header[2:4])
+        if version == 43:  # BigTIFF
+            count_fmt, offset_fmt, entry_size = f'{endian}Q', f'{endian}Q', 20
+            (offset,) = struct.unpack(offset_fmt, header[8:16])
+        else:
+            count_fmt, offset_fmt, entry_size = f'{endian}H', f'{endian}I', 12
+            (offset,) = struct.unpack(offset_fmt, header[4:8])
+        pages, seen = 0, set()
+        while offset and offset not in seen:
+            seen.add(offset)
+            f.seek(offset)
+            (n_entries,) = struct.unpack(count_fmt, f.read(struct.calcsize(count_fmt)))
+            f.seek(offset + struct.calcsize(count_fmt) + n_entries * entry_size)
+            (offset,) = struct.unpack(offset_fmt, f.read(struct.calcsize(offset_fmt)))
+            pages += 1
+    return pages
+
+
+def analyze_imaging(filepath, extension, metadata_only=False):
+    """
+    Analyze microscopy/imaging formats.
+
+    Intensity statistics are computed on up to IMAGE_SAMPLE_PAGES evenly
+    spaced pages, each subsampled to about IMAGE_SAMPLE_PIXELS pixels, so only
+    one decoded page is held in memory at a time.
+    """
     results = {}
 
     try:
         if extension in ['tif', 'tiff', 'png', 'jpg', 'jpeg']:
-            from PIL import Image
             import numpy as np
 
-            img = Image.open(filepath)
-            img_array = np.array(img)
-
-            results = {
-                'size': img.size,
-                'mode': img.mode,
-                'format': img.format,
-                'shape': img_array.shape,
-                'dtype': str(img_array.dtype),
-                'value_range': [int(img_array.min()), int(img_array.max())],
-                'mean_intensity': float(img_array.mean()),
-            }
-
-            # Check for multi-page TIFF
-            if extension in ['tif', 'tiff']:
-                try:
-                    frame_count = 0
-                    while True:
-                        img.seek(frame_count)
-                        frame_count += 1
-                except EOFError:
-                    results['page_count'] = frame_count
+            try:
+                import tifffile
+            except ImportError:
+                tifffile = None
+
+            moments = ArrayMoments()
+            strides = set()
+            if tifffile is not None and extension in ['tif', 'tiff']:
+                with tifffile.TiffFile(filepath) as tif:
+                    page_count = len(tif.pages)
+                    first = tif.pages[0]
+                    series = tif.series[0] if tif.series else None
+                    results = {
+                        'size': (first.imagewidth, first.imagelength),
+                        'format': 'TIFF',
+                        'shape': first.shape,
+                        'dtype': str(first.dtype),
+                        'page_count': page_count,
+                        'series_shape': series.shape if series is not None else None,
+                        'series_axes': series.axes if series is not None else None,
+                    }
+                    sampled = [] if metadata_only else _sample_indices(page_count, IMAGE_SAMPLE_PAGES)
+                    for index in sampled:
+                        block, stride = _pixel_sample(tif.pages[index].asarray())
+                        strides.add(stride)
+                        moments.update(block)
+            else:
+                from PIL import Image
+
+                with Image.open(filepath) as img:
+                    # Pillow's n_frames parses every TIFF frame; the IFD chain alone gives the count.
+                    tiff = extension in ['tif', 'tiff']
+                    page_count = _tiff_page_count(filepath) if tiff else getattr(img, 'n_frames', 1)
+                    results = {
+                        'size': img.size,
+                        'mode': img.mode,
+                        'format': img.format,
+                    }
+                    if tiff:
+                        results['page_count'] = page_count
+                    sampled = [] if metadata_only else _sample_indices(page_count, IMAGE_SAMPLE_PAGES)
+                    for index in sampled:
+                        img.seek(index)
+                        page = np.asarray(img)
+                        if index == 0:
+                            results.update({'shape': page.shape, 'dtype': str(page.dtype)})
+                        block, stride = _pixel_sample(page)
+                        strides.add(stride)
+                        moments.update(block)
+
+            if sampled:
+                stats = moments.result()
+                results['value_range'] = [stats['min'], stats['max']]
+                results['mean_intensity'] = stats['mean']
+                results['intensity_sampling'] = {
+                    'pages_sampled': len(sampled),
+                    'page_count': page_count,
+                    'pixel_stride': max(strides),
+                    'exact': len(sampled) == page_count and strides == {1},
+                }
 
     except ImportError as e:
         results['error'] = f"Required library not installed (try: pip install pillow): {e}"
@@ -418,24 +1312,13 @@ def analyze_imaging(filepath, extension):
     return results
 
 
-def generate_markdown_report(analysis, output_path=None):
-    """
-    Generate a comprehensive markdown report from analysis results.
-
-    Args:
-        analysis: Analysis results dictionary
-        output_path: Path to save the report (if None, prints to stdout)
-    """
+def _report_section_lines(analysis, level=2, include_reference=True):
+    """Build the per-file report sections, with headings starting at ``level``."""
+    h = '#' * level
     lines = []
 
-    # Title
-    filename = analysis['basic_info']['filename']
-    lines.append(f"# Exploratory Data Analysis Report: {filename}\n")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    lines.append("---\n")
-
     # Basic Information
-    lines.append("## Basic Information\n")
+    lines.append(f"{h} Basic Information\n")
     basic = analysis['basic_info']
     lines.append(f"- **Filename:** `{basic['filename']}`")
     lines.append(f"- **Full Path:** `{basic['path']}`")
@@ -444,14 +1327,14 @@ def generate_markdown_report(analysis, output_path=None):
     lines.append(f"- **Extension:** `.{analysis['file_type']['extension']}`\n")
 
     # File Type Information
-    lines.append("## File Type\n")
+    lines.append(f"{h} File Type\n")
     ft = analysis['file_type']
     lines.append(f"- **Category:** {ft['category'].replace('_', ' ').title()}")
     lines.append(f"- **Description:** {ft['description']}\n")
 
     # Reference Information
-    if analysis.get('reference_info'):
-        lines.append("## Format Reference\n")
+    if include_reference and analysis.get('reference_info'):
+        lines.append(f"{h} Format Reference\n")
         ref = analysis['reference_info']
         if 'raw_section' in ref:
             lines.append(ref['raw_section'])
@@ -459,45 +1342,133 @@ def generate_markdown_report(analysis, output_path=None):
 
     # Data Analysis
     if analysis.get('data_analysis'):
-        lines.append("## Data Analysis\n")
+        lines.append(f"{h} Data Analysis\n")
         data = analysis['data_analysis']
 
         if 'error' in data:
             lines.append(f"⚠️ **Analysis Error:** {data['error']}\n")
         else:
             # Format the data analysis based on what's present
-            lines.append("### Summary Statistics\n")
+            lines.append(f"{h}# Summary Statistics\n")
             lines.append("```json")
             lines.append(json.dumps(data, indent=2, default=str))
             lines.append("```\n")
 
-    # Recommendations
-    lines.append("## Recommendations for Further Analysis\n")
-    lines.append(f"Based on the file type (`.{analysis['file_type']['extension']}`), consider the following analyses:\n")
+    return lines
+
 
-    # Add specific recommendations based on category
-    category = analysis['file_type']['category']
+def _recommendation_lines(category):
+    """Suggested downstream analyses for a file category."""
     if category == 'general_scientific':
-        lines.append("- Statistical distribution analysis")
-        lines.append("- Missing value imputation strategies")
-        lines.append("- Correlation analysis between variables")
-        lines.append("- Outlier detection and handling")
-        lines.append("- Dimensionality reduction (PCA, t-SNE)")
-    elif category == 'bioinformatics_genomics':
-        lines.append("- Sequence quality control and filtering")
-        lines.append("- GC content analysis")
-        lines.append("- Read alignment and mapping statistics")
-        lines.append("- Variant calling and annotation")
-        lines.append("- Differential expression analysis")
-    elif category == 'microscopy_imaging':
-        lines.append("- Image quality assessment")
-        lines.append("- Background correction and normalization")
-        lines.append("- Segmentation and object detection")
-        lines.append("- Colocalization analysis")
-        lines.append("- Intensity measurements and quantification")
+        return [
+            "- Statistical distribution analysis",
+            "- Missing value imputation strategies",
+            "- Correlation analysis between variables",
+            "- Outlier detection and handling",
+            "- Dimensionality reduction (PCA, t-SNE)",
+        ]
+    if category == 'bioinformatics_genomics':
+        return [
+            "- Sequence quality control and filtering",
+            "- GC content analysis",
+            "- Read alignment and mapping statistics",
+            "- Variant calling and annotation",
+            "- Differential expression analysis",
+        ]
+    if category == 'microscopy_imaging':
+        return [
+            "- Image quality assessment",
+            "- Background correction and normalization",
+            "- Segmentation and object detection",
+            "- Colocalization analysis",
+            "- Intensity measurements and quantification",
+        ]
+    return []
+
+
+def _analysis_status(analysis):
+    data = analysis.get('data_analysis') or {}
+    if 'error' in data:
+        return 'error'
+    return 'analyzed' if data else 'metadata only'
+
+
+def _combined_report_lines(analyses):
+    """Build one report covering many files; references and recommendations appear once."""
+    lines = []
+    lines.append(f"# Exploratory Data Analysis Report: {len(analyses)} files\n")
+    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    lines.append("---\n")
 
+    # Overview table
+    lines.append("## Overview\n")
+    lines.append("| File | Category | Size | Status |")
+    lines.append("|------|----------|------|--------|")
+    for analysis in analyses:
+        basic = analysis['basic_info']
+        category = analysis['file_type']['category'].replace('_', ' ').title()
+        lines.append(f"| `{basic['path']}` | {category} | {basic['size_human']} | {_analysis_status(analysis)} |")
     lines.append("")
 
+    # Per-file sections
+    for analysis in analyses:
+        lines.append(f"## {analysis['basic_info']['path']}\n")
+        lines.extend(_report_section_lines(analysis, level=3, include_reference=False))
+
+    # Format references, once per extension
+    references = {}
+    for analysis in analyses:
+        ref = analysis.get('reference_info')
+        if ref and 'raw_section' in ref:
+            references.setdefault(analysis['file_type']['extension'], ref)
+    if references:
+        lines.append("## Format References\n")
+        for extension in sorted(references):
+            ref = references[extension]
+            lines.append(ref['raw_section'])
+            lines.append(f"\n*Reference: {ref['reference_file']}*\n")
+
+    # Recommendations, once per category
+    lines.append("## Recommendations for Further Analysis\n")
+    categories = sorted({analysis['file_type']['category'] for analysis in analyses})
+    for category in categories:
+        recommendations = _recommendation_lines(category)
+        if recommendations:
+            lines.append(f"### {category.replace('_', ' ').title()}\n")
+            lines.extend(recommendations)
+            lines.append("")
+
+    return lines
+
+
+def generate_markdown_report(analysis, output_path=None):
+    """
+    Generate a comprehensive markdown report from analysis results.
+
+    Args:
+        analysis: Analysis results dictionary, or a list of them for a
+            combined multi-file report
+        output_path: Path to save the report (if None, prints to stdout)
+    """
+    if isinstance(analysis, list):
+        lines = _combined_report_lines(analysis)
+    else:
+        lines = []
+
+        # Title
+        filename = analysis['basic_info']['filename']
+        lines.append(f"# Exploratory Data Analysis Report: {filename}\n")
+        lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        lines.append("---\n")
+
+        lines.extend(_report_section_lines(analysis))
+
+        # Recommendations
+        lines.append("## Recommendations for Further Analysis\n")
+        lines.append(f"Based on the file type (`.{analysis['file_type']['extension']}`), consider the following analyses:\n")
+        lines.extend(_recommendation_lines(analysis['file_type']['category']))
+        lines.append("")
+
     # Footer
     lines.append("---")
     lines.append("*This report was generated by the exploratory-data-analysis skill.*")
@@ -514,31 +1485,201 @@ def generate_markdown_report(analysis, output_path=None):
     return report
 
 
-def main():
-    """Main CLI interface."""
-    if len(sys.argv) < 2:
-        print("Usage: python eda_analyzer.py <filepath> [output.md]")
-        print("  filepath: Path to the data file to analyze")
-        print("  output.md: Optional output path for markdown report")
-        sys.exit(1)
+def _json_default(value):
+    """JSON fallback for numpy scalars/arrays and other non-builtin values."""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+def profile_cache_key(filepath):
+    """
+    Return the (absolute path, size, mtime_ns) triple identifying a file version.
+
+    The mtime also covers sidecar indexes, so indexing a BAM/VCF after a
+    first run invalidates its cached profile.
+    """
+    stat = os.stat(filepath)
+    mtime_ns = stat.st_mtime_ns
+    for candidate in _index_candidates(filepath):
+        if os.path.exists(candidate):
+            mtime_ns = max(mtime_ns, os.stat(candidate).st_mtime_ns)
+    return str(Path(filepath).absolute()), stat.st_size, mtime_ns
+
+
+def load_profile_cache(cache_path):
+    """Load cached per-file profiles; a missing, corrupt or outdated cache is empty."""
+    try:
+        with open(cache_path, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != PROFILE_CACHE_VERSION:
+        return {}
+    return data.get('profiles', {})
 
-    filepath = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
 
-    if not os.path.exists(filepath):
+def save_profile_cache(cache_path, profiles):
+    """Atomically write the profile cache."""
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({'version': PROFILE_CACHE_VERSION, 'profiles': profiles}, f, default=_json_default)
+    os.replace(tmp_path, cache_path)
+
+
+def collect_input_files(target, pattern='*', exclude=()):
+    """
+    Expand a file, directory or glob into a sorted list of files to profile.
+
+    Directories are searched recursively for names matching ``pattern``.
+    Sidecar indexes (.bai/.crai/.csi/.tbi) are skipped; they are read as part
+    of the file they index.
+    """
+    if GLOB_CHARS & set(target):
+        matches = glob.glob(target, recursive=True)
+    elif os.path.isdir(target):
+        matches = glob.glob(os.path.join(target, '**', pattern), recursive=True)
+    else:
+        matches = [target]
+
+    excluded = {os.path.abspath(path) for path in exclude}
+    files = []
+    for match in matches:
+        if not os.path.isfile(match) or os.path.basename(match) == PROFILE_CACHE_FILENAME:
+            continue
+        if match.lower().endswith(INDEX_SUFFIXES):
+            continue
+        if os.path.abspath(match) in excluded:
+            continue
+        files.append(match)
+    return sorted(files)
+
+
+def _glob_base_dir(pattern):
+    """Return the leading directory of a glob that contains no wildcards."""
+    parts = []
+    for part in Path(pattern).parts[:-1]:
+        if GLOB_CHARS & set(part):
+            break
+        parts.append(part)
+    return str(Path(*parts)) if parts else '.'
+
+
+def analyze_many(filepaths, workers=None, cache_path=None, metadata_only=False):
+    """
+    Profile many files, reusing cached profiles for unchanged files.
+
+    A file is re-analyzed only when its (path, size, mtime) differs from the
+    cached entry. Pending files are analyzed in a process pool.
+
+    Args:
+        filepaths: Files to analyze
+        workers: Process pool size (None = CPU count, 1 = run in-process)
+        cache_path: Optional on-disk profile cache (JSON)
+        metadata_only: Passed through to analyze_file
+
+    Returns:
+        tuple: (list of analyses in input order, number of cache hits)
+    """
+    profiles = load_profile_cache(cache_path) if cache_path else {}
+    analyses = {}
+    keys = {}
+    pending = []
+
+    for filepath in filepaths:
+        key = profile_cache_key(filepath)
+        keys[filepath] = key
+        cached = profiles.get(key[0])
+        if cached and (cached.get('size_bytes'), cached.get('mtime_ns'), cached.get('metadata_only', False)) == (*key[1:], metadata_only):
+            analyses[filepath] = cached['analysis']
+        else:
+            pending.append(filepath)
+
+    if pending:
+        analyze = partial(analyze_file, metadata_only=metadata_only)
+        if workers == 1 or len(pending) == 1:
+            results = [analyze(filepath) for filepath in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(analyze, pending))
+
+        for filepath, analysis in zip(pending, results):
+            # Round-trip through JSON so fresh and cached profiles look identical.
+            analysis = json.loads(json.dumps(analysis, default=_json_default))
+            analyses[filepath] = analysis
+            path, size, mtime_ns = keys[filepath]
+            profiles[path] = {
+                'size_bytes': size,
+                'mtime_ns': mtime_ns,
+                'metadata_only': metadata_only,
+                'analysis': analysis,
+            }
+
+        if cache_path:
+            save_profile_cache(cache_path, profiles)
+
+    return [analyses[filepath] for filepath in filepaths], len(filepaths) - len(pending)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Analyze scientific data files and generate markdown EDA reports.",
+    )
+    parser.add_argument('path', help="Data file, directory, or quoted glob (e.g. 'runs/**/*.fastq')")
+    parser.add_argument('output', nargs='?', help="Output path for the markdown report")
+    parser.add_argument('--pattern', default='*', help="Filename pattern when PATH is a directory (default: *)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes for multi-file mode (default: CPU count)")
+    parser.add_argument('--cache', help=f"Profile cache path (default: {PROFILE_CACHE_FILENAME} next to the report)")
+    parser.add_argument('--no-cache', action='store_true', help="Re-analyze every file and do not write a cache")
+    parser.add_argument('--metadata-only', action='store_true', help="Use file metadata only (Parquet footer, BAM/CRAM/VCF indexes, array/image headers) without scanning data")
+    return parser
+
+
+def main(argv=None):
+    """Main CLI interface."""
+    args = build_parser().parse_args(argv)
+    filepath = args.path
+    multi = os.path.isdir(filepath) or bool(GLOB_CHARS & set(filepath))
+
+    if not multi and not os.path.exists(filepath):
         print(f"Error: File not found: {filepath}")
         sys.exit(1)
 
-    # If no output path specified, use the input filename
+    if not multi:
+        # If no output path specified, use the input filename
+        output_path = args.output
+        if output_path is None:
+            input_path = Path(filepath)
+            output_path = input_path.parent / f"{input_path.stem}_eda_report.md"
+
+        print(f"Analyzing: {filepath}")
+        analysis = analyze_file(filepath, metadata_only=args.metadata_only)
+
+        print(f"\nGenerating report...")
+        generate_markdown_report(analysis, output_path)
+
+        print(f"\n✓ Analysis complete!")
+        return
+
+    output_path = args.output
     if output_path is None:
-        input_path = Path(filepath)
-        output_path = input_path.parent / f"{input_path.stem}_eda_report.md"
+        base_dir = filepath if os.path.isdir(filepath) else _glob_base_dir(filepath)
+        output_path = os.path.join(base_dir, 'eda_combined_report.md')
+    cache_path = None if args.no_cache else (args.cache or os.path.join(os.path.dirname(os.path.abspath(output_path)), PROFILE_CACHE_FILENAME))
+
+    filepaths = collect_input_files(filepath, args.pattern, exclude=[output_path])
+    if not filepaths:
+        print(f"Error: No files matched: {filepath}")
+        sys.exit(1)
 
-    print(f"Analyzing: {filepath}")
-    analysis = analyze_file(filepath)
+    print(f"Analyzing {len(filepaths)} files...")
+    analyses, cache_hits = analyze_many(
+        filepaths, workers=args.workers, cache_path=cache_path, metadata_only=args.metadata_only
+    )
+    print(f"  {cache_hits} unchanged (cached), {len(filepaths) - cache_hits} analyzed")
 
-    print(f"\nGenerating report...")
-    generate_markdown_report(analysis, output_path)
+    print(f"\nGenerating combined report...")
+    generate_markdown_report(analyses, output_path)
 
     print(f"\n✓ Analysis complete!")
 
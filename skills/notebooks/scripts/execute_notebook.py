@@ -1,22 +1,233 @@
 #!/usr/bin/env python3
 
 """
-Execute a Jupyter notebook top-to-bottom on a fresh kernel and write an executed copy.
+Execute Jupyter notebooks top-to-bottom on fresh kernels and write executed copies.
 
 Why this exists:
 - Human "it ran on my machine" is not enough.
 - This creates a deterministic validation gate in CI or local checks.
 
+Batch mode (several notebooks, or directories of them) runs notebooks
+concurrently. Every notebook still gets its own fresh kernel; while one runs,
+the kernel for the next queued notebook is started and left for whichever worker
+claims it, so kernel start-up overlaps execution instead of adding to it. Per-cell wall time is stored in
+cell metadata (`execution_duration_s`), executed cells are checkpointed to
+`<out stem>.checkpoint.ipynb` while a notebook runs (and kept if it fails or
+times out), and `--resume` skips notebooks whose executed copy already matches
+the current source.
+
+`--cell-cache` (opt-in, for iterative editing) stores each code cell's outputs
+under a hash chain of its source, the sources before it and declared input files
+(`--cache-input`, or a `cache_inputs` list in cell metadata, relative to the
+notebook). Unchanged notebooks are replayed without starting a kernel. After an
+edit, outputs are replayed up to the last cell with a kernel-state snapshot
+(pickled with dill, which must be installed in the kernel, after cells slower
+than `--snapshot-after` seconds); that state is restored and execution resumes
+from there. Cells run for side effects (writing files) are skipped when
+replayed, so leave the cache off for delivery runs.
+
 Usage:
   python scripts/execute_notebook.py notebooks/01_analysis.ipynb --out notebooks/01_analysis.executed.ipynb
+  python scripts/execute_notebook.py notebooks/ --workers 4 --out-dir executed/ --report run_report.json --resume
+  python scripts/execute_notebook.py notebooks/eda.ipynb --cell-cache --cache-input data/counts.parquet
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Iterable
 
 import nbformat
+from jupyter_core.utils import run_sync
 from nbclient import NotebookClient
+from nbclient.exceptions import CellExecutionError, CellTimeoutError, DeadKernelError
+
+RUN_METADATA_KEY = "execute_notebook"
+SKIP_SUFFIXES = (".executed.ipynb", ".checkpoint.ipynb")
+DEFAULT_SNAPSHOT_AFTER_S = 5.0
+# Kernel-side snapshot/restore of user variables (IPython's own history and
+# helpers are skipped). Run through exec() so no names leak into the notebook.
+SNAPSHOT_SOURCE = """
+import os, dill
+from IPython import get_ipython
+shell = get_ipython()
+state = {k: v for k, v in shell.user_ns.items() if k not in shell.user_ns_hidden and not k.startswith("_")}
+try:
+    with open(TMP, "wb") as handle:
+        dill.dump(state, handle)
+    os.replace(TMP, PATH)
+finally:
+    if os.path.exists(TMP):
+        os.remove(TMP)
+"""
+RESTORE_SOURCE = """
+import dill
+from IPython import get_ipython
+with open(PATH, "rb") as handle:
+    get_ipython().user_ns.update(dill.load(handle))
+"""
+
+
+@dataclass
+class NotebookResult:
+    notebook: str
+    out: str
+    status: str  # ok | error | timeout | dead_kernel | skipped
+    duration_s: float = 0.0
+    code_cells: int = 0
+    cells_executed: int = 0
+    cells_replayed: int = 0
+    failed_cell: int | None = None
+    error: str | None = None
+    checkpoint: str | None = None
+    slowest_cells: list[dict[str, Any]] = field(default_factory=list)
+
+
+def notebook_digest(nb: nbformat.NotebookNode, kernel_name: str | None) -> str:
+    """Hash of what determines an execution: cell types, sources and kernel."""
+    payload = json.dumps([kernel_name, [(cell.cell_type, cell.source) for cell in nb.cells]])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def notebook_kernel(nb: nbformat.NotebookNode, kernel_name: str | None) -> str | None:
+    return kernel_name or nb.metadata.get("kernelspec", {}).get("name")
+
+
+def checkpoint_path(out_path: Path) -> Path:
+    name = out_path.name[: -len(".ipynb")] if out_path.name.endswith(".ipynb") else out_path.name
+    if name.endswith(".executed"):
+        name = name[: -len(".executed")]
+    return out_path.with_name(f"{name}.checkpoint.ipynb")
+
+
+def write_notebook(nb: nbformat.NotebookNode, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    nbformat.write(nb, str(partial))
+    os.replace(partial, path)
+
+
+def is_up_to_date(out_path: Path, digest: str) -> bool:
+    """True when `out_path` is a successful execution of the same source."""
+    try:
+        with out_path.open(encoding="utf-8") as handle:
+            run = json.load(handle).get("metadata", {}).get(RUN_METADATA_KEY) or {}
+    except (OSError, ValueError):
+        return False
+    return run.get("status") == "ok" and run.get("source_sha256") == digest
+
+
+def default_cache_dir() -> Path:
+    override = os.environ.get("NOTEBOOK_CELL_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".cache" / "omics-skills" / "notebook-cells"
+
+
+class CellCache:
+    """Code-cell outputs and kernel-state snapshots keyed by a hash chain.
+
+    A cell's key covers its source, the files it declares in `cache_inputs`
+    metadata and the key of the code cell before it (the first cell also
+    covers the kernel and the notebook-wide inputs), so an edit invalidates
+    that cell and everything after it.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        inputs: Iterable[Path] = (),
+        snapshot_after_s: float | None = DEFAULT_SNAPSHOT_AFTER_S,
+    ) -> None:
+        # Absolute, because snapshots are written by kernels running in the notebook's directory.
+        self.directory = Path(directory).expanduser().resolve()
+        self.inputs = [Path(path) for path in inputs]
+        self.snapshot_after_s = snapshot_after_s
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def file_digest(self, path: Path) -> str:
+        try:
+            stat = path.stat()
+        except OSError:
+            return "missing"
+        memo = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if memo in self._digests:
+                return self._digests[memo]
+        digest = hashlib.sha256()
+        with path.open("rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+        with self._lock:
+            self._digests[memo] = digest.hexdigest()
+        return self._digests[memo]
+
+    def cell_keys(self, nb: nbformat.NotebookNode, kernel_name: str | None, notebook_dir: Path) -> dict[int, str]:
+        """Map each code cell's index to its cache key, in notebook order."""
+        inputs = [(str(path), self.file_digest(path)) for path in self.inputs]
+        chain = hashlib.sha256(json.dumps([kernel_name, inputs]).encode("utf-8")).hexdigest()
+        keys: dict[int, str] = {}
+        for index, cell in enumerate(nb.cells):
+            if cell.cell_type != "code":
+                continue
+            declared = [(name, self.file_digest(notebook_dir / name)) for name in cell.metadata.get("cache_inputs", [])]
+            chain = hashlib.sha256(json.dumps([chain, cell.source, declared]).encode("utf-8")).hexdigest()
+            keys[index] = chain
+        return keys
+
+    def _path(self, kind: str, key: str, suffix: str) -> Path:
+        return self.directory / kind / key[:2] / f"{key}{suffix}"
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        try:
+            return json.loads(self._path("cells", key, ".json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, cell: nbformat.NotebookNode) -> None:
+        path = self._path("cells", key, ".json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "outputs": cell.get("outputs", []),
+            "execution_count": cell.get("execution_count"),
+            "execution_duration_s": cell.metadata.get("execution_duration_s"),
+        }
+        partial = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        partial.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(partial, path)
+
+    def snapshot_path(self, key: str) -> Path:
+        path = self._path("state", key, ".pkl")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def has_snapshot(self, key: str) -> bool:
+        return self._path("state", key, ".pkl").is_file()
+
+    def fully_cached(self, notebook_path: Path, kernel_name: str | None) -> bool:
+        """True when every code cell would be replayed, i.e. no kernel is needed."""
+        try:
+            nb = nbformat.read(str(notebook_path), as_version=4)
+        except (OSError, ValueError):
+            return False
+        keys = self.cell_keys(nb, notebook_kernel(nb, kernel_name), notebook_path.parent)
+        return bool(keys) and all(self._path("cells", key, ".json").is_file() for key in keys.values())
+
+
+def run_hidden(client: NotebookClient, source: str, **names: str) -> bool:
+    """Run bookkeeping code in the kernel without recording it in the notebook."""
+    code = f"exec({source!r}, {names!r})"
+    reply = client.wait_for_reply(client.kc.execute(code, silent=True, store_history=False))
+    return reply is not None and reply["content"].get("status") == "ok"
 
 
 def execute_notebook(
@@ -25,8 +236,57 @@ def execute_notebook(
     *,
     kernel_name: str | None = None,
     timeout_s: int = 600,
-) -> None:
+    km: Any = None,
+    start_kernel: Callable[[], Any] | None = None,
+    checkpoint_interval_s: float = 30.0,
+    cache: CellCache | None = None,
+) -> NotebookResult:
+    """Execute one notebook and report how it went instead of raising.
+
+    Pass `km` to run on an already started kernel, or `start_kernel` to have
+    one started only if a cell actually has to run (not when every cell is
+    replayed from `cache`); either way the caller owns it and shuts it down.
+    The executed copy is written only on success; otherwise the checkpoint
+    holds every cell that ran, including the failing one.
+    With `cache`, unchanged leading cells are replayed (see the module docs).
+    """
     nb = nbformat.read(str(notebook_path), as_version=4)
+    kernel = notebook_kernel(nb, kernel_name)
+    digest = notebook_digest(nb, kernel)
+    result = NotebookResult(
+        notebook=str(notebook_path),
+        out=str(out_path),
+        status="ok",
+        code_cells=sum(cell.cell_type == "code" for cell in nb.cells),
+    )
+    checkpoint = checkpoint_path(out_path)
+    durations: dict[int, float] = {}
+    current_cell: int | None = None
+    cell_started = last_checkpoint = time.monotonic()
+
+    def run_metadata(status: str) -> dict[str, Any]:
+        return {
+            "status": status,
+            "source_sha256": digest,
+            "kernel_name": kernel,
+            "cells_executed": result.cells_executed,
+            "duration_s": round(time.monotonic() - run_started, 3),
+        }
+
+    def on_cell_execute(cell: nbformat.NotebookNode, cell_index: int) -> None:
+        nonlocal current_cell, cell_started
+        cell.metadata.pop("execution_cached", None)
+        current_cell, cell_started = cell_index, time.monotonic()
+
+    def on_cell_executed(cell: nbformat.NotebookNode, cell_index: int, execute_reply: dict[str, Any]) -> None:
+        nonlocal last_checkpoint
+        now = time.monotonic()
+        durations[cell_index] = cell.metadata["execution_duration_s"] = round(now - cell_started, 3)
+        result.cells_executed += 1
+        if now - last_checkpoint >= checkpoint_interval_s:
+            nb.metadata[RUN_METADATA_KEY] = run_metadata("running")
+            write_notebook(nb, checkpoint)
+            last_checkpoint = now
 
     # Execute in the notebook's directory so relative paths behave as expected.
     resources = {"metadata": {"path": str(notebook_path.parent)}}
@@ -34,38 +294,334 @@ def execute_notebook(
     client = NotebookClient(
         nb,
         timeout=timeout_s,
-        kernel_name=kernel_name,
+        kernel_name=kernel or "",
+        km=km,
         resources=resources,
+        on_cell_execute=on_cell_execute,
+        on_cell_executed=on_cell_executed,
     )
 
-    # Execute all cells; exceptions raise CellExecutionError by default.
-    client.execute()
+    keys = cache.cell_keys(nb, kernel, notebook_path.parent) if cache else {}
+    code_indices = list(keys)
+    replayable = 0
+    for index in code_indices:
+        entry = cache.load(keys[index]) if cache else None
+        if entry is None:
+            break
+        cell = nb.cells[index]
+        cell.outputs = [nbformat.from_dict(output) for output in entry["outputs"]]
+        cell.execution_count = entry["execution_count"]
+        cell.metadata["execution_duration_s"] = entry["execution_duration_s"]
+        cell.metadata["execution_cached"] = True
+        replayable += 1
+    # Past the replayed outputs, the kernel needs the state they left behind:
+    # resume after the last snapshotted cell, or from the top without one.
+    resume = replayable
+    if resume < len(code_indices):
+        while resume and not cache.has_snapshot(keys[code_indices[resume - 1]]):
+            resume -= 1
+    result.cells_replayed = resume
+    restore = cache.snapshot_path(keys[code_indices[resume - 1]]) if cache and 0 < resume < len(code_indices) else None
+
+    def run_cells() -> None:
+        if client.km is None and start_kernel is not None:
+            client.km, client.owns_km = start_kernel(), False
+        with client.setup_kernel():
+            client.reset_execution_trackers()
+            info = client.wait_for_reply(client.kc.kernel_info())
+            if info is not None and "language_info" in info["content"]:
+                nb.metadata["language_info"] = info["content"]["language_info"]
+            start = code_indices[resume] if resume < len(code_indices) else 0
+            if restore is not None and not run_hidden(client, RESTORE_SOURCE, PATH=str(restore)):
+                start, result.cells_replayed = 0, 0
+            client.code_cells_executed = result.cells_replayed
+            last_code_cell = code_indices[-1] if code_indices else None
+            for index in range(start, len(nb.cells)):
+                # Exceptions raise CellExecutionError by default.
+                client.execute_cell(nb.cells[index], index, execution_count=client.code_cells_executed + 1)
+                if cache is None or index not in keys:
+                    continue
+                cache.store(keys[index], nb.cells[index])
+                slow = cache.snapshot_after_s is not None and durations.get(index, 0.0) >= cache.snapshot_after_s
+                if slow and index != last_code_cell:
+                    path = cache.snapshot_path(keys[index])
+                    run_hidden(client, SNAPSHOT_SOURCE, TMP=f"{path}.{os.getpid()}.tmp", PATH=str(path))
+            client.set_widgets_metadata()
+
+    run_started = time.monotonic()
+    try:
+        if not code_indices or resume < len(code_indices):
+            run_cells()
+    except (CellExecutionError, CellTimeoutError, DeadKernelError, RuntimeError) as exc:
+        result.failed_cell = current_cell
+        if isinstance(exc, CellExecutionError):
+            result.status, result.error = "error", f"{exc.ename}: {exc.evalue}"
+        elif isinstance(exc, CellTimeoutError):
+            result.status, result.error = "timeout", f"cell exceeded {timeout_s}s"
+        else:
+            result.status = "dead_kernel" if isinstance(exc, DeadKernelError) else "error"
+            result.error = f"{type(exc).__name__}: {exc}"
+    finally:
+        if not client.owns_km and client.kc is not None:
+            client.kc.stop_channels()
+    result.duration_s = round(time.monotonic() - run_started, 3)
+    result.slowest_cells = [
+        {"cell": index, "duration_s": duration}
+        for index, duration in sorted(durations.items(), key=lambda item: item[1], reverse=True)[:3]
+    ]
+
+    nb.metadata[RUN_METADATA_KEY] = run_metadata(result.status)
+    if result.status != "ok":
+        write_notebook(nb, checkpoint)
+        result.checkpoint = str(checkpoint)
+        return result
+    write_notebook(nb, out_path)
+    checkpoint.unlink(missing_ok=True)
+    return result
+
+
+class KernelPool:
+    """Pre-started kernels shared by all workers, keyed by kernel name and cwd.
+
+    Kernels are never shared between notebooks: `take` hands out a kernel that
+    has not run anything, and the worker shuts it down after the notebook. A
+    kernel pre-started for the next job waits under that job's key, so the
+    worker that claims the job gets it and no other worker throws it away.
+    """
+
+    def __init__(self) -> None:
+        self._idle: dict[tuple[str | None, str], list[Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _start(kernel_name: str | None, cwd: str) -> Any:
+        from jupyter_client import AsyncKernelManager
+
+        km = AsyncKernelManager(kernel_name=kernel_name) if kernel_name else AsyncKernelManager()
+        # Match nbclient: keep IPython history in memory, so concurrent kernels
+        # do not contend for the same SQLite file.
+        extra = ["--HistoryManager.hist_file=:memory:"] if km.ipykernel else []
+        run_sync(km.start_kernel)(extra_arguments=extra, cwd=cwd)
+        return km
+
+    @staticmethod
+    def shutdown(km: Any) -> None:
+        try:
+            run_sync(km.shutdown_kernel)(now=True)
+        except Exception:
+            pass
+
+    def take(self, kernel_name: str | None, cwd: str) -> Any:
+        while True:
+            with self._lock:
+                idle = self._idle.get((kernel_name, cwd))
+                km = idle.pop() if idle else None
+            if km is None:
+                return self._start(kernel_name, cwd)
+            if run_sync(km.is_alive)():
+                return km
+            self.shutdown(km)
+
+    def prestart(self, kernel_name: str | None, cwd: str) -> None:
+        """Start a kernel for an upcoming job unless one is already waiting for its key."""
+        key = (kernel_name, cwd)
+        with self._lock:
+            if self._idle.get(key):
+                return
+        km = self._start(kernel_name, cwd)
+        with self._lock:
+            self._idle.setdefault(key, []).append(km)
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [km for kms in self._idle.values() for km in kms]
+            self._idle.clear()
+        for km in idle:
+            self.shutdown(km)
+
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    nbformat.write(nb, str(out_path))
+def peek_kernel(notebook_path: Path, kernel_name: str | None) -> str | None:
+    if kernel_name:
+        return kernel_name
+    try:
+        with notebook_path.open(encoding="utf-8") as handle:
+            return json.load(handle).get("metadata", {}).get("kernelspec", {}).get("name")
+    except (OSError, ValueError):
+        return None
+
+
+def execute_notebooks(
+    jobs: list[tuple[Path, Path]],
+    *,
+    workers: int = 4,
+    kernel_name: str | None = None,
+    timeout_s: int = 600,
+    checkpoint_interval_s: float = 30.0,
+    resume: bool = False,
+    cache: CellCache | None = None,
+) -> list[NotebookResult]:
+    """Run `(notebook, out)` jobs on `workers` threads; results keep job order."""
+    results: list[NotebookResult | None] = [None] * len(jobs)
+    lock = threading.Lock()
+    position = 0
+
+    def claim() -> tuple[int | None, tuple[Path, Path] | None]:
+        nonlocal position
+        with lock:
+            if position >= len(jobs):
+                return None, None
+            position += 1
+            return position - 1, jobs[position] if position < len(jobs) else None
+
+    def run(index: int, upcoming: tuple[Path, Path] | None, pool: KernelPool) -> NotebookResult:
+        notebook_path, out_path = jobs[index]
+        try:
+            if resume:
+                nb = nbformat.read(str(notebook_path), as_version=4)
+                if is_up_to_date(out_path, notebook_digest(nb, notebook_kernel(nb, kernel_name))):
+                    return NotebookResult(str(notebook_path), str(out_path), "skipped")
+            started: list[Any] = []
+
+            def start_kernel() -> Any:
+                # Called only on a cache miss, so fully replayed notebooks never start a kernel.
+                started.append(pool.take(peek_kernel(notebook_path, kernel_name), str(notebook_path.parent)))
+                if upcoming is not None and not (cache and cache.fully_cached(upcoming[0], kernel_name)):
+                    pool.prestart(peek_kernel(upcoming[0], kernel_name), str(upcoming[0].parent))
+                return started[0]
+
+            try:
+                return execute_notebook(
+                    notebook_path,
+                    out_path,
+                    kernel_name=kernel_name,
+                    timeout_s=timeout_s,
+                    start_kernel=start_kernel,
+                    checkpoint_interval_s=checkpoint_interval_s,
+                    cache=cache,
+                )
+            finally:
+                for km in started:
+                    pool.shutdown(km)
+        except Exception as exc:  # unreadable notebook, missing kernelspec, ...
+            return NotebookResult(str(notebook_path), str(out_path), "error", error=f"{type(exc).__name__}: {exc}")
+
+    pool = KernelPool()
+
+    def worker() -> None:
+        while True:
+            index, upcoming = claim()
+            if index is None:
+                return
+            results[index] = run(index, upcoming, pool)
+
+    threads = [
+        threading.Thread(target=worker, name=f"execute-notebook-{n}", daemon=True)
+        for n in range(max(1, min(workers, len(jobs))))
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        pool.close()
+    return [result for result in results if result is not None]
+
+
+def collect_jobs(paths: list[Path], out_dir: Path | None) -> list[tuple[Path, Path]]:
+    """Expand directories to their notebooks and pick each output path."""
+    jobs: list[tuple[Path, Path]] = []
+    for path in paths:
+        if path.is_dir():
+            notebooks = sorted(
+                found
+                for found in path.rglob("*.ipynb")
+                if ".ipynb_checkpoints" not in found.parts and not found.name.endswith(SKIP_SUFFIXES)
+            )
+            pairs = [(found, found.relative_to(path)) for found in notebooks]
+        else:
+            pairs = [(path, Path(path.name))]
+        for notebook, relative in pairs:
+            target = out_dir / relative if out_dir else notebook
+            jobs.append((notebook, target.with_suffix(".executed.ipynb")))
+    return jobs
+
+
+def format_summary(results: list[NotebookResult], wall_s: float) -> str:
+    lines = []
+    for result in results:
+        line = f"{result.status:<11} {result.duration_s:>9.1f}s  {result.cells_executed:>4}/{result.code_cells:<4} {result.notebook}"
+        if result.cells_replayed:
+            line += f" ({result.cells_replayed} replayed from cache)"
+        if result.error:
+            line += f"\n{'':<12}cell {result.failed_cell}: {result.error} (checkpoint: {result.checkpoint})"
+        lines.append(line)
+    counts = Counter(result.status for result in results)
+    lines.append(f"{len(results)} notebooks in {wall_s:.1f}s: " + ", ".join(f"{k} {v}" for k, v in sorted(counts.items())))
+    return "\n".join(lines)
 
 
 def main() -> None:
     ap = argparse.ArgumentParser()
-    ap.add_argument("notebook", type=Path, help="Path to .ipynb notebook")
-    ap.add_argument("--out", type=Path, default=None, help="Output executed notebook path")
+    ap.add_argument("notebooks", nargs="+", type=Path, help="Notebook(s) or directories of notebooks")
+    ap.add_argument("--out", type=Path, default=None, help="Output executed notebook path (single notebook only)")
+    ap.add_argument("--out-dir", type=Path, default=None, help="Write executed copies here, mirroring directory inputs")
     ap.add_argument("--kernel", type=str, default=None, help="Kernel name (optional)")
     ap.add_argument("--timeout", type=int, default=600, help="Cell timeout in seconds (default: 600)")
+    ap.add_argument("--workers", type=int, default=1, help="Notebooks executed concurrently (default: 1)")
+    ap.add_argument("--resume", action="store_true", help="Skip notebooks whose executed copy matches the current source")
+    ap.add_argument("--checkpoint-interval", type=float, default=30.0,
+                    help="Seconds between checkpoints of executed cells (default: 30)")
+    ap.add_argument("--report", type=Path, default=None, help="Write a JSON run report")
+    ap.add_argument("--cell-cache", action="store_true",
+                    help="Replay outputs of unchanged leading cells and execute from the first changed one")
+    ap.add_argument("--cache-dir", type=Path, default=None,
+                    help="Cell cache directory (default: ~/.cache/omics-skills/notebook-cells)")
+    ap.add_argument("--cache-input", type=Path, action="append", default=[],
+                    help="Data file every cell depends on (repeatable); changing it invalidates the cache")
+    ap.add_argument("--snapshot-after", type=float, default=DEFAULT_SNAPSHOT_AFTER_S,
+                    help="Snapshot kernel state with dill after cells slower than this many seconds "
+                         "(default: 5; negative disables snapshots)")
     args = ap.parse_args()
 
-    nb_path: Path = args.notebook
-    if not nb_path.exists():
-        raise SystemExit(f"Notebook not found: {nb_path}")
+    for nb_path in args.notebooks:
+        if not nb_path.exists():
+            raise SystemExit(f"Notebook not found: {nb_path}")
+    if args.out and (len(args.notebooks) > 1 or args.notebooks[0].is_dir()):
+        raise SystemExit("--out takes a single notebook; use --out-dir for several")
 
-    out_path = args.out or nb_path.with_suffix(".executed.ipynb")
+    jobs = collect_jobs(args.notebooks, args.out_dir)
+    if args.out:
+        jobs = [(jobs[0][0], args.out)]
+    if not jobs:
+        raise SystemExit("No notebooks found")
 
-    execute_notebook(
-        nb_path,
-        out_path,
+    started = time.monotonic()
+    results = execute_notebooks(
+        jobs,
+        workers=args.workers,
         kernel_name=args.kernel,
         timeout_s=args.timeout,
+        checkpoint_interval_s=args.checkpoint_interval,
+        resume=args.resume,
+        cache=CellCache(
+            args.cache_dir or default_cache_dir(),
+            inputs=args.cache_input,
+            snapshot_after_s=args.snapshot_after if args.snapshot_after >= 0 else None,
+        ) if args.cell_cache else None,
     )
-    print(f"Executed notebook written to: {out_path}")
+    wall_s = time.monotonic() - started
+
+    if args.report:
+        report = {"wall_s": round(wall_s, 3), "notebooks": [asdict(result) for result in results]}
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if len(results) == 1 and results[0].status in ("ok", "skipped") and not results[0].cells_replayed:
+        print(f"Executed notebook written to: {results[0].out}")
+    else:
+        print(format_summary(results, wall_s))
+    if any(result.status not in ("ok", "skipped") for result in results):
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -10,34 +10,93 @@ Rules (default):
 
 Optional:
 - --require-local-pixi: require pixi.toml in the same directory as the notebook.
+- --validate: also validate each notebook against the nbformat schema (slower).
+
+Notebooks are read as plain JSON, so linting does not need nbformat unless
+--validate is given. Paths may be notebooks or directories; directories are
+searched recursively for *.ipynb (hidden directories and .ipynb_checkpoints are
+skipped) and linted across a process pool. Results for notebooks whose size and
+mtime have not changed since the last run are reused from a cache under
+~/.cache/omics-skills/notebook-lint (override with NOTEBOOK_LINT_CACHE_DIR).
 
 Usage:
   python scripts/lint_notebook_structure.py notebooks/01_analysis.ipynb
+  python scripts/lint_notebook_structure.py notebooks/ --workers 8 --format json
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Iterable
+
+CACHE_VERSION = 1
+# Below this many notebooks a process pool costs more to start than it saves.
+MIN_PARALLEL_NOTEBOOKS = 32
+
 
-import nbformat
+def cell_source(cell) -> str:
+    # Raw JSON stores source as a string or a list of lines; v3 code cells use "input".
+    src = cell.get("source", cell.get("input")) or ""
+    return "".join(src) if isinstance(src, list) else src
 
 
 def is_nonempty_markdown(cell) -> bool:
     if cell.get("cell_type") != "markdown":
         return False
-    src = (cell.get("source") or "").strip()
+    src = cell_source(cell).strip()
     return len(src) > 0
 
 
-def lint_notebook(path: Path, *, max_code_lines: int = 50, require_local_pixi: bool = False) -> list[str]:
-    nb = nbformat.read(str(path), as_version=4)
+def upgrade_v3_cell(cell: dict[str, Any]) -> dict[str, Any]:
+    """Convert v3 heading/html cells to markdown the way nbformat's v3 -> v4 upgrade does."""
+    if cell.get("cell_type") == "heading":
+        level = cell.get("level", 1)
+        return {"cell_type": "markdown", "source": "#" * level + " " + " ".join(cell_source(cell).splitlines())}
+    if cell.get("cell_type") == "html":
+        return {**cell, "cell_type": "markdown"}
+    return cell
+
+
+def read_notebook_cells(path: Path, *, validate: bool = False) -> list[dict[str, Any]]:
+    """Return the notebook's cells; raise ValueError for unreadable notebooks."""
+    if validate:
+        import nbformat
+
+        try:
+            nb = nbformat.read(str(path), as_version=4)
+            nbformat.validate(nb)
+        except Exception as exc:  # nbformat raises several unrelated types
+            raise ValueError(f"Invalid notebook: {exc}") from exc
+        return nb.get("cells", [])
+
+    try:
+        with path.open("rb") as handle:
+            nb = json.load(handle)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Unreadable notebook JSON: {exc}") from exc
+    if not isinstance(nb, dict):
+        raise ValueError("Unreadable notebook JSON: top level is not an object.")
+    if "worksheets" in nb:  # nbformat v3
+        return [upgrade_v3_cell(cell) for sheet in nb.get("worksheets") or [] for cell in sheet.get("cells") or []]
+    cells = nb.get("cells", [])
+    if not isinstance(cells, list) or not all(isinstance(cell, dict) for cell in cells):
+        raise ValueError("Unreadable notebook JSON: 'cells' is not a list of objects.")
+    return cells
+
+
+def lint_cells(cells: list[dict[str, Any]], *, max_code_lines: int = 50) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
 
-    cells = nb.get("cells", [])
     if not cells:
         errors.append("Notebook has no cells.")
-        return errors
+        return errors, warnings
 
     if not is_nonempty_markdown(cells[0]):
         errors.append("First cell must be a non-empty markdown intro/title cell.")
@@ -51,45 +110,230 @@ def lint_notebook(path: Path, *, max_code_lines: int = 50, require_local_pixi: b
             errors.append(f"Code cell #{i} must be preceded by a non-empty markdown cell.")
 
         # Warn on large code cells
-        src = cell.get("source") or ""
-        n_lines = len(src.splitlines())
+        n_lines = len(cell_source(cell).splitlines())
         if n_lines > max_code_lines:
             warnings.append(f"Code cell #{i} has {n_lines} lines (> {max_code_lines}). Consider splitting it.")
 
-    if require_local_pixi:
-        pixi_path = path.parent / "pixi.toml"
-        if not pixi_path.exists():
-            errors.append(f"Missing pixi.toml next to notebook: expected {pixi_path}")
+    return errors, warnings
+
+
+def lint_content(path: Path, *, max_code_lines: int = 50, validate: bool = False) -> tuple[list[str], list[str]]:
+    """Lint what is inside the notebook file; these results are safe to cache by mtime."""
+    try:
+        cells = read_notebook_cells(path, validate=validate)
+    except ValueError as exc:
+        return [str(exc)], []
+    return lint_cells(cells, max_code_lines=max_code_lines)
+
+
+def pixi_errors(path: Path) -> list[str]:
+    pixi_path = path.parent / "pixi.toml"
+    if not pixi_path.exists():
+        return [f"Missing pixi.toml next to notebook: expected {pixi_path}"]
+    return []
 
+
+def format_messages(errors: list[str], warnings: list[str]) -> list[str]:
     return errors + [f"WARNING: {w}" for w in warnings]
 
 
+def lint_notebook(
+    path: Path, *, max_code_lines: int = 50, require_local_pixi: bool = False, validate: bool = False
+) -> list[str]:
+    errors, warnings = lint_content(path, max_code_lines=max_code_lines, validate=validate)
+    if require_local_pixi:
+        errors = errors + pixi_errors(path)
+    return format_messages(errors, warnings)
+
+
+def iter_notebooks(paths: Iterable[Path]) -> Iterable[Path]:
+    """Yield notebooks named directly or found under directories, each once."""
+    seen: set[Path] = set()
+    for path in paths:
+        if path.is_dir():
+            found = []
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d != "__pycache__")
+                found.extend(Path(root) / name for name in files if name.endswith(".ipynb"))
+            candidates = sorted(found)
+        elif path.exists():
+            candidates = [path]
+        else:
+            raise SystemExit(f"Notebook not found: {path}")
+        for candidate in candidates:
+            key = candidate.resolve()
+            if key not in seen:
+                seen.add(key)
+                yield candidate
+
+
+def default_cache_dir() -> Path:
+    override = os.environ.get("NOTEBOOK_LINT_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".cache" / "omics-skills" / "notebook-lint"
+
+
+class LintCache:
+    """Content-lint results keyed by absolute path, reused while size and mtime match."""
+
+    def __init__(self, directory: Path, *, max_code_lines: int, validate: bool) -> None:
+        options = json.dumps({"version": CACHE_VERSION, "max_code_lines": max_code_lines, "validate": validate})
+        digest = hashlib.sha256(options.encode("utf-8")).hexdigest()[:16]
+        self.path = Path(directory).expanduser() / f"lint-{digest}.json"
+        self.entries: dict[str, list[Any]] = {}
+        self.dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self.entries = data
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def stamp(path: Path) -> list[int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def get(self, path: Path) -> tuple[list[str], list[str]] | None:
+        entry = self.entries.get(str(path.resolve()))
+        stamp = self.stamp(path)
+        if not entry or stamp is None or entry[0] != stamp:
+            return None
+        return entry[1], entry[2]
+
+    def put(self, path: Path, errors: list[str], warnings: list[str]) -> None:
+        stamp = self.stamp(path)
+        if stamp is not None:
+            self.entries[str(path.resolve())] = [stamp, errors, warnings]
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(self.entries, handle, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            return
+        self.dirty = False
+
+
+def _lint_content_job(job: tuple[str, int, bool]) -> tuple[list[str], list[str]]:
+    path, max_code_lines, validate = job
+    return lint_content(Path(path), max_code_lines=max_code_lines, validate=validate)
+
+
+def lint_notebooks(
+    notebooks: list[Path],
+    *,
+    max_code_lines: int = 50,
+    require_local_pixi: bool = False,
+    validate: bool = False,
+    workers: int | None = None,
+    cache: LintCache | None = None,
+) -> list[dict[str, Any]]:
+    """Lint many notebooks, in input order, reusing cached results for unchanged files."""
+    results: list[dict[str, Any] | None] = [None] * len(notebooks)
+    stale: list[int] = []
+    for index, path in enumerate(notebooks):
+        hit = cache.get(path) if cache is not None else None
+        if hit is None:
+            stale.append(index)
+        else:
+            results[index] = {"errors": hit[0], "warnings": hit[1], "cached": True}
+
+    jobs = [(str(notebooks[index]), max_code_lines, validate) for index in stale]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(jobs) >= MIN_PARALLEL_NOTEBOOKS:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            linted = list(pool.map(_lint_content_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    else:
+        linted = [_lint_content_job(job) for job in jobs]
+
+    for index, (errors, warnings) in zip(stale, linted):
+        if cache is not None:
+            cache.put(notebooks[index], errors, warnings)
+        results[index] = {"errors": errors, "warnings": warnings, "cached": False}
+    if cache is not None:
+        cache.save()
+
+    report = []
+    for path, result in zip(notebooks, results):
+        assert result is not None
+        errors = result["errors"] + (pixi_errors(path) if require_local_pixi else [])
+        report.append({"path": str(path), "errors": errors, "warnings": result["warnings"], "cached": result["cached"]})
+    return report
+
+
+def summarize(report: list[dict[str, Any]]) -> dict[str, int]:
+    return {
+        "notebooks": len(report),
+        "with_errors": sum(1 for item in report if item["errors"]),
+        "with_warnings": sum(1 for item in report if item["warnings"]),
+        "cached": sum(1 for item in report if item["cached"]),
+    }
+
+
 def main() -> None:
     ap = argparse.ArgumentParser()
-    ap.add_argument("notebook", type=Path)
+    ap.add_argument("paths", nargs="+", type=Path, metavar="notebook", help="Notebooks or directories to lint")
     ap.add_argument("--max-code-lines", type=int, default=50)
     ap.add_argument("--require-local-pixi", action="store_true")
+    ap.add_argument("--validate", action="store_true", help="Also validate against the nbformat schema")
+    ap.add_argument("--workers", type=int, default=None, help="Lint processes (default: CPU count)")
+    ap.add_argument("--format", choices=("text", "json"), default="text")
+    ap.add_argument("--cache-dir", type=Path, default=None, help="Lint cache directory")
+    ap.add_argument("--no-cache", action="store_true", help="Re-lint every notebook")
     args = ap.parse_args()
 
-    nb_path: Path = args.notebook
-    if not nb_path.exists():
-        raise SystemExit(f"Notebook not found: {nb_path}")
-
-    msgs = lint_notebook(
-        nb_path,
+    notebooks = list(iter_notebooks(args.paths))
+    cache = None
+    if not args.no_cache:
+        cache = LintCache(
+            args.cache_dir or default_cache_dir(), max_code_lines=args.max_code_lines, validate=args.validate
+        )
+    report = lint_notebooks(
+        notebooks,
         max_code_lines=args.max_code_lines,
         require_local_pixi=args.require_local_pixi,
+        validate=args.validate,
+        workers=args.workers,
+        cache=cache,
     )
+    summary = summarize(report)
+    has_error = summary["with_errors"] > 0
 
-    if not msgs:
-        print("OK: Notebook passes structure lint.")
-        return
+    if args.format == "json":
+        json.dump({"summary": summary, "notebooks": report}, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        raise SystemExit(1 if has_error else 0)
 
-    # Print all messages; non-warning messages are errors.
-    has_error = any(not m.startswith("WARNING:") for m in msgs)
-    for m in msgs:
-        print(m)
+    if len(args.paths) == 1 and len(report) == 1 and not args.paths[0].is_dir():
+        # Single notebook: keep the original unprefixed output.
+        msgs = format_messages(report[0]["errors"], report[0]["warnings"])
+        if not msgs:
+            print("OK: Notebook passes structure lint.")
+            return
+        # Print all messages; non-warning messages are errors.
+        for m in msgs:
+            print(m)
+        raise SystemExit(1 if has_error else 0)
 
+    for item in report:
+        for m in format_messages(item["errors"], item["warnings"]):
+            print(f"{item['path']}: {m}")
+    print(
+        f"{summary['notebooks']} notebooks linted ({summary['cached']} cached): "
+        f"{summary['with_errors']} with errors, {summary['with_warnings']} with warnings."
+    )
     raise SystemExit(1 if has_error else 0)
 
 
@@ -5,6 +5,7 @@ import json
 import re
 from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -128,6 +129,16 @@ DROP_LINE_PATTERNS = (
     re.compile(r"^\s*(citation|copyright):", re.IGNORECASE),
     re.compile(r"^\s*doi:\s*", re.IGNORECASE),
 )
+# DROP_LINE_PATTERNS folded into one alternation per kind; the running-header
+# patterns all need a "|" so they are only tried on lines containing one.
+DROP_LINE_RE = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in DROP_LINE_PATTERNS if r"\|" not in pattern.pattern),
+    re.IGNORECASE,
+)
+DROP_PIPE_LINE_RE = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in DROP_LINE_PATTERNS if r"\|" in pattern.pattern),
+    re.IGNORECASE,
+)
 CAPTION_START_RE = re.compile(
     r"^\s*(?:fig(?:ure)?\.?|table|supplementary\s+(?:fig(?:ure)?\.?|table))\s+[a-z0-9]+(?:\.[a-z0-9]+)?\s*[:.]",
     re.IGNORECASE,
@@ -137,6 +148,7 @@ FIGURE_BLOCK_MARKER_RE = re.compile(
     re.IGNORECASE,
 )
 HEADING_RE = re.compile(r"^(#{1,6})\s+(.*\S)\s*$")
+LIST_ITEM_RE = re.compile(r"^(?:[-*]|\d+\.)\s+")
 LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 FOOTNOTE_MARKER_RE = re.compile(r"\$?\^\{[^}]+\}\$?")
 ANGLE_URL_RE = re.compile(r"<(https?://[^>]+)>")
@@ -158,19 +170,31 @@ class Section:
     content_lines: list[str]
 
 
+@dataclass(frozen=True)
+class LineInfo:
+    cleaned: str
+    heading_level: int
+    heading: str
+    normalized_heading: str
+    is_caption: bool
+
+
 def strip_markdown_inline(text: str) -> str:
-    text = LINK_RE.sub(lambda match: match.group(1), text)
+    if "[" in text:
+        text = LINK_RE.sub(lambda match: match.group(1), text)
     text = text.replace("**", "").replace("__", "")
     text = text.replace("`", "")
-    text = ANGLE_URL_RE.sub(lambda match: match.group(1), text)
-    text = HTML_TAG_RE.sub("", text)
-    return re.sub(r"\s+", " ", text).strip()
+    if "<" in text:
+        text = ANGLE_URL_RE.sub(lambda match: match.group(1), text)
+        text = HTML_TAG_RE.sub("", text)
+    return " ".join(text.split())
 
 
 def clean_title_or_text(text: str) -> str:
     text = strip_markdown_inline(text)
-    text = FOOTNOTE_MARKER_RE.sub("", text)
-    return re.sub(r"\s+", " ", text).strip(" ,;")
+    if "^" in text:
+        text = FOOTNOTE_MARKER_RE.sub("", text)
+    return " ".join(text.split()).strip(" ,;")
 
 
 def strip_heading_numbering(text: str) -> str:
@@ -190,7 +214,23 @@ def normalize_heading(text: str) -> str:
 
 
 def normalize_count_key(text: str) -> str:
-    return re.sub(r"\s+", " ", text.strip().lower())
+    return " ".join(text.lower().split())
+
+
+@lru_cache(maxsize=1 << 17)
+def classify_line(line: str) -> LineInfo:
+    """Clean and classify a Markdown line once for every pass that needs it.
+
+    Section parsing, caption scanning and body collapsing all revisit the same
+    lines, so results are memoized by line text.
+    """
+    cleaned = clean_title_or_text(line)
+    match = HEADING_RE.match(line.strip())
+    if match:
+        heading = clean_title_or_text(match.group(2))
+        return LineInfo(cleaned, len(match.group(1)), heading, normalize_heading(heading), False)
+    is_caption = bool(cleaned) and CAPTION_START_RE.match(cleaned) is not None
+    return LineInfo(cleaned, 0, "", "", is_caption)
 
 
 def looks_like_repeated_furniture(text: str) -> bool:
@@ -211,14 +251,16 @@ def looks_like_repeated_furniture(text: str) -> bool:
     return False
 
 
-def should_drop_line(text: str, counts: Counter[str]) -> bool:
+def should_drop_line(text: str, counts: Counter[str], count_key: str | None = None) -> bool:
     stripped = text.strip()
     if not stripped:
         return False
-    for pattern in DROP_LINE_PATTERNS:
-        if pattern.search(stripped):
-            return True
-    count_key = normalize_count_key(stripped)
+    if DROP_LINE_RE.match(stripped):
+        return True
+    if "|" in stripped and DROP_PIPE_LINE_RE.match(stripped):
+        return True
+    if count_key is None:
+        count_key = normalize_count_key(stripped)
     if counts[count_key] >= 2 and looks_like_repeated_furniture(stripped):
         return True
     return False
@@ -232,11 +274,12 @@ def load_clean_lines(markdown_path: Path) -> list[str]:
             if raw_lines[index].strip() == "---":
                 raw_lines = raw_lines[index + 1 :]
                 break
-    counts = Counter(normalize_count_key(line) for line in raw_lines if normalize_count_key(line))
+    count_keys = [normalize_count_key(line) for line in raw_lines]
+    counts = Counter(key for key in count_keys if key)
 
     cleaned: list[str] = []
-    for line in raw_lines:
-        if should_drop_line(line, counts):
+    for line, count_key in zip(raw_lines, count_keys):
+        if should_drop_line(line, counts, count_key):
             continue
         if cleaned and not line.strip() and not cleaned[-1].strip():
             continue
@@ -247,11 +290,9 @@ def load_clean_lines(markdown_path: Path) -> list[str]:
 def parse_sections(lines: list[str]) -> list[Section]:
     heading_positions: list[tuple[int, int, str, str]] = []
     for index, line in enumerate(lines):
-        match = HEADING_RE.match(line.strip())
-        if not match:
-            continue
-        raw_heading = clean_title_or_text(match.group(2))
-        heading_positions.append((index, len(match.group(1)), raw_heading, normalize_heading(raw_heading)))
+        info = classify_line(line)
+        if info.heading_level:
+            heading_positions.append((index, info.heading_level, info.heading, info.normalized_heading))
 
     sections: list[Section] = []
     for i, (start, level, heading, normalized_heading) in enumerate(heading_positions):
@@ -273,13 +314,14 @@ def collapse_lines(lines: list[str]) -> str:
     paragraphs: list[str] = []
     current: list[str] = []
     for raw_line in lines:
-        line = clean_title_or_text(raw_line)
+        info = classify_line(raw_line)
+        line = info.cleaned
         if not line:
             if current:
                 paragraphs.append(" ".join(current).strip())
                 current = []
             continue
-        if CAPTION_START_RE.match(line) or re.match(r"^[-*]\s+", line) or re.match(r"^\d+\.\s+", line):
+        if info.is_caption or LIST_ITEM_RE.match(line):
             if current:
                 paragraphs.append(" ".join(current).strip())
                 current = []
@@ -565,19 +607,20 @@ def extract_figure_legends(lines: list[str]) -> list[str]:
     captions: list[str] = []
     current: list[str] = []
     for line in lines:
-        cleaned = clean_title_or_text(line)
+        info = classify_line(line)
+        cleaned = info.cleaned
         if not cleaned:
             if current:
                 captions.append(" ".join(current).strip())
                 current = []
             continue
-        if CAPTION_START_RE.match(cleaned):
+        if info.is_caption:
             if current:
                 captions.append(" ".join(current).strip())
             current = [cleaned]
             continue
         if current:
-            if HEADING_RE.match(line.strip()) or CAPTION_START_RE.match(cleaned):
+            if info.heading_level:
                 captions.append(" ".join(current).strip())
                 current = []
             else:
@@ -602,7 +645,7 @@ def extract_main(
 ) -> tuple[str, list[str]]:
     def trim_figure_tail(lines: list[str]) -> list[str]:
         for idx, raw_line in enumerate(lines):
-            cleaned = clean_title_or_text(raw_line)
+            cleaned = classify_line(raw_line).cleaned
             if not cleaned:
                 continue
             if FIGURE_BLOCK_MARKER_RE.match(cleaned):
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["liteparse>=2,<3"]
+# ///
+"""Convert a directory of PDFs to Markdown + article JSON with LiteParse v2.
+
+Each document runs the same chain as the single-file helpers:
+
+    parse -> Markdown -> section audit -> article JSON
+
+across a process pool (one LiteParse parser per worker). Documents are keyed
+by the SHA-256 of the PDF plus the conversion settings, so re-running over the
+same tree skips unchanged PDFs whose outputs are still on disk.
+
+Outputs mirror the input tree under ``--output-dir``:
+- <stem>.md / .ocr.json / .job.json   as written by ``liteparse_to_md.py``
+- <stem>.section_audit.json           as written by ``build_section_audit.py``
+- <stem>.article.json                 as written by ``populate_article_json.py``
+- batch_manifest.json                 per-document status, hashes and timings
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+
+from article_extraction import build_article_from_audit, build_section_audit, default_audit_path, write_json
+from liteparse_to_md import build_config, ensure_v2, load_liteparse, pages_to_markdown, write_outputs
+
+MANIFEST_NAME = "batch_manifest.json"
+MANIFEST_VERSION = 1
+HASH_BLOCK_BYTES = 1 << 20
+# Flush the manifest every N finished documents so an interrupted run keeps its cache.
+MANIFEST_FLUSH_EVERY = 25
+
+_PARSER = None
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def settings_fingerprint(settings: dict) -> str:
+    encoded = json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def collect_pdfs(input_dir: Path, pattern: str = "*.pdf", recursive: bool = True) -> list[Path]:
+    matches = input_dir.rglob(pattern) if recursive else input_dir.glob(pattern)
+    return sorted(path for path in matches if path.is_file())
+
+
+def expected_outputs(output_dir: Path, stem: str, markdown_only: bool) -> dict[str, Path]:
+    outputs = {
+        "markdown": output_dir / f"{stem}.md",
+        "json": output_dir / f"{stem}.ocr.json",
+        "job": output_dir / f"{stem}.job.json",
+    }
+    if not markdown_only:
+        outputs["section_audit"] = default_audit_path(outputs["markdown"])
+        outputs["article"] = outputs["markdown"].with_suffix(".article.json")
+    return outputs
+
+
+def load_manifest(path: Path) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("documents", {})
+
+
+def write_manifest(path: Path, documents: dict, summary: dict, settings: dict) -> None:
+    payload = {
+        "version": MANIFEST_VERSION,
+        "run_datetime": datetime.now(timezone.utc).isoformat(),
+        "settings": settings,
+        "summary": summary,
+        "documents": dict(sorted(documents.items())),
+    }
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _init_worker(config: dict) -> None:
+    global _PARSER
+    liteparse = load_liteparse()
+    ensure_v2(liteparse)
+    _PARSER = liteparse.LiteParse(**config)
+
+
+def convert_document(input_path: str, output_dir: str, settings: dict) -> dict:
+    """Run the full chain for one PDF inside a worker; return its timings and outputs."""
+    source = Path(input_path)
+    target = Path(output_dir)
+    target.mkdir(parents=True, exist_ok=True)
+    markdown_only = settings["markdown_only"]
+    timings: dict[str, float] = {}
+
+    started = time.perf_counter()
+    pages = _PARSER.parse(source).pages
+    timings["parse"] = time.perf_counter() - started
+
+    mark = time.perf_counter()
+    markdown, body_size, heading_count = pages_to_markdown(pages)
+    paths = write_outputs(
+        source,
+        target,
+        markdown,
+        page_count=len(pages),
+        body_size=body_size,
+        heading_count=heading_count,
+        lp_version=settings["liteparse_version"],
+        ocr_enabled=settings["config"].get("ocr_enabled", True),
+        ocr_server_url=settings["config"].get("ocr_server_url"),
+    )
+    timings["markdown"] = time.perf_counter() - mark
+
+    outputs = dict(paths)
+    missing_fields: list[str] = []
+    if not markdown_only:
+        mark = time.perf_counter()
+        audit = build_section_audit(paths["markdown"])
+        outputs["section_audit"] = default_audit_path(paths["markdown"])
+        write_json(outputs["section_audit"], audit)
+        timings["section_audit"] = time.perf_counter() - mark
+
+        mark = time.perf_counter()
+        outputs["article"] = paths["markdown"].with_suffix(".article.json")
+        write_json(outputs["article"], build_article_from_audit(audit))
+        timings["article"] = time.perf_counter() - mark
+        missing_fields = audit.get("missing_expected_fields", [])
+
+    timings["total"] = time.perf_counter() - started
+    return {
+        "page_count": len(pages),
+        "heading_count": heading_count,
+        "missing_expected_fields": missing_fields,
+        "outputs": {key: str(value) for key, value in outputs.items()},
+        "timings": {key: round(value, 4) for key, value in timings.items()},
+    }
+
+
+def _safe_convert(input_path: str, output_dir: str, settings: dict) -> dict:
+    try:
+        return {"status": "converted", **convert_document(input_path, output_dir, settings)}
+    except Exception as exc:  # noqa: BLE001 - one bad PDF must not sink the batch
+        return {"status": "failed", "error": f"{type(exc).__name__}: {exc}"}
+
+
+def plan_batch(
+    pdfs: list[Path],
+    input_dir: Path,
+    output_dir: Path,
+    previous: dict,
+    fingerprint: str,
+    *,
+    markdown_only: bool,
+    force: bool,
+) -> tuple[dict, list[tuple[str, Path, Path]]]:
+    """Split PDFs into cached manifest entries and (key, source, target_dir) jobs."""
+    documents: dict = {}
+    pending: list[tuple[str, Path, Path]] = []
+    for pdf in pdfs:
+        key = pdf.relative_to(input_dir).as_posix()
+        target_dir = output_dir / Path(key).parent
+        stat = pdf.stat()
+        prior = previous.get(key, {})
+        # Re-hash only when size or mtime moved; the hash is what decides staleness.
+        if prior.get("size") == stat.st_size and prior.get("mtime_ns") == stat.st_mtime_ns and prior.get("sha256"):
+            digest = prior["sha256"]
+        else:
+            digest = sha256_file(pdf)
+        entry = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "settings": fingerprint}
+        outputs = expected_outputs(target_dir, pdf.stem, markdown_only)
+        if (
+            not force
+            and prior.get("status") in {"converted", "cached"}
+            and prior.get("sha256") == digest
+            and prior.get("settings") == fingerprint
+            and all(path.exists() for path in outputs.values())
+        ):
+            documents[key] = {**prior, **entry, "status": "cached"}
+        else:
+            documents[key] = entry
+            pending.append((key, pdf, target_dir))
+    return documents, pending
+
+
+def run_batch(
+    pending: list[tuple[str, Path, Path]],
+    documents: dict,
+    settings: dict,
+    *,
+    workers: int,
+    manifest_path: Path,
+    summary: dict,
+) -> None:
+    def record(key: str, result: dict, done: int) -> None:
+        documents[key].update(result)
+        status = result["status"]
+        detail = result.get("error") or f"{result['timings']['total']:.2f}s"
+        print(f"[{done}/{len(pending)}] {status} {key} ({detail})", file=sys.stderr)
+        if done % MANIFEST_FLUSH_EVERY == 0:
+            write_manifest(manifest_path, documents, summary, settings)
+
+    if workers <= 1:
+        _init_worker(settings["config"])
+        for done, (key, source, target_dir) in enumerate(pending, start=1):
+            record(key, _safe_convert(str(source), str(target_dir), settings), done)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(settings["config"],)) as pool:
+        futures = {
+            pool.submit(_safe_convert, str(source), str(target_dir), settings): key
+            for key, source, target_dir in pending
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            record(futures[future], future.result(), done)
+
+
+def summarize(documents: dict, wall_seconds: float) -> dict:
+    statuses = [entry.get("status") for entry in documents.values()]
+    converted = [entry for entry in documents.values() if entry.get("status") == "converted"]
+    return {
+        "documents": len(documents),
+        "converted": statuses.count("converted"),
+        "cached": statuses.count("cached"),
+        "failed": statuses.count("failed"),
+        "wall_seconds": round(wall_seconds, 3),
+        "convert_seconds": round(sum(entry["timings"]["total"] for entry in converted), 3),
+        "pages_converted": sum(entry.get("page_count", 0) for entry in converted),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Convert a directory of PDFs to Markdown, section audits and article JSON in parallel."
+    )
+    parser.add_argument("input_dir", type=Path, help="Directory containing PDFs.")
+    parser.add_argument("--output-dir", type=Path, required=True)
+    parser.add_argument("--pattern", default="*.pdf", help="Glob for input files (default: *.pdf).")
+    parser.add_argument("--no-recursive", action="store_true", help="Do not descend into subdirectories.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Parallel worker processes (default: CPU count).",
+    )
+    parser.add_argument("--force", action="store_true", help="Reconvert documents even when cached.")
+    parser.add_argument(
+        "--markdown-only",
+        action="store_true",
+        help="Stop after Markdown (skip section audit and article JSON).",
+    )
+    parser.add_argument("--no-ocr", action="store_true", help="Disable OCR (text-layer only).")
+    parser.add_argument("--ocr-server-url", default=None, help="HTTP OCR server URL.")
+    parser.add_argument("--ocr-language", default=None, help="OCR language code (e.g. en, fr).")
+    parser.add_argument("--max-pages", type=int, default=None, help="Max pages to parse per document.")
+    parser.add_argument("--dpi", type=float, default=None, help="Rendering DPI for OCR.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    input_dir = args.input_dir.expanduser().resolve()
+    output_dir = args.output_dir.expanduser().resolve()
+    if not input_dir.is_dir():
+        raise NotADirectoryError(input_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    liteparse = load_liteparse()
+    settings = {
+        "liteparse_version": ensure_v2(liteparse),
+        "markdown_only": args.markdown_only,
+        "config": build_config(
+            no_ocr=args.no_ocr,
+            ocr_server_url=args.ocr_server_url,
+            ocr_language=args.ocr_language,
+            max_pages=args.max_pages,
+            dpi=args.dpi,
+        ),
+    }
+    fingerprint = settings_fingerprint(settings)
+    manifest_path = output_dir / MANIFEST_NAME
+
+    started = time.perf_counter()
+    pdfs = collect_pdfs(input_dir, args.pattern, recursive=not args.no_recursive)
+    documents, pending = plan_batch(
+        pdfs,
+        input_dir,
+        output_dir,
+        load_manifest(manifest_path),
+        fingerprint,
+        markdown_only=args.markdown_only,
+        force=args.force,
+    )
+    print(f"{len(pdfs)} documents, {len(pdfs) - len(pending)} cached, {len(pending)} to convert", file=sys.stderr)
+
+    summary: dict = {}
+    if pending:
+        workers = max(1, min(args.workers, len(pending)))
+        run_batch(pending, documents, settings, workers=workers, manifest_path=manifest_path, summary=summary)
+    summary.update(summarize(documents, time.perf_counter() - started))
+    write_manifest(manifest_path, documents, summary, settings)
+
+    print(f"manifest={manifest_path}")
+    print(
+        f"converted={summary['converted']} cached={summary['cached']} "
+        f"failed={summary['failed']} wall_seconds={summary['wall_seconds']}"
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Measure section-audit throughput over a corpus of converted Markdown papers.
+
+Runs ``build_section_audit`` on every ``*.md`` under the given paths and reports
+lines/s and MB/s per file and in total. The line-classification cache is cleared
+before each run so numbers reflect a cold, single-document audit.
+
+Usage:
+  python3 benchmark_section_audit.py CORPUS_DIR [MORE.md ...] [--repeat 3] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from article_extraction import build_section_audit, classify_line
+
+
+def collect_markdown(paths: list[Path]) -> list[Path]:
+    files: list[Path] = []
+    for path in paths:
+        path = path.expanduser().resolve()
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*.md") if p.is_file()))
+        elif path.exists():
+            files.append(path)
+        else:
+            raise FileNotFoundError(path)
+    return files
+
+
+def time_audit(markdown_path: Path, repeat: int) -> float:
+    """Best-of-``repeat`` wall time for one cold audit."""
+    best = float("inf")
+    for _ in range(repeat):
+        classify_line.cache_clear()
+        started = time.perf_counter()
+        build_section_audit(markdown_path)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark build_section_audit throughput on Markdown papers.")
+    parser.add_argument("paths", type=Path, nargs="+", help="Markdown files or directories containing them.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per file; the fastest is reported (default: 3).")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable results.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    files = collect_markdown(args.paths)
+    if not files:
+        raise SystemExit("No Markdown files found")
+
+    rows = []
+    for path in files:
+        text = path.read_text(encoding="utf-8")
+        seconds = time_audit(path, max(1, args.repeat))
+        rows.append(
+            {
+                "path": str(path),
+                "lines": text.count("\n") + 1,
+                "bytes": len(text.encode("utf-8")),
+                "seconds": round(seconds, 5),
+            }
+        )
+
+    total_lines = sum(row["lines"] for row in rows)
+    total_bytes = sum(row["bytes"] for row in rows)
+    total_seconds = sum(row["seconds"] for row in rows)
+    summary = {
+        "files": len(rows),
+        "lines": total_lines,
+        "bytes": total_bytes,
+        "seconds": round(total_seconds, 5),
+        "lines_per_second": round(total_lines / total_seconds) if total_seconds else None,
+        "mb_per_second": round(total_bytes / total_seconds / 1e6, 3) if total_seconds else None,
+    }
+
+    if args.json:
+        print(json.dumps({"summary": summary, "files": rows}, indent=2))
+        return 0
+
+    width = max(len(Path(row["path"]).name) for row in rows)
+    for row in rows:
+        rate = row["lines"] / row["seconds"] if row["seconds"] else float("inf")
+        print(f"{Path(row['path']).name:<{width}}  {row['lines']:>8} lines  {row['seconds']:>8.3f}s  {rate:>10,.0f} lines/s")
+    print(
+        f"TOTAL: {summary['files']} files, {total_lines} lines in {total_seconds:.3f}s "
+        f"({summary['lines_per_second']:,} lines/s, {summary['mb_per_second']} MB/s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -28,7 +28,9 @@ import re
 import statistics
 import sys
 from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -93,7 +95,7 @@ def ensure_v2(liteparse) -> str:
 
 def normalize(text: str) -> str:
     text = text.replace("ﬁ", "fi").replace("ﬂ", "fl")
-    return re.sub(r"\s+", " ", text).strip()
+    return " ".join(text.split())
 
 
 def strip_numbering(text: str) -> str:
@@ -123,66 +125,109 @@ def is_furniture(line: str) -> bool:
     return False
 
 
-def build_drop_keys(pages) -> set[str]:
+@dataclass(frozen=True)
+class LineFacts:
+    """Everything the post-processing stages need to know about one string."""
+
+    text: str
+    key: str
+    word_count: int
+    watermark: bool
+    page_furniture: bool
+
+
+@lru_cache(maxsize=1 << 16)
+def line_facts(raw: str) -> LineFacts:
+    # Running headers and text items that repeat a line hit the cache.
+    text = normalize(raw)
+    return LineFacts(
+        text=text,
+        key=normalize_heading_key(text),
+        word_count=len(text.split()),
+        watermark=bool(FURNITURE_RE.search(text)),
+        page_furniture=is_furniture(text),
+    )
+
+
+@lru_cache(maxsize=256)
+def is_bold_font(font_name: str) -> bool:
+    return bool(BOLD_FONT_RE.search(font_name))
+
+
+@dataclass
+class PageItem:
+    facts: LineFacts
+    font_size: float
+    bold: bool
+
+
+@dataclass
+class PageModel:
+    """Normalized lines and positioned items for every page, built in one traversal."""
+
+    lines: list[list[LineFacts]] = field(default_factory=list)
+    page_presence: Counter[str] = field(default_factory=Counter)
+    body_sizes: list[float] = field(default_factory=list)
+    all_sizes: list[float] = field(default_factory=list)
+    heading_candidates: list[PageItem] = field(default_factory=list)
+    first_page_items: list[PageItem] = field(default_factory=list)
+
+
+def build_page_model(pages) -> PageModel:
+    model = PageModel()
+    for page_index, page in enumerate(pages):
+        page_lines = [line_facts(raw) for raw in page.text.splitlines()]
+        model.lines.append(page_lines)
+        model.page_presence.update({facts.key for facts in page_lines if facts.key})
+
+        for it in page.text_items:
+            facts = line_facts(it.text)
+            item = PageItem(facts, it.font_size, bool(it.font_name) and is_bold_font(it.font_name))
+            if it.font_size:
+                model.all_sizes.append(it.font_size)
+                if facts.word_count >= 5:
+                    model.body_sizes.append(it.font_size)
+                if page_index == 0:
+                    model.first_page_items.append(item)
+            if 1 <= facts.word_count <= 14 and not facts.watermark:
+                model.heading_candidates.append(item)
+    return model
+
+
+def build_drop_keys(model: PageModel) -> set[str]:
     """Normalized keys for lines that are page furniture: watermarks plus short
     lines repeated across two or more pages (running headers/footers)."""
-    page_presence: Counter[str] = Counter()
-    for page in pages:
-        seen: set[str] = set()
-        for raw in page.text.splitlines():
-            key = normalize_heading_key(raw)
-            if key and key not in seen:
-                seen.add(key)
-                page_presence[key] += 1
-    return {key for key, count in page_presence.items() if count >= 2 and len(key.split()) <= 15}
-
-
-def is_drop(text: str, drop_keys: set[str]) -> bool:
-    if FURNITURE_RE.search(text):
-        return True
-    return normalize_heading_key(text) in drop_keys
+    return {key for key, count in model.page_presence.items() if count >= 2 and len(key.split()) <= 15}
+
+
+def is_drop(facts: LineFacts, drop_keys: set[str]) -> bool:
+    return facts.watermark or facts.key in drop_keys
 
 
-def collect_font_signals(pages, drop_keys: set[str]) -> tuple[float, set[str], list[str]]:
+def collect_font_signals(model: PageModel, drop_keys: set[str]) -> tuple[float, set[str], list[str]]:
     """Return (body_font_size, heading_keys, title_lines) from positioned items."""
-    sizes = [
-        it.font_size
-        for page in pages
-        for it in page.text_items
-        if it.font_size and len(it.text.split()) >= 5
-    ]
-    if not sizes:
-        sizes = [it.font_size for page in pages for it in page.text_items if it.font_size]
+    sizes = model.body_sizes or model.all_sizes
     body_size = statistics.median(sizes) if sizes else 0.0
 
     heading_keys: set[str] = set()
-    for page in pages:
-        for it in page.text_items:
-            text = normalize(it.text)
-            words = text.split()
-            if not (1 <= len(words) <= 14) or is_drop(text, drop_keys):
-                continue
-            bigger = bool(it.font_size) and body_size and it.font_size >= body_size * 1.15
-            bold = bool(it.font_name) and bool(BOLD_FONT_RE.search(it.font_name))
-            if bigger or bold:
-                heading_keys.add(normalize_heading_key(text))
+    for item in model.heading_candidates:
+        if item.facts.key in drop_keys:
+            continue
+        bigger = bool(item.font_size) and body_size and item.font_size >= body_size * 1.15
+        if bigger or item.bold:
+            heading_keys.add(item.facts.key)
 
     # Title: the largest-font, non-furniture lines on page 1, in reading order.
     title_lines: list[str] = []
-    if pages and pages[0].text_items:
-        sized = [it for it in pages[0].text_items if it.font_size and not is_drop(normalize(it.text), drop_keys)]
-        if sized:
-            top = max(it.font_size for it in sized)
-            if not body_size or top >= body_size * 1.2:
-                title_lines = [
-                    normalize(it.text)
-                    for it in sized
-                    if it.font_size >= top * 0.98 and normalize(it.text)
-                ]
+    sized = [item for item in model.first_page_items if not is_drop(item.facts, drop_keys)]
+    if sized:
+        top = max(item.font_size for item in sized)
+        if not body_size or top >= body_size * 1.2:
+            title_lines = [item.facts.text for item in sized if item.font_size >= top * 0.98 and item.facts.text]
     return body_size, heading_keys, title_lines
 
 
-def to_markdown(pages, heading_keys: set[str], title_lines: list[str], drop_keys: set[str]) -> tuple[str, int]:
+def to_markdown(model: PageModel, heading_keys: set[str], title_lines: list[str], drop_keys: set[str]) -> tuple[str, int]:
     out: list[str] = []
     paragraph: list[str] = []
     title_tokens: set[str] = set()
@@ -200,15 +245,15 @@ def to_markdown(pages, heading_keys: set[str], title_lines: list[str], drop_keys
         out.append(f"# {' '.join(title_lines)}")
         out.append("")
 
-    for page in pages:
-        for raw in page.text.splitlines():
-            line = normalize(raw)
+    for page_lines in model.lines:
+        for facts in page_lines:
+            line = facts.text
             if not line:
                 flush()
                 continue
-            if is_furniture(line) or is_drop(line, drop_keys):
+            if facts.page_furniture or is_drop(facts, drop_keys):
                 continue
-            key = normalize_heading_key(line)
+            key = facts.key
             # Drop the leading lines that just re-state the title emitted above.
             if in_title_zone:
                 tokens = set(key.split())
@@ -257,40 +302,57 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def main() -> int:
-    args = parse_args()
-    input_path = args.input_path.expanduser().resolve()
-    output_dir = args.output_dir.expanduser().resolve()
-    if not input_path.exists():
-        raise FileNotFoundError(input_path)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    liteparse = load_liteparse()
-    lp_version = ensure_v2(liteparse)
+def build_config(
+    *,
+    no_ocr: bool = False,
+    ocr_server_url: str | None = None,
+    ocr_language: str | None = None,
+    target_pages: str | None = None,
+    max_pages: int | None = None,
+    dpi: float | None = None,
+    password: str | None = None,
+) -> dict:
+    """LiteParse constructor options for the given CLI settings."""
     config = {"output_format": "json", "quiet": True}
-    if args.no_ocr:
+    if no_ocr:
         config["ocr_enabled"] = False
-    if args.ocr_server_url:
-        config["ocr_server_url"] = args.ocr_server_url
-    if args.ocr_language:
-        config["ocr_language"] = args.ocr_language
-    if args.target_pages:
-        config["target_pages"] = args.target_pages
-    if args.max_pages is not None:
-        config["max_pages"] = args.max_pages
-    if args.dpi is not None:
-        config["dpi"] = args.dpi
-    if args.password:
-        config["password"] = args.password
-
-    parser = liteparse.LiteParse(**config)
-    result = parser.parse(input_path)
-    pages = result.pages
-
-    drop_keys = build_drop_keys(pages)
-    body_size, heading_keys, title_lines = collect_font_signals(pages, drop_keys)
-    markdown, heading_count = to_markdown(pages, heading_keys, title_lines, drop_keys)
-
+    if ocr_server_url:
+        config["ocr_server_url"] = ocr_server_url
+    if ocr_language:
+        config["ocr_language"] = ocr_language
+    if target_pages:
+        config["target_pages"] = target_pages
+    if max_pages is not None:
+        config["max_pages"] = max_pages
+    if dpi is not None:
+        config["dpi"] = dpi
+    if password:
+        config["password"] = password
+    return config
+
+
+def pages_to_markdown(pages) -> tuple[str, float, int]:
+    """Run the post-processing stages; return (markdown, body_font_size, heading_count)."""
+    model = build_page_model(pages)
+    drop_keys = build_drop_keys(model)
+    body_size, heading_keys, title_lines = collect_font_signals(model, drop_keys)
+    markdown, heading_count = to_markdown(model, heading_keys, title_lines, drop_keys)
+    return markdown, body_size, heading_count
+
+
+def write_outputs(
+    input_path: Path,
+    output_dir: Path,
+    markdown: str,
+    *,
+    page_count: int,
+    body_size: float,
+    heading_count: int,
+    lp_version: str,
+    ocr_enabled: bool,
+    ocr_server_url: str | None,
+) -> dict[str, Path]:
+    """Write <stem>.md, <stem>.ocr.json and <stem>.job.json; return their paths."""
     stem = input_path.stem
     markdown_path = output_dir / f"{stem}.md"
     ocr_json_path = output_dir / f"{stem}.ocr.json"
@@ -302,7 +364,7 @@ def main() -> int:
             {
                 "source": "liteparse",
                 "metadata": {
-                    "page_count": len(pages),
+                    "page_count": page_count,
                     "body_font_size": round(body_size, 3),
                     "heading_count": heading_count,
                 },
@@ -318,9 +380,9 @@ def main() -> int:
                 "tool": "liteparse",
                 "tool_version": lp_version,
                 "input_path": str(input_path),
-                "ocr_enabled": not args.no_ocr,
-                "ocr_server_url": args.ocr_server_url,
-                "page_count": len(pages),
+                "ocr_enabled": ocr_enabled,
+                "ocr_server_url": ocr_server_url,
+                "page_count": page_count,
                 "run_datetime": datetime.now(timezone.utc).isoformat(),
             },
             indent=2,
@@ -328,10 +390,49 @@ def main() -> int:
         + "\n",
         encoding="utf-8",
     )
+    return {"job": job_meta_path, "markdown": markdown_path, "json": ocr_json_path}
+
+
+def main() -> int:
+    args = parse_args()
+    input_path = args.input_path.expanduser().resolve()
+    output_dir = args.output_dir.expanduser().resolve()
+    if not input_path.exists():
+        raise FileNotFoundError(input_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    liteparse = load_liteparse()
+    lp_version = ensure_v2(liteparse)
+    config = build_config(
+        no_ocr=args.no_ocr,
+        ocr_server_url=args.ocr_server_url,
+        ocr_language=args.ocr_language,
+        target_pages=args.target_pages,
+        max_pages=args.max_pages,
+        dpi=args.dpi,
+        password=args.password,
+    )
+
+    parser = liteparse.LiteParse(**config)
+    result = parser.parse(input_path)
+    pages = result.pages
+
+    markdown, body_size, heading_count = pages_to_markdown(pages)
+    paths = write_outputs(
+        input_path,
+        output_dir,
+        markdown,
+        page_count=len(pages),
+        body_size=body_size,
+        heading_count=heading_count,
+        lp_version=lp_version,
+        ocr_enabled=not args.no_ocr,
+        ocr_server_url=args.ocr_server_url,
+    )
 
-    print(f"job={job_meta_path}")
-    print(f"markdown={markdown_path}")
-    print(f"json={ocr_json_path}")
+    print(f"job={paths['job']}")
+    print(f"markdown={paths['markdown']}")
+    print(f"json={paths['json']}")
     return 0
 
 
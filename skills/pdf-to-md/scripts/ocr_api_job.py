@@ -2,27 +2,120 @@
 from __future__ import annotations
 
 import argparse
+import http.client
 import json
+import mimetypes
 import os
-import subprocess
+import shutil
 import sys
+import threading
 import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from urllib.parse import urlsplit
 
 LOCAL_BASE_URL = "http://127.0.0.1:8002/ocr"
 REMOTE_BASE_URL = "https://api.newlineages.com/ocr"
 API_KEY_ENV_VARS = ("OCR_API_KEY", "NELLI_API_KEY")
 BASE_URL_ENV = "OCR_BASE_URL"
+STATE_FILENAME = "ocr_jobs.state.json"
+# Poll interval grows by this factor while a job's status is unchanged.
+POLL_BACKOFF = 1.5
+# Consecutive failed status requests tolerated before a submitted job is marked failed.
+POLL_RETRIES = 3
 
 
-def run(cmd: list[str], *, input_text: str | None = None) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(cmd, input=input_text, capture_output=True, text=True, check=False)
+class OcrClient:
+    """Keep-alive HTTP client for the OCR API; each thread reuses one connection."""
 
+    def __init__(self, base_url: str, api_key: str, *, timeout: float = 120.0) -> None:
+        parts = urlsplit(base_url.rstrip("/"))
+        if parts.scheme not in {"http", "https"}:
+            raise ValueError(f"Unsupported OCR base URL: {base_url}")
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.prefix = parts.path
+        self.timeout = timeout
+        self.headers = {"X-API-Key": api_key}
+        self._local = threading.local()
 
-def run_curl(args: list[str], *, api_key: str) -> subprocess.CompletedProcess[str]:
-    # Keep the API key out of the process argument list.
-    config = f'header = "X-API-Key: {api_key}"\n'
-    return run(["curl", "-fsS", "-K", "-", *args], input_text=config)
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            conn = cls(self.netloc, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+    def _open(self, method: str, path: str, *, body: bytes | None = None, headers: dict | None = None):
+        url = f"{self.prefix}{path}"
+        for attempt in (0, 1):
+            conn = self._connection()
+            try:
+                conn.request(method, url, body=body, headers={**self.headers, **(headers or {})})
+                response = conn.getresponse()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server closed an idle keep-alive connection; reconnect once.
+                self._drop_connection()
+                if attempt:
+                    raise
+            except Exception:
+                # Timeouts and other errors leave the connection mid-request; never reuse it.
+                self._drop_connection()
+                raise
+        if response.status >= 400:
+            try:
+                detail = response.read().decode("utf-8", "replace").strip()
+            finally:
+                self._drop_connection()
+            raise RuntimeError(f"{method} {url} failed with HTTP {response.status}: {detail[:500]}")
+        return response
+
+    def json(self, path: str, *, method: str = "GET", form_file: Path | None = None) -> dict:
+        body = None
+        headers = None
+        if form_file is not None:
+            body, content_type = encode_multipart("file", form_file)
+            headers = {"Content-Type": content_type}
+        response = self._open(method, path, body=body, headers=headers)
+        try:
+            return json.loads(response.read())
+        except Exception:
+            self._drop_connection()
+            raise
+
+    def download(self, path: str, output_path: Path) -> None:
+        tmp_path = output_path.with_name(output_path.name + ".part")
+        try:
+            response = self._open("GET", path)
+            with tmp_path.open("wb") as handle:
+                shutil.copyfileobj(response, handle)
+        except Exception:
+            self._drop_connection()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, output_path)
+
+
+def encode_multipart(field: str, path: Path) -> tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    filename = path.name.replace('"', "%22")
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode("utf-8")
+    tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+    return head + path.read_bytes() + tail, f"multipart/form-data; boundary={boundary}"
 
 
 def resolve_base_url(explicit: str | None) -> str:
@@ -33,10 +126,16 @@ def resolve_base_url(explicit: str | None) -> str:
     if env_url:
         return env_url
     # Auto-detect: try local first, fall back to remote
-    probe = run(["curl", "-sf", "-o", "/dev/null", "-w", "%{http_code}",
-                  f"{LOCAL_BASE_URL}/health"])
-    if probe.returncode == 0 and probe.stdout.strip().startswith("2"):
-        return LOCAL_BASE_URL
+    parts = urlsplit(LOCAL_BASE_URL)
+    conn = http.client.HTTPConnection(parts.netloc, timeout=2)
+    try:
+        conn.request("GET", f"{parts.path}/health")
+        if 200 <= conn.getresponse().status < 300:
+            return LOCAL_BASE_URL
+    except OSError:
+        pass
+    finally:
+        conn.close()
     return REMOTE_BASE_URL
 
 
@@ -51,28 +150,214 @@ def require_api_key(args: argparse.Namespace) -> str:
     raise SystemExit(f"Missing OCR API key. Set {names} or pass --api-key.")
 
 
-def curl_json(url: str, *, api_key: str, method: str = "GET", form_file: Path | None = None) -> dict:
-    cmd = ["-X", method]
-    if form_file is not None:
-        cmd.extend(["-F", f"file=@{form_file}"])
-    cmd.append(url)
-    result = run_curl(cmd, api_key=api_key)
-    if result.returncode != 0:
-        raise RuntimeError(result.stderr.strip() or result.stdout.strip() or f"curl failed for {url}")
-    return json.loads(result.stdout)
+def collect_inputs(paths: list[Path]) -> list[Path]:
+    inputs: list[Path] = []
+    for path in paths:
+        path = path.expanduser().resolve()
+        if path.is_dir():
+            inputs.extend(sorted(p for p in path.glob("*.pdf") if p.is_file()))
+        elif path.exists():
+            inputs.append(path)
+        else:
+            raise FileNotFoundError(path)
+    stems: dict[str, Path] = {}
+    for path in inputs:
+        if path.stem in stems and stems[path.stem] != path:
+            raise SystemExit(f"Two inputs share the output stem {path.stem!r}: {stems[path.stem]} and {path}")
+        stems[path.stem] = path
+    return list(dict.fromkeys(inputs))
+
+
+def output_paths(output_dir: Path, stem: str) -> dict[str, Path]:
+    return {
+        "job": output_dir / f"{stem}.job.json",
+        "markdown": output_dir / f"{stem}.md",
+        "json": output_dir / f"{stem}.ocr.json",
+    }
+
+
+def load_state(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("jobs", {})
+    except (OSError, ValueError):
+        return {}
+
 
+def save_state(path: Path, jobs: dict) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps({"jobs": jobs}, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
 
-def curl_download(url: str, *, api_key: str, output_path: Path) -> None:
-    result = run_curl(["-o", str(output_path), url], api_key=api_key)
-    if result.returncode != 0:
-        raise RuntimeError(result.stderr.strip() or result.stdout.strip() or f"curl failed for {url}")
+
+def initial_phase(job: dict, outputs: dict[str, Path]) -> str:
+    """Where a job recorded in the state file should resume.
+
+    A failed job that was already submitted is polled again unless the server
+    itself reported the failure; resubmitting would pay for a second OCR run.
+    """
+    phase = job.get("phase")
+    if not job.get("job_id") or phase in {None, "submit"}:
+        return "submit"
+    if phase == "failed":
+        return "submit" if (job.get("job_status") or {}).get("status") == "failed" else "poll"
+    if phase == "done":
+        return "done" if all(path.exists() for path in outputs.values()) else "download"
+    return phase
+
+
+def submit_job(client: OcrClient, input_path: Path) -> dict:
+    return client.json("/api/jobs", method="POST", form_file=input_path)
+
+
+def fetch_artifacts(client: OcrClient, job: dict, outputs: dict[str, Path]) -> dict:
+    job_id = job["job_id"]
+    result_payload = client.json(f"/api/jobs/{job_id}/result")
+    client.download(f"/api/jobs/{job_id}/artifacts/markdown", outputs["markdown"])
+    client.download(f"/api/jobs/{job_id}/artifacts/json", outputs["json"])
+    outputs["job"].write_text(
+        json.dumps(
+            {
+                "job_create": job.get("job_create"),
+                "job_status": job.get("job_status"),
+                "job_result": result_payload,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    return result_payload
+
+
+def run_jobs(
+    client: OcrClient,
+    inputs: list[Path],
+    output_dir: Path,
+    state_path: Path,
+    *,
+    timeout_seconds: float = 1800,
+    poll_interval: float = 2,
+    max_poll_interval: float = 30,
+    concurrency: int = 8,
+) -> dict:
+    """Submit, poll and download every input; return the per-input job records.
+
+    Jobs already recorded in ``state_path`` resume where they stopped: submitted
+    jobs are polled rather than resubmitted and finished ones are skipped.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state = load_state(state_path)
+    jobs: dict[str, dict] = {}
+    outputs: dict[str, dict[str, Path]] = {}
+    for input_path in inputs:
+        key = str(input_path)
+        outputs[key] = output_paths(output_dir, input_path.stem)
+        job = dict(state.get(key, {}))
+        job["phase"] = initial_phase(job, outputs[key])
+        if job["phase"] == "submit":
+            job = {"phase": "submit"}
+        else:
+            job.pop("error", None)
+        jobs[key] = job
+
+    # Poll schedule lives in memory; a resumed job is polled straight away.
+    next_poll = {key: 0.0 for key in jobs}
+    intervals = {key: poll_interval for key in jobs}
+    poll_errors = {key: 0 for key in jobs}
+
+    def persist() -> None:
+        save_state(state_path, {**state, **jobs})
+
+    def fail(key: str, exc: BaseException) -> None:
+        jobs[key].update(phase="failed", error=f"{type(exc).__name__}: {exc}")
+        print(f"ERROR: {key}: {exc}", file=sys.stderr)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        submissions = {
+            pool.submit(submit_job, client, Path(key)): key for key, job in jobs.items() if job["phase"] == "submit"
+        }
+        for future in submissions:
+            key = submissions[future]
+            try:
+                payload = future.result()
+            except Exception as exc:  # noqa: BLE001 - record and keep the batch going
+                fail(key, exc)
+                continue
+            jobs[key] = {"phase": "poll", "job_id": payload["job_id"], "job_create": payload, "submitted_at": time.time()}
+        persist()
+
+        downloads: dict = {}
+        while True:
+            polling = [key for key, job in jobs.items() if job["phase"] == "poll"]
+            for key, job in jobs.items():
+                if job["phase"] == "download" and key not in downloads.values():
+                    downloads[pool.submit(fetch_artifacts, client, job, outputs[key])] = key
+            if not polling and not downloads:
+                break
+
+            now = time.monotonic()
+            due = [key for key in polling if next_poll[key] <= now]
+            status_futures = {
+                pool.submit(client.json, f"/api/jobs/{jobs[key]['job_id']}"): key for key in due
+            }
+            for future in status_futures:
+                key = status_futures[future]
+                job = jobs[key]
+                try:
+                    payload = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    # A status request failing says little about the job itself; back off and retry.
+                    poll_errors[key] += 1
+                    if poll_errors[key] > POLL_RETRIES or time.time() - job["submitted_at"] > timeout_seconds:
+                        fail(key, exc)
+                    else:
+                        intervals[key] = min(intervals[key] * POLL_BACKOFF**poll_errors[key], max_poll_interval)
+                        next_poll[key] = time.monotonic() + intervals[key]
+                    continue
+                poll_errors[key] = 0
+                status = payload["status"]
+                previous = (job.get("job_status") or {}).get("status")
+                job["job_status"] = payload
+                if status == "succeeded":
+                    job["phase"] = "download"
+                elif status == "failed":
+                    fail(key, RuntimeError(f"OCR API job {job['job_id']} failed: {payload.get('error')}"))
+                elif time.time() - job["submitted_at"] > timeout_seconds:
+                    fail(key, TimeoutError(f"OCR API job {job['job_id']} timed out after {timeout_seconds}s"))
+                else:
+                    intervals[key] = (
+                        poll_interval if status != previous else min(intervals[key] * POLL_BACKOFF, max_poll_interval)
+                    )
+                    next_poll[key] = time.monotonic() + intervals[key]
+
+            finished = [future for future in downloads if future.done()]
+            for future in finished:
+                key = downloads.pop(future)
+                try:
+                    jobs[key]["job_result"] = future.result()
+                    jobs[key]["phase"] = "done"
+                except Exception as exc:  # noqa: BLE001
+                    fail(key, exc)
+            if due or finished:
+                persist()
+
+            if any(job["phase"] == "download" for key, job in jobs.items() if key not in downloads.values()):
+                continue
+            waiting = [next_poll[key] for key, job in jobs.items() if job["phase"] == "poll"]
+            delay = max(0.0, min(waiting) - time.monotonic()) if waiting else None
+            if downloads:
+                wait(list(downloads), timeout=delay, return_when=FIRST_COMPLETED)
+            elif delay:
+                time.sleep(delay)
+
+    persist()
+    return jobs
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Submit a PDF to the OCR API service, poll the async job, and download Markdown/JSON artifacts."
+        description="Submit PDFs to the OCR API service, poll the async jobs, and download Markdown/JSON artifacts."
     )
-    parser.add_argument("input_path", type=Path)
+    parser.add_argument("input_paths", type=Path, nargs="+", help="PDF files or directories of PDFs.")
     parser.add_argument("--output-dir", type=Path, required=True)
     parser.add_argument("--base-url", default=None,
                         help="OCR API base URL. Auto-detected from OCR_BASE_URL env, "
@@ -80,68 +365,49 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--api-key", default=None,
                         help="OCR API key. Falls back to OCR_API_KEY / NELLI_API_KEY env vars.")
     parser.add_argument("--timeout-seconds", type=int, default=1800)
-    parser.add_argument("--poll-interval-seconds", type=int, default=2)
+    parser.add_argument("--poll-interval-seconds", type=float, default=2,
+                        help="Initial poll interval; backs off while a job's status is unchanged.")
+    parser.add_argument("--max-poll-interval-seconds", type=float, default=30)
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="Concurrent HTTP requests (submissions, polls, downloads).")
+    parser.add_argument("--state-file", type=Path, default=None,
+                        help=f"Job-state file used to resume interrupted runs. Defaults to <output-dir>/{STATE_FILENAME}.")
     return parser.parse_args()
 
 
 def main() -> int:
     args = parse_args()
-    input_path = args.input_path.expanduser().resolve()
+    inputs = collect_inputs(args.input_paths)
     output_dir = args.output_dir.expanduser().resolve()
-    if not input_path.exists():
-        raise FileNotFoundError(input_path)
 
     api_key = require_api_key(args)
     base_url = resolve_base_url(args.base_url).rstrip("/")
     output_dir.mkdir(parents=True, exist_ok=True)
+    state_path = args.state_file.expanduser().resolve() if args.state_file else output_dir / STATE_FILENAME
 
-    create_payload = curl_json(
-        f"{base_url}/api/jobs",
-        api_key=api_key,
-        method="POST",
-        form_file=input_path,
-    )
-
-    job_id = create_payload["job_id"]
-    status_url = f"{base_url}/api/jobs/{job_id}"
-    result_url = f"{base_url}/api/jobs/{job_id}/result"
-    started = time.time()
-
-    while True:
-        status_payload = curl_json(status_url, api_key=api_key)
-        status = status_payload["status"]
-        if status == "succeeded":
-            break
-        if status == "failed":
-            raise RuntimeError(f"OCR API job {job_id} failed: {status_payload.get('error')}")
-        if time.time() - started > args.timeout_seconds:
-            raise TimeoutError(f"OCR API job {job_id} timed out after {args.timeout_seconds}s")
-        time.sleep(max(1, args.poll_interval_seconds))
-
-    result_payload = curl_json(result_url, api_key=api_key)
-    stem = input_path.stem
-    markdown_path = output_dir / f"{stem}.md"
-    ocr_json_path = output_dir / f"{stem}.ocr.json"
-    job_meta_path = output_dir / f"{stem}.job.json"
-
-    curl_download(f"{base_url}/api/jobs/{job_id}/artifacts/markdown", api_key=api_key, output_path=markdown_path)
-    curl_download(f"{base_url}/api/jobs/{job_id}/artifacts/json", api_key=api_key, output_path=ocr_json_path)
-    job_meta_path.write_text(
-        json.dumps(
-            {
-                "job_create": create_payload,
-                "job_status": status_payload,
-                "job_result": result_payload,
-            },
-            indent=2,
-        ),
-        encoding="utf-8",
+    jobs = run_jobs(
+        OcrClient(base_url, api_key),
+        inputs,
+        output_dir,
+        state_path,
+        timeout_seconds=args.timeout_seconds,
+        poll_interval=max(0.5, args.poll_interval_seconds),
+        max_poll_interval=args.max_poll_interval_seconds,
+        concurrency=args.concurrency,
     )
 
-    print(f"job={job_meta_path}")
-    print(f"markdown={markdown_path}")
-    print(f"json={ocr_json_path}")
-    return 0
+    failed = 0
+    for input_path in inputs:
+        if jobs[str(input_path)]["phase"] != "done":
+            failed += 1
+            continue
+        paths = output_paths(output_dir, input_path.stem)
+        print(f"job={paths['job']}")
+        print(f"markdown={paths['markdown']}")
+        print(f"json={paths['json']}")
+    if len(inputs) > 1 or failed:
+        print(f"done={len(inputs) - failed} failed={failed} state={state_path}", file=sys.stderr)
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
@@ -6,12 +6,21 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
-import re
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pypdfium2 as pdfium
 
+MANIFEST_NAME = "render_manifest.json"
+FORMAT_SUFFIXES = {"png": ".png", "webp": ".webp", "jpeg": ".jpg"}
+# Below this many pages per worker, process start-up costs more than it saves.
+MIN_PAGES_PER_WORKER = 4
+# Manifest fields that must match for a previously rendered page to be reused.
+SETTING_KEYS = ("source_sha256", "dpi", "encoder", "prefix")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -23,6 +32,26 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--first-page", type=int, default=None, help="First page to render (1-based)")
     parser.add_argument("--last-page", type=int, default=None, help="Last page to render (1-based)")
     parser.add_argument("--prefix", default="page", help="PNG filename prefix (default: page)")
+    parser.add_argument(
+        "--format",
+        choices=sorted(FORMAT_SUFFIXES),
+        default="png",
+        help="Image format (default: png). webp/jpeg encode faster and smaller for OCR input.",
+    )
+    parser.add_argument(
+        "--png-compress-level",
+        type=int,
+        default=6,
+        help="zlib level 0-9 for PNG output (default: 6); 1 is much faster at a modest size cost.",
+    )
+    parser.add_argument("--quality", type=int, default=90, help="WebP/JPEG quality 1-100 (default: 90)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Worker processes (default: CPU count, at most one per {MIN_PAGES_PER_WORKER} pages)",
+    )
+    parser.add_argument("--force", action="store_true", help="Re-render pages even if unchanged")
     return parser.parse_args()
 
 
@@ -39,9 +68,90 @@ def validate_args(args: argparse.Namespace) -> None:
         and args.first_page > args.last_page
     ):
         raise SystemExit("--first-page cannot be greater than --last-page")
-
-
-def render_pages(args: argparse.Namespace) -> list[Path]:
+    if not 0 <= args.png_compress_level <= 9:
+        raise SystemExit("--png-compress-level must be between 0 and 9")
+    if not 1 <= args.quality <= 100:
+        raise SystemExit("--quality must be between 1 and 100")
+    if args.workers is not None and args.workers <= 0:
+        raise SystemExit("--workers must be positive")
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def encoder_settings(args: argparse.Namespace) -> dict:
+    if args.format == "png":
+        return {"format": "png", "compress_level": args.png_compress_level}
+    return {"format": args.format, "quality": args.quality}
+
+
+def save_image(image, output_path: Path, encoder: dict) -> None:
+    if encoder["format"] == "png":
+        image.save(output_path, format="PNG", compress_level=encoder["compress_level"])
+        return
+    if encoder["format"] == "jpeg" and image.mode not in {"RGB", "L"}:
+        image = image.convert("RGB")
+    if encoder["format"] == "webp":
+        # method=0 is libwebp's fastest encoder; size stays well below PNG.
+        image.save(output_path, format="WEBP", quality=encoder["quality"], method=0)
+        return
+    image.save(output_path, format="JPEG", quality=encoder["quality"])
+
+
+def page_path(output_dir: Path, prefix: str, page_number: int, encoder: dict) -> Path:
+    return output_dir / f"{prefix}-{page_number}{FORMAT_SUFFIXES[encoder['format']]}"
+
+
+def render_page_range(
+    input_pdf: str, page_numbers: list[int], output_dir: str, prefix: str, dpi: int, encoder: dict
+) -> list[int]:
+    """Render pages in one process; each worker opens its own PdfDocument."""
+    pdf = pdfium.PdfDocument(input_pdf)
+    scale = dpi / 72.0
+    try:
+        for page_number in page_numbers:
+            page = pdf[page_number - 1]
+            image = page.render(scale=scale).to_pil()
+            save_image(image, page_path(Path(output_dir), prefix, page_number, encoder), encoder)
+            page.close()
+    finally:
+        pdf.close()
+    return page_numbers
+
+
+def split_ranges(page_numbers: list[int], parts: int) -> list[list[int]]:
+    """Contiguous, near-equal slices so each worker walks its pages in order."""
+    size, extra = divmod(len(page_numbers), parts)
+    slices, start = [], 0
+    for index in range(parts):
+        end = start + size + (1 if index < extra else 0)
+        if end > start:
+            slices.append(page_numbers[start:end])
+        start = end
+    return slices
+
+
+def load_previous_render(output_dir: Path) -> dict:
+    try:
+        return json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def unchanged_pages(previous: dict, source_sha256: str, dpi: int, encoder: dict, prefix: str) -> set[int]:
+    """Pages already rendered from the same PDF bytes with the same settings."""
+    current = {"source_sha256": source_sha256, "dpi": dpi, "encoder": encoder, "prefix": prefix}
+    if any(previous.get(key) != current[key] for key in SETTING_KEYS):
+        return set()
+    return {entry["page"] for entry in previous.get("pages", []) if "page" in entry and Path(entry["path"]).exists()}
+
+
+def render_pages(args: argparse.Namespace) -> tuple[list[Path], dict]:
     input_pdf = args.input_pdf.expanduser().resolve()
     output_dir = args.output_dir.expanduser().resolve()
     if not input_pdf.exists():
@@ -50,6 +160,7 @@ def render_pages(args: argparse.Namespace) -> list[Path]:
     output_dir.mkdir(parents=True, exist_ok=True)
     pdf = pdfium.PdfDocument(str(input_pdf))
     page_count = len(pdf)
+    pdf.close()
 
     first_page = args.first_page or 1
     last_page = args.last_page or page_count
@@ -58,33 +169,61 @@ def render_pages(args: argparse.Namespace) -> list[Path]:
     if last_page > page_count:
         last_page = page_count
 
-    pattern = re.compile(rf"^{re.escape(args.prefix)}-(\d+)\.png$")
-    pngs: list[Path] = []
-    scale = args.dpi / 72.0
-    for page_number in range(first_page, last_page + 1):
-        page = pdf[page_number - 1]
-        bitmap = page.render(scale=scale)
-        image = bitmap.to_pil()
-        output_path = output_dir / f"{args.prefix}-{page_number}.png"
-        image.save(output_path)
-        if pattern.match(output_path.name):
-            pngs.append(output_path)
+    encoder = encoder_settings(args)
+    source_sha256 = sha256_file(input_pdf)
+    skip = set() if args.force else unchanged_pages(
+        load_previous_render(output_dir), source_sha256, args.dpi, encoder, args.prefix
+    )
+    page_numbers = list(range(first_page, last_page + 1))
+    todo = [page for page in page_numbers if page not in skip]
+
+    if todo:
+        workers = args.workers or os.cpu_count() or 1
+        workers = max(1, min(workers, len(todo) // MIN_PAGES_PER_WORKER or 1))
+        if workers == 1:
+            render_page_range(str(input_pdf), todo, str(output_dir), args.prefix, args.dpi, encoder)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(render_page_range, str(input_pdf), chunk, str(output_dir), args.prefix, args.dpi, encoder)
+                    for chunk in split_ranges(todo, workers)
+                ]
+                for future in futures:
+                    future.result()
+
+    render_info = {
+        "source_pdf": str(input_pdf),
+        "source_sha256": source_sha256,
+        "dpi": args.dpi,
+        "prefix": args.prefix,
+        "encoder": encoder,
+        "rendered": len(todo),
+        "unchanged": len(page_numbers) - len(todo),
+    }
+    pngs = [page_path(output_dir, args.prefix, page, encoder) for page in page_numbers]
     if not pngs:
         raise SystemExit("No PNG files were produced")
-    return pngs
+    return pngs, render_info
 
 
-def write_manifest(output_dir: Path, pngs: list[Path]) -> Path:
-    manifest_path = output_dir / "render_manifest.json"
+def write_manifest(output_dir: Path, pngs: list[Path], render_info: dict | None = None) -> Path:
+    """Record this run's pages, keeping pages outside a --first/--last range from earlier runs.
+
+    Earlier entries are only kept when they were rendered from the same PDF with
+    the same settings, so the manifest never vouches for stale images.
+    """
+    manifest_path = output_dir / MANIFEST_NAME
+    previous = load_previous_render(output_dir)
+    pages: dict[int, dict] = {}
+    if render_info and all(previous.get(key) == render_info.get(key) for key in SETTING_KEYS):
+        pages = {entry["page"]: entry for entry in previous.get("pages", []) if "page" in entry}
+    for path in pngs:
+        page = int(path.stem.rsplit("-", 1)[1])
+        pages[page] = {"path": str(path), "name": path.name, "page": page}
     manifest = {
-        "page_count": len(pngs),
-        "pages": [
-            {
-                "path": str(path),
-                "name": path.name,
-            }
-            for path in pngs
-        ],
+        **(render_info or {}),
+        "page_count": len(pages),
+        "pages": [pages[page] for page in sorted(pages)],
     }
     manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
     return manifest_path
@@ -93,8 +232,8 @@ def write_manifest(output_dir: Path, pngs: list[Path]) -> Path:
 def main() -> int:
     args = parse_args()
     validate_args(args)
-    pngs = render_pages(args)
-    manifest_path = write_manifest(args.output_dir.expanduser().resolve(), pngs)
+    pngs, render_info = render_pages(args)
+    manifest_path = write_manifest(args.output_dir.expanduser().resolve(), pngs, render_info)
     for path in pngs:
         print(path)
     print(manifest_path)
@@ -2,21 +2,71 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import csv
+import hashlib
+import http.client
 import json
 import os
 import re
 import sys
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
 
 
 SKILL_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_JOURNAL_METRICS = SKILL_ROOT / "references" / "journal_metrics_2024.tsv"
 DOI_PATTERN = re.compile(r"^10\.\d{4,}/\S+$", re.IGNORECASE)
+USER_AGENT = "scientific-impact-assessment/1.0 (+https://github.com/fmschulz/omics-skills)"
+# OpenAlex accepts up to 50 values in one OR filter (`doi:a|b|c`).
+OPENALEX_BATCH_SIZE = 50
+# Trigram Dice similarity a journal name needs to match a table entry fuzzily.
+FUZZY_JOURNAL_THRESHOLD = 0.85
+# Batches kept in flight while earlier reports are written.
+BATCH_WINDOW = 2
+MAX_RETRIES = 3
+MAX_REDIRECTS = 5
+NEGATIVE_TTL_SECONDS = 24 * 3600
+BATCH_FORMATS = ("jsonl", "parquet")
+PARQUET_ROW_GROUP = 1000
+PARQUET_COLUMNS = (
+    ("input", "string"),
+    ("doi", "string"),
+    ("status", "string"),
+    ("openalex_id", "string"),
+    ("title", "string"),
+    ("publication_year", "int64"),
+    ("cited_by_count", "int64"),
+    ("citation_percentile_min", "float64"),
+    ("citation_percentile_max", "float64"),
+    ("counts_by_year", "string"),
+    ("journal_name", "string"),
+    ("journal_issn_l", "string"),
+    ("type", "string"),
+    ("altmetric_status", "string"),
+    ("altmetric_reason", "string"),
+    ("altmetric_score", "float64"),
+    ("altmetric_posts_count", "int64"),
+    ("altmetric_news_outlets_count", "int64"),
+    ("altmetric_tweeters_count", "int64"),
+    ("altmetric_policies_count", "int64"),
+    ("altmetric_patents_count", "int64"),
+    ("altmetric_readers_count", "int64"),
+    ("journal_metric_matched", "bool_"),
+    ("journal_metric_match", "string"),
+    ("journal_metric_similarity", "float64"),
+    ("journal_metric_name", "string"),
+    ("journal_metric_year", "int64"),
+    ("journal_metric_value", "float64"),
+    ("journal_metric_source_kind", "string"),
+)
 
 
 def normalize_doi(raw_doi: str) -> str:
@@ -49,7 +99,7 @@ def fetch_json(url: str, headers: dict[str, str] | None = None) -> dict[str, Any
         url,
         headers={
             "Accept": "application/json",
-            "User-Agent": "scientific-impact-assessment/1.0 (+https://github.com/fmschulz/omics-skills)",
+            "User-Agent": USER_AGENT,
             **(headers or {}),
         },
     )
@@ -95,7 +145,80 @@ def parse_openalex_work(payload: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def load_journal_metrics(path: Path) -> list[dict[str, Any]]:
+def name_ngrams(name: str, size: int = 3) -> set[str]:
+    padded = f" {name} "
+    return {padded[index : index + size] for index in range(len(padded) - size + 1)}
+
+
+class JournalMetrics(list):
+    """Journal metric rows, indexed by normalized journal name and alias.
+
+    Exact lookups are one dict probe. Names missing from the index fall back to
+    a trigram index (built on first use), accepting the most similar table name
+    when its Dice similarity reaches `fuzzy_threshold` and no other journal ties
+    with it. Fuzzy matches are labeled in the lookup result; pass
+    `fuzzy_threshold=None` for exact matching only. Build a new instance after
+    changing the rows, the index is not updated in place.
+    """
+
+    def __init__(self, rows: Iterable[dict[str, Any]] = (), fuzzy_threshold: float | None = FUZZY_JOURNAL_THRESHOLD) -> None:
+        super().__init__(rows)
+        self.fuzzy_threshold = fuzzy_threshold
+        self.by_name: dict[str, dict[str, Any]] = {}
+        for row in self:
+            for candidate in (row["journal_name"], *row["aliases"]):
+                self.by_name.setdefault(normalize_name(candidate), row)
+        self._names: list[str] = []
+        self._gram_counts: list[int] = []
+        self._postings: dict[str, list[int]] | None = None
+        self._matches: dict[str, tuple[dict[str, Any], float] | None] = {}
+
+    def _ngram_index(self) -> dict[str, list[int]]:
+        # Built on the first fuzzy lookup: most runs only need exact matches.
+        if self._postings is None:
+            self._names = list(self.by_name)
+            postings: dict[str, list[int]] = defaultdict(list)
+            for index, name in enumerate(self._names):
+                grams = name_ngrams(name)
+                self._gram_counts.append(len(grams))
+                for gram in grams:
+                    postings[gram].append(index)
+            self._postings = postings
+        return self._postings
+
+    def fuzzy_match(self, query: str) -> tuple[dict[str, Any], float] | None:
+        if self.fuzzy_threshold is None or not query:
+            return None
+        postings = self._ngram_index()
+        grams = name_ngrams(query)
+        overlaps: Counter = Counter()
+        for gram in grams:
+            overlaps.update(postings.get(gram, ()))
+        scored = sorted(
+            ((2 * overlap / (len(grams) + self._gram_counts[index]), index) for index, overlap in overlaps.items()),
+            reverse=True,
+        )
+        if not scored or scored[0][0] < self.fuzzy_threshold:
+            return None
+        best_score, best_index = scored[0]
+        row = self.by_name[self._names[best_index]]
+        for score, index in scored[1:]:
+            if score < best_score:
+                break
+            if self.by_name[self._names[index]] is not row:
+                return None
+        return row, round(best_score, 3)
+
+    def match(self, journal_name: str) -> tuple[dict[str, Any], float] | None:
+        """The row for a journal name and its similarity (1.0 when exact), memoized."""
+        if journal_name not in self._matches:
+            query = normalize_name(journal_name)
+            row = self.by_name.get(query)
+            self._matches[journal_name] = (row, 1.0) if row is not None else self.fuzzy_match(query)
+        return self._matches[journal_name]
+
+
+def load_journal_metrics(path: Path, fuzzy_threshold: float | None = FUZZY_JOURNAL_THRESHOLD) -> JournalMetrics:
     rows: list[dict[str, Any]] = []
     with path.open(encoding="utf-8", newline="") as handle:
         reader = csv.DictReader(handle, delimiter="\t")
@@ -104,29 +227,33 @@ def load_journal_metrics(path: Path) -> list[dict[str, Any]]:
             row["aliases"] = aliases
             row["value"] = float(row["value"])
             rows.append(row)
-    return rows
+    return JournalMetrics(rows, fuzzy_threshold=fuzzy_threshold)
 
 
 def lookup_journal_metric(journal_metrics: list[dict[str, Any]], journal_name: str | None) -> dict[str, Any]:
     if not journal_name:
         return {"matched": False, "reason": "no_journal_name"}
-    query = normalize_name(journal_name)
-    for row in journal_metrics:
-        candidates = [row["journal_name"], *row["aliases"]]
-        if any(normalize_name(candidate) == query for candidate in candidates):
-            return {
-                "matched": True,
-                "journal_name": row["journal_name"],
-                "category": row["category"],
-                "metric_name": row["metric_name"],
-                "metric_year": int(row["metric_year"]),
-                "value": row["value"],
-                "source_url": row["source_url"],
-                "source_kind": row["source_kind"],
-                "verified_date": row["verified_date"],
-                "notes": row["notes"],
-            }
-    return {"matched": False, "reason": "not_in_reference_table", "query": journal_name}
+    if not isinstance(journal_metrics, JournalMetrics):
+        journal_metrics = JournalMetrics(journal_metrics)
+    found = journal_metrics.match(journal_name)
+    if found is None:
+        return {"matched": False, "reason": "not_in_reference_table", "query": journal_name}
+    row, similarity = found
+    result = {
+        "matched": True,
+        "journal_name": row["journal_name"],
+        "category": row["category"],
+        "metric_name": row["metric_name"],
+        "metric_year": int(row["metric_year"]),
+        "value": row["value"],
+        "source_url": row["source_url"],
+        "source_kind": row["source_kind"],
+        "verified_date": row["verified_date"],
+        "notes": row["notes"],
+    }
+    if similarity < 1.0:
+        result.update({"match": "fuzzy", "similarity": similarity, "query": journal_name})
+    return result
 
 
 def summarize_altmetric_payload(payload: dict[str, Any] | None, reason: str | None = None) -> dict[str, Any]:
@@ -146,15 +273,18 @@ def summarize_altmetric_payload(payload: dict[str, Any] | None, reason: str | No
     }
 
 
+def altmetric_url(doi: str, api_key: str) -> str:
+    encoded_doi = urllib.parse.quote(doi, safe="")
+    return f"https://api.altmetric.com/v1/doi/{encoded_doi}?{urllib.parse.urlencode({'key': api_key})}"
+
+
 def fetch_altmetric_summary(doi: str | None, api_key: str | None) -> dict[str, Any]:
     if not doi:
         return summarize_altmetric_payload(None, reason="doi_required")
     if not api_key:
         return summarize_altmetric_payload(None, reason="no_api_key")
-    encoded_doi = urllib.parse.quote(doi, safe="")
-    url = f"https://api.altmetric.com/v1/doi/{encoded_doi}?{urllib.parse.urlencode({'key': api_key})}"
     try:
-        payload = fetch_json(url)
+        payload = fetch_json(altmetric_url(doi, api_key))
     except urllib.error.HTTPError as exc:
         return summarize_altmetric_payload(None, reason=f"http_{exc.code}")
     except urllib.error.URLError:
@@ -179,10 +309,14 @@ def build_report_from_payloads(
     }
 
 
+def journal_match_threshold(args: argparse.Namespace) -> float | None:
+    return None if args.exact_journal_match else FUZZY_JOURNAL_THRESHOLD
+
+
 def build_live_report(args: argparse.Namespace) -> dict[str, Any]:
     doi = normalize_doi(args.doi) if args.doi else None
     openalex_id = normalize_openalex_id(args.openalex_id) if args.openalex_id else None
-    journal_metrics = load_journal_metrics(Path(args.journal_metrics))
+    journal_metrics = load_journal_metrics(Path(args.journal_metrics), fuzzy_threshold=journal_match_threshold(args))
     openalex_payload = fetch_openalex_work(doi=doi, openalex_id=openalex_id, mailto=args.mailto)
     altmetric_summary = fetch_altmetric_summary(doi=doi, api_key=args.altmetric_api_key)
     openalex_summary = parse_openalex_work(openalex_payload)
@@ -194,6 +328,434 @@ def build_live_report(args: argparse.Namespace) -> dict[str, Any]:
     }
 
 
+def default_cache_dir() -> Path:
+    override = os.environ.get("MEASURE_IMPACT_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".cache" / "omics-skills" / "measure-impact"
+
+
+class ResponseCache:
+    """OpenAlex and Altmetric payloads on disk, one JSON file per record.
+
+    Misses (404s) expire sooner than hits, so records that appear later are
+    picked up again without clearing the cache.
+    """
+
+    def __init__(self, directory: Path | None, ttl_seconds: float, negative_ttl_seconds: float) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+    def _path(self, namespace: str, key: str) -> Path:
+        assert self.directory is not None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / namespace / digest[:2] / f"{digest}.json"
+
+    def get(self, namespace: str, key: str) -> tuple[bool, Any] | None:
+        if self.directory is None:
+            return None
+        try:
+            entry = json.loads(self._path(namespace, key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        ttl = self.ttl_seconds if entry.get("ok") else self.negative_ttl_seconds
+        if time.time() - float(entry.get("fetched_at", 0)) > ttl:
+            return None
+        return bool(entry.get("ok")), entry.get("value")
+
+    def put(self, namespace: str, key: str, ok: bool, value: Any) -> None:
+        if self.directory is None:
+            return
+        path = self._path(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        entry = {"key": key, "ok": ok, "value": value, "fetched_at": time.time()}
+        partial.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(partial, path)
+
+
+class TokenBucket:
+    """Thread-safe limiter spacing requests to at most `rate` per second."""
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(1.0, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def retry_after_seconds(headers: Any, attempt: int) -> float:
+    try:
+        return max(0.0, float(headers.get("Retry-After", "")))
+    except ValueError:
+        return float(2 ** attempt)
+
+
+class HttpClient:
+    """JSON GETs over keep-alive connections, one per host and thread.
+
+    Raises the same `urllib.error` exceptions as `fetch_json`, follows
+    redirects, and retries 429s and dropped connections. A 200 response whose
+    body is not a JSON object raises `ValueError`.
+    """
+
+    def __init__(self, timeout: float = 20) -> None:
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self, scheme: str, host: str) -> http.client.HTTPConnection:
+        connections = self._local.__dict__.setdefault("connections", {})
+        connection = connections.get((scheme, host))
+        if connection is None:
+            factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            connection = connections[(scheme, host)] = factory(host, timeout=self.timeout)
+        return connection
+
+    def _drop(self, scheme: str, host: str) -> None:
+        connection = self._local.__dict__.get("connections", {}).pop((scheme, host), None)
+        if connection is not None:
+            connection.close()
+
+    def get_json(self, url: str) -> dict[str, Any]:
+        headers = {"Accept": "application/json", "User-Agent": USER_AGENT}
+        attempt = redirects = 0
+        while True:
+            parts = urllib.parse.urlsplit(url)
+            target = parts.path + (f"?{parts.query}" if parts.query else "")
+            try:
+                connection = self._connection(parts.scheme, parts.netloc)
+                connection.request("GET", target or "/", headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                self._drop(parts.scheme, parts.netloc)
+                attempt += 1
+                if attempt > MAX_RETRIES:
+                    raise urllib.error.URLError(exc) from exc
+                continue
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+                redirects += 1
+                if redirects > MAX_REDIRECTS:
+                    raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+                url = urllib.parse.urljoin(url, response.getheader("Location"))
+                continue
+            if response.status == 429 and attempt < MAX_RETRIES:
+                attempt += 1
+                time.sleep(retry_after_seconds(response.headers, attempt))
+                continue
+            if response.status != 200:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            payload = json.loads(body)
+            if not isinstance(payload, dict):
+                raise ValueError(f"Expected a JSON object from {url}, got {type(payload).__name__}")
+            return payload
+
+
+def openalex_batch_url(dois: list[str], mailto: str | None) -> str:
+    params = {"filter": "doi:" + "|".join(dois), "per-page": str(len(dois))}
+    if mailto:
+        params["mailto"] = mailto
+    return f"https://api.openalex.org/works?{urllib.parse.urlencode(params, safe=':/|')}"
+
+
+def work_doi_key(work: dict[str, Any]) -> str | None:
+    doi = (work.get("ids") or {}).get("doi") or work.get("doi")
+    try:
+        return normalize_doi(doi).lower() if doi else None
+    except ValueError:
+        return None
+
+
+class ImpactClient:
+    """OpenAlex and Altmetric lookups shared across a batch.
+
+    Holds the keep-alive connections, one rate limit per service, and the
+    on-disk response cache, so several hundred DOIs cost a handful of OpenAlex
+    requests plus one rate-limited Altmetric request per uncached DOI.
+    """
+
+    def __init__(
+        self,
+        *,
+        mailto: str | None = None,
+        altmetric_api_key: str | None = None,
+        cache: ResponseCache | None = None,
+        http: HttpClient | None = None,
+        openalex_rate: float = 10.0,
+        altmetric_rate: float = 1.0,
+    ) -> None:
+        self.mailto = mailto
+        self.altmetric_api_key = altmetric_api_key
+        self.cache = cache or ResponseCache(None, 0, 0)
+        self.http = http or HttpClient()
+        self._openalex_bucket = TokenBucket(openalex_rate)
+        self._altmetric_bucket = TokenBucket(altmetric_rate)
+
+    def _openalex_get(self, url: str) -> dict[str, Any]:
+        self._openalex_bucket.acquire()
+        return self.http.get_json(url)
+
+    def openalex_works(self, dois: list[str]) -> dict[str, tuple[bool, Any]]:
+        """Map each lower-cased DOI to `(True, work)` or `(False, reason)`.
+
+        Uncached DOIs are fetched with one `filter=doi:a|b|c` request; DOIs the
+        filter cannot express or that it does not return are looked up singly
+        so that only a confirmed 404 is reported (and cached) as not found.
+        """
+        results: dict[str, tuple[bool, Any]] = {}
+        pending: dict[str, str] = {}
+        for doi in dois:
+            key = doi.lower()
+            if key in results or key in pending:
+                continue
+            cached = self.cache.get("openalex", key)
+            if cached is None:
+                pending[key] = doi
+            else:
+                results[key] = cached
+        batchable = [doi for doi in pending.values() if "|" not in doi and "," not in doi]
+        if len(batchable) > 1:
+            try:
+                payload = self._openalex_get(openalex_batch_url(batchable, self.mailto))
+            except (urllib.error.URLError, ValueError):
+                payload = {}
+            for work in payload.get("results") or []:
+                key = work_doi_key(work)
+                if key in pending and key not in results:
+                    results[key] = (True, work)
+                    self.cache.put("openalex", key, True, work)
+        for key, doi in pending.items():
+            if key in results:
+                continue
+            try:
+                work = self._openalex_get(openalex_url_from_args(doi=doi, openalex_id=None, mailto=self.mailto))
+            except urllib.error.HTTPError as exc:
+                results[key] = (False, "not_found" if exc.code == 404 else f"http_{exc.code}")
+                if exc.code == 404:
+                    self.cache.put("openalex", key, False, "not_found")
+                continue
+            except urllib.error.URLError:
+                results[key] = (False, "network_error")
+                continue
+            except ValueError:
+                results[key] = (False, "bad_response")
+                continue
+            results[key] = (True, work)
+            self.cache.put("openalex", key, True, work)
+        return results
+
+    def altmetric_summary(self, doi: str) -> dict[str, Any]:
+        if not self.altmetric_api_key:
+            return summarize_altmetric_payload(None, reason="no_api_key")
+        key = doi.lower()
+        cached = self.cache.get("altmetric", key)
+        if cached is not None:
+            ok, value = cached
+            return summarize_altmetric_payload(value) if ok else summarize_altmetric_payload(None, reason=value)
+        self._altmetric_bucket.acquire()
+        try:
+            payload = self.http.get_json(altmetric_url(doi, self.altmetric_api_key))
+        except urllib.error.HTTPError as exc:
+            reason = f"http_{exc.code}"
+            if exc.code == 404:
+                self.cache.put("altmetric", key, False, reason)
+            return summarize_altmetric_payload(None, reason=reason)
+        except urllib.error.URLError:
+            return summarize_altmetric_payload(None, reason="network_error")
+        except ValueError:
+            return summarize_altmetric_payload(None, reason="bad_response")
+        self.cache.put("altmetric", key, True, payload)
+        return summarize_altmetric_payload(payload)
+
+
+def iter_doi_list(handle: TextIO) -> Iterator[str]:
+    """DOIs from a list file: one per line, blank lines and `#` comments skipped."""
+    for line in handle:
+        value = line.strip()
+        if value and not value.startswith("#"):
+            yield value
+
+
+def iter_chunks(values: Iterable[str], size: int) -> Iterator[list[str]]:
+    chunk: list[str] = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def assess_dois(
+    client: ImpactClient,
+    raw_dois: Iterable[str],
+    journal_metrics: list[dict[str, Any]],
+    *,
+    workers: int = 4,
+) -> Iterator[dict[str, Any]]:
+    """Yield one report per input DOI, in input order.
+
+    Inputs are processed in OpenAlex-sized batches; Altmetric lookups for a
+    batch run concurrently, and the next batch is already in flight while the
+    current one is being written.
+    """
+    no_altmetric = summarize_altmetric_payload(None, reason="no_api_key")
+
+    def submit(pool: ThreadPoolExecutor, chunk: list[str]) -> tuple[list[tuple[str, str | None]], Future, dict[str, Future]]:
+        parsed: list[tuple[str, str | None]] = []
+        for raw in chunk:
+            try:
+                parsed.append((raw, normalize_doi(raw)))
+            except ValueError:
+                parsed.append((raw, None))
+        dois = [doi for _, doi in parsed if doi]
+        works = pool.submit(client.openalex_works, dois)
+        altmetric: dict[str, Future] = {}
+        if client.altmetric_api_key:
+            for doi in dois:
+                if doi.lower() not in altmetric:
+                    altmetric[doi.lower()] = pool.submit(client.altmetric_summary, doi)
+        return parsed, works, altmetric
+
+    window: deque = deque()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        chunks = iter_chunks(raw_dois, OPENALEX_BATCH_SIZE)
+        while True:
+            while len(window) < BATCH_WINDOW:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                window.append(submit(pool, chunk))
+            if not window:
+                return
+            parsed, works_future, altmetric = window.popleft()
+            works = works_future.result()
+            for raw, doi in parsed:
+                if doi is None:
+                    yield {"input": raw, "doi": None, "status": "invalid_doi"}
+                    continue
+                key = doi.lower()
+                altmetric_summary = altmetric[key].result() if key in altmetric else no_altmetric
+                ok, value = works[key]
+                if not ok:
+                    yield {"input": raw, "doi": doi, "status": value, "altmetric": altmetric_summary}
+                    continue
+                openalex_summary = parse_openalex_work(value)
+                yield {
+                    "input": raw,
+                    "doi": doi,
+                    "status": "ok",
+                    "openalex": openalex_summary,
+                    "altmetric": altmetric_summary,
+                    "journal_metric": lookup_journal_metric(journal_metrics, openalex_summary.get("journal_name")),
+                }
+
+
+def flatten_report(report: dict[str, Any]) -> dict[str, Any]:
+    """One flat row per batch report, matching `PARQUET_COLUMNS`."""
+    openalex = report.get("openalex") or {}
+    altmetric = report.get("altmetric") or {}
+    journal_metric = report.get("journal_metric") or {}
+    row: dict[str, Any] = {"input": report["input"], "doi": report["doi"], "status": report["status"]}
+    for name in ("openalex_id", "title", "publication_year", "cited_by_count", "citation_percentile_min",
+                 "citation_percentile_max", "journal_name", "journal_issn_l", "type"):
+        row[name] = openalex.get(name)
+    row["counts_by_year"] = json.dumps(openalex["counts_by_year"]) if openalex else None
+    row["altmetric_status"] = altmetric.get("status")
+    row["altmetric_reason"] = altmetric.get("reason")
+    row["altmetric_score"] = altmetric.get("score")
+    for name in ("posts", "news_outlets", "tweeters", "policies", "patents"):
+        row[f"altmetric_{name}_count"] = altmetric.get(f"cited_by_{name}_count")
+    row["altmetric_readers_count"] = altmetric.get("readers_count")
+    row["journal_metric_matched"] = journal_metric.get("matched")
+    if journal_metric.get("matched"):
+        row["journal_metric_match"] = journal_metric.get("match", "exact")
+        row["journal_metric_similarity"] = journal_metric.get("similarity", 1.0)
+    else:
+        row["journal_metric_match"] = row["journal_metric_similarity"] = None
+    row["journal_metric_name"] = journal_metric.get("metric_name")
+    row["journal_metric_year"] = journal_metric.get("metric_year")
+    row["journal_metric_value"] = journal_metric.get("value")
+    row["journal_metric_source_kind"] = journal_metric.get("source_kind")
+    return row
+
+
+def write_jsonl(out: TextIO, reports: Iterable[dict[str, Any]]) -> Counter:
+    statuses: Counter = Counter()
+    for report in reports:
+        out.write(json.dumps(report) + "\n")
+        out.flush()
+        statuses[report["status"]] += 1
+    return statuses
+
+
+def write_parquet(path: Path, reports: Iterable[dict[str, Any]]) -> Counter:
+    # Imported here so single-DOI runs do not pay for pyarrow.
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)") from exc
+    schema = pa.schema([(name, getattr(pa, kind)()) for name, kind in PARQUET_COLUMNS])
+    statuses: Counter = Counter()
+    rows: list[dict[str, Any]] = []
+    with pq.ParquetWriter(str(path), schema) as writer:
+        for report in reports:
+            rows.append(flatten_report(report))
+            statuses[report["status"]] += 1
+            if len(rows) >= PARQUET_ROW_GROUP:
+                writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+                rows = []
+        if rows or not statuses:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+    return statuses
+
+
+def run_batch(args: argparse.Namespace) -> Counter:
+    journal_metrics = load_journal_metrics(Path(args.journal_metrics), fuzzy_threshold=journal_match_threshold(args))
+    cache_dir = None if args.no_cache else Path(args.cache_dir) if args.cache_dir else default_cache_dir()
+    client = ImpactClient(
+        mailto=args.mailto,
+        altmetric_api_key=args.altmetric_api_key,
+        cache=ResponseCache(cache_dir, args.cache_ttl_days * 86400, NEGATIVE_TTL_SECONDS),
+        openalex_rate=args.openalex_rate,
+        altmetric_rate=args.altmetric_rate,
+    )
+    source = contextlib.nullcontext(sys.stdin) if args.doi_list == "-" else open(args.doi_list, encoding="utf-8")
+    with source as handle:
+        reports = assess_dois(client, iter_doi_list(handle), journal_metrics, workers=args.workers)
+        if not args.output:
+            return write_jsonl(sys.stdout, reports)
+        output = Path(args.output)
+        partial = output.with_name(output.name + ".partial")
+        try:
+            if args.format == "parquet":
+                statuses = write_parquet(partial, reports)
+            else:
+                with partial.open("w", encoding="utf-8") as out:
+                    statuses = write_jsonl(out, reports)
+            os.replace(partial, output)
+        finally:
+            partial.unlink(missing_ok=True)
+        return statuses
+
+
 def format_text(report: dict[str, Any]) -> str:
     openalex = report["openalex"]
     journal_metric = report["journal_metric"]
@@ -210,6 +772,10 @@ def format_text(report: dict[str, Any]) -> str:
         lines.append(
             f"Journal impact factor ({journal_metric['metric_year']}): {journal_metric['value']} [{journal_metric['source_kind']}]"
         )
+        if journal_metric.get("match") == "fuzzy":
+            lines.append(
+                f"Journal matched fuzzily: {journal_metric['journal_name']} (similarity {journal_metric['similarity']})"
+            )
     else:
         lines.append(f"Journal impact factor: unavailable ({journal_metric.get('reason')})")
     if altmetric.get("status") == "available":
@@ -224,6 +790,10 @@ def build_parser() -> argparse.ArgumentParser:
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument("--doi", help="DOI for the work to assess")
     group.add_argument("--openalex-id", help="OpenAlex work ID, e.g. W2741809807")
+    group.add_argument(
+        "--doi-list",
+        help="Batch mode: file with one DOI per line ('-' for stdin); writes one report per DOI as JSONL or Parquet",
+    )
     parser.add_argument(
         "--mailto",
         default=os.environ.get("OPENALEX_MAILTO"),
@@ -239,14 +809,46 @@ def build_parser() -> argparse.ArgumentParser:
         default=str(DEFAULT_JOURNAL_METRICS),
         help="Path to the curated journal metrics TSV",
     )
-    parser.add_argument("--format", choices=("json", "text"), default="json")
+    parser.add_argument(
+        "--exact-journal-match",
+        action="store_true",
+        help="Only accept exact journal name/alias matches (no fuzzy fallback)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "text", "jsonl", "parquet"),
+        help="json/text for one work (default json); jsonl/parquet for --doi-list (default jsonl)",
+    )
     parser.add_argument("--output", help="Write output to a file instead of stdout")
+    batch = parser.add_argument_group("batch mode")
+    batch.add_argument("--workers", type=int, default=4, help="Concurrent lookups (default: 4)")
+    batch.add_argument("--openalex-rate", type=float, default=10.0, help="OpenAlex requests per second (default: 10)")
+    batch.add_argument("--altmetric-rate", type=float, default=1.0, help="Altmetric requests per second (default: 1)")
+    batch.add_argument("--cache-dir", help="Response cache directory (default: ~/.cache/omics-skills/measure-impact)")
+    batch.add_argument("--no-cache", action="store_true", help="Do not read or write the response cache")
+    batch.add_argument("--cache-ttl-days", type=float, default=7.0, help="Days before cached responses are refetched")
     return parser
 
 
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
+    batch = args.doi_list is not None
+    args.format = args.format or ("jsonl" if batch else "json")
+    if batch != (args.format in BATCH_FORMATS):
+        parser.error(f"--format {args.format} is not available {'with' if batch else 'without'} --doi-list")
+    if args.format == "parquet" and not args.output:
+        parser.error("--format parquet requires --output")
+    if batch:
+        try:
+            statuses = run_batch(args)
+        except Exception as exc:  # pragma: no cover - exercised through CLI failure paths
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        summary = ", ".join(f"{status} {count}" for status, count in sorted(statuses.items()))
+        print(f"Assessed {sum(statuses.values())} DOIs ({summary or 'none'})", file=sys.stderr)
+        return 0
+
     try:
         report = build_live_report(args)
     except Exception as exc:  # pragma: no cover - exercised through CLI failure paths
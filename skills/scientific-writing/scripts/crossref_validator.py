@@ -7,16 +7,24 @@ Examples:
     python scripts/crossref_validator.py --title "CRISPR-Cas9 genome editing"
     python scripts/crossref_validator.py --validate-file references.txt
     python scripts/crossref_validator.py --audit-bibliography refs.bib
+    python scripts/crossref_validator.py --audit-bibliography refs.bib --json --output audit.json
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 try:
     import requests
@@ -26,63 +34,299 @@ except ImportError:
 
 
 CROSSREF_API_BASE = "https://api.crossref.org"
-RATE_LIMIT_DELAY_SECONDS = 0.05
+# Polite-pool budget shared by all worker threads (requests per second, in flight).
+DEFAULT_RATE_PER_SECOND = 10.0
+DEFAULT_MAX_WORKERS = 3
+DEFAULT_CACHE_TTL_DAYS = 30.0
+DEFAULT_NEGATIVE_TTL_HOURS = 24.0
+# DOIs per `filter=doi:...,doi:...` request; keeps URLs well under common limits.
+BATCH_SIZE = 40
+MAX_RETRIES = 3
 DOI_PATTERN = re.compile(r"^10\.\d{4,}/\S+$")
+DOI_IN_TEXT_RE = re.compile(r"(?:doi:\s*|https?://(?:dx\.)?doi\.org/)?(10\.\d{4,}/[^\s{}\"]+)", re.IGNORECASE)
+BIB_ENTRY_START_RE = re.compile(r"@\s*[A-Za-z]+\s*([{(])")
+BIB_HEADER_RE = re.compile(r"@\s*([A-Za-z]+)\s*[{(]\s*([^,\s{}()=]*)\s*,?")
+BIB_FIELD_RE = re.compile(r"[\s,]*([A-Za-z][\w\-:.+]*)\s*=\s*")
+BIB_BARE_RE = re.compile(r"[^,#})\s]*")
+BIB_SEPARATOR_RE = re.compile(r"\s*(#\s*)?")
+BIB_SPECIAL_RE = re.compile(r'[{}"\\]')
+LATEX_COMMAND_RE = re.compile(r"\\[A-Za-z]+|\\.")
+# Crossref title similarity above which a title search hit is offered as the DOI,
+# and below which a DOI's registered title is reported as not matching the entry.
+TITLE_MATCH_THRESHOLD = 0.9
+TITLE_MISMATCH_THRESHOLD = 0.6
+INVALID_DOI_ERROR = "invalid DOI format"
+NOT_FOUND_ERROR = "DOI not found in Crossref"
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per second.
+
+    The default capacity of one token spaces requests evenly, so no one-second
+    window exceeds the advertised rate even right after an idle period.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def limit(self, rate: float) -> None:
+        """Lower the rate, e.g. to what Crossref's X-Rate-Limit headers advertise."""
+        with self._lock:
+            if 0 < rate < self.rate or self.rate <= 0:
+                self.rate = rate
+
+
+def default_cache_dir() -> Path:
+    override = os.environ.get("CROSSREF_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".cache" / "omics-skills" / "crossref"
+
+
+class MetadataCache:
+    """Crossref responses on disk: DOI records and title searches.
+
+    "DOI not found" records expire sooner than hits, so newly registered DOIs
+    are picked up again without clearing the cache.
+    """
+
+    def __init__(self, directory: Path | None, ttl_seconds: float, negative_ttl_seconds: float) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+    def _path(self, namespace: str, key: str) -> Path:
+        assert self.directory is not None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / namespace / digest[:2] / f"{digest}.json"
+
+    def _read(self, namespace: str, key: str) -> dict[str, Any] | None:
+        if self.directory is None:
+            return None
+        try:
+            entry = json.loads(self._path(namespace, key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        ttl = self.ttl_seconds if entry.get("ok") else self.negative_ttl_seconds
+        if time.time() - float(entry.get("fetched_at", 0)) > ttl:
+            return None
+        return entry
+
+    def _write(self, namespace: str, key: str, entry: dict[str, Any]) -> None:
+        if self.directory is None:
+            return
+        entry["fetched_at"] = time.time()
+        path = self._path(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        partial.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(partial, path)
+
+    def get(self, doi: str) -> tuple[bool, dict[str, Any]] | None:
+        entry = self._read("works", doi.lower())
+        if entry is None:
+            return None
+        if entry.get("ok"):
+            return True, entry.get("metadata") or {}
+        return False, {"error": entry.get("error", NOT_FOUND_ERROR)}
+
+    def put(self, doi: str, ok: bool, payload: dict[str, Any]) -> None:
+        entry: dict[str, Any] = {"doi": doi, "ok": ok}
+        entry["metadata" if ok else "error"] = payload if ok else payload.get("error")
+        self._write("works", doi.lower(), entry)
+
+    def get_search(self, title: str, rows: int) -> list[dict[str, Any]] | None:
+        entry = self._read("titles", f"{rows}:{title_key(title)}")
+        return None if entry is None else entry.get("items", [])
+
+    def put_search(self, title: str, rows: int, items: list[dict[str, Any]]) -> None:
+        self._write("titles", f"{rows}:{title_key(title)}", {"title": title, "ok": True, "items": items})
+
+
+def parse_rate_limit(headers: Any) -> float | None:
+    """Requests per second from Crossref's X-Rate-Limit-Limit / -Interval headers."""
+    try:
+        limit = float(headers.get("X-Rate-Limit-Limit", ""))
+        interval = float(str(headers.get("X-Rate-Limit-Interval", "1s")).rstrip("s"))
+    except ValueError:
+        return None
+    return limit / interval if limit > 0 and interval > 0 else None
 
 
 class CrossrefClient:
-    def __init__(self, user_agent: str) -> None:
-        self._session = requests.Session()
-        self._session.headers.update({"User-Agent": user_agent})
-        self._last_request = 0.0
-
-    def _rate_limit(self) -> None:
-        elapsed = time.time() - self._last_request
-        if elapsed < RATE_LIMIT_DELAY_SECONDS:
-            time.sleep(RATE_LIMIT_DELAY_SECONDS - elapsed)
-        self._last_request = time.time()
-
-    def fetch_doi(self, raw_doi: str) -> tuple[bool, dict[str, Any] | None]:
-        doi = normalize_doi(raw_doi)
-        if doi is None:
-            return False, {"error": "invalid DOI format"}
-
-        self._rate_limit()
+    def __init__(
+        self,
+        user_agent: str,
+        cache_dir: Path | None = None,
+        rate: float = DEFAULT_RATE_PER_SECOND,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_DAYS * 86400,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_HOURS * 3600,
+    ) -> None:
+        self._user_agent = user_agent
+        self._local = threading.local()
+        self._bucket = TokenBucket(rate)
+        self.max_workers = max(1, max_workers)
+        self.cache = MetadataCache(cache_dir, ttl_seconds, negative_ttl_seconds)
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({"User-Agent": self._user_agent})
+            self._local.session = session
+        return session
+
+    def _get(self, url: str, params: dict[str, Any] | None = None) -> requests.Response:
+        for attempt in range(MAX_RETRIES + 1):
+            self._bucket.acquire()
+            response = self._session().get(url, params=params, timeout=10)
+            advertised = parse_rate_limit(response.headers)
+            if advertised is not None:
+                self._bucket.limit(advertised)
+            if response.status_code != 429 or attempt == MAX_RETRIES:
+                return response
+            try:
+                delay = float(response.headers.get("Retry-After", ""))
+            except ValueError:
+                delay = 2.0 ** attempt
+            time.sleep(max(delay, 0.0))
+        return response
+
+    def _lookup(self, doi: str) -> tuple[bool, dict[str, Any]]:
         try:
-            response = self._session.get(f"{CROSSREF_API_BASE}/works/{doi}", timeout=10)
+            response = self._get(f"{CROSSREF_API_BASE}/works/{doi}")
         except requests.RequestException as exc:
             return False, {"error": f"request failed: {exc}"}
 
         if response.status_code == 404:
-            return False, {"error": "DOI not found in Crossref"}
+            self.cache.put(doi, False, {"error": NOT_FOUND_ERROR})
+            return False, {"error": NOT_FOUND_ERROR}
         if response.status_code != 200:
             return False, {"error": f"HTTP {response.status_code}"}
 
         payload = response.json()
         if payload.get("status") != "ok":
             return False, {"error": "unexpected Crossref response"}
-        return True, payload.get("message", {})
+        metadata = payload.get("message", {})
+        self.cache.put(doi, True, metadata)
+        return True, metadata
 
-    def search_title(self, title: str, max_results: int = 5) -> list[dict[str, Any]]:
-        self._rate_limit()
+    def _lookup_batch(self, dois: list[str]) -> dict[str, dict[str, Any]]:
+        """Resolve several DOIs with one multi-filter query; returns hits by lowercase DOI."""
         try:
-            response = self._session.get(
+            response = self._get(
+                f"{CROSSREF_API_BASE}/works",
+                params={"filter": ",".join(f"doi:{doi}" for doi in dois), "rows": len(dois)},
+            )
+        except requests.RequestException:
+            return {}
+        if response.status_code != 200:
+            return {}
+        payload = response.json()
+        if payload.get("status") != "ok":
+            return {}
+        wanted = {doi.lower(): doi for doi in dois}
+        found: dict[str, dict[str, Any]] = {}
+        for item in payload.get("message", {}).get("items", []):
+            key = str(item.get("DOI", "")).lower()
+            if key in wanted:
+                found[key] = item
+                self.cache.put(wanted[key], True, item)
+        return found
+
+    def fetch_doi(self, raw_doi: str) -> tuple[bool, dict[str, Any] | None]:
+        doi = normalize_doi(raw_doi)
+        if doi is None:
+            return False, {"error": INVALID_DOI_ERROR}
+        cached = self.cache.get(doi)
+        if cached is not None:
+            return cached
+        return self._lookup(doi)
+
+    def fetch_dois(self, raw_dois: Iterable[str]) -> dict[str, tuple[bool, dict[str, Any] | None]]:
+        """Validate many DOIs: cache first, then batched filters, then single lookups.
+
+        DOIs a batch did not return are confirmed one by one so a filter quirk is
+        never reported as a missing DOI.
+        """
+        raw_dois = list(raw_dois)
+        results: dict[str, tuple[bool, dict[str, Any] | None]] = {}
+        pending: dict[str, str] = {}
+        for raw in raw_dois:
+            doi = normalize_doi(raw)
+            if doi is None:
+                results[raw] = (False, {"error": INVALID_DOI_ERROR})
+                continue
+            cached = self.cache.get(doi)
+            if cached is not None:
+                results[raw] = cached
+            else:
+                pending.setdefault(doi.lower(), doi)
+
+        resolved: dict[str, tuple[bool, dict[str, Any] | None]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # Commas separate filter values, so those DOIs can only be looked up alone.
+            batchable = [doi for doi in pending.values() if "," not in doi]
+            batches = [batchable[i : i + BATCH_SIZE] for i in range(0, len(batchable), BATCH_SIZE)]
+            if len(batchable) > 1:
+                for found in pool.map(self._lookup_batch, batches):
+                    resolved.update((key, (True, metadata)) for key, metadata in found.items())
+            singles = [doi for key, doi in pending.items() if key not in resolved]
+            resolved.update(zip((doi.lower() for doi in singles), pool.map(self._lookup, singles)))
+
+        return {raw: results.get(raw) or resolved[normalize_doi(raw).lower()] for raw in raw_dois}
+
+    def _search(self, title: str, max_results: int) -> list[dict[str, Any]] | None:
+        try:
+            response = self._get(
                 f"{CROSSREF_API_BASE}/works",
                 params={"query.title": title, "rows": max_results},
-                timeout=10,
             )
         except requests.RequestException as exc:
             print(f"Error searching title: {exc}", file=sys.stderr)
-            return []
+            return None
 
         if response.status_code != 200:
             print(f"Error searching title: HTTP {response.status_code}", file=sys.stderr)
-            return []
+            return None
 
         payload = response.json()
         if payload.get("status") != "ok":
-            return []
-        return payload.get("message", {}).get("items", [])
+            return None
+        items = payload.get("message", {}).get("items", [])
+        self.cache.put_search(title, max_results, items)
+        return items
+
+    def search_title(self, title: str, max_results: int = 5) -> list[dict[str, Any]]:
+        cached = self.cache.get_search(title, max_results)
+        if cached is not None:
+            return cached
+        return self._search(title, max_results) or []
+
+    def search_titles(self, titles: Iterable[str], max_results: int = 5) -> dict[str, list[dict[str, Any]]]:
+        unique = list(dict.fromkeys(titles))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            found = pool.map(lambda title: self.search_title(title, max_results), unique)
+            return dict(zip(unique, found))
 
 
 def normalize_doi(raw_doi: str) -> str | None:
@@ -94,6 +338,165 @@ def normalize_doi(raw_doi: str) -> str | None:
     return None
 
 
+def title_key(title: str) -> str:
+    """Casefolded title with LaTeX markup and punctuation reduced to single spaces."""
+    text = LATEX_COMMAND_RE.sub(" ", title.replace("\\&", "&"))
+    return " ".join(re.sub(r"[\W_]+", " ", text.casefold()).split())
+
+
+def title_similarity(left: str, right: str) -> float:
+    return SequenceMatcher(None, title_key(left), title_key(right)).ratio()
+
+
+def crossref_titles(metadata: dict[str, Any]) -> list[str]:
+    """Crossref title, plus title: subtitle when a subtitle is recorded."""
+    title = first_string(metadata.get("title"))
+    subtitle = first_string(metadata.get("subtitle"))
+    return [title, f"{title}: {subtitle}"] if subtitle else [title]
+
+
+@dataclass
+class BibEntry:
+    key: str | None
+    entry_type: str
+    line: int
+    fields: dict[str, str]
+
+    @property
+    def title(self) -> str:
+        return clean_bib_value(self.fields.get("title", ""))
+
+    @property
+    def raw_doi(self) -> str:
+        """The DOI as written: the `doi` field, else a doi.org link in a URL-like field."""
+        if self.fields.get("doi"):
+            return clean_bib_value(self.fields["doi"])
+        for name in ("url", "howpublished", "note"):
+            match = DOI_IN_TEXT_RE.search(self.fields.get(name, ""))
+            if match:
+                return trim_doi(match.group(1))
+        return ""
+
+
+def trim_doi(doi: str) -> str:
+    """Drop sentence punctuation after a DOI found in running text."""
+    doi = doi.rstrip(".,;")
+    if doi.endswith(")") and doi.count(")") > doi.count("("):
+        doi = doi[:-1]
+    return doi
+
+
+def clean_bib_value(value: str) -> str:
+    return " ".join(value.replace("\\&", "&").replace("{", "").replace("}", "").split())
+
+
+def _read_delimited(text: str, start: int) -> tuple[str, int]:
+    """Read a {...} or "..." value at `start`; returns (value, index after it).
+
+    Braces nest in both forms; a quoted value ends at the first `"` outside braces.
+    """
+    quoted = text[start] == '"'
+    depth = 0 if quoted else 1
+    index = start + 1
+    while True:
+        match = BIB_SPECIAL_RE.search(text, index)
+        if match is None:
+            return text[start + 1 :], len(text)
+        index = match.start()
+        char = text[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0 and not quoted:
+                return text[start + 1 : index], index + 1
+        elif quoted and depth == 0:
+            return text[start + 1 : index], index + 1
+        index += 1
+
+
+def parse_bib_fields(body: str) -> dict[str, str]:
+    """`name = value` pairs of one entry body; values may be {...}, "..." or bare, joined with #."""
+    fields: dict[str, str] = {}
+    position = 0
+    while True:
+        match = BIB_FIELD_RE.match(body, position)
+        if not match:
+            return fields
+        name, position = match.group(1).lower(), match.end()
+        parts: list[str] = []
+        while position < len(body):
+            char = body[position]
+            if char in '{"':
+                value, position = _read_delimited(body, position)
+            else:
+                bare = BIB_BARE_RE.match(body, position)
+                value, position = bare.group(0).strip(), bare.end()
+            parts.append(value)
+            separator = BIB_SEPARATOR_RE.match(body, position)
+            position = separator.end()
+            if not separator.group(1):
+                break
+        fields[name] = "".join(parts)
+        comma = body.find(",", position)
+        if comma < 0:
+            return fields
+        position = comma + 1
+
+
+def iter_bib_entries(lines: Iterable[str]) -> Iterator[BibEntry]:
+    """Yield BibTeX entries one at a time from a line stream.
+
+    Only the lines of the current entry are buffered. Lines outside entries
+    (other than `%` comments) are scanned for DOIs, so plain-text reference
+    lists still yield one entry per DOI (with no title).
+    """
+    buffer: list[str] = []
+    depth = 0
+    start_line = 0
+    closer = "}"
+    for line_number, line in enumerate(lines, start=1):
+        if not buffer:
+            match = BIB_ENTRY_START_RE.search(line)
+            if match is None:
+                if line.lstrip().startswith("%"):
+                    continue
+                for doi in DOI_IN_TEXT_RE.findall(line):
+                    yield BibEntry(None, "text", line_number, {"doi": trim_doi(doi)})
+                continue
+            line = line[match.start() :]
+            start_line = line_number
+            opener, closer = ("{", "}") if match.group(1) == "{" else ("(", ")")
+            depth = 0
+        else:
+            opener = "{" if closer == "}" else "("
+        buffer.append(line)
+        unescaped = line.replace("\\{", "").replace("\\}", "")
+        depth += unescaped.count(opener) - unescaped.count(closer)
+        if depth <= 0:
+            entry = parse_bib_entry("".join(buffer), start_line)
+            buffer = []
+            if entry is not None:
+                yield entry
+    if buffer:
+        entry = parse_bib_entry("".join(buffer), start_line)
+        if entry is not None:
+            yield entry
+
+
+def parse_bib_entry(text: str, line: int) -> BibEntry | None:
+    header = BIB_HEADER_RE.match(text)
+    if header is None:
+        return None
+    entry_type = header.group(1).lower()
+    if entry_type in {"comment", "preamble", "string"}:
+        return None
+    return BibEntry(header.group(2) or None, entry_type, line, parse_bib_fields(text[header.end() :]))
+
+
 def extract_year(metadata: dict[str, Any]) -> str:
     for field in ("published-print", "published-online", "issued"):
         date_parts = metadata.get(field, {}).get("date-parts", [[]])
@@ -199,44 +602,110 @@ def first_string(value: Any) -> str:
 
 def validate_file(client: CrossrefClient, path: Path) -> dict[str, list[Any]]:
     results: dict[str, list[Any]] = {"valid": [], "invalid": [], "errors": []}
-    for line in path.read_text().splitlines():
-        raw = line.strip()
-        if not raw:
-            continue
-        is_valid, metadata = client.fetch_doi(raw)
+    raws = [line.strip() for line in path.read_text().splitlines() if line.strip()]
+    lookups = client.fetch_dois(raws)
+    for raw in raws:
+        is_valid, metadata = lookups[raw]
         if is_valid:
             results["valid"].append({"doi": raw, "metadata": metadata})
-        elif metadata and metadata.get("error") == "invalid DOI format":
+        elif metadata and metadata.get("error") == INVALID_DOI_ERROR:
             results["invalid"].append(raw)
         else:
             results["errors"].append({"doi": raw, "error": metadata.get("error") if metadata else "unknown"})
     return results
 
 
-def audit_bibliography(client: CrossrefClient, path: Path) -> dict[str, Any]:
-    content = path.read_text()
-    doi_matches = set(
-        re.findall(r"(?:doi:|https?://(?:dx\.)?doi\.org/)?(10\.\d{4,}/\S+)", content, flags=re.IGNORECASE)
+def reconcile_entry(
+    entry: BibEntry,
+    lookup: tuple[bool, dict[str, Any] | None] | None,
+    candidates: list[dict[str, Any]] | None,
+) -> dict[str, Any]:
+    """Per-entry audit result: check the DOI against the title, or find a DOI for the title."""
+    result: dict[str, Any] = {"key": entry.key, "type": entry.entry_type, "line": entry.line, "title": entry.title}
+    raw_doi = entry.raw_doi
+    if raw_doi:
+        result["doi"] = normalize_doi(raw_doi) or raw_doi
+        if lookup is None:
+            result["status"] = "invalid_doi"
+            return result
+        ok, metadata = lookup
+        if not ok:
+            error = (metadata or {}).get("error", "unknown")
+            result["status"] = "doi_not_found" if error == NOT_FOUND_ERROR else "lookup_error"
+            result["error"] = error
+            return result
+        registered = crossref_titles(metadata or {})
+        result["crossref_title"] = registered[-1]
+        if entry.title and registered[0]:
+            similarity = max(title_similarity(entry.title, title) for title in registered)
+            result["title_similarity"] = round(similarity, 3)
+            if similarity < TITLE_MISMATCH_THRESHOLD:
+                result["status"] = "title_mismatch"
+                return result
+        result["status"] = "valid"
+        return result
+
+    if not entry.title:
+        result["status"] = "unchecked"
+        return result
+    result["status"] = "missing_doi"
+    if candidates is None:
+        return result
+    scored = sorted(
+        ((max(title_similarity(entry.title, title) for title in crossref_titles(item)), item) for item in candidates),
+        key=lambda pair: -pair[0],
     )
-    title_matches = re.findall(r'title\s*=\s*["{]([^"}]+)["}]', content, flags=re.IGNORECASE)
-
-    valid: list[dict[str, str]] = []
-    invalid: list[str] = []
-    for doi in sorted(doi_matches):
-        is_valid, metadata = client.fetch_doi(doi)
-        if is_valid and metadata:
-            valid.append({"doi": doi, "title": first_string(metadata.get("title"))})
+    result["candidates"] = [
+        {"doi": item.get("DOI", ""), "title": first_string(item.get("title")), "year": extract_year(item), "similarity": round(score, 3)}
+        for score, item in scored
+    ]
+    if scored and scored[0][0] >= TITLE_MATCH_THRESHOLD:
+        result["suggested_doi"] = scored[0][1].get("DOI", "")
+    return result
+
+
+def audit_bibliography(client: CrossrefClient, path: Path, search_missing: bool = True) -> dict[str, Any]:
+    """Audit a .bib (or plain-text) bibliography entry by entry.
+
+    Each distinct DOI is resolved once (batched, cached) and its registered title
+    compared with the entry's; entries without a DOI are matched by cached title
+    search instead of being inferred from a count difference.
+    """
+    with path.open(encoding="utf-8", errors="replace") as handle:
+        entries = list(iter_bib_entries(handle))
+
+    normalized = {entry.raw_doi: normalize_doi(entry.raw_doi) for entry in entries if entry.raw_doi}
+    lookups = client.fetch_dois(dict.fromkeys(doi for doi in normalized.values() if doi))
+    titles = [entry.title for entry in entries if entry.title and not entry.raw_doi]
+    searches = client.search_titles(titles, max_results=3) if search_missing and titles else {}
+
+    results = []
+    for entry in entries:
+        doi = normalized.get(entry.raw_doi)
+        results.append(reconcile_entry(entry, lookups.get(doi) if doi else None, searches.get(entry.title)))
+
+    valid: dict[str, dict[str, str]] = {}
+    invalid: dict[str, str] = {}
+    for result in results:
+        if "doi" not in result:
+            continue
+        if result["status"] in {"valid", "title_mismatch"}:
+            valid.setdefault(result["doi"].lower(), {"doi": result["doi"], "title": result.get("crossref_title", "")})
         else:
-            invalid.append(doi)
+            invalid.setdefault(result["doi"].lower(), result["doi"])
 
     return {
-        "total_dois": len(doi_matches),
+        "total_entries": len(results),
+        "total_dois": len(valid) + len(invalid),
         "valid_dois": len(valid),
         "invalid_dois": len(invalid),
-        "valid_list": valid,
-        "invalid_list": invalid,
-        "total_titles": len(title_matches),
-        "missing_dois": max(len(title_matches) - len(doi_matches), 0),
+        "valid_list": list(valid.values()),
+        "invalid_list": sorted(invalid.values()),
+        "total_titles": sum(1 for entry in entries if entry.title),
+        "missing_dois": sum(1 for result in results if result["status"] == "missing_doi"),
+        "title_mismatches": sum(1 for result in results if result["status"] == "title_mismatch"),
+        "suggested_dois": sum(1 for result in results if result.get("suggested_doi")),
+        "entries": results,
     }
 
 
@@ -253,11 +722,48 @@ def build_parser() -> argparse.ArgumentParser:
         help="Citation style for formatted output",
     )
     parser.add_argument("--output", help="Write output to a file instead of stdout")
+    parser.add_argument(
+        "--no-title-search",
+        action="store_true",
+        help="Skip Crossref title searches for bibliography entries without a DOI",
+    )
+    parser.add_argument("--json", action="store_true", help="Write the bibliography audit as JSON")
     parser.add_argument(
         "--email",
         default="your-email@example.com",
         help="Email used in the Crossref polite-pool user agent",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Concurrent Crossref requests (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE_PER_SECOND,
+        help=f"Requests per second across all workers (default: {DEFAULT_RATE_PER_SECOND:g})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for the DOI metadata cache (default: ~/.cache/omics-skills/crossref)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable cache reads and writes")
+    parser.add_argument(
+        "--cache-ttl-days",
+        type=float,
+        default=DEFAULT_CACHE_TTL_DAYS,
+        help=f"Days a cached DOI record stays valid (default: {DEFAULT_CACHE_TTL_DAYS:g})",
+    )
+    parser.add_argument(
+        "--negative-ttl-hours",
+        type=float,
+        default=DEFAULT_NEGATIVE_TTL_HOURS,
+        help=f"Hours a cached 'DOI not found' stays valid (default: {DEFAULT_NEGATIVE_TTL_HOURS:g})",
+    )
     return parser
 
 
@@ -266,7 +772,14 @@ def main() -> int:
     args = parser.parse_args()
 
     user_agent = f"scientific-writing-skill/1.0 (mailto:{args.email})"
-    client = CrossrefClient(user_agent=user_agent)
+    client = CrossrefClient(
+        user_agent=user_agent,
+        cache_dir=None if args.no_cache else (args.cache_dir or default_cache_dir()),
+        rate=args.rate,
+        max_workers=args.max_workers,
+        ttl_seconds=args.cache_ttl_days * 86400,
+        negative_ttl_seconds=args.negative_ttl_hours * 3600,
+    )
 
     output_handle = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
     try:
@@ -316,19 +829,48 @@ def main() -> int:
             return 0
 
         if args.audit_bibliography:
-            report = audit_bibliography(client, Path(args.audit_bibliography))
+            report = audit_bibliography(
+                client, Path(args.audit_bibliography), search_missing=not args.no_title_search
+            )
+            if args.json:
+                print(json.dumps(report, indent=2), file=output_handle)
+                return 0
             print("Bibliography audit", file=output_handle)
             print("=================", file=output_handle)
+            print(f"Entries: {report['total_entries']}", file=output_handle)
             print(f"Total DOIs found: {report['total_dois']}", file=output_handle)
             print(f"Valid DOIs: {report['valid_dois']}", file=output_handle)
             print(f"Invalid DOIs: {report['invalid_dois']}", file=output_handle)
             print(f"Total titles: {report['total_titles']}", file=output_handle)
-            print(f"Potentially missing DOIs: {report['missing_dois']}", file=output_handle)
+            print(f"Entries missing DOIs: {report['missing_dois']}", file=output_handle)
+            print(f"DOI/title mismatches: {report['title_mismatches']}", file=output_handle)
             if report["invalid_list"]:
                 print("", file=output_handle)
                 print("Invalid DOIs:", file=output_handle)
                 for doi in report["invalid_list"]:
                     print(f"- {doi}", file=output_handle)
+            mismatches = [entry for entry in report["entries"] if entry["status"] == "title_mismatch"]
+            if mismatches:
+                print("", file=output_handle)
+                print("DOI does not match the entry title:", file=output_handle)
+                for entry in mismatches:
+                    print(f"- {entry['key'] or 'line ' + str(entry['line'])}: {entry['doi']}", file=output_handle)
+                    print(f"  bib:      {entry['title']}", file=output_handle)
+                    print(f"  crossref: {entry['crossref_title']}", file=output_handle)
+            missing = [entry for entry in report["entries"] if entry["status"] == "missing_doi"]
+            if missing:
+                print("", file=output_handle)
+                print("Entries without a DOI:", file=output_handle)
+                for entry in missing:
+                    if entry.get("suggested_doi"):
+                        hint = f"suggested {entry['suggested_doi']}"
+                    elif entry.get("candidates"):
+                        hint = "no confident match; candidates: " + ", ".join(
+                            candidate["doi"] for candidate in entry["candidates"]
+                        )
+                    else:
+                        hint = "not searched" if args.no_title_search else "no Crossref match"
+                    print(f"- {entry['key'] or 'line ' + str(entry['line'])}: {entry['title']} ({hint})", file=output_handle)
             return 0
 
         parser.print_help(file=output_handle)
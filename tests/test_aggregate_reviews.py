@@ -0,0 +1,123 @@
+"""Tests for the AI scientist review leaderboard."""
+
+from __future__ import annotations
+
+import csv
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pq = None
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "skills" / "ai-scientist-evaluator" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+SPEC = importlib.util.spec_from_file_location("aggregate_reviews", SCRIPTS_DIR / "aggregate_reviews.py")
+aggregate_reviews = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+sys.modules[SPEC.name] = aggregate_reviews
+SPEC.loader.exec_module(aggregate_reviews)
+
+# submission_id, total, task_completion, reproducibility, benchmarking, gate fails, red flags
+REVIEWS = [
+    ("s1", 80, 20, 10, 5, 0, 0),
+    ("s2", 90, 15, 10, 5, 1, 2),
+    ("s3", 80, 20, 12, 5, 0, 0),
+    ("s4", 80, 20, 10, 5, 1, 0),
+    ("s5", 80, 20, 10, 5, 0, 0),
+]
+
+
+def _review(submission: str, total: float, task: float, repro: float, bench: float, gates: int, flags: int) -> dict:
+    return {
+        "submission_id": submission,
+        "scientist_name": f"bot-{submission}",
+        "overall": {"total_score_100": total, "recommendation": "minor revision"},
+        "scores": [
+            {"category": "clarity", "weighted_points": 3},
+            {"category": "benchmarking", "weighted_points": bench},
+            {"category": "task_completion", "weighted_points": task},
+            {"category": "validation_robustness", "weighted_points": 99},
+            {"category": "reproducibility", "weighted_points": repro},
+        ],
+        "gate_checks": [{"status": "fail"}] * gates + [{"status": "pass"}],
+        "red_flags": ["flag"] * flags,
+    }
+
+
+class AggregateReviewsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.paths = []
+        for index, spec in enumerate(REVIEWS):
+            path = self.root / "sweep" / f"evaluator{index % 2}" / f"{spec[0]}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(_review(*spec)), encoding="utf-8")
+            self.paths.append(path)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_rows_rank_like_the_full_sort_and_keep_ties_stable(self) -> None:
+        for path in self.paths:
+            data = aggregate_reviews.load_review(path)
+            self.assertEqual(aggregate_reviews.summarize_review(path, data)["sort_key"], aggregate_reviews.sort_key(data))
+
+        ranked = aggregate_reviews.rank_rows(aggregate_reviews.iter_rows(self.paths))
+        self.assertEqual([row["submission_id"] for row in ranked], ["s2", "s3", "s1", "s5", "s4"])
+        self.assertEqual([row["rank"] for row in ranked], [1, 2, 3, 4, 5])
+        self.assertEqual(ranked[1]["validation"], 5.0)
+
+        top = aggregate_reviews.rank_rows(aggregate_reviews.iter_rows(self.paths), top=3)
+        self.assertEqual(top, ranked[:3])
+        markdown = aggregate_reviews.format_markdown(top)
+        self.assertIn("| 1 | s2 | bot-s2 | 90.0 | minor revision | 1 | 2 |", markdown)
+        self.assertTrue(markdown.endswith("s2 (bot-s2) ranks first with 90.0/100."))
+
+    def test_directory_and_glob_inputs_load_in_parallel(self) -> None:
+        (self.root / "sweep" / "bad.json").write_text('{"overall": {}}', encoding="utf-8")
+        specs = [str(self.root / "sweep" / "evaluator0"), str(self.root / "sweep" / "**" / "*.json")]
+        paths = list(aggregate_reviews.iter_review_paths(specs))
+        self.assertEqual(len(paths), 6)
+        self.assertEqual(paths[:3], sorted(path for path in self.paths if path.parent.name == "evaluator0"))
+        with self.assertRaises(FileNotFoundError):
+            list(aggregate_reviews.iter_review_paths([str(self.root / "missing.json")]))
+
+        with self.assertRaises(ValueError):
+            list(aggregate_reviews.iter_rows(paths))
+        with mock.patch.object(aggregate_reviews, "MIN_PARALLEL_REVIEWS", 1), mock.patch("sys.stderr"):
+            rows = list(aggregate_reviews.iter_rows(paths, workers=2, skip_invalid=True))
+        self.assertEqual([row["path"] for row in rows], [str(path) for path in paths if path.name != "bad.json"])
+
+    def test_tables_share_one_column_order(self) -> None:
+        ranked = aggregate_reviews.rank_rows(aggregate_reviews.iter_rows(self.paths))
+        out = self.root / "leaderboard.csv"
+        aggregate_reviews.write_csv(out, ranked)
+        with out.open(encoding="utf-8", newline="") as handle:
+            table = list(csv.DictReader(handle))
+        self.assertEqual(list(table[0]), [name for name, _ in aggregate_reviews.TABLE_COLUMNS])
+        self.assertEqual((table[0]["rank"], table[0]["submission_id"], table[0]["gate_fails"]), ("1", "s2", "1"))
+
+    @unittest.skipUnless(pq is not None, "pyarrow not installed")
+    def test_parquet_output(self) -> None:
+        ranked = aggregate_reviews.rank_rows(aggregate_reviews.iter_rows(self.paths))
+        out = self.root / "leaderboard.parquet"
+        aggregate_reviews.write_parquet(out, ranked)
+        table = pq.read_table(out)
+        self.assertEqual(table.column_names, [name for name, _ in aggregate_reviews.TABLE_COLUMNS])
+        self.assertEqual(table.column("submission_id").to_pylist(), ["s2", "s3", "s1", "s5", "s4"])
+
+        aggregate_reviews.write_parquet(out, [])
+        self.assertEqual(pq.read_table(out).num_rows, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Tests for the beautiful_style plotting helpers."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+try:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    matplotlib = None
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MODULE_PATH = REPO_ROOT / "skills" / "beautiful-data-viz" / "assets" / "beautiful_style.py"
+if matplotlib is not None:
+    SPEC = importlib.util.spec_from_file_location("beautiful_style", MODULE_PATH)
+    beautiful_style = importlib.util.module_from_spec(SPEC)
+    assert SPEC.loader is not None
+    sys.modules[SPEC.name] = beautiful_style
+    SPEC.loader.exec_module(beautiful_style)
+
+IMPORT_PROBE = """
+import json, sys
+import matplotlib
+sys.path.insert(0, sys.argv[1])
+import beautiful_style
+heavy = ("matplotlib.pyplot", "seaborn", "IPython", "pandas")
+print(json.dumps([name for name in heavy if name in sys.modules]))
+"""
+
+
+@unittest.skipUnless(matplotlib is not None, "matplotlib not installed")
+class StyleSetupTests(unittest.TestCase):
+    def test_import_defers_heavy_modules(self) -> None:
+        probe = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE, str(MODULE_PATH.parent)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(json.loads(probe.stdout), [])
+
+    def test_style_rc_is_built_once_per_style(self) -> None:
+        with matplotlib.rc_context():
+            beautiful_style._style_rc.cache_clear()
+            config = beautiful_style.set_beautiful_style(medium="paper", background="dark", font_scale=1.2)
+            self.assertEqual(config, beautiful_style.VizConfig("paper", "dark", 1.2, 150))
+            self.assertEqual(matplotlib.rcParams["axes.titlesize"], 11 * 1.2)
+            self.assertEqual(matplotlib.rcParams["figure.facecolor"], beautiful_style.TUFTE_COLORS["dark_bg"])
+
+            matplotlib.rcParams["axes.titlesize"] = 30
+            beautiful_style.set_beautiful_style(medium="paper", background="dark", font_scale=1.2)
+            self.assertEqual(matplotlib.rcParams["axes.titlesize"], 11 * 1.2)
+            beautiful_style.set_beautiful_style(medium="slides")
+            self.assertEqual(matplotlib.rcParams["axes.titlesize"], 18)
+            info = beautiful_style._style_rc.cache_info()
+            self.assertEqual((info.hits, info.misses), (1, 2))
+
+
+@unittest.skipUnless(matplotlib is not None, "matplotlib not installed")
+class LargeDataTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fig, self.ax = plt.subplots()
+
+    def tearDown(self) -> None:
+        plt.close(self.fig)
+
+    def test_lttb_keeps_endpoints_and_narrow_peaks(self) -> None:
+        x = np.arange(100_000, dtype=float)
+        y = np.sin(x / 5_000)
+        y[12_345] = 50.0
+        y[70_001] = -50.0
+        y[500:520] = np.nan
+        dx, dy = beautiful_style.lttb_downsample(x, y, 1_000)
+        (gap,) = np.flatnonzero(np.isnan(dy))
+        self.assertTrue(np.isnan(dx[gap]))
+        self.assertLess(dx[gap - 1], 500.0)
+        self.assertGreaterEqual(dx[gap + 1], 520.0)
+        dx, dy = np.delete(dx, gap), np.delete(dy, gap)
+        self.assertEqual(dx.size, 1_000)
+        self.assertEqual((dx[0], dx[-1]), (0.0, 99_999.0))
+        self.assertTrue(np.all(np.diff(dx) > 0))
+        self.assertIn(12_345.0, dx)
+        self.assertIn(70_001.0, dx)
+        self.assertTrue(np.isfinite(dy).all())
+
+        short_x, short_y = beautiful_style.lttb_downsample([0, 1, 2], [3, 4, 5], 10)
+        self.assertEqual(short_y.tolist(), [3.0, 4.0, 5.0])
+        short_x, short_y = beautiful_style.lttb_downsample([0, 1, 2, 3, 4], [3, np.nan, np.nan, 4, 5], 10)
+        self.assertEqual(np.isnan(short_y).tolist(), [False, True, False, False])
+        self.assertEqual(short_x[[0, 2, 3]].tolist(), [0.0, 3.0, 4.0])
+        with self.assertRaises(ValueError):
+            beautiful_style.lttb_downsample(x, y, 2)
+
+    def test_fast_scatter_switches_strategy_by_point_count(self) -> None:
+        limits = beautiful_style.LargeDataThresholds(rasterize_points=100, bin_points=1_000, line_points=50)
+        rng = np.random.default_rng(0)
+
+        beautiful_style.fast_scatter(self.ax, rng.normal(size=100), rng.normal(size=100), thresholds=limits)
+        self.assertFalse(self.ax.collections[-1].get_rasterized())
+        beautiful_style.fast_scatter(self.ax, rng.normal(size=500), rng.normal(size=500), s=2, thresholds=limits)
+        self.assertTrue(self.ax.collections[-1].get_rasterized())
+
+        x, y = rng.normal(size=5_000), rng.normal(size=5_000)
+        beautiful_style.fast_scatter(self.ax, x, y, s=2, color="k", bins=50, thresholds=limits)
+        density = self.ax.images[-1].get_array()
+        self.assertEqual(density.shape, (50, 50))
+        self.assertEqual(int(density.sum()), 5_000)
+        self.assertEqual(self.ax.images[-1].get_extent(), [x.min(), x.max(), y.min(), y.max()])
+
+        self.ax.set_xscale("log")
+        collections = len(self.ax.collections)
+        beautiful_style.fast_scatter(self.ax, np.exp(x), y, thresholds=limits)
+        self.assertEqual(len(self.ax.collections), collections + 1)
+        self.assertEqual(len(self.ax.images), 1)
+        with self.assertRaises(ValueError):
+            beautiful_style.fast_scatter(self.ax, x, y, mode="contour")
+
+    def test_fast_line_downsamples_long_lines(self) -> None:
+        limits = beautiful_style.LargeDataThresholds(rasterize_points=10, bin_points=1_000, line_points=200)
+        beautiful_style.fast_line(self.ax, np.arange(5_000), np.arange(5_000) % 7, thresholds=limits, color="k")
+        line = self.ax.lines[-1]
+        self.assertEqual(len(line.get_xdata()), 200)
+        self.assertTrue(line.get_rasterized())
+        beautiful_style.fast_line(self.ax, [0, 1, 2], [1, 2, 3], thresholds=limits)
+        self.assertFalse(self.ax.lines[-1].get_rasterized())
+        gappy = np.where((np.arange(5_000) // 1_000) == 2, np.nan, 1.0)
+        beautiful_style.fast_line(self.ax, np.arange(5_000), gappy, thresholds=limits)
+        self.assertEqual(int(np.isnan(self.ax.lines[-1].get_ydata()).sum()), 1)
+
+        x = np.arange(1_000, dtype=float)
+        columns = np.column_stack([np.zeros_like(x), np.zeros_like(x)])
+        columns[123, 0], columns[877, 1] = 9.0, -9.0
+        before = len(self.ax.lines)
+        beautiful_style.fast_line(self.ax, x, columns, max_points=50, thresholds=limits)
+        first, second = self.ax.lines[before:]
+        self.assertEqual((len(first.get_xdata()), len(second.get_xdata())), (50, 50))
+        self.assertIn(123.0, first.get_xdata())
+        self.assertIn(877.0, second.get_xdata())
+        with self.assertRaisesRegex(ValueError, "max_points must be at least 3"):
+            beautiful_style.fast_line(self.ax, x, x, max_points=2)
+        with self.assertRaisesRegex(ValueError, "shape"):
+            beautiful_style.fast_line(self.ax, x, columns.T)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+"""Tests for batched, cached Crossref DOI validation."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    import requests
+except ImportError:  # pragma: no cover - optional dependency
+    requests = None
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MODULE_PATH = REPO_ROOT / "skills" / "scientific-writing" / "scripts" / "crossref_validator.py"
+if requests is not None:
+    SPEC = importlib.util.spec_from_file_location("crossref_validator", MODULE_PATH)
+    crossref_validator = importlib.util.module_from_spec(SPEC)
+    assert SPEC.loader is not None
+    sys.modules[SPEC.name] = crossref_validator
+    SPEC.loader.exec_module(crossref_validator)
+
+KNOWN = {"10.1234/a", "10.1234/b", "10.1234/c,d"}
+TITLES = {"10.1234/a": "Soil viromes at depth", "10.1234/b": "Phage host range", "10.1234/c,d": "Marine phages"}
+SEARCH_HITS = [
+    {"DOI": "10.1234/found", "title": ["Viral dark matter"], "subtitle": ["a global survey"]},
+    {"DOI": "10.1234/other", "title": ["Dark matter in particle physics"]},
+]
+
+
+class _Response:
+    def __init__(self, status_code: int, payload: dict, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+
+    def json(self) -> dict:
+        return self._payload
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict | None]] = []
+
+    def get(self, url: str, params: dict | None = None, timeout: int = 10) -> _Response:
+        self.calls.append((url, params))
+        if params and "filter" in params:
+            dois = [value[4:] for value in params["filter"].split(",")]
+            items = [{"DOI": doi.upper(), "title": [TITLES[doi.lower()]]} for doi in dois if doi.lower() in KNOWN]
+            return _Response(200, {"status": "ok", "message": {"items": items}})
+        if params and "query.title" in params:
+            hits = SEARCH_HITS if "dark matter" in params["query.title"].lower() else []
+            return _Response(200, {"status": "ok", "message": {"items": hits}})
+        doi = url.rsplit("/works/", 1)[1]
+        if doi.lower() in KNOWN:
+            return _Response(200, {"status": "ok", "message": {"DOI": doi, "title": [TITLES[doi.lower()]]}})
+        return _Response(404, {})
+
+
+@unittest.skipUnless(requests is not None, "requests not installed")
+class CrossrefValidatorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _client(self, session: _Session) -> object:
+        client = crossref_validator.CrossrefClient("test", cache_dir=self.cache_dir, rate=0)
+        client._session = lambda: session
+        return client
+
+    def test_fetch_dois_batches_then_confirms_misses_and_caches(self) -> None:
+        raws = ["https://doi.org/10.1234/A", "10.1234/missing", "doi:10.1234/b", "nonsense", "10.1234/c,d"]
+        session = _Session()
+        results = self._client(session).fetch_dois(raws)
+
+        self.assertEqual(list(results), raws)
+        self.assertEqual([ok for ok, _ in results.values()], [True, False, True, False, True])
+        self.assertEqual(results["10.1234/missing"][1], {"error": "DOI not found in Crossref"})
+        self.assertEqual(results["nonsense"][1], {"error": "invalid DOI format"})
+        batch_calls = [params for _, params in session.calls if params]
+        self.assertEqual(batch_calls, [{"filter": "doi:10.1234/A,doi:10.1234/missing,doi:10.1234/b", "rows": 3}])
+        self.assertEqual(
+            sorted(url.rsplit("/", 2)[-1] for url, params in session.calls if not params), ["c,d", "missing"]
+        )
+
+        warm = _Session()
+        again = self._client(warm).fetch_dois(raws)
+        self.assertEqual(warm.calls, [])
+        self.assertEqual(again, results)
+
+    def test_negative_results_expire_sooner(self) -> None:
+        cache = crossref_validator.MetadataCache(self.cache_dir, ttl_seconds=3600, negative_ttl_seconds=60)
+        cache.put("10.1234/a", True, {"title": ["A"]})
+        cache.put("10.1234/gone", False, {"error": "DOI not found in Crossref"})
+        with mock.patch.object(crossref_validator.time, "time", return_value=time.time() + 600):
+            self.assertEqual(cache.get("10.1234/A"), (True, {"title": ["A"]}))
+            self.assertIsNone(cache.get("10.1234/gone"))
+
+        for path in self.cache_dir.rglob("*.json"):
+            path.write_text("{not json", encoding="utf-8")
+        self.assertIsNone(cache.get("10.1234/a"))
+
+    def test_transient_errors_are_not_cached(self) -> None:
+        session = _Session()
+        session.get = mock.Mock(return_value=_Response(503, {}))
+        client = self._client(session)
+        self.assertEqual(client.fetch_doi("10.1234/a"), (False, {"error": "HTTP 503"}))
+        self.assertEqual(list(self.cache_dir.rglob("*.json")), [])
+
+    def test_bib_entries_stream_with_nested_values(self) -> None:
+        text = (
+            "% 10.9999/commented-out\n"
+            '@string{nat = "Nature"}\n'
+            "@article{smith,\n"
+            "  title = {Soil {Viromes} at \\& depth},\n"
+            '  journal = nat, year = 2020, doi = "10.1234/a",\n'
+            "}\n"
+            '@Misc(web, title = "Part " # {one}, howpublished = {\\url{https://doi.org/10.1234/B}})\n'
+            "@comment{@article{hidden, doi = {10.1/x}}}\n"
+            "Plain reference, doi:10.1234/c.\n"
+        )
+        entries = list(crossref_validator.iter_bib_entries(io.StringIO(text)))
+        self.assertEqual(
+            [(entry.key, entry.entry_type, entry.line, entry.title, entry.raw_doi) for entry in entries],
+            [
+                ("smith", "article", 3, "Soil Viromes at & depth", "10.1234/a"),
+                ("web", "misc", 7, "Part one", "10.1234/B"),
+                (None, "text", 9, "", "10.1234/c"),
+            ],
+        )
+
+    def test_audit_reconciles_titles_and_searches_missing_dois(self) -> None:
+        bib = self.cache_dir / "refs.bib"
+        bib.write_text(
+            "@article{ok, title={Soil viromes at depth}, doi={10.1234/a}}\n"
+            "@article{dup, title={Soil viromes at depth}, doi={https://doi.org/10.1234/A}}\n"
+            "@article{wrong, title={Completely unrelated chemistry}, doi={10.1234/b}}\n"
+            "@article{gone, title={Lost}, doi={10.1234/gone}}\n"
+            "@article{bad, title={Bad}, doi={not-a-doi}}\n"
+            "@article{nodoi, title={Viral dark matter: a global survey}}\n"
+            "@article{unknown, title={Nothing like it}}\n",
+            encoding="utf-8",
+        )
+        session = _Session()
+        report = crossref_validator.audit_bibliography(self._client(session), bib)
+        statuses = {entry["key"]: entry["status"] for entry in report["entries"]}
+        self.assertEqual(
+            statuses,
+            {
+                "ok": "valid",
+                "dup": "valid",
+                "wrong": "title_mismatch",
+                "gone": "doi_not_found",
+                "bad": "invalid_doi",
+                "nodoi": "missing_doi",
+                "unknown": "missing_doi",
+            },
+        )
+        by_key = {entry["key"]: entry for entry in report["entries"]}
+        self.assertEqual(by_key["nodoi"]["suggested_doi"], "10.1234/found")
+        self.assertNotIn("suggested_doi", by_key["unknown"])
+        self.assertEqual(
+            (report["total_dois"], report["valid_dois"], report["invalid_dois"], report["missing_dois"]), (4, 2, 2, 2)
+        )
+        self.assertEqual(report["invalid_list"], ["10.1234/gone", "not-a-doi"])
+        self.assertEqual(sum(1 for _, params in session.calls if params and "filter" in params), 1)
+
+        warm = _Session()
+        self.assertEqual(crossref_validator.audit_bibliography(self._client(warm), bib), report)
+        self.assertEqual(warm.calls, [])
+
+    def test_token_bucket_spaces_requests_and_honours_headers(self) -> None:
+        bucket = crossref_validator.TokenBucket(rate=40)
+        started = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 4 / 40 - 0.01)
+
+        bucket.limit(crossref_validator.parse_rate_limit({"X-Rate-Limit-Limit": "5", "X-Rate-Limit-Interval": "1s"}))
+        self.assertEqual(bucket.rate, 5)
+        bucket.limit(50)
+        self.assertEqual(bucket.rate, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
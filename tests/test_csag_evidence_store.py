@@ -0,0 +1,147 @@
+"""Tests for the cross-paper CSAG evidence store."""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "skills" / "csag-extraction" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+MODULE_PATH = SCRIPTS_DIR / "csag_evidence_store.py"
+SPEC = importlib.util.spec_from_file_location("csag_evidence_store", MODULE_PATH)
+csag_evidence_store = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+sys.modules[SPEC.name] = csag_evidence_store
+SPEC.loader.exec_module(csag_evidence_store)
+
+
+def _extraction(paper_id: str, doi: str, strength: str) -> dict:
+    return {
+        "id": paper_id,
+        "title": f"Paper {paper_id}",
+        "doi": f"https://doi.org/{doi}",
+        "entities": [
+            {"id": "N1", "label": "Soil virus", "ontology_annotations": [{"term_id": "NCBITaxon:10239"}]},
+            {"id": "N2", "label": "Nitrogen fixation", "aliases": ["N2 fixation"]},
+        ],
+        "assertions": [
+            {"id": "A1", "assertion_text": "Soil viruses carry nifH", "claim_role": "result_claim", "subject": "N1", "object": "N2"},
+            {
+                "id": "A2",
+                "assertion_text": "Phage abundance tracks moisture",
+                "claim_role": "conclusion",
+                "contexts": [{"id": "C1", "organism": "NCBITaxon:562"}],
+            },
+        ],
+        "evidence_items": [{"id": "E1", "evidence_type": "observation", "evidence_text": "nifH in 12 vMAGs"}],
+        "evidence_links": [
+            {"id": "L1", "evidence_item": "E1", "assertion": "A1", "polarity": "supports", "strength": strength},
+            {"id": "L2", "evidence_item": "E1", "assertion": "A2", "polarity": "refutes", "strength": "weak"},
+        ],
+    }
+
+
+def _query(**overrides: object) -> argparse.Namespace:
+    values = {
+        "entity": None,
+        "entity_role": None,
+        "claim_role": None,
+        "criticality": None,
+        "polarity": None,
+        "min_strength": None,
+        "doi": None,
+        "text": None,
+        "valid_only": False,
+        "limit": 0,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+class EvidenceStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.paths = []
+        for stem, strength in (("alpha", "strong"), ("beta", "weak")):
+            folder = self.root / "work" / stem
+            folder.mkdir(parents=True)
+            path = folder / "paper_extraction.json"
+            path.write_text(json.dumps(_extraction(stem, f"10.1/{stem}", strength)), encoding="utf-8")
+            self.paths.append(path)
+        (self.paths[0].parent / "paper_extraction.validation.json").write_text('{"ok": true}', encoding="utf-8")
+        self.connection = csag_evidence_store.connect(self.root / "store.sqlite")
+
+    def tearDown(self) -> None:
+        self.connection.close()
+        self._tmp.cleanup()
+
+    def _rows(self, **overrides: object) -> list[tuple]:
+        sql, params = csag_evidence_store.build_query(_query(**overrides))
+        return [(row["extraction_id"], row["assertion_id"], row["link_id"]) for row in self.connection.execute(sql, params)]
+
+    def test_ingest_skips_unchanged_and_refreshes_edits(self) -> None:
+        paths = csag_evidence_store.collect_extractions([self.root / "work"], "paper_extraction.json")
+        self.assertEqual(csag_evidence_store.ingest(self.connection, paths)["ingested"], 2)
+        self.assertEqual(csag_evidence_store.ingest(self.connection, paths)["unchanged"], 2)
+
+        edited = _extraction("beta", "10.1/beta", "weak")
+        edited["assertions"].pop()
+        self.paths[1].write_text(json.dumps(edited), encoding="utf-8")
+        summary = csag_evidence_store.ingest(self.connection, paths)
+        self.assertEqual((summary["ingested"], summary["unchanged"]), (1, 1))
+        stats = csag_evidence_store.store_stats(self.connection)
+        self.assertEqual(stats["counts"]["papers"], 2)
+        self.assertEqual(stats["counts"]["assertions"], 3)
+
+    def test_entity_queries_match_across_papers(self) -> None:
+        csag_evidence_store.ingest(self.connection, self.paths)
+        self.assertEqual(
+            self._rows(entity=["ncbitaxon:10239"], polarity=["supports"], min_strength="strong"),
+            [("alpha", "A1", "L1")],
+        )
+        self.assertEqual(self._rows(entity=["N2 FIXATION"], entity_role="object"), [("alpha", "A1", "L1"), ("beta", "A1", "L1")])
+        self.assertEqual(self._rows(entity=["NCBITaxon:562"], doi="doi:10.1/BETA"), [("beta", "A2", "L2")])
+        self.assertEqual(self._rows(entity=["Soil virus", "Nitrogen fixation"], valid_only=True), [("alpha", "A1", "L1")])
+        self.assertEqual(self._rows(claim_role=["conclusion"], text="MOISTURE"), [("alpha", "A2", "L2"), ("beta", "A2", "L2")])
+        # Paper-local entity ids are not cross-paper search terms.
+        self.assertEqual(self._rows(entity=["N1"]), [])
+
+    def test_require_valid_and_duplicate_ids(self) -> None:
+        summary = csag_evidence_store.ingest(self.connection, self.paths, require_valid=True)
+        self.assertEqual((summary["ingested"], summary["skipped_invalid"]), (1, 1))
+
+        copy = self.root / "work" / "copy" / "paper_extraction.json"
+        copy.parent.mkdir()
+        copy.write_text(self.paths[0].read_text(encoding="utf-8"), encoding="utf-8")
+        summary = csag_evidence_store.ingest(self.connection, [copy])
+        self.assertEqual(summary["ingested"], 0)
+        self.assertIn("already ingested", summary["failed"][0]["error"])
+
+    def test_validation_status_follows_report_changes(self) -> None:
+        csag_evidence_store.ingest(self.connection, self.paths)
+        self.assertEqual(self._rows(valid_only=True, entity=["Soil virus"]), [("alpha", "A1", "L1")])
+
+        report = self.paths[0].parent / "paper_extraction.validation.json"
+        report.write_text('{"ok": false}', encoding="utf-8")
+        (self.paths[1].parent / report.name).write_text('{"ok": true}', encoding="utf-8")
+        summary = csag_evidence_store.ingest(self.connection, self.paths)
+        self.assertEqual((summary["unchanged"], summary["revalidated"], summary["ingested"]), (2, 2, 0))
+        self.assertEqual(self._rows(valid_only=True, entity=["Soil virus"]), [("beta", "A1", "L1")])
+
+        report.unlink()
+        summary = csag_evidence_store.ingest(self.connection, self.paths, require_valid=True)
+        self.assertEqual((summary["revalidated"], summary["skipped_invalid"]), (1, 1))
+        self.assertIsNone(
+            self.connection.execute("SELECT validation_ok FROM papers WHERE extraction_id = 'alpha'").fetchone()[0]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Tests for the CSAG quality report corpus mode."""
+
+from __future__ import annotations
+
+import csv
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MODULE_PATH = REPO_ROOT / "skills" / "csag-extraction" / "scripts" / "csag_quality_report.py"
+SPEC = importlib.util.spec_from_file_location("csag_quality_report", MODULE_PATH)
+csag_quality_report = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+sys.modules[SPEC.name] = csag_quality_report
+SPEC.loader.exec_module(csag_quality_report)
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pq = None
+
+
+def _extraction(paper_id: str, roles: list[str]) -> dict:
+    return {
+        "id": paper_id,
+        "title": f"Paper {paper_id}",
+        "assertions": [
+            {
+                "id": f"A{index}",
+                "assertion_text": "Soil viruses encode many auxiliary metabolic genes",
+                "claim_role": role,
+                "normalization_status": "raw",
+                "contexts": [{"id": "C1"}],
+                "text_spans": [{"section_type": "results"}] if index == 0 else [],
+            }
+            for index, role in enumerate(roles)
+        ],
+        "evidence_items": [{"id": "E1", "evidence_type": "observation"}],
+        "evidence_links": [
+            {"id": "L1", "evidence_item": "E1", "assertion": "A0", "polarity": "supports", "strength": "strong"}
+        ],
+    }
+
+
+class CorpusModeTests(unittest.TestCase):
+    def _corpus(self, root: Path) -> list[Path]:
+        for stem, roles in (("alpha", ["result_claim", "objective"]), ("beta", ["conclusion", "made_up"])):
+            folder = root / stem
+            folder.mkdir(parents=True)
+            (folder / "paper_extraction.json").write_text(json.dumps(_extraction(stem, roles)), encoding="utf-8")
+            (folder / f"{stem}.md").write_text("## Results\n\nData availability: accession PRJNA1.\n", encoding="utf-8")
+        return csag_quality_report.collect_corpus(root)
+
+    def test_rows_match_single_reports_and_are_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            paths = self._corpus(root)
+            cache_dir = root / csag_quality_report.CACHE_DIRNAME
+            self.assertEqual([path.parent.name for path in paths], ["alpha", "beta"])
+
+            rows = csag_quality_report.run_corpus(paths, workers=1, cache_dir=cache_dir)
+            self.assertEqual([row["status"] for row in rows], ["built", "built"])
+            self.assertEqual(rows[0]["source_markdown"], str(root / "alpha" / "alpha.md"))
+
+            single = csag_quality_report.build_report(
+                _extraction("alpha", ["result_claim", "objective"]),
+                (root / "alpha" / "alpha.md").read_text(encoding="utf-8"),
+            )
+            self.assertEqual(rows[0]["completeness_score"], single["completeness"]["score"])
+            self.assertEqual(rows[0]["issue_count"], len(single["issues"]))
+            self.assertEqual(rows[1]["claim_role__other"], 1)
+            self.assertAlmostEqual(rows[0]["grounding_coverage"], 1 / 4)
+
+            cached = csag_quality_report.run_corpus(paths, workers=1, cache_dir=cache_dir)
+            self.assertEqual([row["status"] for row in cached], ["cached", "cached"])
+            self.assertEqual([{**row, "status": None} for row in cached], [{**row, "status": None} for row in rows])
+
+            (root / "beta" / "beta.md").write_text("## Results\n\nChanged.\n", encoding="utf-8")
+            refreshed = csag_quality_report.run_corpus(paths, workers=1, cache_dir=cache_dir)
+            self.assertEqual([row["status"] for row in refreshed], ["cached", "built"])
+
+    def test_summary_totals_and_failed_documents(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            paths = self._corpus(root)
+            broken = root / "gamma" / "paper_extraction.json"
+            broken.parent.mkdir()
+            broken.write_text("[]", encoding="utf-8")
+
+            rows = csag_quality_report.run_corpus(paths + [broken], workers=1)
+            summary = csag_quality_report.corpus_summary(rows)
+
+        self.assertEqual(summary["documents"], 3)
+        self.assertEqual(summary["failed"][0]["path"], str(broken))
+        self.assertEqual(summary["distributions"]["claim_role"]["result_claim"], 1)
+        self.assertEqual(summary["distributions"]["claim_role"]["other"], 1)
+        self.assertEqual(summary["distributions"]["evidence_strength"]["strong"], 2)
+
+    def test_aggregate_writers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            rows = csag_quality_report.run_corpus(self._corpus(root), workers=1)
+
+            csag_quality_report.write_aggregate(rows, root / "agg.csv")
+            with (root / "agg.csv").open(encoding="utf-8") as handle:
+                self.assertEqual([row["extraction_id"] for row in csv.DictReader(handle)], ["alpha", "beta"])
+
+            csag_quality_report.write_aggregate(rows, root / "agg.jsonl")
+            lines = (root / "agg.jsonl").read_text(encoding="utf-8").splitlines()
+            self.assertEqual(json.loads(lines[1])["claim_role__conclusion"], 1)
+
+            if pq is not None:
+                csag_quality_report.write_aggregate(rows, root / "agg.parquet")
+                table = pq.read_table(root / "agg.parquet")
+                self.assertEqual(table.num_rows, 2)
+                self.assertIn("evidence_strength__strong", table.column_names)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,315 @@
+"""Tests for the exploratory-data-analysis analyzer script."""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import importlib.util
+import io
+import json
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MODULE_PATH = REPO_ROOT / "skills" / "exploratory-data-analysis" / "scripts" / "eda_analyzer.py"
+SPEC = importlib.util.spec_from_file_location("eda_analyzer", MODULE_PATH)
+eda_analyzer = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+sys.modules[SPEC.name] = eda_analyzer
+SPEC.loader.exec_module(eda_analyzer)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - optional dependency
+    pd = None
+
+try:
+    from PIL import Image, TiffImagePlugin
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+try:
+    import pysam
+except ImportError:  # pragma: no cover - optional dependency
+    pysam = None
+
+
+class MultiFileModeTests(unittest.TestCase):
+    def _write(self, path: Path, payload) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload), encoding="utf-8")
+
+    def test_collect_input_files_recurses_and_skips_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._write(root / "a.json", {"x": 1})
+            self._write(root / "nested" / "b.json", [1, 2])
+            (root / eda_analyzer.PROFILE_CACHE_FILENAME).write_text("{}", encoding="utf-8")
+
+            files = eda_analyzer.collect_input_files(str(root))
+            self.assertEqual([Path(f).name for f in files], ["a.json", "b.json"])
+
+            globbed = eda_analyzer.collect_input_files(str(root / "**" / "b.json"))
+            self.assertEqual([Path(f).name for f in globbed], ["b.json"])
+
+    def test_unchanged_files_are_served_from_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            first = root / "a.json"
+            second = root / "b.json"
+            self._write(first, {"x": 1})
+            self._write(second, [1, 2, 3])
+            cache = str(root / eda_analyzer.PROFILE_CACHE_FILENAME)
+            files = [str(first), str(second)]
+
+            analyses, hits = eda_analyzer.analyze_many(files, workers=1, cache_path=cache)
+            self.assertEqual(hits, 0)
+            self.assertEqual(analyses[1]["data_analysis"]["length"], 3)
+
+            cached, hits = eda_analyzer.analyze_many(files, workers=1, cache_path=cache)
+            self.assertEqual(hits, 2)
+            self.assertEqual(cached, analyses)
+
+            self._write(second, [1, 2, 3, 4])
+            stat = second.stat()
+            os.utime(second, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            refreshed, hits = eda_analyzer.analyze_many(files, workers=1, cache_path=cache)
+            self.assertEqual(hits, 1)
+            self.assertEqual(refreshed[1]["data_analysis"]["length"], 4)
+
+    def test_outdated_cache_version_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = Path(tmp) / "cache.json"
+            cache.write_text(json.dumps({"version": -1, "profiles": {"x": {}}}), encoding="utf-8")
+            self.assertEqual(eda_analyzer.load_profile_cache(str(cache)), {})
+
+    def test_combined_report_lists_every_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._write(root / "a.json", {"x": 1})
+            self._write(root / "b.json", [1])
+            analyses, _ = eda_analyzer.analyze_many(
+                [str(root / "a.json"), str(root / "b.json")], workers=1
+            )
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                report = eda_analyzer.generate_markdown_report(analyses)
+
+            self.assertIn("# Exploratory Data Analysis Report: 2 files", report)
+            self.assertIn(f"## {root / 'a.json'}", report)
+            self.assertIn(f"## {root / 'b.json'}", report)
+            self.assertEqual(report.count("## Recommendations for Further Analysis"), 1)
+
+
+@unittest.skipUnless(pd is not None, "pandas not installed")
+class StreamingTableProfileTests(unittest.TestCase):
+    def test_chunked_profile_matches_whole_table(self) -> None:
+        frame = pd.DataFrame(
+            {
+                "abundance": [float(i) if i % 5 else None for i in range(1, 101)],
+                "taxon": [f"t{i % 7}" for i in range(100)],
+            }
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "table.tsv"
+            frame.to_csv(path, sep="\t", index=False)
+            with patch.object(eda_analyzer, "TABULAR_CHUNK_ROWS", 17):
+                results = eda_analyzer.analyze_general_scientific(str(path), "tsv")
+
+        self.assertEqual(results["shape"], (100, 2))
+        self.assertEqual(results["missing_values"], {"abundance": 20, "taxon": 0})
+        stats = results["summary_statistics"]["abundance"]
+        expected = frame["abundance"].describe()
+        self.assertEqual(stats["count"], 80)
+        self.assertAlmostEqual(stats["mean"], expected["mean"])
+        self.assertAlmostEqual(stats["std"], expected["std"])
+        self.assertEqual((stats["min"], stats["max"]), (expected["min"], expected["max"]))
+        self.assertAlmostEqual(stats["50%"], expected["50%"])
+        self.assertNotIn("taxon", results["summary_statistics"])
+        self.assertEqual(results["distinct_counts"], {"abundance": 80, "taxon": 7})
+        self.assertEqual(results["profiling"]["quantiles"], "exact")
+
+    def test_distinct_counts_ignore_chunk_dtype_changes(self) -> None:
+        rows = ["count,flag"] + [f"{i % 10},{i % 2 == 0}" for i in range(100)]
+        rows[75] = ","
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "table.csv"
+            path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+            with patch.object(eda_analyzer, "TABULAR_CHUNK_ROWS", 30):
+                results = eda_analyzer.analyze_general_scientific(str(path), "csv")
+
+        self.assertEqual(results["dtypes"]["count"], "float64")
+        self.assertEqual(results["distinct_counts"], {"count": 10, "flag": 2})
+
+
+@unittest.skipUnless(np is not None, "numpy not installed")
+class ArrayStatisticsTests(unittest.TestCase):
+    def test_npy_statistics_are_exact_across_slabs(self) -> None:
+        data = np.arange(3000, dtype=np.float64).reshape(1000, 3) / 7.0
+        data[5, 1] = np.nan
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "embedding.npy"
+            np.save(path, data)
+            with patch.object(eda_analyzer, "ARRAY_SLAB_BYTES", 240):
+                results = eda_analyzer.analyze_general_scientific(str(path), "npy")
+
+        finite = data[np.isfinite(data)]
+        stats = results["statistics"]
+        self.assertEqual(results["shape"], (1000, 3))
+        self.assertAlmostEqual(stats["mean"], float(finite.mean()))
+        self.assertAlmostEqual(stats["std"], float(finite.std()))
+        self.assertEqual((stats["min"], stats["max"]), (float(finite.min()), float(finite.max())))
+        self.assertEqual(stats["nan_count"], 1)
+
+    def test_slabs_align_to_chunk_rows(self) -> None:
+        class RecordingArray:
+            def __init__(self, array):
+                self.array = array
+                self.shape = array.shape
+                self.ndim = array.ndim
+                self.dtype = array.dtype
+                self.slices = []
+
+            def __getitem__(self, key):
+                self.slices.append(key)
+                return self.array[key]
+
+        array = RecordingArray(np.ones((100, 4), dtype=np.int32))
+        eda_analyzer.array_statistics(array, chunk_rows=16, slab_bytes=16 * 4 * 4 * 2 + 8)
+        self.assertTrue(all(key.start % 32 == 0 for key in array.slices))
+
+    def test_sample_indices_are_evenly_spaced(self) -> None:
+        self.assertEqual(eda_analyzer._sample_indices(3, 8), [0, 1, 2])
+        self.assertEqual(eda_analyzer._sample_indices(100, 3), [0, 50, 99])
+
+
+@unittest.skipUnless(Image is not None and np is not None, "pillow/numpy not installed")
+class ImagingTests(unittest.TestCase):
+    def test_pillow_fallback_counts_pages_from_ifd_chain(self) -> None:
+        pages = [Image.fromarray(np.full((4, 6), value, dtype=np.uint8)) for value in range(10, 60, 10)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "stack.tif"
+            pages[0].save(path, save_all=True, append_images=pages[1:])
+            self.assertEqual(eda_analyzer._tiff_page_count(path), 5)
+            n_frames = PropertyMock(side_effect=AssertionError("walked every frame"))
+            with patch.dict(sys.modules, {"tifffile": None}), patch.object(
+                TiffImagePlugin.TiffImageFile, "n_frames", new_callable=lambda: n_frames
+            ):
+                results = eda_analyzer.analyze_imaging(str(path), "tif", metadata_only=True)
+            self.assertEqual(results["page_count"], 5)
+
+            # BigTIFF header: version 43, 8-byte offsets, one empty IFD at byte 16.
+            bigtiff = Path(tmp) / "big.tif"
+            bigtiff.write_bytes(b"II+\x00\x08\x00\x00\x00" + struct.pack("<3Q", 16, 0, 0))
+            self.assertEqual(eda_analyzer._tiff_page_count(bigtiff), 1)
+
+
+def _bam_header(references: list[tuple[str, int]]) -> bytes:
+    text = b"@HD\tVN:1.6\tSO:coordinate\n@PG\tID:bwa\tPN:bwa\n"
+    payload = b"BAM\x01" + struct.pack("<i", len(text)) + text + struct.pack("<i", len(references))
+    for name, length in references:
+        encoded = name.encode() + b"\x00"
+        payload += struct.pack("<i", len(encoded)) + encoded + struct.pack("<i", length)
+    return gzip.compress(payload)
+
+
+def _bai(counts: list[tuple[int, int]], no_coordinate: int) -> bytes:
+    payload = b"BAI\x01" + struct.pack("<i", len(counts))
+    for mapped, unmapped in counts:
+        # One ordinary bin with one chunk, then the pseudo-bin carrying counts.
+        payload += struct.pack("<i", 2)
+        payload += struct.pack("<Ii2Q", 4681, 1, 0, 100)
+        payload += struct.pack("<Ii4Q", 37450, 2, 0, 100, mapped, unmapped)
+        payload += struct.pack("<i", 1) + struct.pack("<Q", 0)
+    return payload + struct.pack("<Q", no_coordinate)
+
+
+class IndexSummaryTests(unittest.TestCase):
+    def test_bam_counts_come_from_index_without_reading_records(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            bam = Path(tmp) / "sample.bam"
+            bam.write_bytes(_bam_header([("chr1", 1000), ("chr2", 500), ("chr3", 10)]))
+            Path(f"{bam}.bai").write_bytes(_bai([(120, 3), (0, 0), (7, 1)], no_coordinate=9))
+
+            results = eda_analyzer.analyze_bioinformatics(str(bam), "bam", metadata_only=True)
+
+        self.assertEqual(results["index"]["format"], "BAI")
+        self.assertEqual(results["mapped_reads"], 127)
+        self.assertEqual(results["unmapped_reads"], 13)
+        self.assertEqual(results["contigs_with_reads"], 2)
+        self.assertEqual(results["header"]["programs"], ["bwa"])
+        self.assertEqual(
+            [(row["contig"], row["mapped"]) for row in results["per_contig"]],
+            [("chr1", 120), ("chr3", 7), ("chr2", 0)],
+        )
+        self.assertNotIn("sampled", results)
+
+    def test_missing_index_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            bam = Path(tmp) / "sample.bam"
+            bam.write_bytes(_bam_header([("chr1", 1000)]))
+            results = eda_analyzer.analyze_bioinformatics(str(bam), "bam", metadata_only=True)
+
+        self.assertIsNone(results["index"]["path"])
+        self.assertIn("samtools index", results["index"]["note"])
+
+    def test_index_candidates_follow_the_file_format(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for name in ("sample.bam", "sample.bai", "sample.cram", "calls.vcf.gz", "calls.vcf.gz.bai"):
+                (root / name).write_bytes(b"")
+            self.assertEqual(eda_analyzer.find_index(root / "sample.bam"), str(root / "sample.bai"))
+            self.assertIsNone(eda_analyzer.find_index(root / "sample.cram"))
+            self.assertIsNone(eda_analyzer.find_index(root / "calls.vcf.gz"))
+            (root / "sample.cram.crai").write_bytes(b"")
+            (root / "calls.vcf.gz.tbi").write_bytes(b"")
+            self.assertEqual(eda_analyzer.find_index(root / "sample.cram"), str(root / "sample.cram.crai"))
+            self.assertEqual(eda_analyzer.find_index(root / "calls.vcf.gz"), str(root / "calls.vcf.gz.tbi"))
+
+    def test_sample_regions_follow_index_bins(self) -> None:
+        references = [("chr1", 248_956_422), ("chr2", 1_000)]
+        counts = [{"mapped": 5}, {"mapped": 0}]
+        tiles = eda_analyzer._sample_regions(references, counts, "mapped", 4)
+        self.assertEqual(tiles[0][:2], ("chr1", 0))
+        self.assertEqual(len(tiles), 4)
+        bins = [[(0, 16_384), (0, 131_072), (16_384, 32_768), (1 << 26, (1 << 26) + 16_384)], []]
+        self.assertEqual(
+            eda_analyzer._sample_regions(references, counts, "mapped", 2, bins),
+            [("chr1", 0, 16_384), ("chr1", 1 << 26, (1 << 26) + 16_384)],
+        )
+        self.assertEqual(eda_analyzer._bin_span(4681 + 3, 14, 5), (3 * 16_384, 4 * 16_384))
+        self.assertEqual(eda_analyzer._bin_span(1, 14, 5), (0, 1 << 26))
+
+    @unittest.skipUnless(pysam is not None, "pysam not installed")
+    def test_sparse_indexed_vcf_is_sampled(self) -> None:
+        header = "##fileformat=VCFv4.2\n##contig=<ID=chr1,length=248956422>\n"
+        header += "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+        rows = "".join(f"chr1\t{pos}\t.\tA\tG\t50\tPASS\t.\n" for pos in range(10, 3001, 10))
+        with tempfile.TemporaryDirectory() as tmp:
+            vcf = Path(tmp) / "calls.vcf"
+            vcf.write_text(header + rows, encoding="utf-8")
+            bgzipped = pysam.tabix_index(str(vcf), preset="vcf")
+            results = eda_analyzer.summarize_variants(bgzipped, "vcf")
+
+        self.assertEqual(results["record_count"], 300)
+        self.assertEqual(results["sampled"]["records_sampled"], 300)
+        self.assertEqual(results["sampled"]["pass_fraction"], 1.0)
+        self.assertEqual(results["sampled"]["qual"]["50%"], 50.0)
+
+    def test_compressed_suffix_is_looked_through(self) -> None:
+        self.assertEqual(eda_analyzer.detect_file_type("calls.vcf.gz")[:2], ("vcf", "bioinformatics_genomics"))
+        self.assertEqual(eda_analyzer.detect_file_type("reads.fastq.gz")[0], "fastq")
+
+
+if __name__ == "__main__":
+    unittest.main()
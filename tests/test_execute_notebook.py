@@ -0,0 +1,180 @@
+"""Tests for the batch notebook executor."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    import ipykernel  # noqa: F401
+    import nbclient  # noqa: F401
+    import nbformat
+    from nbformat.v4 import new_code_cell, new_markdown_cell, new_notebook
+except ImportError:  # pragma: no cover - optional dependency
+    nbformat = None
+
+try:
+    import dill
+except ImportError:  # pragma: no cover - optional dependency
+    dill = None
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MODULE_PATH = REPO_ROOT / "skills" / "notebooks" / "scripts" / "execute_notebook.py"
+if nbformat is not None:
+    SPEC = importlib.util.spec_from_file_location("execute_notebook", MODULE_PATH)
+    execute_notebook = importlib.util.module_from_spec(SPEC)
+    assert SPEC.loader is not None
+    sys.modules[SPEC.name] = execute_notebook
+    SPEC.loader.exec_module(execute_notebook)
+
+
+class _FakeKernel:
+    def __init__(self, key: tuple) -> None:
+        self.key = key
+        self.alive = True
+
+    async def is_alive(self) -> bool:
+        return self.alive
+
+    async def shutdown_kernel(self, now: bool = False) -> None:
+        self.alive = False
+
+
+def _write(path: Path, *sources: str) -> None:
+    nb = new_notebook(cells=[new_markdown_cell("# Analysis"), *(new_code_cell(source) for source in sources)])
+    nb.metadata["kernelspec"] = {"name": "python3", "display_name": "Python 3", "language": "python"}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    nbformat.write(nb, str(path))
+
+
+@unittest.skipUnless(nbformat is not None, "nbformat/nbclient/ipykernel not installed")
+class ExecuteNotebookTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.src = self.root / "notebooks"
+        _write(self.src / "a.ipynb", "import os\ncwd = os.getcwd()", "print(cwd)")
+        _write(self.src / "b.ipynb", "x = 2", "print(x * 21)")
+        _write(self.src / "nested" / "broken.ipynb", "y = 1", "1 / 0", "print('unreachable')")
+        _write(self.src / "a.executed.ipynb", "raise SystemExit('outputs are not inputs')")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_jobs_mirror_directories_and_skip_outputs(self) -> None:
+        out_dir = self.root / "out"
+        jobs = execute_notebook.collect_jobs([self.src], out_dir)
+        self.assertEqual(
+            [(str(nb.relative_to(self.src)), str(out.relative_to(out_dir))) for nb, out in jobs],
+            [
+                ("a.ipynb", "a.executed.ipynb"),
+                ("b.ipynb", "b.executed.ipynb"),
+                ("nested/broken.ipynb", "nested/broken.executed.ipynb"),
+            ],
+        )
+        self.assertEqual(
+            execute_notebook.checkpoint_path(out_dir / "a.executed.ipynb"), out_dir / "a.checkpoint.ipynb"
+        )
+
+    def test_batch_run_records_timing_checkpoints_failures_and_resumes(self) -> None:
+        out_dir = self.root / "out"
+        jobs = execute_notebook.collect_jobs([self.src], out_dir)
+        results = execute_notebook.execute_notebooks(jobs, workers=2, timeout_s=60)
+        self.assertEqual([result.status for result in results], ["ok", "ok", "error"])
+
+        executed = nbformat.read(str(out_dir / "a.executed.ipynb"), as_version=4)
+        nbformat.validate(executed)
+        self.assertEqual(executed.cells[2].outputs[0]["text"].strip(), str(self.src))
+        self.assertTrue(all(isinstance(cell.metadata["execution_duration_s"], float) for cell in executed.cells[1:]))
+        self.assertEqual(executed.metadata["execute_notebook"]["status"], "ok")
+
+        broken = results[2]
+        self.assertEqual((broken.failed_cell, broken.cells_executed), (2, 2))
+        self.assertEqual(broken.error, "ZeroDivisionError: division by zero")
+        self.assertFalse((out_dir / "nested" / "broken.executed.ipynb").exists())
+        checkpoint = nbformat.read(broken.checkpoint, as_version=4)
+        self.assertEqual([len(cell.get("outputs", [])) for cell in checkpoint.cells], [0, 0, 1, 0])
+
+        _write(self.src / "b.ipynb", "x = 3", "print(x * 21)")
+        again = execute_notebook.execute_notebooks(jobs, workers=1, timeout_s=60, resume=True)
+        self.assertEqual([result.status for result in again], ["skipped", "ok", "error"])
+        rerun = json.loads((out_dir / "b.executed.ipynb").read_text(encoding="utf-8"))
+        self.assertEqual(rerun["cells"][2]["outputs"][0]["text"], ["63\n"])
+
+    @unittest.skipUnless(dill is not None, "dill not installed")
+    def test_cell_cache_replays_unchanged_prefix_and_resumes_from_snapshot(self) -> None:
+        data = self.src / "data.txt"
+        data.write_text("a b c", encoding="utf-8")
+        notebook = self.src / "eda.ipynb"
+        out = self.root / "eda.executed.ipynb"
+        cache = execute_notebook.CellCache(self.root / "cache", snapshot_after_s=0)
+
+        def run(last: str) -> object:
+            _write(notebook, "words = open('data.txt').read().split()", "n = len(words)", last)
+            nb = nbformat.read(str(notebook), as_version=4)
+            nb.cells[1].metadata["cache_inputs"] = ["data.txt"]
+            nbformat.write(nb, str(notebook))
+            return execute_notebook.execute_notebook(notebook, out, timeout_s=60, cache=cache)
+
+        def printed() -> str:
+            return nbformat.read(str(out), as_version=4).cells[3].outputs[0]["text"]
+
+        first = run("print(n * 2)")
+        self.assertEqual((first.status, first.cells_replayed, first.cells_executed), ("ok", 0, 3))
+
+        warm = run("print(n * 2)")
+        self.assertEqual((warm.cells_replayed, warm.cells_executed), (3, 0))
+        self.assertEqual(printed(), "6\n")
+        self.assertTrue(nbformat.read(str(out), as_version=4).cells[3].metadata["execution_cached"])
+
+        edited = run("print(n * 3)")
+        self.assertEqual((edited.cells_replayed, edited.cells_executed), (2, 1))
+        self.assertEqual(printed(), "9\n")
+        executed = nbformat.read(str(out), as_version=4)
+        self.assertEqual([cell.get("execution_count") for cell in executed.cells[1:]], [1, 2, 3])
+        self.assertNotIn("execution_cached", executed.cells[3].metadata)
+
+        data.write_text("a b c d", encoding="utf-8")
+        changed = run("print(n * 3)")
+        self.assertEqual((changed.cells_replayed, changed.cells_executed), (0, 3))
+        self.assertEqual(printed(), "12\n")
+
+    def test_prestarted_kernels_wait_for_a_job_with_their_key(self) -> None:
+        pool = execute_notebook.KernelPool()
+        with mock.patch.object(execute_notebook.KernelPool, "_start", side_effect=lambda *key: _FakeKernel(key)):
+            pool.prestart("python3", "/a")
+            pool.prestart("python3", "/a")
+            waiting = pool.take("python3", "/a")
+            other = pool.take("python3", "/b")
+            self.assertEqual((waiting.key, other.key), (("python3", "/a"), ("python3", "/b")))
+            self.assertIsNot(pool.take("python3", "/a"), waiting)
+
+            pool.prestart("ir", "/a")
+            pool.take("python3", "/a")
+            (leftover,) = pool._idle[("ir", "/a")]
+            self.assertTrue(leftover.alive)
+            pool.close()
+            self.assertFalse(leftover.alive)
+
+    def test_fully_cached_batch_starts_no_kernel(self) -> None:
+        out_dir = self.root / "out"
+        jobs = execute_notebook.collect_jobs([self.src / "a.ipynb", self.src / "b.ipynb"], out_dir)
+        cache = execute_notebook.CellCache(self.root / "cache")
+        cold = execute_notebook.execute_notebooks(jobs, workers=1, timeout_s=60, cache=cache)
+        self.assertEqual([(result.status, result.cells_replayed) for result in cold], [("ok", 0), ("ok", 0)])
+        self.assertTrue(all(cache.fully_cached(notebook, None) for notebook, _ in jobs))
+
+        with mock.patch.object(execute_notebook.KernelPool, "_start", side_effect=AssertionError("kernel started")):
+            warm = execute_notebook.execute_notebooks(jobs, workers=1, timeout_s=60, cache=cache)
+        self.assertEqual([(result.status, result.cells_replayed) for result in warm], [("ok", 2), ("ok", 2)])
+        replayed = nbformat.read(str(out_dir / "b.executed.ipynb"), as_version=4)
+        self.assertEqual(replayed.cells[2].outputs[0]["text"], "42\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
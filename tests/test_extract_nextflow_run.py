@@ -0,0 +1,111 @@
+"""Tests for the streaming Nextflow run manifest extractor."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MODULE_PATH = REPO_ROOT / "skills" / "bio-workflow-methods-docwriter" / "scripts" / "extract_nextflow_run.py"
+if yaml is not None:
+    SPEC = importlib.util.spec_from_file_location("extract_nextflow_run", MODULE_PATH)
+    extract_nextflow_run = importlib.util.module_from_spec(SPEC)
+    assert SPEC.loader is not None
+    SPEC.loader.exec_module(extract_nextflow_run)
+
+TRACE_HEADER = "task_id\thash\tname\tstatus\texit\tduration\trealtime\t%cpu\tpeak_rss\tpeak_vmem\n"
+
+
+@unittest.skipUnless(yaml is not None, "pyyaml not installed")
+class ExtractNextflowRunTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.work = self.root / "work"
+        tasks = {
+            "ab/12cdef0123": ".command.sh",
+            "ab/12cdff9999": ".command.sh",
+            "cd/777aaa0000": ".command.run",
+            "ef/999bbb0000": None,
+        }
+        for name, command_file in tasks.items():
+            folder = self.work / name
+            folder.mkdir(parents=True)
+            if command_file:
+                (folder / command_file).write_text("#!/bin/bash -ue\nsamtools sort in.bam\n", encoding="utf-8")
+        rows = [
+            ("1", "ab/12cdef", "SORT (a)"),
+            ("2", "ab/12cd", "SORT (b)"),
+            ("3", "cd/777aaa", "INDEX (a)"),
+            ("4", "ef/999bbb", "STATS (a)"),
+            ("5", "", ""),
+        ]
+        lines = [f"{task_id}\t{task_hash}\t{name}\tCOMPLETED\t0\t1m\t58s\t97.5%\t1 GB\t2 GB\n" for task_id, task_hash, name in rows]
+        self.trace = self.root / "trace.txt"
+        self.trace.write_text(TRACE_HEADER + "".join(lines), encoding="utf-8")
+
+    def tearDown(self) -> None:
+        extract_nextflow_run.list_bucket.cache_clear()
+        self._tmp.cleanup()
+
+    def _run(self, out: Path, *extra: str) -> None:
+        argv = [
+            "extract_nextflow_run.py",
+            "--trace", str(self.trace),
+            "--workdir", str(self.work),
+            "--out", str(out),
+            "--pipeline-name", "rnaseq",
+            *extra,
+        ]
+        with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(io.StringIO()):
+            extract_nextflow_run.main()
+
+    def test_abbreviated_hashes_resolve_without_guessing(self) -> None:
+        workdir = str(self.work)
+        self.assertTrue(extract_nextflow_run.resolve_task_dir(workdir, "ab/12cdef").endswith("12cdef0123"))
+        self.assertIsNone(extract_nextflow_run.resolve_task_dir(workdir, "ab/12cd"))
+        self.assertIsNone(extract_nextflow_run.resolve_task_dir(workdir, "zz/000000"))
+        self.assertTrue(extract_nextflow_run.resolve_task_dir(workdir, "ef/999bbb0000").endswith("999bbb0000"))
+
+    def test_streamed_outputs_match_a_single_dump(self) -> None:
+        self._run(self.root / "a.json", "--workers", "1")
+        self._run(self.root / "b.json", "--workers", "4")
+        self._run(self.root / "c.yaml")
+        text = (self.root / "a.json").read_text(encoding="utf-8")
+        manifest = json.loads(text)
+        self.assertEqual(text, json.dumps(manifest, indent=2))
+        self.assertEqual(text, (self.root / "b.json").read_text(encoding="utf-8"))
+        self.assertEqual(yaml.safe_load((self.root / "c.yaml").read_text(encoding="utf-8")), manifest)
+
+        steps = manifest["steps"]
+        self.assertEqual([step["step_id"] for step in steps], [f"nf-task-{i}" for i in range(1, 6)])
+        self.assertEqual([step["command"] != "NOT CAPTURED" for step in steps], [True, False, True, False, False])
+        self.assertEqual([bool(step["workdir"]) for step in steps], [True, False, True, True, False])
+        self.assertEqual(steps[4]["name"], "task_5")
+        self.assertNotIn("commands", manifest)
+
+    def test_dedup_commands_store_each_body_once(self) -> None:
+        self._run(self.root / "d.yaml", "--dedup-commands")
+        manifest = yaml.safe_load((self.root / "d.yaml").read_text(encoding="utf-8"))
+        self.assertEqual(len(manifest["commands"]), 1)
+        digest, body = next(iter(manifest["commands"].items()))
+        self.assertEqual(body, "#!/bin/bash -ue\nsamtools sort in.bam\n")
+        referenced = [step for step in manifest["steps"] if step["command"] != "NOT CAPTURED"]
+        self.assertEqual([step["command"] for step in referenced], [f"sha256:{digest}"] * 2)
+        self.assertEqual({step["command_sha256"] for step in referenced}, {digest})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Tests for the notebook structure linter."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "skills" / "notebooks" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+SPEC = importlib.util.spec_from_file_location("lint_notebook_structure", SCRIPTS_DIR / "lint_notebook_structure.py")
+lint_notebook_structure = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+sys.modules[SPEC.name] = lint_notebook_structure
+SPEC.loader.exec_module(lint_notebook_structure)
+
+
+def _write(path: Path, *cells: tuple[str, str]) -> Path:
+    nb = {
+        "cells": [{"cell_type": kind, "metadata": {}, "source": source.splitlines(True)} for kind, source in cells],
+        "metadata": {},
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(nb), encoding="utf-8")
+    return path
+
+
+class LintNotebookStructureTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.good = _write(self.root / "repo" / "a" / "good.ipynb", ("markdown", "# Title"), ("code", "x = 1\ny = 2"))
+        self.bad = _write(
+            self.root / "repo" / "b" / "bad.ipynb",
+            ("code", "import os"),
+            ("markdown", "# Later"),
+            ("code", "\n".join(["pass"] * 4)),
+            ("code", "pass"),
+        )
+        _write(self.root / "repo" / "a" / ".ipynb_checkpoints" / "good-checkpoint.ipynb", ("code", "x"))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_json_reader_applies_rules_without_nbformat(self) -> None:
+        self.assertEqual(lint_notebook_structure.lint_notebook(self.good), [])
+        self.assertEqual(
+            lint_notebook_structure.lint_notebook(self.bad, max_code_lines=3, require_local_pixi=True),
+            [
+                "First cell must be a non-empty markdown intro/title cell.",
+                "Code cell #0 must be preceded by a non-empty markdown cell.",
+                "Code cell #3 must be preceded by a non-empty markdown cell.",
+                f"Missing pixi.toml next to notebook: expected {self.bad.parent / 'pixi.toml'}",
+                "WARNING: Code cell #2 has 4 lines (> 3). Consider splitting it.",
+            ],
+        )
+
+        v3 = self.root / "v3.ipynb"
+        v3.write_text(
+            json.dumps(
+                {
+                    "nbformat": 3,
+                    "worksheets": [
+                        {
+                            "cells": [
+                                {"cell_type": "heading", "level": 1, "source": "T"},
+                                {"cell_type": "code", "input": "1"},
+                                {"cell_type": "markdown", "source": ["Then ", "more"]},
+                                {"cell_type": "code", "input": ["2\n", "3"]},
+                                {"cell_type": "heading", "level": 2, "source": ""},
+                                {"cell_type": "code", "input": "4"},
+                            ]
+                        }
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+        self.assertEqual(lint_notebook_structure.lint_notebook(v3), [])
+
+        broken = self.root / "broken.ipynb"
+        broken.write_text('{"cells": [', encoding="utf-8")
+        self.assertTrue(lint_notebook_structure.lint_notebook(broken)[0].startswith("Unreadable notebook JSON"))
+
+    def test_directories_are_linted_in_parallel_and_cached_by_mtime(self) -> None:
+        notebooks = list(lint_notebook_structure.iter_notebooks([self.root / "repo", self.good]))
+        self.assertEqual(notebooks, [self.good, self.bad])
+
+        def run(**kwargs) -> list[dict]:
+            cache = lint_notebook_structure.LintCache(self.root / "cache", max_code_lines=50, validate=False)
+            return lint_notebook_structure.lint_notebooks(
+                notebooks, require_local_pixi=True, workers=2, cache=cache, **kwargs
+            )
+
+        with mock.patch.object(lint_notebook_structure, "MIN_PARALLEL_NOTEBOOKS", 1):
+            cold = run()
+        self.assertEqual([item["cached"] for item in cold], [False, False])
+        self.assertEqual([len(item["errors"]) for item in cold], [1, 4])
+
+        (self.good.parent / "pixi.toml").write_text("", encoding="utf-8")
+        warm = run()
+        self.assertEqual([item["cached"] for item in warm], [True, True])
+        self.assertEqual(warm[0]["errors"], [])
+        self.assertEqual(warm[1], cold[1] | {"cached": True})
+
+        _write(self.bad, ("markdown", "# Fixed"), ("code", "pass"))
+        stat = self.bad.stat()
+        os.utime(self.bad, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        edited = run()
+        self.assertEqual([item["cached"] for item in edited], [True, False])
+        self.assertEqual(len(edited[1]["errors"]), 1)
+        self.assertEqual(
+            lint_notebook_structure.summarize(edited),
+            {"notebooks": 2, "with_errors": 1, "with_warnings": 0, "cached": 1},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Tests for the Nextflow resource-usage report."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "skills" / "bio-workflow-methods-docwriter" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+SPEC = importlib.util.spec_from_file_location("nextflow_resource_report", SCRIPTS_DIR / "nextflow_resource_report.py")
+nextflow_resource_report = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+sys.modules[SPEC.name] = nextflow_resource_report
+# The report only reads TSV traces, so it must load without PyYAML.
+with mock.patch.dict(sys.modules, {"yaml": None}):
+    SPEC.loader.exec_module(nextflow_resource_report)
+
+HEADER = "task_id\thash\tname\tstatus\texit\tsubmit\tduration\trealtime\t%cpu\tpeak_rss\tcpus\tmemory\ttime\n"
+ROWS = [
+    # task_id, name, status, exit, submit, duration, realtime, %cpu, peak_rss, cpus, memory, time
+    ("1", "QC (a)", "COMPLETED", "0", "2024-01-01 08:00:00.000", "1m 10s", "1m", "150.0%", "1 GB", "2", "4 GB", "1h"),
+    ("2", "QC (b)", "COMPLETED", "0", "2024-01-01 08:00:00.000", "2m 5s", "2m", "50.0%", "512 MB", "2", "4 GB", "1h"),
+    ("3", "QC (c)", "CACHED", "0", "2024-01-01 07:00:00.000", "3h", "3h", "100.0%", "3 GB", "2", "4 GB", "1h"),
+    ("4", "ALIGN (a)", "COMPLETED", "0", "2024-01-01 08:02:10.000", "1h 0m 30s", "1h", "400.0%", "6 GB", "8", "32 GB", "4h"),
+    ("5", "ALIGN (b)", "FAILED", "137", "2024-01-01 08:02:10.000", "10m", "10m", "-", "-", "8", "32 GB", "4h"),
+    ("6", "MERGE", "COMPLETED", "0", "2024-01-01 09:03:00.000", "30m 5s", "30m", "90.0%", "2 GB", "1", "2 GB", "1h"),
+]
+
+
+class NextflowResourceReportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.trace = Path(self._tmp.name) / "trace.txt"
+        lines = ["\t".join((row[0], f"{int(row[0]):02x}/abcdef", *row[1:])) + "\n" for row in ROWS]
+        self.trace.write_text(HEADER + "".join(lines), encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_units_parse_in_formatted_and_raw_traces(self) -> None:
+        self.assertEqual(nextflow_resource_report.parse_duration("1d 2h 3m 4.5s"), 93784.5)
+        self.assertAlmostEqual(nextflow_resource_report.parse_duration("350ms"), 0.35)
+        self.assertEqual(nextflow_resource_report.parse_duration("93784500"), 93784.5)
+        self.assertIsNone(nextflow_resource_report.parse_duration("soon"))
+        self.assertEqual(nextflow_resource_report.parse_memory("1.5 GB"), 1.5 * 1024 ** 3)
+        self.assertEqual(nextflow_resource_report.parse_memory("2048"), 2048.0)
+        self.assertIsNone(nextflow_resource_report.parse_memory("-"))
+        self.assertEqual(nextflow_resource_report.parse_timestamp("1704096000000"), 1704096000.0)
+        self.assertEqual(
+            nextflow_resource_report.parse_timestamp("2024-01-01 08:00:01.500")
+            - nextflow_resource_report.parse_timestamp("2024-01-01 08:00:00"),
+            1.5,
+        )
+
+    def test_process_aggregates_and_right_sizing(self) -> None:
+        report = nextflow_resource_report.build_report(nextflow_resource_report.read_tasks(self.trace))
+        processes = {item["process"]: item for item in report["processes"]}
+        self.assertEqual(list(processes), ["ALIGN", "MERGE", "QC"])
+
+        qc = processes["QC"]
+        self.assertEqual((qc["tasks"], qc["executed"], qc["cached"]), (3, 2, 1))
+        self.assertEqual(qc["realtime_s"]["p50"], 90.0)
+        self.assertAlmostEqual(qc["cpu_efficiency"], (1.5 * 60 + 0.5 * 120) / (2 * 180))
+        self.assertEqual(qc["memory_utilization_max"], 0.25)
+        self.assertEqual(qc["suggested"]["memory_bytes"], 2 * 1024 ** 3)
+        self.assertEqual(qc["suggested"]["cpus"], 2)
+
+        align = processes["ALIGN"]
+        self.assertEqual(align["limit_failures"], 1)
+        self.assertEqual(align["suggested"]["memory_bytes"], 48 * 1024 ** 3)
+        self.assertEqual([item["process"] for item in report["right_sizing"]][0], "ALIGN")
+        self.assertGreater(processes["MERGE"]["memory_utilization_max"], 0.99)
+
+    def test_critical_path_follows_the_latest_predecessor(self) -> None:
+        report = nextflow_resource_report.build_report(nextflow_resource_report.read_tasks(self.trace))
+        path = report["critical_path"]
+        self.assertEqual([step["task_id"] for step in path["tasks"]], ["2", "4", "6"])
+        self.assertEqual(list(path["by_process"]), ["ALIGN", "MERGE", "QC"])
+        self.assertEqual(path["length_s"], 3600 + 33 * 60 + 5)
+
+    def test_missing_requested_fields_are_not_guessed(self) -> None:
+        row = dict(zip(HEADER.split(), ("1", "ab/cdef", *ROWS[0][1:])))
+        for key in ("cpus", "memory", "time"):
+            del row[key]
+        report = nextflow_resource_report.build_report([nextflow_resource_report.parse_task(row, 1)])
+        self.assertFalse(report["requested_fields_captured"])
+        self.assertEqual(report["processes"][0]["suggested"], "NOT CAPTURED")
+        self.assertIsNone(report["processes"][0]["cpu_efficiency"])
+        self.assertEqual(report["right_sizing"], [])
+        self.assertIn("NOT CAPTURED", nextflow_resource_report.render_summary(report, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,475 @@
+"""Tests for the pdf-to-md batch conversion helpers."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "skills" / "pdf-to-md" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+SPEC = importlib.util.spec_from_file_location("batch_convert", SCRIPTS_DIR / "batch_convert.py")
+batch_convert = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+sys.modules[SPEC.name] = batch_convert
+SPEC.loader.exec_module(batch_convert)
+
+import article_extraction  # noqa: E402 - loaded from SCRIPTS_DIR by batch_convert
+import liteparse_to_md  # noqa: E402
+
+OCR_SPEC = importlib.util.spec_from_file_location("ocr_api_job", SCRIPTS_DIR / "ocr_api_job.py")
+ocr_api_job = importlib.util.module_from_spec(OCR_SPEC)
+assert OCR_SPEC.loader is not None
+sys.modules[OCR_SPEC.name] = ocr_api_job
+OCR_SPEC.loader.exec_module(ocr_api_job)
+
+try:
+    import pypdfium2 as pdfium
+    from PIL import Image
+except ImportError:  # pragma: no cover - optional dependency
+    pdfium = None
+    render_pdf_pages_to_png = None
+else:
+    RENDER_SPEC = importlib.util.spec_from_file_location(
+        "render_pdf_pages_to_png", SCRIPTS_DIR / "render_pdf_pages_to_png.py"
+    )
+    render_pdf_pages_to_png = importlib.util.module_from_spec(RENDER_SPEC)
+    assert RENDER_SPEC.loader is not None
+    sys.modules[RENDER_SPEC.name] = render_pdf_pages_to_png
+    RENDER_SPEC.loader.exec_module(render_pdf_pages_to_png)
+
+
+class BatchPlanTests(unittest.TestCase):
+    def _touch_outputs(self, output_dir: Path, stem: str) -> None:
+        for path in batch_convert.expected_outputs(output_dir, stem, markdown_only=False).values():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("{}", encoding="utf-8")
+
+    def _plan(self, root: Path, previous: dict, fingerprint: str = "f1", force: bool = False):
+        input_dir = root / "in"
+        pdfs = batch_convert.collect_pdfs(input_dir)
+        return batch_convert.plan_batch(
+            pdfs, input_dir, root / "out", previous, fingerprint, markdown_only=False, force=force
+        )
+
+    def test_unchanged_pdf_with_outputs_is_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "in" / "sub").mkdir(parents=True)
+            (root / "in" / "a.pdf").write_bytes(b"%PDF-a")
+            (root / "in" / "sub" / "b.pdf").write_bytes(b"%PDF-b")
+
+            documents, pending = self._plan(root, {})
+            self.assertEqual([key for key, _, _ in pending], ["a.pdf", "sub/b.pdf"])
+            self.assertEqual(pending[1][2], root / "out" / "sub")
+
+            for key in documents:
+                documents[key]["status"] = "converted"
+            self._touch_outputs(root / "out", "a")
+            self._touch_outputs(root / "out" / "sub", "b")
+
+            cached, pending = self._plan(root, documents)
+            self.assertEqual(pending, [])
+            self.assertEqual({entry["status"] for entry in cached.values()}, {"cached"})
+
+            _, pending = self._plan(root, documents, fingerprint="f2")
+            self.assertEqual(len(pending), 2)
+            _, pending = self._plan(root, documents, force=True)
+            self.assertEqual(len(pending), 2)
+
+    def test_changed_content_or_missing_output_reconverts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "in").mkdir()
+            pdf = root / "in" / "a.pdf"
+            pdf.write_bytes(b"%PDF-a")
+            documents, _ = self._plan(root, {})
+            documents["a.pdf"]["status"] = "converted"
+            self._touch_outputs(root / "out", "a")
+
+            (root / "out" / "a.article.json").unlink()
+            _, pending = self._plan(root, documents)
+            self.assertEqual(len(pending), 1)
+
+            self._touch_outputs(root / "out", "a")
+            pdf.write_bytes(b"%PDF-a, revised")
+            refreshed, pending = self._plan(root, documents)
+            self.assertEqual(len(pending), 1)
+            self.assertNotEqual(refreshed["a.pdf"]["sha256"], documents["a.pdf"]["sha256"])
+
+    def test_manifest_round_trip_and_version_guard(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / batch_convert.MANIFEST_NAME
+            documents = {"a.pdf": {"sha256": "x", "status": "converted"}}
+            batch_convert.write_manifest(path, documents, {"documents": 1}, {"markdown_only": False})
+            self.assertEqual(batch_convert.load_manifest(path), documents)
+
+            path.write_text(json.dumps({"version": -1, "documents": documents}), encoding="utf-8")
+            self.assertEqual(batch_convert.load_manifest(path), {})
+
+
+class LineClassifierTests(unittest.TestCase):
+    SAMPLE_LINES = [
+        "![fig](figures/a.png)",
+        "----",
+        " 3 / 20 ",
+        "BioRxiv | preprint",
+        "Doe et al. | Journal 2020",
+        "Nature 12 | https://doi.org/10.1/x",
+        "Received: 1 Jan 2020",
+        "Copyright: CC-BY",
+        "DOI: 10.1/abc",
+        "Plain body text with a | pipe",
+        "Results were robust.",
+        "",
+    ]
+
+    def test_combined_drop_regex_matches_pattern_scan(self) -> None:
+        for line in self.SAMPLE_LINES:
+            expected = bool(line.strip()) and any(p.search(line.strip()) for p in article_extraction.DROP_LINE_PATTERNS)
+            self.assertEqual(article_extraction.should_drop_line(line, Counter()), expected, line)
+
+    def test_sections_and_captions_share_classified_lines(self) -> None:
+        markdown = "\n".join(
+            [
+                "# A Study of Giant Virus Lineages in Soil",
+                "## 1. Results",
+                "Figure 1. A caption that",
+                "continues here.",
+                "## Methods",
+                "FOOTER TEXT",
+                "Table 2: numbers",
+                "FOOTER TEXT",
+            ]
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "paper.md"
+            path.write_text(markdown, encoding="utf-8")
+            lines = article_extraction.load_clean_lines(path)
+
+        self.assertNotIn("FOOTER TEXT", lines)
+        sections = article_extraction.parse_sections(lines)
+        self.assertEqual([s.normalized_heading for s in sections][1:], ["results", "methods"])
+        self.assertEqual(
+            article_extraction.extract_figure_legends(lines),
+            ["Figure 1. A caption that continues here.", "Table 2: numbers"],
+        )
+        info = article_extraction.classify_line("## 2.1 Materials and Methods")
+        self.assertEqual((info.heading_level, info.normalized_heading), (2, "materials and methods"))
+
+
+def _page(lines: list[tuple[str, float, str]]) -> SimpleNamespace:
+    items = [SimpleNamespace(text=text, font_size=size, font_name=font) for text, size, font in lines]
+    return SimpleNamespace(text="\n".join(text for text, _, _ in lines), text_items=items)
+
+
+class LiteParsePostProcessingTests(unittest.TestCase):
+    def test_page_model_drives_headings_title_and_furniture(self) -> None:
+        pages = [
+            _page(
+                [
+                    ("Journal of Soil Virology", 8.0, "Times"),
+                    ("Giant Viruses in", 20.0, "Times-Bold"),
+                    ("Forest Soils", 20.0, "Times-Bold"),
+                    ("Downloaded from https://academic.oup.com by guest", 7.0, "Times"),
+                    ("1. Introduction", 10.0, "Times-Bold"),
+                    ("Soil viruses were sampled across many sites in the study area", 10.0, "Times"),
+                    ("Marker genes were recovered from every sample we tested", 10.0, "Times"),
+                    ("1", 8.0, "Times"),
+                ]
+            ),
+            _page(
+                [
+                    ("Journal of Soil Virology", 8.0, "Times"),
+                    ("Figure 1. Phylogeny of recovered lineages.", 9.0, "Times"),
+                    ("Methods", 10.0, "Times"),
+                    ("Reads were assembled and binned with standard tools today", 10.0, "Times"),
+                    ("2", 8.0, "Times"),
+                ]
+            ),
+        ]
+
+        markdown, body_size, heading_count = liteparse_to_md.pages_to_markdown(pages)
+
+        self.assertEqual(body_size, 10.0)
+        self.assertEqual(heading_count, 2)
+        self.assertTrue(markdown.startswith("# Giant Viruses in Forest Soils\n"))
+        self.assertIn("## Introduction", markdown)
+        self.assertIn("## Methods", markdown)
+        self.assertIn("\nFigure 1. Phylogeny of recovered lineages.\n", markdown)
+        self.assertIn("study area Marker genes", markdown)
+        self.assertNotIn("Journal of Soil Virology", markdown)
+        self.assertNotIn("Downloaded from", markdown)
+        self.assertNotIn("\n1\n", markdown)
+
+    def test_repeated_lines_share_cached_facts(self) -> None:
+        first = liteparse_to_md.line_facts("  Running   Header ")
+        self.assertIs(first, liteparse_to_md.line_facts("  Running   Header "))
+        self.assertEqual((first.text, first.key, first.word_count), ("Running Header", "running header", 2))
+        self.assertTrue(liteparse_to_md.line_facts("12").page_furniture)
+        self.assertTrue(liteparse_to_md.line_facts("doi.org/10.1/x").watermark)
+
+
+class StubOcrServer(ThreadingHTTPServer):
+    """In-process OCR API: each job reports "running" for a few polls, then succeeds."""
+
+    def __init__(self, polls_until_done: int = 2) -> None:
+        super().__init__(("127.0.0.1", 0), StubOcrHandler)
+        self.polls_until_done = polls_until_done
+        self.poll_errors = 0
+        self.jobs: dict[str, dict] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.connections: set[tuple] = set()
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/ocr"
+
+
+class StubOcrHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _send(self, status: int, payload) -> None:
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _record(self) -> None:
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path))
+            self.server.connections.add(self.client_address)
+
+    def do_POST(self) -> None:
+        self._record()
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("X-API-Key") != "secret":
+            self._send(401, {"detail": "bad key"})
+            return
+        with self.server.lock:
+            job_id = f"job{len(self.server.jobs)}"
+            self.server.jobs[job_id] = {"polls": 0, "upload": body}
+        self._send(200, {"job_id": job_id, "status": "queued"})
+
+    def do_GET(self) -> None:
+        self._record()
+        parts = self.path.split("/")
+        job = self.server.jobs.get(parts[4]) if len(parts) > 4 else None
+        if parts[-1] == "slow":
+            # Never answer; the client times out and must drop this connection.
+            time.sleep(0.5)
+            self.close_connection = True
+        elif job is None:
+            self._send(404, {"detail": "unknown job"})
+        elif len(parts) == 5 and self.server.poll_errors:
+            with self.server.lock:
+                self.server.poll_errors -= 1
+            self._send(503, {"detail": "busy"})
+        elif len(parts) == 5:
+            job["polls"] += 1
+            done = job["polls"] >= self.server.polls_until_done
+            self._send(200, {"status": "succeeded" if done else "running"})
+        elif parts[5] == "result":
+            self._send(200, {"pages": 1})
+        else:
+            marker = b"%PDF" in job["upload"]
+            self._send(200, f"{parts[6]} for {parts[4]} {marker}".encode("utf-8"))
+
+
+class OcrJobTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StubOcrServer()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.client = ocr_api_job.OcrClient(self.server.base_url, "secret")
+
+    def _inputs(self, root: Path, count: int) -> list[Path]:
+        paths = []
+        for index in range(count):
+            path = root / f"paper{index}.pdf"
+            path.write_bytes(b"%PDF-1.4 stub")
+            paths.append(path)
+        return paths
+
+    def _run(self, inputs: list[Path], output_dir: Path, state: Path) -> dict:
+        with contextlib.redirect_stderr(io.StringIO()):
+            return ocr_api_job.run_jobs(
+                self.client, inputs, output_dir, state, poll_interval=0.01, max_poll_interval=0.05, concurrency=2
+            )
+
+    def test_submits_polls_and_downloads_every_document(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            inputs = self._inputs(root, 3)
+            jobs = self._run(inputs, root / "out", root / "state.json")
+
+            self.assertEqual({job["phase"] for job in jobs.values()}, {"done"})
+            markdown = (root / "out" / "paper1.md").read_text(encoding="utf-8")
+            self.assertTrue(markdown.startswith("markdown for job") and markdown.endswith("True"))
+            meta = json.loads((root / "out" / "paper1.job.json").read_text(encoding="utf-8"))
+            self.assertEqual(meta["job_status"]["status"], "succeeded")
+            self.assertEqual(meta["job_result"], {"pages": 1})
+            # Keep-alive: far fewer TCP connections than HTTP requests.
+            self.assertLessEqual(len(self.server.connections), 2)
+            self.assertGreater(len(self.server.requests), 10)
+
+    def test_resume_polls_existing_jobs_instead_of_resubmitting(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            inputs = self._inputs(root, 3)
+            state = root / "state.json"
+            job_ids = [self.client.json("/api/jobs", method="POST", form_file=path)["job_id"] for path in inputs[:2]]
+            ocr_api_job.save_state(
+                state,
+                {
+                    str(inputs[0]): {"phase": "poll", "job_id": job_ids[0], "job_create": {}, "submitted_at": 1e12},
+                    str(inputs[1]): {
+                        "phase": "failed",
+                        "job_id": job_ids[1],
+                        "submitted_at": 1e12,
+                        "error": "TimeoutError: timed out",
+                    },
+                },
+            )
+
+            jobs = self._run(inputs, root / "out", state)
+            posts = [path for method, path in self.server.requests if method == "POST"]
+            self.assertEqual(len(posts), 3)
+            self.assertNotIn("error", jobs[str(inputs[1])])
+
+            self.server.requests.clear()
+            jobs = self._run(inputs, root / "out", state)
+            self.assertEqual(self.server.requests, [])
+            self.assertEqual({job["phase"] for job in jobs.values()}, {"done"})
+
+    def test_server_reported_failures_are_resubmitted(self) -> None:
+        outputs = {"markdown": Path("missing.md")}
+        failed = {"phase": "failed", "job_id": "job0", "job_status": {"status": "failed"}}
+        self.assertEqual(ocr_api_job.initial_phase(failed, outputs), "submit")
+        self.assertEqual(ocr_api_job.initial_phase({**failed, "job_status": {"status": "running"}}, outputs), "poll")
+        self.assertEqual(ocr_api_job.initial_phase({"phase": "failed"}, outputs), "submit")
+
+    def test_transient_poll_errors_are_retried(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.server.poll_errors = ocr_api_job.POLL_RETRIES
+            jobs = self._run(self._inputs(root, 1), root / "out", root / "state.json")
+            self.assertEqual([job["phase"] for job in jobs.values()], ["done"])
+            self.assertEqual(self.server.poll_errors, 0)
+
+    def test_timed_out_request_does_not_poison_the_connection(self) -> None:
+        client = ocr_api_job.OcrClient(self.server.base_url, "secret", timeout=0.1)
+        self.addCleanup(client._drop_connection)
+        with self.assertRaises(OSError):
+            client.json("/api/jobs/x/slow")
+        with self.assertRaisesRegex(RuntimeError, "HTTP 404"):
+            client.json("/api/jobs/missing")
+        self.assertEqual(client.json("/api/jobs", method="POST", form_file=Path(__file__))["status"], "queued")
+
+    def test_http_errors_mark_the_job_failed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.client = ocr_api_job.OcrClient(self.server.base_url, "wrong")
+            jobs = self._run(self._inputs(root, 1), root / "out", root / "state.json")
+            (job,) = jobs.values()
+            self.assertEqual(job["phase"], "failed")
+            self.assertIn("HTTP 401", job["error"])
+
+
+@unittest.skipUnless(pdfium is not None, "pypdfium2/pillow not installed")
+class RenderPagesTests(unittest.TestCase):
+    def _pdf(self, path: Path, pages: int) -> Path:
+        document = pdfium.PdfDocument.new()
+        for _ in range(pages):
+            document.new_page(144, 72)
+        document.save(str(path))
+        document.close()
+        return path
+
+    def _args(self, pdf: Path, output_dir: Path, **overrides):
+        values = {
+            "input_pdf": pdf,
+            "output_dir": output_dir,
+            "dpi": 72,
+            "first_page": None,
+            "last_page": None,
+            "prefix": "page",
+            "format": "png",
+            "png_compress_level": 1,
+            "quality": 90,
+            "workers": 1,
+            "force": False,
+        }
+        values.update(overrides)
+        return argparse.Namespace(**values)
+
+    def _render(self, args) -> tuple[list[Path], dict]:
+        paths, info = render_pdf_pages_to_png.render_pages(args)
+        render_pdf_pages_to_png.write_manifest(args.output_dir, paths, info)
+        return paths, info
+
+    def test_split_ranges_are_contiguous_and_balanced(self) -> None:
+        chunks = render_pdf_pages_to_png.split_ranges(list(range(1, 11)), 3)
+        self.assertEqual(chunks, [[1, 2, 3, 4], [5, 6, 7], [8, 9, 10]])
+        self.assertEqual(render_pdf_pages_to_png.split_ranges([1, 2], 4), [[1], [2]])
+
+    def test_unchanged_pages_are_skipped_until_settings_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            pdf = self._pdf(root / "doc.pdf", 3)
+            out = root / "pages"
+
+            paths, info = self._render(self._args(pdf, out))
+            self.assertEqual([path.name for path in paths], ["page-1.png", "page-2.png", "page-3.png"])
+            with Image.open(paths[0]) as image:
+                self.assertEqual(image.size, (144, 72))
+            self.assertEqual(info["rendered"], 3)
+
+            _, info = self._render(self._args(pdf, out))
+            self.assertEqual((info["rendered"], info["unchanged"]), (0, 3))
+
+            paths[1].unlink()
+            _, info = self._render(self._args(pdf, out))
+            self.assertEqual(info["rendered"], 1)
+
+            _, info = self._render(self._args(pdf, out, dpi=144))
+            self.assertEqual(info["rendered"], 3)
+
+            _, info = self._render(self._args(pdf, out, dpi=144, first_page=2, last_page=2))
+            self.assertEqual((info["rendered"], info["unchanged"]), (0, 1))
+            manifest = json.loads((out / render_pdf_pages_to_png.MANIFEST_NAME).read_text(encoding="utf-8"))
+            self.assertEqual([entry["page"] for entry in manifest["pages"]], [1, 2, 3])
+            _, info = self._render(self._args(pdf, out, dpi=144))
+            self.assertEqual((info["rendered"], info["unchanged"]), (0, 3))
+
+            paths, info = self._render(self._args(pdf, out, dpi=144, format="webp", last_page=2))
+            self.assertEqual([path.name for path in paths], ["page-1.webp", "page-2.webp"])
+            with Image.open(paths[0]) as image:
+                self.assertEqual(image.format, "WEBP")
+            manifest = json.loads((out / render_pdf_pages_to_png.MANIFEST_NAME).read_text(encoding="utf-8"))
+            self.assertEqual([entry["name"] for entry in manifest["pages"]], ["page-1.webp", "page-2.webp"])
+
+
+if __name__ == "__main__":
+    unittest.main()
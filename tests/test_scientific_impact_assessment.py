@@ -2,9 +2,20 @@ from __future__ import annotations
 
 import importlib.util
 import json
+import sys
+import tempfile
+import threading
 import unittest
+import urllib.error
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pq = None
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SKILL_ROOT = REPO_ROOT / "skills" / "scientific-impact-assessment"
@@ -13,8 +24,64 @@ MODULE_PATH = SKILL_ROOT / "scripts" / "measure_impact.py"
 spec = importlib.util.spec_from_file_location("scientific_impact_assessment", MODULE_PATH)
 assert spec is not None and spec.loader is not None
 scientific_impact_assessment = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = scientific_impact_assessment
 spec.loader.exec_module(scientific_impact_assessment)
 
+FIXTURE_WORK = json.loads((SKILL_ROOT / "fixtures" / "openalex_work.json").read_text(encoding="utf-8"))
+FIXTURE_ALTMETRIC = json.loads((SKILL_ROOT / "fixtures" / "altmetric_counts.json").read_text(encoding="utf-8"))
+KNOWN_DOIS = ("10.1038/s41586-024-00000-0", "10.1234/abc", "10.1234/a,b")
+
+
+class _Http:
+    """Stands in for `HttpClient`, answering like OpenAlex and Altmetric."""
+
+    def __init__(self) -> None:
+        self.urls: list[str] = []
+
+    def get_json(self, url: str) -> dict:
+        self.urls.append(url)
+        parts = urllib.parse.urlsplit(url)
+        if parts.netloc == "api.altmetric.com":
+            if urllib.parse.unquote(parts.path).endswith("10.1234/abc"):
+                raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+            return FIXTURE_ALTMETRIC
+        query = urllib.parse.parse_qs(parts.query)
+        if "filter" in query:
+            requested = query["filter"][0][len("doi:"):].split("|")
+            return {"results": [self._work(doi) for doi in requested if doi.lower() in KNOWN_DOIS]}
+        doi = urllib.parse.unquote(parts.path).split("doi.org/", 1)[1]
+        if doi.lower() not in KNOWN_DOIS:
+            raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+        return self._work(doi)
+
+    @staticmethod
+    def _work(doi: str) -> dict:
+        return {**FIXTURE_WORK, "ids": {**FIXTURE_WORK["ids"], "doi": f"https://doi.org/{doi.lower()}"}}
+
+
+class _TruncatedHttp(_Http):
+    """Answers 200 with an unparseable body for one DOI and for batch filters."""
+
+    def get_json(self, url: str) -> dict:
+        if "filter=" in url or "10.1234" in urllib.parse.unquote(url):
+            self.urls.append(url)
+            raise json.JSONDecodeError("Expecting value", "<html>", 0)
+        return super().get_json(url)
+
+
+class _HtmlHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        body = b"<html>rate limited</html>" if self.path == "/html" else b"[1, 2]"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
 
 class ScientificImpactAssessmentTests(unittest.TestCase):
     def test_fixture_report_matches_expected(self) -> None:
@@ -33,11 +100,139 @@ class ScientificImpactAssessmentTests(unittest.TestCase):
 
         self.assertEqual(report, expected)
 
+    def test_journal_lookup_is_indexed_with_labeled_fuzzy_fallback(self) -> None:
+        metrics = scientific_impact_assessment.load_journal_metrics(
+            SKILL_ROOT / "references" / "journal_metrics_2024.tsv"
+        )
+        lookup = scientific_impact_assessment.lookup_journal_metric
+        self.assertEqual(lookup(metrics, "NAT BIOTECHNOL")["journal_name"], "Nature Biotechnology")
+        self.assertNotIn("match", lookup(metrics, "Nat Med"))
+
+        fuzzy = lookup(metrics, "Nature Comunications")
+        self.assertEqual(
+            (fuzzy["journal_name"], fuzzy["match"], fuzzy["query"]),
+            ("Nature Communications", "fuzzy", "Nature Comunications"),
+        )
+        self.assertGreaterEqual(fuzzy["similarity"], scientific_impact_assessment.FUZZY_JOURNAL_THRESHOLD)
+        for near_miss in ("Nature Methods", "Science Advances", "Genome Biology and Evolution"):
+            self.assertFalse(lookup(metrics, near_miss)["matched"], near_miss)
+
+        exact_only = scientific_impact_assessment.load_journal_metrics(
+            SKILL_ROOT / "references" / "journal_metrics_2024.tsv", fuzzy_threshold=None
+        )
+        self.assertEqual(lookup(exact_only, "Nature Comunications")["reason"], "not_in_reference_table")
+        self.assertEqual(lookup(list(exact_only), "Bioinformatics")["journal_name"], "Bioinformatics")
+
+    def test_fuzzy_lookup_refuses_ties_between_journals(self) -> None:
+        row = {"category": "x", "metric_name": "jif", "metric_year": "2024", "value": 1.0, "source_url": "",
+               "source_kind": "official", "verified_date": "", "notes": ""}
+        metrics = scientific_impact_assessment.JournalMetrics(
+            [{**row, "journal_name": "Journal of Viromics A", "aliases": []},
+             {**row, "journal_name": "Journal of Viromics B", "aliases": []}],
+            fuzzy_threshold=0.5,
+        )
+        self.assertFalse(scientific_impact_assessment.lookup_journal_metric(metrics, "Journal of Viromics")["matched"])
+
     def test_altmetric_is_explicitly_unavailable_without_key(self) -> None:
         summary = scientific_impact_assessment.summarize_altmetric_payload(None, reason="no_api_key")
         self.assertEqual(summary["status"], "unavailable")
         self.assertEqual(summary["reason"], "no_api_key")
 
 
+class BatchImpactAssessmentTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.metrics = scientific_impact_assessment.load_journal_metrics(
+            SKILL_ROOT / "references" / "journal_metrics_2024.tsv"
+        )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _assess(self, http: _Http, raws: list[str]) -> list[dict]:
+        client = scientific_impact_assessment.ImpactClient(
+            altmetric_api_key="key",
+            cache=scientific_impact_assessment.ResponseCache(self.tmp / "cache", 3600, 60),
+            http=http,
+            openalex_rate=0,
+            altmetric_rate=0,
+        )
+        return list(scientific_impact_assessment.assess_dois(client, raws, self.metrics, workers=3))
+
+    def test_batch_uses_one_filter_request_and_caches_responses(self) -> None:
+        raws = [
+            "https://doi.org/10.1038/S41586-024-00000-0",
+            "10.1234/missing",
+            "not a doi",
+            "doi:10.1234/abc",
+            "10.1234/a,b",
+            "10.1234/ABC",
+        ]
+        http = _Http()
+        reports = self._assess(http, raws)
+
+        self.assertEqual([report["input"] for report in reports], raws)
+        self.assertEqual(
+            [report["status"] for report in reports], ["ok", "not_found", "invalid_doi", "ok", "ok", "ok"]
+        )
+        self.assertEqual(reports[0]["journal_metric"]["journal_name"], "Nature Communications")
+        self.assertEqual(reports[0]["altmetric"]["score"], FIXTURE_ALTMETRIC["score"])
+        self.assertEqual(reports[3]["altmetric"], {"status": "unavailable", "reason": "http_404"})
+        self.assertEqual(reports[3]["openalex"], reports[5]["openalex"])
+
+        openalex = [url for url in http.urls if "api.openalex.org" in url]
+        batch_filters = [urllib.parse.parse_qs(urllib.parse.urlsplit(url).query).get("filter") for url in openalex]
+        self.assertEqual(
+            [value for value in batch_filters if value],
+            [["doi:10.1038/S41586-024-00000-0|10.1234/missing|10.1234/abc"]],
+        )
+        self.assertEqual(len(openalex), 3)
+        self.assertEqual(sum("api.altmetric.com" in url for url in http.urls), 4)
+
+        warm = _Http()
+        self.assertEqual(self._assess(warm, raws), reports)
+        self.assertEqual(warm.urls, [])
+
+    def test_malformed_responses_are_reported_per_doi(self) -> None:
+        reports = self._assess(_TruncatedHttp(), ["10.1038/s41586-024-00000-0", "10.1234/abc"])
+        self.assertEqual([report["status"] for report in reports], ["ok", "bad_response"])
+        self.assertEqual(reports[1]["altmetric"], {"status": "unavailable", "reason": "bad_response"})
+        self.assertEqual(self._assess(_Http(), ["10.1234/abc"])[0]["status"], "ok")
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _HtmlHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        client = scientific_impact_assessment.HttpClient(timeout=5)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        for path in ("/html", "/list"):
+            with self.assertRaises(ValueError):
+                client.get_json(base + path)
+
+    def test_expired_misses_are_fetched_again(self) -> None:
+        cache = scientific_impact_assessment.ResponseCache(self.tmp, ttl_seconds=3600, negative_ttl_seconds=-1)
+        cache.put("openalex", "10.1234/abc", True, {"id": "W1"})
+        cache.put("openalex", "10.1234/gone", False, "not_found")
+        self.assertEqual(cache.get("openalex", "10.1234/abc"), (True, {"id": "W1"}))
+        self.assertIsNone(cache.get("openalex", "10.1234/gone"))
+        self.assertIsNone(scientific_impact_assessment.ResponseCache(None, 3600, 60).get("openalex", "10.1234/abc"))
+
+    @unittest.skipUnless(pq is not None, "pyarrow not installed")
+    def test_parquet_rows_match_jsonl_reports(self) -> None:
+        reports = self._assess(_Http(), ["10.1038/s41586-024-00000-0", "bad", "10.1234/missing"])
+        path = self.tmp / "impact.parquet"
+        statuses = scientific_impact_assessment.write_parquet(path, reports)
+        self.assertEqual(statuses, {"ok": 1, "invalid_doi": 1, "not_found": 1})
+
+        rows = pq.read_table(path).to_pylist()
+        self.assertEqual(rows, [scientific_impact_assessment.flatten_report(report) for report in reports])
+        self.assertEqual(rows[0]["cited_by_count"], 321)
+        self.assertEqual(json.loads(rows[0]["counts_by_year"]), FIXTURE_WORK["counts_by_year"])
+        self.assertIsNone(rows[1]["title"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,205 @@
+"""Tests for the rule-table CSAG PaperExtraction validator."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "skills" / "csag-extraction" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+MODULE_PATH = SCRIPTS_DIR / "validate_paper_extraction.py"
+SPEC = importlib.util.spec_from_file_location("validate_paper_extraction", MODULE_PATH)
+validate_paper_extraction = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+sys.modules[SPEC.name] = validate_paper_extraction
+SPEC.loader.exec_module(validate_paper_extraction)
+
+
+def _extraction(paper_id: str = "csag:doc/x") -> dict:
+    return {
+        "id": paper_id,
+        "title": "Soil viromes",
+        "schema_version": "0.3",
+        "validator_version": validate_paper_extraction.VALIDATOR_VERSION,
+        "extraction_activities": [
+            {
+                "id": "ACT1",
+                "activity_type": "curation",
+                "parameters": [{"key": "doi_status", "value": "unresolved"}, {"key": "pmid_status", "value": "unresolved"}],
+            }
+        ],
+        "artifacts": [{"id": "F1", "artifact_type": "figure", "caption": "Figure 1"}],
+        "assertions": [
+            {
+                "id": "A1",
+                "assertion_text": "Soil viruses encode auxiliary metabolic genes",
+                "claim_role": "result_claim",
+                "normalization_status": "raw",
+                "contexts": [{"id": "C1", "artifact_ref": "F1"}],
+                "criticality": "core",
+                "falsification_criteria": ["No AMGs in deeper sequencing"],
+                "curation_status": "human_verified",
+                "text_spans": [{"section_type": "results"}],
+            }
+        ],
+        "evidence_items": [{"id": "E1"}],
+        "evidence_links": [
+            {
+                "id": "L1",
+                "evidence_item": "E1",
+                "assertion": "A1",
+                "polarity": "supports",
+                "strength": "strong",
+                "rationale": "Direct observation",
+                "curation_status": "human_verified",
+            }
+        ],
+    }
+
+
+class RuleEngineTests(unittest.TestCase):
+    def test_clean_extraction_passes_every_profile(self) -> None:
+        for profile in ("paper_local", "promoted_claim", "benchmark_key"):
+            self.assertEqual(validate_paper_extraction.validate_extraction(_extraction(), profile), [])
+
+    def test_messages_only_for_failing_rules(self) -> None:
+        extraction = _extraction()
+        extraction["assertions"][0]["claim_role"] = "vibe"
+        extraction["assertions"][0]["criticality"] = "huge"
+        errors = validate_paper_extraction.validate_extraction(extraction)
+        self.assertEqual(
+            errors,
+            [
+                "object=A1; field=assertions[].claim_role; reason=invalid claim role; "
+                "suggested_fix=Set claim_role from the controlled vocabulary.",
+                "object=A1; field=assertions[].criticality; reason=invalid criticality huge; "
+                "suggested_fix=Use core, major, supporting, or background.",
+            ],
+        )
+
+    def test_cross_references_use_index(self) -> None:
+        extraction = _extraction()
+        extraction["evidence_links"].append({"id": "L1", "assertion": "A9", "polarity": "supports"})
+        extraction["assertions"][0]["contexts"][0]["associated_artifacts"] = ["F1", "F9"]
+        extraction["qa_items"] = [
+            {"id": "Q1", "answers": [{"supporting_assertions": ["A1", "A7"], "supporting_evidence_links": ["L8"]}]}
+        ]
+        summary = [
+            (item["object_id"], item["field_path"], item["code"])
+            for item in map(validate_paper_extraction.structured_issue, validate_paper_extraction.validate_extraction(extraction))
+        ]
+        self.assertEqual(
+            summary,
+            [
+                ("L1", "evidence_links", "duplicate_ids_are_present"),
+                ("F9", "paper_extraction.assertions[0].contexts[0].associated_artifacts", "reference_does_not_resolve"),
+                ("evidence_link L1 evidence_item", "evidence_link L1 evidence_item", "required_reference_is_missing"),
+                ("A9", "evidence_link L1 assertion", "reference_does_not_resolve"),
+                ("A7", "qa_item Q1 answer supporting_assertions", "reference_does_not_resolve"),
+                ("L8", "qa_item Q1 answer supporting_evidence_links", "reference_does_not_resolve"),
+            ],
+        )
+
+    def test_profile_rules_read_links_from_index(self) -> None:
+        extraction = _extraction()
+        extraction["evidence_links"][0]["strength"] = "weak"
+        self.assertEqual(validate_paper_extraction.validate_extraction(extraction, "promoted_claim"), [])
+        errors = validate_paper_extraction.validate_extraction(extraction, "benchmark_key")
+        self.assertEqual(len(errors), 1)
+        self.assertIn("core or major assertion has no moderate-or-strong decisive evidence", errors[0])
+
+    def test_non_object_input(self) -> None:
+        errors = validate_paper_extraction.validate_extraction([])
+        self.assertEqual(validate_paper_extraction.structured_issue(errors[0])["object_id"], "(input)")
+
+
+class IncrementalValidationTests(unittest.TestCase):
+    def _previous(self, extraction: dict, profile: str) -> tuple[object, dict]:
+        run = validate_paper_extraction.run_validation(extraction, profile)
+        report = validate_paper_extraction.build_report(
+            Path("paper_extraction.json"), run.errors, [], {}, profile, error_segments=run.segments
+        )
+        return validate_paper_extraction.load_previous_run(extraction, json.loads(json.dumps(report)), profile), report
+
+    def _larger_extraction(self) -> dict:
+        extraction = _extraction()
+        for number in range(2, 30):
+            assertion = dict(extraction["assertions"][0], id=f"A{number}")
+            if number % 3 == 0:
+                assertion["claim_role"] = "vibe"
+            extraction["assertions"].append(assertion)
+            extraction["evidence_links"].append(dict(extraction["evidence_links"][0], id=f"L{number}", assertion=f"A{number}"))
+        return extraction
+
+    def test_edits_produce_the_same_report_as_a_full_run(self) -> None:
+        edits = (
+            lambda doc: doc["assertions"][4].update(claim_role="result_claim"),
+            lambda doc: doc["assertions"].pop(0),
+            lambda doc: doc["artifacts"].clear(),
+            lambda doc: doc["evidence_links"][5].update(strength="weak"),
+            lambda doc: doc["evidence_items"][0].update(text_spans=[]),
+            lambda doc: doc["assertions"].insert(0, dict(doc["assertions"][1])),
+            lambda doc: doc["assertions"][7]["contexts"].append({"artifact_ref": "F404"}),
+        )
+        for profile in ("paper_local", "benchmark_key"):
+            for position, edit in enumerate(edits):
+                with self.subTest(profile=profile, edit=position):
+                    before = self._larger_extraction()
+                    previous, _ = self._previous(before, profile)
+                    after = json.loads(json.dumps(before))
+                    edit(after)
+                    full = validate_paper_extraction.run_validation(after, profile)
+                    incremental = validate_paper_extraction.run_validation(after, profile, previous=previous)
+                    self.assertEqual(incremental.errors, full.errors)
+                    self.assertEqual(incremental.segments, full.segments)
+                    self.assertGreater(incremental.reused, 0)
+
+    def test_previous_report_must_match_profile(self) -> None:
+        extraction = self._larger_extraction()
+        _, report = self._previous(extraction, "paper_local")
+        self.assertIsNone(validate_paper_extraction.load_previous_run(extraction, report, "benchmark_key"))
+        report["errors"] = report["errors"][1:]
+        self.assertIsNone(validate_paper_extraction.load_previous_run(extraction, report, "paper_local"))
+
+
+class BatchValidationTests(unittest.TestCase):
+    def test_batch_writes_one_report_per_extraction(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            paths = []
+            for stem in ("alpha", "beta"):
+                folder = root / stem
+                folder.mkdir()
+                extraction = _extraction(stem)
+                if stem == "beta":
+                    extraction["artifacts"] = []
+                (folder / "paper_extraction.json").write_text(json.dumps(extraction), encoding="utf-8")
+                (folder / f"{stem}.md").write_text("# Title\n\nFigure 1. Phage counts\n", encoding="utf-8")
+                paths.append(str(folder / "paper_extraction.json"))
+
+            stdout = io.StringIO()
+            with mock.patch.object(sys, "argv", ["validate_paper_extraction.py", *paths]), contextlib.redirect_stdout(stdout):
+                status = validate_paper_extraction.main()
+
+            self.assertEqual(status, 1)
+            self.assertIn("1/2 extractions passed", stdout.getvalue())
+            alpha = json.loads((root / "alpha" / "paper_extraction.validation.json").read_text(encoding="utf-8"))
+            beta = json.loads((root / "beta" / "paper_extraction.validation.json").read_text(encoding="utf-8"))
+            self.assertTrue(alpha["ok"])
+            self.assertFalse(beta["ok"])
+            self.assertEqual(
+                [item["field_path"] for item in beta["structured_errors"]],
+                ["paper_extraction.assertions[0].contexts[0].artifact_ref references missing id F1", "artifacts"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()